@@ -60,6 +60,25 @@ export interface Project {
   steps_completed: number;
   workers_active?: number;
   current_phase?: string;
+  updated_at?: string;
+  completed_at?: string | null;
+  owner?: string | null;
+  departments?: string[];
+}
+
+/** Cursor-paginated list response; pass next_cursor back as cursor for the next page */
+export interface PageInfo {
+  count: number;
+  next_cursor: string | null;
+}
+
+export interface ProjectListOptions {
+  owner?: string;
+  department?: string;
+  updated_since?: string;
+  include_completed?: boolean;
+  cursor?: string;
+  limit?: number;
 }
 
 export interface Gate {
@@ -214,9 +233,17 @@ class APIClient {
   // Projects
   // ==========================================================================
 
-  async getProjects(status?: string): Promise<{ projects: Project[] }> {
-    const query = status ? `?status=${status}` : '';
-    return this.request(`/api/projects${query}`);
+  async getProjects(
+    status?: string,
+    options: ProjectListOptions = {}
+  ): Promise<PageInfo & { projects: Project[] }> {
+    const params = new URLSearchParams();
+    if (status) params.set('status', status);
+    Object.entries(options).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) params.set(key, String(value));
+    });
+    const query = params.toString();
+    return this.request(`/api/projects${query ? `?${query}` : ''}`);
   }
 
   async getProject(projectId: string): Promise<Project & { steps: unknown[] }> {
@@ -231,8 +258,9 @@ class APIClient {
     return this.request('/api/gates');
   }
 
-  async getPendingGates(): Promise<{ pending: PendingGate[] }> {
-    return this.request('/api/gates/pending');
+  async getPendingGates(cursor?: string): Promise<PageInfo & { pending: PendingGate[] }> {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    return this.request(`/api/gates/pending${query}`);
   }
 
   async approveGate(
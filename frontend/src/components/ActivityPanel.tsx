@@ -374,7 +374,12 @@ export function ActivityPanel({
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          handleMessage(data);
+          // Bursts are delivered as one batch frame
+          if (data?.type === 'batch' && Array.isArray(data.messages)) {
+            data.messages.forEach(handleMessage);
+          } else {
+            handleMessage(data);
+          }
         } catch (err) {
           console.error('Failed to parse activity event:', err);
         }
@@ -19,8 +19,9 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
-from ..core.molecule import MoleculeEngine, Molecule, MoleculeStep
-from ..core.hook import HookManager, Hook, WorkItem
+from ..core.molecule import Molecule, MoleculeStep
+from ..core.hook import Hook, WorkItem
+from ..core.registry import get_hook_manager, get_molecule_engine
 from ..core.channel import ChannelManager, ChannelType, Message, MessagePriority
 from ..core.bead import BeadLedger, Bead
 from ..core.raci import RACI
@@ -37,6 +38,7 @@ from ..core.llm import (
     LLMBackend, LLMBackendFactory, AgentLLMInterface, LLMRequest, LLMResponse,
     get_llm_interface
 )
+from ..core.metering import activate_usage_meter, usage_scope
 from ..core.processor import MessageProcessor, ProcessingResult
 from ..core.skills import SkillRegistry
 
@@ -82,8 +84,9 @@ class BaseAgent(ABC):
         self.auto_claim = auto_claim
 
         # Initialize managers
-        self.molecule_engine = MoleculeEngine(self.corp_path)
-        self.hook_manager = HookManager(self.corp_path)
+        # Shared per corp so sibling agents use one cache
+        self.molecule_engine = get_molecule_engine(self.corp_path)
+        self.hook_manager = get_hook_manager(self.corp_path)
         self.channel_manager = ChannelManager(self.corp_path)
         self.bead_ledger = BeadLedger(self.corp_path, auto_commit=False)
 
@@ -111,6 +114,8 @@ class BaseAgent(ABC):
 
         # Initialize LLM interface (swappable backend)
         self.llm = AgentLLMInterface(llm_backend or LLMBackendFactory.get_best_available())
+        # Meter this corp's LLM calls (tokens, latency, cost)
+        activate_usage_meter(self.corp_path)
 
         # Initialize message processor
         self.message_processor = MessageProcessor(self)
@@ -390,11 +395,20 @@ Always maintain professional communication and follow the organizational hierarc
         Returns structured thought process.
         """
         from ..core.llm import AgentThought
-        return self.llm.think(
-            role=self.identity.role_name,
-            task=task,
-            context=context or {},
-            constraints=[f"Reports to: {self.identity.reports_to}"] if self.identity.reports_to else []
+        with self._usage_scope():
+            return self.llm.think(
+                role=self.identity.role_name,
+                task=task,
+                context=context or {},
+                constraints=[f"Reports to: {self.identity.reports_to}"] if self.identity.reports_to else []
+            )
+
+    def _usage_scope(self):
+        """Tag LLM calls with this agent and its current molecule/step"""
+        return usage_scope(
+            agent_id=self.identity.id,
+            molecule_id=self.current_molecule.id if self.current_molecule else None,
+            step_id=self.current_step.id if self.current_step else None
         )
 
     def get_available_skills(self) -> List[str]:
@@ -444,19 +458,20 @@ Always maintain professional communication and follow the organizational hierarc
         This is the main method for agents to use LLM capabilities.
         Automatically includes all skills available to this agent.
         """
-        return self.llm.execute_task(
-            role=self.identity.role_name,
-            system_prompt=self.get_system_prompt(),
-            task=task,
-            working_directory=working_directory or self.corp_path,
-            skills=self.get_available_skills(),  # Use combined skills
-            context={
-                'agent_id': self.identity.id,
-                'agent_level': self.identity.level,  # For tool selection
-                'molecule_id': self.current_molecule.id if self.current_molecule else None,
-                'step_id': self.current_step.id if self.current_step else None
-            }
-        )
+        with self._usage_scope():
+            return self.llm.execute_task(
+                role=self.identity.role_name,
+                system_prompt=self.get_system_prompt(),
+                task=task,
+                working_directory=working_directory or self.corp_path,
+                skills=self.get_available_skills(),  # Use combined skills
+                context={
+                    'agent_id': self.identity.id,
+                    'agent_level': self.identity.level,  # For tool selection
+                    'molecule_id': self.current_molecule.id if self.current_molecule else None,
+                    'step_id': self.current_step.id if self.current_step else None
+                }
+            )
 
     def analyze_work_item(self, work_item: WorkItem) -> Dict[str, Any]:
         """
@@ -475,12 +490,13 @@ Always maintain professional communication and follow the organizational hierarc
                     f"- {l['title']}: {l['lesson']}" for l in lessons[:3]
                 )
 
-        return self.llm.analyze_work_item(
-            role=self.identity.role_name,
-            work_item=work_item.to_dict(),
-            molecule=molecule_dict,
-            memory_context=memory_context
-        )
+        with self._usage_scope():
+            return self.llm.analyze_work_item(
+                role=self.identity.role_name,
+                work_item=work_item.to_dict(),
+                molecule=molecule_dict,
+                memory_context=memory_context
+            )
 
     def checkpoint(self, description: str, data: Dict[str, Any]) -> None:
         """Create a checkpoint for crash recovery"""
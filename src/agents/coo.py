@@ -24,7 +24,7 @@ from ..core.molecule import Molecule, MoleculeStep, MoleculeStatus, StepStatus
 from ..core.hook import WorkItem, WorkItemPriority
 from ..core.channel import MessagePriority, ChannelType
 from ..core.raci import RACI, create_raci
-from ..core.gate import GateKeeper
+from ..core.registry import get_gate_keeper
 from ..core.contract import ContractManager, SuccessContract
 from ..core.llm import LLMRequest
 from ..core.skills import SkillRegistry
@@ -36,6 +36,8 @@ from ..core.memory import (
     score_query_complexity, calculate_adaptive_depth,
     DEFAULT_BASE_K, COMPLEXITY_SENSITIVITY
 )
+from ..core.threads import ConversationThreadStore
+from ..core.versions import VersionedCache, get_versions
 
 
 class COOAgent(BaseAgent):
@@ -78,7 +80,7 @@ class COOAgent(BaseAgent):
         super().__init__(identity, corp_path, skill_registry=skill_registry)
 
         # Initialize gate keeper
-        self.gate_keeper = GateKeeper(self.corp_path)
+        self.gate_keeper = get_gate_keeper(self.corp_path)
 
         # Initialize contract manager
         self.contract_manager = ContractManager(self.corp_path, bead_ledger=self.bead)
@@ -86,6 +88,13 @@ class COOAgent(BaseAgent):
         # Initialize The Forge (intention incubation system)
         self.forge = TheForge(self.corp_path)
 
+        # CEO-COO conversation threads (created on first use)
+        self._thread_store: Optional[ConversationThreadStore] = None
+
+        # Session context components, rebuilt when their stores change
+        self._session_cache = VersionedCache()
+        self._context_summary: Optional[tuple] = None  # (component generations, rendered text)
+
     def process_work(self, work_item: WorkItem) -> Dict[str, Any]:
         """Process a work item (CEO task)"""
         task_type = work_item.context.get('task_type', 'general')
@@ -1519,6 +1528,13 @@ IMPORTANT:
         store_path.mkdir(parents=True, exist_ok=True)
         return store_path
 
+    @property
+    def thread_store(self) -> ConversationThreadStore:
+        """Append-only thread storage with catalog and token index"""
+        if self._thread_store is None:
+            self._thread_store = ConversationThreadStore(self.get_conversation_store_path())
+        return self._thread_store
+
     def create_conversation_thread(
         self,
         title: str,
@@ -1554,8 +1570,7 @@ IMPORTANT:
         }
 
         # Save thread
-        thread_path = self.get_conversation_store_path() / f"{thread_id}.json"
-        thread_path.write_text(json.dumps(thread_data, indent=2))
+        self.thread_store.create(thread_data)
 
         # Record in bead for audit trail
         self.bead.create(
@@ -1579,6 +1594,9 @@ IMPORTANT:
         """
         Add a message to an existing conversation thread.
 
+        Appends to the thread's message log; the rest of the thread is
+        not read or rewritten.
+
         Args:
             thread_id: ID of the thread
             role: Who sent the message ('ceo' or 'coo')
@@ -1589,13 +1607,6 @@ IMPORTANT:
         Returns:
             The added message
         """
-        thread_path = self.get_conversation_store_path() / f"{thread_id}.json"
-
-        if not thread_path.exists():
-            raise ValueError(f"Thread {thread_id} not found")
-
-        thread_data = json.loads(thread_path.read_text())
-
         message = {
             'id': f"msg-{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')[:17]}",
             'role': role,
@@ -1605,30 +1616,25 @@ IMPORTANT:
             'metadata': metadata or {}
         }
 
-        thread_data['messages'].append(message)
-        thread_data['updated_at'] = datetime.utcnow().isoformat()
+        # Raises ValueError if the thread does not exist
+        self.thread_store.append_message(thread_id, message)
 
         # If it's a decision, record it
         if message_type == 'decision':
-            thread_data['key_decisions'].append({
-                'message_id': message['id'],
-                'summary': content[:200],
-                'timestamp': message['timestamp']
-            })
-
-        # Save updated thread
-        thread_path.write_text(json.dumps(thread_data, indent=2))
+            self.thread_store.update_header(
+                thread_id,
+                lambda header: header.setdefault('key_decisions', []).append({
+                    'message_id': message['id'],
+                    'summary': content[:200],
+                    'timestamp': message['timestamp']
+                })
+            )
 
         return message
 
     def get_thread(self, thread_id: str) -> Optional[Dict[str, Any]]:
         """Get a conversation thread by ID"""
-        thread_path = self.get_conversation_store_path() / f"{thread_id}.json"
-
-        if not thread_path.exists():
-            return None
-
-        return json.loads(thread_path.read_text())
+        return self.thread_store.get(thread_id)
 
     def list_threads(
         self,
@@ -1639,6 +1645,8 @@ IMPORTANT:
         """
         List conversation threads with optional filters.
 
+        Served from the thread catalog; thread files are not opened.
+
         Args:
             status: Filter by status ('active', 'archived', 'resolved')
             tags: Filter by tags
@@ -1647,38 +1655,7 @@ IMPORTANT:
         Returns:
             List of thread metadata
         """
-        threads = []
-        store_path = self.get_conversation_store_path()
-
-        for thread_file in sorted(store_path.glob("thread-*.json"), reverse=True):
-            try:
-                thread_data = json.loads(thread_file.read_text())
-
-                if status and thread_data.get('status') != status:
-                    continue
-
-                if tags and not any(t in thread_data.get('tags', []) for t in tags):
-                    continue
-
-                # Return summary info, not full messages
-                threads.append({
-                    'id': thread_data['id'],
-                    'title': thread_data['title'],
-                    'status': thread_data['status'],
-                    'created_at': thread_data['created_at'],
-                    'updated_at': thread_data['updated_at'],
-                    'message_count': len(thread_data['messages']),
-                    'tags': thread_data.get('tags', [])
-                })
-
-                if len(threads) >= limit:
-                    break
-
-            except Exception as e:
-                print(f"[COO] Error loading thread {thread_file}: {e}")
-                continue
-
-        return threads
+        return self.thread_store.list_threads(status=status, tags=tags, limit=limit)
 
     def get_thread_context(
         self,
@@ -1721,17 +1698,15 @@ IMPORTANT:
         molecule_id: str
     ) -> None:
         """Link a conversation thread to a molecule for tracking"""
-        thread_path = self.get_conversation_store_path() / f"{thread_id}.json"
-
-        if not thread_path.exists():
+        header = self.thread_store.get_header(thread_id)
+        if header is None:
             raise ValueError(f"Thread {thread_id} not found")
 
-        thread_data = json.loads(thread_path.read_text())
-
-        if molecule_id not in thread_data['linked_molecules']:
-            thread_data['linked_molecules'].append(molecule_id)
-            thread_data['updated_at'] = datetime.utcnow().isoformat()
-            thread_path.write_text(json.dumps(thread_data, indent=2))
+        if molecule_id not in header.get('linked_molecules', []):
+            self.thread_store.update_header(
+                thread_id,
+                lambda h: h.setdefault('linked_molecules', []).append(molecule_id)
+            )
 
     def update_thread_summary(
         self,
@@ -1739,15 +1714,7 @@ IMPORTANT:
         summary: str
     ) -> None:
         """Update the summary for a conversation thread"""
-        thread_path = self.get_conversation_store_path() / f"{thread_id}.json"
-
-        if not thread_path.exists():
-            raise ValueError(f"Thread {thread_id} not found")
-
-        thread_data = json.loads(thread_path.read_text())
-        thread_data['summary'] = summary
-        thread_data['updated_at'] = datetime.utcnow().isoformat()
-        thread_path.write_text(json.dumps(thread_data, indent=2))
+        self.thread_store.update_header(thread_id, lambda header: header.update(summary=summary))
 
     # =========================================================================
     # Lesson Learning from Execution Outcomes
@@ -1893,106 +1860,124 @@ IMPORTANT:
     # Context Loading on Session Start
     # =========================================================================
 
-    def load_session_context(self) -> Dict[str, Any]:
+    def _session_components(self) -> List[tuple]:
         """
-        Load comprehensive context at the start of a COO session.
+        Session context components as (name, label, change counters, loader).
 
-        Returns organizational state, recent decisions, active threads,
-        and relevant lessons for the COO to have full situational awareness.
+        Each component is cached until one of the store change counters it
+        depends on moves (or the cache entry expires).
         """
-        context = {
-            'loaded_at': datetime.utcnow().isoformat(),
-            'ceo_preferences': [],
-            'organization_status': {},
-            'active_molecules': [],
-            'pending_gates': [],
-            'recent_decisions': [],
-            'active_conversations': [],
-            'recent_lessons': [],
-            'warnings': []
-        }
-
-        # Load CEO preferences (highest priority)
-        try:
-            context['ceo_preferences'] = self.org_memory.get_priority_preferences("high")
-        except Exception as e:
-            context['warnings'].append(f"Failed to load CEO preferences: {e}")
+        corp = self.corp_path
+        threads = self.thread_store
 
-        # Load organization status
-        try:
-            context['organization_status'] = self.get_organization_status()
-        except Exception as e:
-            context['warnings'].append(f"Failed to load org status: {e}")
-
-        # Load active molecules
-        try:
-            molecules = self.molecule_engine.list_active_molecules()
-            context['active_molecules'] = [
+        def load_molecules():
+            return [
                 {
                     'id': m.id,
                     'name': m.name,
                     'status': m.status.value,
                     'progress': m.get_progress()
                 }
-                for m in molecules[:10]  # Limit to 10 most recent
+                for m in self.molecule_engine.list_active_molecules()[:10]  # Limit to 10 most recent
             ]
-        except Exception as e:
-            context['warnings'].append(f"Failed to load molecules: {e}")
 
-        # Load pending gates
-        try:
-            pending = self.gate_keeper.get_pending_submissions()
-            context['pending_gates'] = [
+        def load_gates():
+            return [
                 {'id': s.id, 'gate_id': s.gate_id, 'molecule_id': s.molecule_id}
-                for s in pending[:5]
+                for s in self.gate_keeper.get_pending_submissions()[:5]
             ]
-        except Exception as e:
-            context['warnings'].append(f"Failed to load gates: {e}")
 
-        # Load recent decisions from organizational memory
-        try:
-            recent_decisions = self.search_past_decisions(
-                query="",  # Get all recent
-                tags=None
-            )
-            context['recent_decisions'] = recent_decisions[:10]
-        except Exception as e:
-            context['warnings'].append(f"Failed to load decisions: {e}")
+        return [
+            # CEO preferences (highest priority)
+            ('ceo_preferences', 'CEO preferences',
+             get_versions(corp, ('memory.ceo_preferences',)),
+             lambda: self.org_memory.get_priority_preferences("high")),
+            ('organization_status', 'org status',
+             get_versions(corp, ('molecules', 'gates', 'hooks')),
+             self.get_organization_status),
+            ('active_molecules', 'molecules',
+             get_versions(corp, ('molecules',)),
+             load_molecules),
+            ('pending_gates', 'gates',
+             get_versions(corp, ('gates',)),
+             load_gates),
+            # Recent decisions from organizational memory
+            ('recent_decisions', 'decisions',
+             get_versions(corp, ('memory.decisions',)),
+             lambda: self.search_past_decisions(query="", tags=None)[:10]),
+            ('active_conversations', 'conversations',
+             get_versions(threads.store_path, ('threads',)),
+             lambda: threads.list_threads(status='active', limit=5)),
+            ('recent_lessons', 'lessons',
+             get_versions(corp, ('memory.lessons_learned',)),
+             lambda: self.get_relevant_lessons(context="Recent organizational activities")[:5]),
+        ]
 
-        # Load active conversation threads
-        try:
-            context['active_conversations'] = self.list_threads(
-                status='active',
-                limit=5
-            )
-        except Exception as e:
-            context['warnings'].append(f"Failed to load conversations: {e}")
+    def load_session_context(self) -> Dict[str, Any]:
+        """
+        Load comprehensive context at the start of a COO session.
 
-        # Load recent lessons
-        try:
-            recent_lessons = self.get_relevant_lessons(
-                context="Recent organizational activities"
-            )
-            context['recent_lessons'] = recent_lessons[:5]
-        except Exception as e:
-            context['warnings'].append(f"Failed to load lessons: {e}")
+        Returns organizational state, recent decisions, active threads,
+        and relevant lessons for the COO to have full situational awareness.
 
-        print(f"[COO] Session context loaded: "
-              f"{len(context['active_molecules'])} molecules, "
-              f"{len(context['pending_gates'])} gates pending, "
-              f"{len(context['active_conversations'])} active threads")
+        Components are served from the session context cache and only
+        recomputed when the store they come from has been written to.
+        """
+        return self._load_session_context()[0]
+
+    def _load_session_context(self) -> tuple:
+        """Session context plus the build numbers of the components it used"""
+        context = {
+            'loaded_at': datetime.utcnow().isoformat(),
+            'warnings': []
+        }
+
+        # Follow thread catalog writes from other processes before reading counters
+        self.thread_store.get_catalog()
+
+        reloaded = False
+        generations = []
+        for name, label, versions, loader in self._session_components():
+            generation = self._session_cache.generation(name)
+            try:
+                context[name], built = self._session_cache.get_with_generation(name, versions, loader)
+            except Exception as e:
+                context[name] = {} if name == 'organization_status' else []
+                context['warnings'].append(f"Failed to load {label}: {e}")
+                built = None
+            if built != generation:
+                reloaded = True
+            generations.append(built)
+
+        if reloaded:
+            print(f"[COO] Session context loaded: "
+                  f"{len(context['active_molecules'])} molecules, "
+                  f"{len(context['pending_gates'])} gates pending, "
+                  f"{len(context['active_conversations'])} active threads")
 
-        return context
+        return context, tuple(generations)
 
     def get_context_summary_for_llm(self) -> str:
         """
         Get a formatted context summary suitable for LLM prompt injection.
 
         This provides the COO's current situational awareness in a format
-        that can be prepended to LLM prompts.
+        that can be prepended to LLM prompts. The rendered text is reused
+        until a component of the session context is rebuilt.
         """
-        context = self.load_session_context()
+        context, key = self._load_session_context()
 
+        # Memoized on the build number of every component; failures are never memoized
+        if not context['warnings'] and self._context_summary and self._context_summary[0] == key:
+            return self._context_summary[1]
+
+        summary = self._render_context_summary(context)
+        if not context['warnings']:
+            self._context_summary = (key, summary)
+        return summary
+
+    def _render_context_summary(self, context: Dict[str, Any]) -> str:
+        """Format session context for prompt injection"""
         summary_parts = [
             "=== COO CONTEXT SUMMARY ===",
             f"Generated: {context['loaded_at']}",
@@ -2348,80 +2333,86 @@ IMPORTANT:
         self,
         keywords: List[str],
         query: str,
-        max_results: int = 5
+        max_results: int = 5,
+        window: int = 20
     ) -> List[Dict[str, Any]]:
         """
         Search conversation threads for relevant history.
 
-        Searches thread titles and messages for keyword matches.
+        Scores thread titles and the last `window` messages of each thread
+        against the query, plus a recency bonus. Candidates come from the
+        thread store's token index and catalog; only the message logs of
+        threads with matching messages are read.
         """
         relevant_threads = []
         query_words = set(query.lower().split())
-
-        # Get conversation store path using existing method
-        store_path = self.get_conversation_store_path()
+        store = self.thread_store
 
         try:
-            # Iterate through thread files (stored as JSON)
-            for thread_file in store_path.glob("thread-*.json"):
+            catalog = store.get_catalog()
+            now = datetime.utcnow()
+
+            # Recency alone (< 15 days old) scores above the inclusion threshold
+            candidates = store.find_threads(query_words)
+            recency = {}
+            for thread_id, entry in list(catalog.items()):
+                updated_at = entry.get('updated_at', '')
+                if not updated_at:
+                    continue
                 try:
-                    thread_data = json.loads(thread_file.read_text())
-                except (json.JSONDecodeError, Exception):
+                    updated_time = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+                except (ValueError, TypeError):
                     continue
-
-                if not thread_data:
+                days_old = (now - updated_time.replace(tzinfo=None)).days
+                recency[thread_id] = max(0, 0.2 - (days_old / 30) * 0.2)  # Decay over a month
+                if recency[thread_id] > 0.1:
+                    candidates.add(thread_id)
+
+            for thread_id in sorted(candidates, reverse=True):
+                entry = catalog.get(thread_id)
+                if not entry:
                     continue
-
-                thread_id = thread_data.get('id', '')
-
-                # Search title and messages
-                title = thread_data.get('title', '').lower()
-                messages = thread_data.get('messages', [])
+                message_count = entry['message_count']
 
                 # Calculate relevance score
                 score = 0.0
 
                 # Title keyword match
-                title_words = set(title.split())
-                title_overlap = len(query_words & title_words)
+                title_overlap = len(query_words & store.title_tokens(thread_id))
                 if title_overlap > 0:
                     score += min(title_overlap / max(len(query_words), 1), 1.0) * 0.3
 
-                # Message content matches (cap contribution at 0.5 total)
-                matching_messages = []
-                message_score_total = 0.0
-                for msg in messages[-20:]:  # Only check last 20 messages
-                    content = msg.get('content', '').lower()
-                    content_words = set(content.split())
-                    overlap = len(query_words & content_words)
-                    if overlap > 0:
-                        msg_score = min(overlap / max(len(query_words), 1), 1.0) * 0.1
-                        message_score_total += msg_score
-                        matching_messages.append({
-                            'role': msg.get('role', 'unknown'),
-                            'content': msg.get('content', '')[:200],  # Truncate
-                            'timestamp': msg.get('timestamp', '')
-                        })
-                # Cap message contribution to prevent unbounded scores
+                # Message content matches in the last `window` messages (cap contribution at 0.5 total)
+                window_start = max(0, message_count - window)
+                matches = store.match_positions(thread_id, query_words, start=window_start)
+                message_score_total = sum(
+                    min(overlap / max(len(query_words), 1), 1.0) * 0.1
+                    for overlap in matches.values()
+                )
                 score += min(message_score_total, 0.5)
 
                 # Recency bonus
-                updated_at = thread_data.get('updated_at', '')
-                if updated_at:
-                    try:
-                        updated_time = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                        days_old = (datetime.utcnow() - updated_time.replace(tzinfo=None)).days
-                        recency_score = max(0, 0.2 - (days_old / 30) * 0.2)  # Decay over a month
-                        score += recency_score
-                    except (ValueError, TypeError):
-                        pass
+                score += recency.get(thread_id, 0)
 
                 if score > 0.1:  # Only include if meaningful match
+                    matching_messages = []
+                    if matches:
+                        first = min(matches)
+                        for offset, msg in enumerate(store.read_messages(thread_id, start=first)):
+                            if first + offset in matches:
+                                matching_messages.append({
+                                    'role': msg.get('role', 'unknown'),
+                                    'content': msg.get('content', '')[:200],  # Truncate
+                                    'timestamp': msg.get('timestamp', '')
+                                })
+                                if len(matching_messages) >= 3:
+                                    break
+
                     relevant_threads.append({
                         'thread_id': thread_id,
-                        'title': thread_data.get('title', ''),
-                        'message_count': len(messages),
-                        'matching_messages': matching_messages[:3],  # Top 3 matching
+                        'title': entry.get('title', ''),
+                        'message_count': message_count,
+                        'matching_messages': matching_messages,  # Top 3 matching
                         'relevance_score': round(score, 3)
                     })
 
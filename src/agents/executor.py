@@ -34,7 +34,7 @@ from .worker import WorkerAgent, create_worker_agent
 from ..core.llm import LLMBackend, LLMBackendFactory
 from ..core.skills import SkillRegistry
 from ..core.scheduler import WorkScheduler
-from ..core.hook import HookManager
+from ..core.registry import get_hook_manager
 
 logger = logging.getLogger(__name__)
 
@@ -391,7 +391,7 @@ class CorporationExecutor:
         self.scheduler = WorkScheduler(corp_path, self.skill_registry)
 
         # Shared hook manager for cache control
-        self.hook_manager = HookManager(corp_path)
+        self.hook_manager = get_hook_manager(corp_path)
 
         # Agent instances (also registered with scheduler)
         self.coo: Optional[COOAgent] = None
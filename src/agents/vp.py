@@ -24,7 +24,7 @@ from .base import BaseAgent, AgentIdentity
 from ..core.molecule import MoleculeStep, StepStatus
 from ..core.hook import WorkItem, WorkItemPriority
 from ..core.channel import MessagePriority
-from ..core.gate import GateKeeper
+from ..core.registry import get_gate_keeper
 from ..core.pool import PoolManager
 from ..core.memory import ContextType
 
@@ -64,7 +64,7 @@ class VPAgent(BaseAgent):
         super().__init__(identity, corp_path)
 
         # Initialize gate keeper for quality gate management
-        self.gate_keeper = GateKeeper(self.corp_path)
+        self.gate_keeper = get_gate_keeper(self.corp_path)
 
         # Initialize pool manager for worker pool oversight
         self.pool_manager = PoolManager(self.corp_path)
@@ -30,7 +30,7 @@ from .base import BaseAgent, AgentIdentity
 from ..core.hook import WorkItem, WorkItemPriority
 from ..core.memory import ContextType
 from ..core.llm import LLMResponse
-from ..core.gate import GateKeeper
+from ..core.registry import get_gate_keeper
 from ..core.pool import PoolManager
 
 logger = logging.getLogger(__name__)
@@ -80,7 +80,7 @@ class WorkerAgent(BaseAgent):
         self.pool_manager = PoolManager(self.corp_path)
 
         # Initialize gate keeper for submitting completed work
-        self.gate_keeper = GateKeeper(self.corp_path)
+        self.gate_keeper = get_gate_keeper(self.corp_path)
 
     def process_work(self, work_item: WorkItem) -> Dict[str, Any]:
         """
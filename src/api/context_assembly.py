@@ -0,0 +1,162 @@
+"""
+Parallel Context Assembly for COO Prompts
+
+Before the COO's LLM call, several independent lookups build the prompt
+context: thread history, system state, organizational context, query-aware
+memory retrieval and lessons from similar past work. Run one after another
+they add up; run concurrently the wait is bounded by the slowest one.
+
+Each lookup is a ContextSource with:
+- a timeout - a slow source is abandoned and its default used instead,
+  so one stuck lookup cannot hold up the CEO's reply
+- an optional character budget - oversized context is truncated
+- a default value used on timeout or error
+
+The assembler reports per-source latency and status so callers can
+surface them (e.g. in response metadata) and spot the slow sources.
+
+Usage:
+    assembler = ContextAssembler(storage)
+    result = await assembler.assemble([
+        ContextSource('org_context', coo.get_context_summary_for_llm, timeout=3.0, default=''),
+        ContextSource('lessons', get_lessons, args=(message,), timeout=3.0, default=''),
+    ])
+    org_context = result.values['org_context']
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default per-source timeout in seconds
+DEFAULT_SOURCE_TIMEOUT = 5.0
+
+# Overall deadline for assembling all sources
+DEFAULT_ASSEMBLY_DEADLINE = 20.0
+
+
+@dataclass
+class ContextSource:
+    """
+    One independent context lookup.
+
+    `func` is either a blocking callable (run on the storage pool) or an
+    async callable (awaited directly).
+    """
+    name: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    timeout: float = DEFAULT_SOURCE_TIMEOUT
+    default: Any = None
+    max_chars: Optional[int] = None  # Truncate string results beyond this
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one context source"""
+    name: str
+    status: str  # ok, timeout, error
+    elapsed_ms: float
+    truncated: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {'status': self.status, 'ms': round(self.elapsed_ms, 1)}
+        if self.truncated:
+            result['truncated'] = True
+        if self.error:
+            result['error'] = self.error
+        return result
+
+
+@dataclass
+class AssembledContext:
+    """Values and timings from a context assembly run"""
+    values: Dict[str, Any]
+    results: Dict[str, SourceResult]
+    total_ms: float
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Per-source latency and status, for response metadata"""
+        return {
+            'total_ms': round(self.total_ms, 1),
+            'sources': {name: r.to_dict() for name, r in self.results.items()},
+        }
+
+    @property
+    def degraded(self) -> List[str]:
+        """Names of sources that fell back to their default"""
+        return [name for name, r in self.results.items() if r.status != 'ok']
+
+
+class ContextAssembler:
+    """
+    Runs context sources concurrently with per-source timeouts.
+
+    Args:
+        storage: AsyncStorageFacade used to run blocking sources off the
+            event loop
+        deadline: Overall cap in seconds; no source waits longer than this
+    """
+
+    def __init__(self, storage, deadline: float = DEFAULT_ASSEMBLY_DEADLINE):
+        self.storage = storage
+        self.deadline = deadline
+
+    async def assemble(self, sources: List[ContextSource]) -> AssembledContext:
+        """Run all sources concurrently and collect their values"""
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*[self._run_source(source) for source in sources])
+
+        values = {}
+        results = {}
+        for source, (value, result) in zip(sources, outcomes):
+            values[source.name] = value
+            results[source.name] = result
+
+        assembled = AssembledContext(
+            values=values,
+            results=results,
+            total_ms=(time.perf_counter() - start) * 1000
+        )
+        if assembled.degraded:
+            logger.warning(f"Context assembly degraded: {assembled.get_metadata()}")
+        else:
+            logger.debug(f"Context assembly: {assembled.get_metadata()}")
+        return assembled
+
+    async def _run_source(self, source: ContextSource) -> Tuple[Any, SourceResult]:
+        start = time.perf_counter()
+        timeout = min(source.timeout, self.deadline)
+
+        try:
+            if inspect.iscoroutinefunction(source.func):
+                call = source.func(*source.args, **source.kwargs)
+            else:
+                call = self.storage.run(source.func, *source.args, **source.kwargs)
+            value = await asyncio.wait_for(call, timeout=timeout)
+        except asyncio.TimeoutError:
+            # The worker thread finishes in the background; its result is dropped
+            return source.default, SourceResult(
+                source.name, 'timeout', (time.perf_counter() - start) * 1000
+            )
+        except Exception as e:
+            logger.warning(f"Context source '{source.name}' failed: {e}")
+            return source.default, SourceResult(
+                source.name, 'error', (time.perf_counter() - start) * 1000, error=str(e)[:200]
+            )
+
+        truncated = False
+        if source.max_chars is not None and isinstance(value, str) and len(value) > source.max_chars:
+            value = value[:source.max_chars] + "\n[...truncated]"
+            truncated = True
+
+        return value, SourceResult(
+            source.name, 'ok', (time.perf_counter() - start) * 1000, truncated=truncated
+        )
@@ -0,0 +1,357 @@
+"""
+Materialized Dashboard Snapshot
+
+Keeps the `/api/dashboard` document in memory instead of rebuilding it
+from disk on every request. The document is split into sections, each
+with its own loader:
+
+- hooks:     agents_active and queue_depth (queued + in-progress work)
+- molecules: active projects
+- gates:     pending gate submissions
+- activity:  recent bead ledger entries
+
+Molecule lifecycle callbacks (the emit_* hooks in main.py) update the
+projects section in place. Changes that do not carry enough information
+to apply directly (new gate submissions, work delegated to hooks) mark
+the affected sections dirty; they are reloaded in the background on the
+next read. Sections also expire after `max_age_seconds` so changes made
+by other processes (CLI workers writing to the corp directory) are
+picked up.
+
+Every change bumps the snapshot version. The serialized document and its
+ETag are cached, so reads are O(1), and each change produces a delta
+that is handed to registered listeners (the activity WebSocket).
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sections of the dashboard document, each refreshed by its own loader
+SECTIONS = ('hooks', 'molecules', 'gates', 'activity')
+
+# Reload sections at least this often to pick up out-of-process changes
+DEFAULT_MAX_AGE_SECONDS = 30.0
+
+# Dashboard list sizes (match the original endpoint)
+DASHBOARD_PROJECTS = 10
+DASHBOARD_GATES = 5
+DASHBOARD_ACTIVITY = 20
+
+# Total agents shown on the dashboard
+AGENTS_TOTAL = 15  # TODO: Get from config
+
+
+def project_entry(molecule) -> Dict[str, Any]:
+    """Dashboard project entry for a molecule"""
+    progress = molecule.get_progress()
+    return {
+        'id': molecule.id,
+        'name': molecule.name,
+        'status': molecule.status.value,
+        'progress': progress['percent_complete'],
+        'priority': molecule.priority,
+        'workers_active': len([s for s in molecule.steps if s.status.value == 'in_progress']),
+        'current_phase': molecule.steps[0].name if molecule.steps else None,
+        'created_at': molecule.created_at,
+    }
+
+
+def gate_entry(submission) -> Dict[str, Any]:
+    """Dashboard pending-gate entry for a gate submission"""
+    return {
+        'id': submission.gate_id,
+        'submission_id': submission.id,
+        'title': submission.gate_id,  # TODO: Get gate title
+        'submitted_at': submission.submitted_at,
+        'submitted_by': submission.submitted_by,
+    }
+
+
+def activity_entry(bead) -> Dict[str, Any]:
+    """Dashboard activity entry for a bead ledger entry"""
+    return {
+        'id': bead.id,
+        'action': bead.action,
+        'agent_id': bead.agent_id,
+        'message': bead.message,
+        'timestamp': bead.timestamp,
+    }
+
+
+def hook_totals(hooks: Iterable) -> Dict[str, int]:
+    """Agent count and total queue depth across hooks"""
+    agents = 0
+    queue_depth = 0
+    for hook in hooks:
+        agents += 1
+        stats = hook.get_stats()
+        queue_depth += stats.get('queued', 0) + stats.get('in_progress', 0)
+    return {'agents_active': agents, 'queue_depth': queue_depth}
+
+
+class DashboardSnapshot:
+    """
+    In-memory dashboard document with incremental updates.
+
+    Args:
+        loaders: Section name -> zero-argument callable returning the
+            section's raw data (list of hooks, molecules, submissions or
+            beads). Loaders do blocking I/O; call `refresh()` off the
+            event loop.
+        max_age_seconds: Sections older than this are reloaded on the
+            next refresh
+    """
+
+    # Section name -> attribute holding its state
+    _SECTION_ATTRS = {
+        'hooks': '_hooks',
+        'molecules': '_projects',
+        'gates': '_gates',
+        'activity': '_activity',
+    }
+
+    def __init__(
+        self,
+        loaders: Dict[str, Callable[[], Any]],
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS
+    ):
+        self._loaders = loaders
+        self.max_age_seconds = max_age_seconds
+
+        self._lock = threading.RLock()
+        self._instance = uuid.uuid4().hex[:8]  # Keeps ETags unique across restarts
+        self._version = 0
+
+        self._hooks: Dict[str, int] = {'agents_active': 0, 'queue_depth': 0}
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        self._gates: Dict[str, Dict[str, Any]] = {}
+        self._activity: List[Dict[str, Any]] = []
+
+        self._loaded_at: Dict[str, float] = {}
+        self._dirty = set(SECTIONS)
+
+        self._body: Optional[bytes] = None
+        self._document: Optional[Dict[str, Any]] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def etag(self) -> str:
+        return f'"{self._instance}-{self._version}"'
+
+    def is_loaded(self) -> bool:
+        """Whether every section has been loaded at least once"""
+        return len(self._loaded_at) == len(SECTIONS)
+
+    def stale_sections(self, now: Optional[float] = None) -> List[str]:
+        """Sections that are dirty or older than max_age_seconds"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return [
+                s for s in SECTIONS
+                if s in self._dirty or now - self._loaded_at.get(s, float('-inf')) > self.max_age_seconds
+            ]
+
+    def get(self) -> Tuple[bytes, str]:
+        """Get the serialized document and its ETag"""
+        with self._lock:
+            if self._body is None:
+                self._render()
+            return self._body, self.etag
+
+    def get_document(self) -> Dict[str, Any]:
+        """Get the document as a dict (do not mutate)"""
+        with self._lock:
+            if self._document is None:
+                self._render()
+            return self._document
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Get just the KPI metrics"""
+        return self.get_document()['metrics']
+
+    def _render(self) -> None:
+        """Rebuild the cached document from section state (lock held)"""
+        projects = sorted(self._projects.values(), key=lambda p: p['created_at'] or '', reverse=True)
+        self._document = {
+            'metrics': self._metrics(),
+            'projects': projects[:DASHBOARD_PROJECTS],
+            'gates_pending': list(self._gates.values())[:DASHBOARD_GATES],
+            'activity': self._activity[:DASHBOARD_ACTIVITY],
+            'alerts': [],  # TODO: Get from monitor
+            'version': self._version,
+        }
+        self._body = json.dumps(self._document, default=str).encode('utf-8')
+
+    def _metrics(self) -> Dict[str, int]:
+        return {
+            'agents_active': self._hooks['agents_active'],
+            'agents_total': AGENTS_TOTAL,
+            'projects_active': len(self._projects),
+            'gates_pending': len(self._gates),
+            'queue_depth': self._hooks['queue_depth'],
+        }
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    def apply_molecule(self, molecule) -> None:
+        """Upsert a molecule's project entry, or drop it once completed"""
+        with self._lock:
+            if molecule.status.value == 'completed':
+                if self._projects.pop(molecule.id, None) is None:
+                    return
+                change = {'op': 'remove', 'section': 'projects', 'id': molecule.id}
+            else:
+                entry = project_entry(molecule)
+                if self._projects.get(molecule.id) == entry:
+                    return
+                self._projects[molecule.id] = entry
+                change = {'op': 'upsert', 'section': 'projects', 'id': molecule.id, 'value': entry}
+            self._commit([change])
+
+    def remove_pending_gate(self, submission_id: str) -> None:
+        """Drop a gate submission that has been reviewed"""
+        with self._lock:
+            if self._gates.pop(submission_id, None) is None:
+                return
+            self._commit([{'op': 'remove', 'section': 'gates_pending', 'id': submission_id}])
+
+    def invalidate(self, *sections: str) -> None:
+        """Mark sections for reload on the next refresh"""
+        with self._lock:
+            self._dirty.update(sections or SECTIONS)
+
+    def _commit(self, changes: List[Dict[str, Any]]) -> None:
+        """Bump the version, drop the cached document and notify listeners (lock held)"""
+        metrics_before = self._document['metrics'] if self._document else None
+        self._version += 1
+        self._render()
+        if self._document['metrics'] != metrics_before:
+            changes = changes + [{'op': 'replace', 'section': 'metrics', 'value': self._document['metrics']}]
+
+        delta = {
+            'type': 'dashboard.delta',
+            'version': self._version,
+            'etag': self.etag,
+            'changes': changes,
+        }
+        for listener in list(self._listeners):
+            try:
+                listener(delta)
+            except Exception as e:
+                logger.warning(f"Dashboard listener failed: {e}")
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def refresh(self, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Reload sections from their loaders (blocking I/O).
+
+        Args:
+            sections: Sections to reload; defaults to the stale ones
+
+        Returns:
+            Names of sections whose content changed
+        """
+        sections = list(sections) if sections is not None else self.stale_sections()
+        if not sections:
+            return []
+
+        loaded = {}
+        for section in sections:
+            with self._lock:
+                self._dirty.discard(section)
+            try:
+                loaded[section] = self._loaders[section]()
+            except Exception as e:
+                logger.warning(f"Dashboard section '{section}' failed to load: {e}")
+                with self._lock:
+                    self._dirty.add(section)
+
+        now = time.monotonic()
+        with self._lock:
+            changed = []
+            changes = []
+            for section, data in loaded.items():
+                self._loaded_at[section] = now
+                if self._replace_section(section, data):
+                    changed.append(section)
+                    change = self._section_change(section)
+                    if change:
+                        changes.append(change)
+            if changed or self._document is None:
+                self._commit(changes)
+            return changed
+
+    def _replace_section(self, section: str, data: Any) -> bool:
+        """Replace one section's state from loader output. Returns True if it changed (lock held)"""
+        if section == 'hooks':
+            new = hook_totals(data)
+            current = self._hooks
+        elif section == 'molecules':
+            new = {m.id: project_entry(m) for m in data}
+            current = self._projects
+        elif section == 'gates':
+            new = {s.id: gate_entry(s) for s in data}
+            current = self._gates
+        elif section == 'activity':
+            new = [activity_entry(b) for b in data]
+            current = self._activity
+        else:
+            raise ValueError(f"Unknown dashboard section: {section}")
+
+        if new == current:
+            return False
+        setattr(self, self._SECTION_ATTRS[section], new)
+        return True
+
+    def _section_change(self, section: str) -> Optional[Dict[str, Any]]:
+        """Delta entry replacing a document list after a section reload (lock held)"""
+        if section == 'molecules':
+            projects = sorted(self._projects.values(), key=lambda p: p['created_at'] or '', reverse=True)
+            return {'op': 'replace', 'section': 'projects', 'value': projects[:DASHBOARD_PROJECTS]}
+        if section == 'gates':
+            return {'op': 'replace', 'section': 'gates_pending', 'value': list(self._gates.values())[:DASHBOARD_GATES]}
+        if section == 'activity':
+            return {'op': 'replace', 'section': 'activity', 'value': self._activity[:DASHBOARD_ACTIVITY]}
+        # Hook totals only feed the metrics, which _commit diffs itself
+        return None
+
+    # =========================================================================
+    # Listeners
+    # =========================================================================
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callable that receives every delta"""
+        self._listeners.append(listener)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot state for diagnostics"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'version': self._version,
+                'etag': self.etag,
+                'dirty': sorted(self._dirty),
+                'section_age_seconds': {
+                    s: round(now - t, 1) for s, t in self._loaded_at.items()
+                },
+                'bytes': len(self._body) if self._body else 0,
+            }
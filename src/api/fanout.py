@@ -0,0 +1,131 @@
+"""
+Per-Client WebSocket Fan-Out
+
+The activity broadcaster used to `await asyncio.gather(send...)` to every
+connection for each event, so a burst of events (a swarm molecule
+scattering many steps) was sent one frame at a time, and one slow socket
+held up delivery to everyone.
+
+Each client now gets a `ClientChannel`: a bounded queue drained by its
+own sender task.
+
+- Publishing is a non-blocking append per client and never awaits a
+  socket. It is safe from any thread.
+- When a client's queue is full the oldest message is dropped, so a
+  stalled client costs bounded memory and gets the most recent state.
+  Drops are counted.
+- The sender waits `batch_window` seconds after the first message of a
+  burst and then sends everything queued as one frame
+  (`{"type": "batch", "messages": [...]}`); a lone message is sent as-is.
+- A send that takes longer than `send_timeout` disconnects the client.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUED = 256
+DEFAULT_BATCH_WINDOW_SECONDS = 0.005
+DEFAULT_MAX_BATCH = 100
+DEFAULT_SEND_TIMEOUT_SECONDS = 10.0
+
+
+def batch_frame(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Frame for several messages sent together (a lone message is sent as-is)"""
+    if len(messages) == 1:
+        return messages[0]
+    return {"type": "batch", "messages": messages, "count": len(messages)}
+
+
+class ClientChannel:
+    """
+    Bounded, drop-oldest message queue for one client.
+
+    `put()` may be called from any thread; `get_batch()` must be awaited
+    on the event loop the channel was created on.
+    """
+
+    def __init__(self, max_queued: int = DEFAULT_MAX_QUEUED,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.max_queued = max_queued
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._loop = loop or asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self.dropped = 0
+        self.frames_sent = 0
+        self.messages_sent = 0
+
+    def put(self, message: Dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._queue) >= self.max_queued:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(message)
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._ready.set()
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._ready.set)
+            except RuntimeError:
+                pass  # Loop closed; the client is gone
+
+    async def get_batch(self, batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+                        max_batch: int = DEFAULT_MAX_BATCH) -> List[Dict[str, Any]]:
+        """Wait for a message, then return it with everything that arrives within batch_window"""
+        while True:
+            await self._ready.wait()
+            if batch_window > 0:
+                await asyncio.sleep(batch_window)
+            with self._lock:
+                batch = []
+                while self._queue and len(batch) < max_batch:
+                    batch.append(self._queue.popleft())
+                if not self._queue:
+                    self._ready.clear()
+            if batch:
+                return batch
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'queued': len(self._queue),
+            'dropped': self.dropped,
+            'frames_sent': self.frames_sent,
+            'messages_sent': self.messages_sent,
+        }
+
+
+async def run_sender(channel: ClientChannel,
+                     send: Callable[[Dict[str, Any]], Awaitable[None]],
+                     batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS,
+                     max_batch: int = DEFAULT_MAX_BATCH,
+                     send_timeout: float = DEFAULT_SEND_TIMEOUT_SECONDS) -> None:
+    """
+    Drain a channel into `send` until a send fails or times out.
+
+    Returns normally on failure so the caller can drop the client;
+    cancellation propagates.
+    """
+    while True:
+        batch = await channel.get_batch(batch_window, max_batch)
+        try:
+            await asyncio.wait_for(send(batch_frame(batch)), timeout=send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to client: {e!r}")
+            return
+        channel.frames_sent += 1
+        channel.messages_sent += len(batch)
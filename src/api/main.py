@@ -14,14 +14,15 @@ This prevents restarts when corp/, foundation/, or tests/ files change during de
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any, Deque
+from typing import Optional, List, Dict, Any, Deque, Set, Tuple
 from pathlib import Path
 from datetime import datetime
 from collections import deque
 import asyncio
+import functools
 import json
 import logging
 import re
@@ -38,15 +39,34 @@ logger = logging.getLogger(__name__)
 # AI Corp imports
 from src.agents.coo import COOAgent
 from src.core.molecule import MoleculeEngine, Molecule, MoleculeStep
-from src.core.hook import HookManager
 from src.core.gate import GateKeeper
+from src.core.registry import (
+    get_store_registry,
+    get_gate_keeper as get_shared_gate_keeper,
+    get_hook_manager as get_shared_hook_manager,
+    get_molecule_engine as get_shared_molecule_engine,
+)
 from src.core.bead import BeadLedger
 from src.core.monitor import SystemMonitor
 from src.core.forge import TheForge
 from src.core.contract import ContractManager
 from src.core.llm import LLMRequest, LLMBackendFactory
 from src.core.memory import ConversationSummarizer
+from src.core.metering import ROLLUP_DIMENSIONS, get_usage_meter
+from src.core.learning import get_learning_system
+from src.core.evolution_runner import EvolutionRunner
+from src.core.graph import EntityGraph
+from src.core.entities import EntityType
 from src.api.activity import ActivityEventTranslator, get_activity_translator
+from src.api.storage import AsyncStorageFacade, LoopBlockMiddleware, LoopBlockTracker
+from src.api.dashboard import DashboardSnapshot
+from src.api.context_assembly import ContextAssembler, ContextSource
+from src.api.streaming import event_to_dict, format_sse, stream_llm_events
+from src.api.fanout import (
+    ClientChannel, run_sender, DEFAULT_BATCH_WINDOW_SECONDS, DEFAULT_MAX_QUEUED
+)
+from src.api.ring_log import ActivityRingLog
+from src.api.pagination import DEFAULT_PAGE_SIZE, clamp_limit, decode_cursor, encode_cursor, paginate
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -64,6 +84,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-endpoint record of time spent running on the event loop
+loop_block_tracker = LoopBlockTracker()
+app.add_middleware(LoopBlockMiddleware, tracker=loop_block_tracker)
+
 
 # Custom validation error handler to log 422 errors with details
 @app.exception_handler(RequestValidationError)
@@ -180,63 +204,57 @@ class ActivityEventBroadcaster:
     - Translates raw technical events to human-readable messages
     - Aggregates rapid sequential events to reduce noise
     - Stores translated events in a ring buffer for late joiners
-    - Writes events to a log file for COO visibility (auto-truncating)
+    - Gives each client a bounded drop-oldest queue with its own sender
+      task, batching events that arrive within a few milliseconds into
+      one frame (see src/api/fanout.py)
+    - Writes events to a memory-mapped ring log for COO visibility
+      (see src/api/ring_log.py)
 
     Note: Instantiated via get_activity_broadcaster() which uses the _systems
     dict pattern consistent with other system components (COO, MoleculeEngine, etc.)
     """
 
-    def __init__(self, max_history: int = 50, max_log_lines: int = 100):
+    def __init__(self, max_history: int = 50, max_log_lines: int = 100,
+                 max_queued_per_client: int = DEFAULT_MAX_QUEUED,
+                 batch_window: float = DEFAULT_BATCH_WINDOW_SECONDS):
         """
         Initialize the broadcaster.
 
         Args:
             max_history: Number of events to retain for late joiners
-            max_log_lines: Max lines to keep in the activity log file
+            max_log_lines: Number of events kept in the activity log file
+            max_queued_per_client: Messages buffered per client before the oldest is dropped
+            batch_window: Seconds to wait after the first message of a burst before sending
         """
-        self._connections: List[WebSocket] = []
+        self._clients: Dict[WebSocket, ClientChannel] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
         self._event_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
         self._max_history = max_history
         self._max_log_lines = max_log_lines
-        self._event_queue: Optional[asyncio.Queue] = None  # Lazy init in async context
+        self._max_queued_per_client = max_queued_per_client
+        self._batch_window = batch_window
         self._translator: Optional[ActivityEventTranslator] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the clients live on
 
         # Activity log file for COO visibility
-        self._log_file: Optional[Path] = None
-        self._log_line_count: int = 0
+        self._activity_log: Optional[ActivityRingLog] = None
         self._init_activity_log()
 
         logger.info("ActivityEventBroadcaster initialized")
 
     def _init_activity_log(self) -> None:
-        """Initialize the activity log file."""
+        """Open (or create) the activity ring log."""
         try:
-            corp_path = get_corp_path()
-            live_dir = corp_path / "live"
-            live_dir.mkdir(parents=True, exist_ok=True)
-            self._log_file = live_dir / "activity.log"
-
-            # Count existing lines if file exists
-            if self._log_file.exists():
-                with open(self._log_file, 'r') as f:
-                    self._log_line_count = sum(1 for _ in f)
-            else:
-                # Create with header
-                with open(self._log_file, 'w') as f:
-                    f.write("# AI Corp Activity Log (auto-truncating, last ~100 events)\n")
-                    f.write(f"# Started: {datetime.utcnow().isoformat()}Z\n")
-                    f.write("# Format: [TIMESTAMP] EVENT_TYPE | message\n")
-                    f.write("#" + "=" * 70 + "\n")
-                self._log_line_count = 4
-
-            logger.info(f"Activity log initialized: {self._log_file}")
+            live_dir = get_corp_path() / "live"
+            self._activity_log = ActivityRingLog(live_dir / "activity.log", capacity=self._max_log_lines)
+            logger.info(f"Activity log initialized: {self._activity_log.path}")
         except Exception as e:
             logger.warning(f"Could not initialize activity log: {e}")
-            self._log_file = None
+            self._activity_log = None
 
     def _write_to_log(self, translated_event: Dict[str, Any]) -> None:
         """Write a translated event to the activity log file."""
-        if not self._log_file:
+        if not self._activity_log:
             return
 
         try:
@@ -246,49 +264,12 @@ class ActivityEventBroadcaster:
             message = translated_event.get('human_message', translated_event.get('message', ''))
             molecule_id = translated_event.get('molecule_id', '')
 
-            # Build log line
             mol_prefix = f"[{molecule_id}] " if molecule_id else ""
-            log_line = f"[{timestamp}] {event_type:20} | {mol_prefix}{message}\n"
-
-            # Append to file
-            with open(self._log_file, 'a') as f:
-                f.write(log_line)
-            self._log_line_count += 1
-
-            # Truncate if needed (keep last max_log_lines/2 when we exceed max)
-            if self._log_line_count > self._max_log_lines:
-                self._truncate_log()
+            self._activity_log.append(f"[{timestamp}] {event_type:20} | {mol_prefix}{message}")
 
         except Exception as e:
             logger.warning(f"Could not write to activity log: {e}")
 
-    def _truncate_log(self) -> None:
-        """Truncate log file to keep only recent events."""
-        if not self._log_file or not self._log_file.exists():
-            return
-
-        try:
-            # Read all lines
-            with open(self._log_file, 'r') as f:
-                lines = f.readlines()
-
-            # Keep header (first 4 lines) + last N lines
-            keep_count = self._max_log_lines // 2
-            header_lines = [l for l in lines[:4] if l.startswith('#')]
-            event_lines = [l for l in lines if not l.startswith('#')]
-
-            # Write truncated file
-            with open(self._log_file, 'w') as f:
-                f.writelines(header_lines)
-                f.write(f"# ... truncated at {datetime.utcnow().isoformat()}Z ...\n")
-                f.writelines(event_lines[-keep_count:])
-
-            self._log_line_count = len(header_lines) + 1 + keep_count
-            logger.debug(f"Activity log truncated to {self._log_line_count} lines")
-
-        except Exception as e:
-            logger.warning(f"Could not truncate activity log: {e}")
-
     @property
     def translator(self) -> ActivityEventTranslator:
         """Get or create the event translator."""
@@ -296,24 +277,14 @@ class ActivityEventBroadcaster:
             self._translator = get_activity_translator()
         return self._translator
 
-    def _ensure_queue(self) -> None:
-        """Lazily initialize the async queue in the right event loop context."""
-        if self._event_queue is None:
-            try:
-                self._event_queue = asyncio.Queue()
-            except RuntimeError:
-                # No event loop - we're in a sync context, queue will be created later
-                pass
-
     async def subscribe(self, websocket: WebSocket) -> None:
         """
         Subscribe a WebSocket connection to activity events.
 
-        Sends recent event history on connection for context.
+        Sends recent event history on connection for context, then starts
+        the client's sender task.
         """
         await websocket.accept()
-        self._connections.append(websocket)
-        logger.info(f"Activity feed: client connected ({len(self._connections)} total)")
 
         # Send recent history so client has context (already translated)
         if self._event_history:
@@ -326,11 +297,30 @@ class ActivityEventBroadcaster:
             except Exception as e:
                 logger.warning(f"Failed to send history to new client: {e}")
 
+        self._loop = asyncio.get_running_loop()
+        channel = ClientChannel(max_queued=self._max_queued_per_client)
+        self._clients[websocket] = channel
+        self._senders[websocket] = asyncio.create_task(self._run_sender(websocket, channel))
+        logger.info(f"Activity feed: client connected ({len(self._clients)} total)")
+
+    async def _run_sender(self, websocket: WebSocket, channel: ClientChannel) -> None:
+        """Deliver a client's queue until its socket fails."""
+        await run_sender(channel, websocket.send_json, batch_window=self._batch_window)
+        self._senders.pop(websocket, None)  # Finished on its own; don't cancel ourselves
+        self.unsubscribe(websocket)
+
     def unsubscribe(self, websocket: WebSocket) -> None:
         """Unsubscribe a WebSocket connection from activity events."""
-        if websocket in self._connections:
-            self._connections.remove(websocket)
-            logger.info(f"Activity feed: client disconnected ({len(self._connections)} remaining)")
+        if self._clients.pop(websocket, None) is not None:
+            logger.info(f"Activity feed: client disconnected ({len(self._clients)} remaining)")
+        sender = self._senders.pop(websocket, None)
+        if sender:
+            sender.cancel()
+
+    def _publish(self, message: Dict[str, Any]) -> None:
+        """Queue a message for every client (never blocks on a socket)."""
+        for channel in list(self._clients.values()):
+            channel.put(message)
 
     def broadcast_sync(self, event_type: str, data: Dict[str, Any],
                        molecule_id: Optional[str] = None,
@@ -356,13 +346,7 @@ class ActivityEventBroadcaster:
             # Write to activity log file for COO visibility
             self._write_to_log(translated_dict)
 
-            if self._connections:
-                self._ensure_queue()
-                if self._event_queue:
-                    try:
-                        self._event_queue.put_nowait(translated_dict)
-                    except Exception as e:
-                        logger.warning(f"Failed to queue event: {e}")
+            self._publish(translated_dict)
         # else: event is buffered for aggregation, will be flushed later
 
         logger.debug(f"Activity event queued: {event_type} (molecule={molecule_id})")
@@ -373,7 +357,7 @@ class ActivityEventBroadcaster:
                         step_id: Optional[str] = None,
                         gate_id: Optional[str] = None) -> str:
         """
-        Async broadcast method - sends event immediately to all clients.
+        Async broadcast method - queues event for all clients without aggregation.
 
         Events are translated to human-readable format.
         Returns the event_id for tracking.
@@ -390,8 +374,7 @@ class ActivityEventBroadcaster:
         # Write to activity log file for COO visibility
         self._write_to_log(translated_dict)
 
-        # Broadcast to all connected clients
-        await self._send_to_all(translated_dict)
+        self._publish(translated_dict)
 
         logger.debug(f"Activity event broadcast: {event_type} (molecule={molecule_id})")
         return raw_event['event_id']
@@ -411,37 +394,6 @@ class ActivityEventBroadcaster:
             "data": data
         }
 
-    async def _send_to_all(self, event: Dict[str, Any]) -> None:
-        """Send event to all connected clients, handling failures gracefully."""
-        if not self._connections:
-            return
-
-        # Iterate over a copy to safely handle disconnections
-        disconnected: List[WebSocket] = []
-
-        # Use asyncio.gather for parallel sends (more efficient)
-        async def send_to_one(ws: WebSocket) -> Optional[WebSocket]:
-            try:
-                await ws.send_json(event)
-                return None
-            except Exception as e:
-                logger.warning(f"Failed to send to client: {e}")
-                return ws
-
-        results = await asyncio.gather(
-            *[send_to_one(ws) for ws in self._connections],
-            return_exceptions=True
-        )
-
-        # Collect disconnected clients
-        for result in results:
-            if isinstance(result, WebSocket):
-                disconnected.append(result)
-
-        # Clean up disconnected clients
-        for ws in disconnected:
-            self.unsubscribe(ws)
-
     def _on_aggregated_event_ready(self, translated_event) -> None:
         """
         Callback when an aggregated event is ready to be sent.
@@ -450,38 +402,17 @@ class ActivityEventBroadcaster:
         """
         translated_dict = translated_event.to_dict()
         self._event_history.append(translated_dict)
-        self._ensure_queue()
-        if self._event_queue:
-            try:
-                self._event_queue.put_nowait(translated_dict)
-            except Exception as e:
-                logger.warning(f"Failed to queue aggregated event: {e}")
+        self._publish(translated_dict)
 
     async def process_queue(self) -> None:
         """
-        Process queued events from sync broadcasts.
+        Flush any expired aggregated events from the translator.
 
-        Also flushes any expired aggregated events from the translator.
-        This should be called periodically or run as a background task.
+        Delivery itself happens in each client's sender task; this should
+        be called periodically or run as a background task.
         """
-        self._ensure_queue()
-
-        # First, check for expired aggregations and flush them
         self.translator.check_and_flush_expired(callback=self._on_aggregated_event_ready)
 
-        # Now process the queue
-        if not self._event_queue:
-            return
-
-        while not self._event_queue.empty():
-            try:
-                event = self._event_queue.get_nowait()
-                await self._send_to_all(event)
-            except asyncio.QueueEmpty:
-                break
-            except Exception as e:
-                logger.warning(f"Error processing event queue: {e}")
-
     def flush_aggregations(self) -> List[Dict[str, Any]]:
         """
         Force flush all pending aggregated events.
@@ -501,6 +432,32 @@ class ActivityEventBroadcaster:
         self.translator.flush_all_pending(callback=on_flush)
         return flushed
 
+    def push_sync(self, message: Dict[str, Any]) -> None:
+        """
+        Queue a non-activity message (e.g. a dashboard delta) for all clients.
+
+        Unlike broadcast_sync, the message is sent as-is: it is not
+        translated, written to the activity log or kept in history.
+
+        Safe from any thread: off the event loop, publishing is handed to
+        the loop with call_soon_threadsafe, so the client table is only
+        touched there.
+        """
+        loop = self._loop
+        if loop is None:
+            return  # No client has connected yet
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._publish(message)
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish, message)
+        except RuntimeError:
+            pass  # Loop closed; nobody is listening
+
     def get_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get recent event history (translated events)."""
         history = list(self._event_history)
@@ -510,7 +467,18 @@ class ActivityEventBroadcaster:
 
     def get_connection_count(self) -> int:
         """Get number of connected clients."""
-        return len(self._connections)
+        return len(self._clients)
+
+    def get_delivery_stats(self) -> Dict[str, Any]:
+        """Per-client queue depth, drops and batching."""
+        clients = [channel.get_stats() for channel in list(self._clients.values())]
+        frames = sum(c['frames_sent'] for c in clients)
+        return {
+            'clients': clients,
+            'dropped': sum(c['dropped'] for c in clients),
+            'avg_messages_per_frame': round(sum(c['messages_sent'] for c in clients) / frames, 2) if frames else 0.0,
+            'activity_log': self._activity_log.get_stats() if self._activity_log else None,
+        }
 
     def clear_history(self) -> None:
         """Clear event history (for testing)."""
@@ -531,8 +499,24 @@ def get_activity_broadcaster() -> ActivityEventBroadcaster:
 # =============================================================================
 
 
+def _update_dashboard(molecule: Optional['Molecule'] = None, invalidate: tuple = (),
+                      reviewed_submission_id: Optional[str] = None) -> None:
+    """Apply a lifecycle change to the dashboard snapshot (never raises)."""
+    try:
+        snapshot = get_dashboard_snapshot()
+        if molecule is not None:
+            snapshot.apply_molecule(molecule)
+        if reviewed_submission_id:
+            snapshot.remove_pending_gate(reviewed_submission_id)
+        if invalidate:
+            snapshot.invalidate(*invalidate)
+    except Exception as e:
+        logger.debug(f"Could not update dashboard snapshot: {e}")
+
+
 def emit_molecule_created(molecule: 'Molecule') -> None:
     """Emit event when a molecule is created."""
+    _update_dashboard(molecule)
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="molecule.created",
@@ -549,6 +533,7 @@ def emit_molecule_created(molecule: 'Molecule') -> None:
 
 def emit_molecule_started(molecule: 'Molecule') -> None:
     """Emit event when a molecule starts execution."""
+    _update_dashboard(molecule)
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="molecule.started",
@@ -563,6 +548,7 @@ def emit_molecule_started(molecule: 'Molecule') -> None:
 
 def emit_step_started(molecule: 'Molecule', step: 'MoleculeStep') -> None:
     """Emit event when a molecule step starts."""
+    _update_dashboard(molecule, invalidate=('hooks',))
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="molecule.step.started",
@@ -580,6 +566,7 @@ def emit_step_started(molecule: 'Molecule', step: 'MoleculeStep') -> None:
 def emit_step_completed(molecule: 'Molecule', step: 'MoleculeStep',
                         result: Optional[Dict[str, Any]] = None) -> None:
     """Emit event when a molecule step completes."""
+    _update_dashboard(molecule, invalidate=('hooks', 'gates') if step.is_gate else ('hooks',))
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="molecule.step.completed",
@@ -598,6 +585,7 @@ def emit_step_completed(molecule: 'Molecule', step: 'MoleculeStep',
 
 def emit_step_failed(molecule: 'Molecule', step: 'MoleculeStep', error: str) -> None:
     """Emit event when a molecule step fails."""
+    _update_dashboard(molecule, invalidate=('hooks',))
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="molecule.step.failed",
@@ -614,6 +602,7 @@ def emit_step_failed(molecule: 'Molecule', step: 'MoleculeStep', error: str) ->
 
 def emit_molecule_completed(molecule: 'Molecule') -> None:
     """Emit event when a molecule completes."""
+    _update_dashboard(molecule, invalidate=('hooks', 'activity'))
     broadcaster = get_activity_broadcaster()
     progress = molecule.get_progress()
     broadcaster.broadcast_sync(
@@ -631,6 +620,7 @@ def emit_molecule_completed(molecule: 'Molecule') -> None:
 def emit_gate_evaluation_started(gate_id: str, submission_id: str,
                                  gate_name: Optional[str] = None) -> None:
     """Emit event when gate evaluation begins."""
+    _update_dashboard(invalidate=('gates',))
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="gate.evaluation.started",
@@ -647,6 +637,7 @@ def emit_gate_approved(gate_id: str, submission_id: str,
                        reviewer: Optional[str] = None,
                        auto_approved: bool = False) -> None:
     """Emit event when gate is approved."""
+    _update_dashboard(reviewed_submission_id=submission_id)
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="gate.approved",
@@ -665,6 +656,7 @@ def emit_gate_rejected(gate_id: str, submission_id: str,
                        reviewer: Optional[str] = None,
                        reasons: Optional[List[str]] = None) -> None:
     """Emit event when gate is rejected."""
+    _update_dashboard(reviewed_submission_id=submission_id)
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="gate.rejected",
@@ -681,6 +673,7 @@ def emit_gate_rejected(gate_id: str, submission_id: str,
 def emit_work_delegated(molecule_id: str, step_name: str, department: str,
                         assigned_to: str) -> None:
     """Emit event when work is delegated."""
+    _update_dashboard(invalidate=('hooks',))
     broadcaster = get_activity_broadcaster()
     broadcaster.broadcast_sync(
         event_type="work.delegated",
@@ -877,7 +870,7 @@ def _record_molecule_outcome(molecule) -> None:
 
 def get_gate_keeper() -> GateKeeper:
     """Get the GateKeeper instance (thread-safe singleton)."""
-    return _get_or_create_system('gates', lambda: GateKeeper(get_corp_path()))
+    return _get_or_create_system('gates', lambda: get_shared_gate_keeper(get_corp_path()))
 
 
 def get_monitor() -> SystemMonitor:
@@ -895,6 +888,77 @@ def get_forge() -> TheForge:
     return _get_or_create_system('forge', lambda: TheForge(get_corp_path()))
 
 
+def get_entity_graph() -> EntityGraph:
+    """Get the EntityGraph instance (thread-safe singleton)."""
+    return _get_or_create_system('entity_graph', lambda: EntityGraph(get_corp_path()))
+
+
+def _create_dashboard_snapshot() -> DashboardSnapshot:
+    """
+    Factory for the materialized dashboard snapshot.
+
+    Section loaders read through the shared system instances; deltas are
+    pushed to activity WebSocket clients.
+    """
+    snapshot = DashboardSnapshot(loaders={
+        'hooks': lambda: get_shared_hook_manager(get_corp_path()).list_hooks(),
+        'molecules': lambda: get_molecule_engine().list_active_molecules(),
+        'gates': lambda: get_gate_keeper().get_pending_submissions(),
+        'activity': lambda: get_bead_ledger().get_recent_entries(limit=20),
+    })
+    snapshot.add_listener(get_activity_broadcaster().push_sync)
+    return snapshot
+
+
+def get_dashboard_snapshot() -> DashboardSnapshot:
+    """Get the DashboardSnapshot instance (thread-safe singleton)."""
+    return _get_or_create_system('dashboard', _create_dashboard_snapshot)
+
+
+# Background dashboard refreshes; the event loop only keeps weak references
+_dashboard_refreshes: Set[asyncio.Future] = set()
+
+
+async def get_current_dashboard() -> DashboardSnapshot:
+    """
+    Get the dashboard snapshot, reloading stale sections.
+
+    The first call waits for the initial load. After that, stale sections
+    are reloaded in the background (single-flight) and the cached
+    document is served immediately.
+    """
+    snapshot = get_dashboard_snapshot()
+    if snapshot.stale_sections():
+        refresh = get_storage().run(snapshot.refresh, key=('dashboard_refresh', id(snapshot)))
+        if snapshot.is_loaded():
+            task = asyncio.ensure_future(refresh)
+            _dashboard_refreshes.add(task)
+            task.add_done_callback(_dashboard_refreshes.discard)
+        else:
+            await refresh
+    return snapshot
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def get_storage() -> AsyncStorageFacade:
+    """Get the async storage facade (thread-safe singleton)."""
+    return _get_or_create_system('storage', AsyncStorageFacade)
+
+
+def get_context_assembler() -> ContextAssembler:
+    """Get the COO context assembler (thread-safe singleton)."""
+    return _get_or_create_system('context_assembler', lambda: ContextAssembler(get_storage()))
+
+
 def get_conversation_summarizer() -> ConversationSummarizer:
     """Get the conversation summarizer (thread-safe singleton, uses COO's LLM client)."""
     def _create_summarizer():
@@ -979,7 +1043,8 @@ def get_smart_thread_context(
             messages=messages,
             existing_summary=existing_summary if existing_summary else None,
             threshold=summarization_threshold,
-            keep_recent=max_messages
+            keep_recent=max_messages,
+            thread_id=thread_id
         )
 
         # Persist updated summary to thread storage
@@ -1004,7 +1069,8 @@ def get_smart_thread_context(
         messages=messages,
         existing_summary=summary_to_use,
         max_recent=max_messages,
-        include_important=True
+        include_important=True,
+        thread_id=thread_id
     )
     context_parts.append(smart_context)
 
@@ -1025,16 +1091,13 @@ async def startup_cleanup_orphaned_work_items():
     development/testing when the corp directory is manually cleaned.
     """
     try:
-        from src.core.hook import HookManager
-        from src.core.molecule import MoleculeEngine
-
         corp_path = get_corp_path()
         if not corp_path.exists():
             logger.info("Corp path doesn't exist yet, skipping orphan cleanup")
             return
 
-        hook_manager = HookManager(corp_path)
-        molecule_engine = MoleculeEngine(corp_path)
+        hook_manager = get_shared_hook_manager(corp_path)
+        molecule_engine = get_shared_molecule_engine(corp_path)
 
         removed = hook_manager.cleanup_orphaned_work_items(molecule_engine.molecule_exists)
 
@@ -1047,6 +1110,47 @@ async def startup_cleanup_orphaned_work_items():
         logger.warning(f"Startup cleanup failed (non-fatal): {e}")
 
 
+def get_evolution_runner() -> EvolutionRunner:
+    """Get the EvolutionRunner instance (thread-safe singleton)."""
+    return _get_or_create_system(
+        'evolution_runner', lambda: EvolutionRunner(get_learning_system(get_corp_path()))
+    )
+
+
+@app.on_event("startup")
+async def startup_evolution_runner():
+    """
+    Consume queued molecule completions in this process.
+
+    Completed molecules are only queued for learning; something has to run
+    the Evolution Daemon cycles. The API server runs them on a background
+    thread unless a dedicated `ai-corp learning daemon` already holds the
+    corp's daemon lock.
+    """
+    try:
+        corp_path = get_corp_path()
+        if not corp_path.exists():
+            logger.info("Corp path doesn't exist yet, not starting the evolution runner")
+            return
+
+        runner = get_evolution_runner()
+        holder = runner.lock_holder()
+        if holder:
+            logger.info(f"Evolution daemon already running (pid {holder}); not starting one here")
+            return
+        runner.start()
+    except Exception as e:
+        logger.warning(f"Evolution runner did not start (non-fatal): {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_evolution_runner():
+    """Stop the in-process evolution runner after its current cycle."""
+    runner = _systems.get('evolution_runner')
+    if runner is not None and runner.get_stats()['running']:
+        await asyncio.to_thread(runner.stop)
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -1068,6 +1172,7 @@ class COOMessageResponse(BaseModel):
     thread_id: str
     timestamp: str
     actions_taken: Optional[List[Dict[str, Any]]] = None
+    context_sources: Optional[Dict[str, Any]] = None  # Per-source context latency/status
 
 class DiscoveryStartRequest(BaseModel):
     initial_request: str
@@ -1109,9 +1214,162 @@ async def send_coo_message(request: COOMessageRequest):
     3. Delegate work to the agent hierarchy (VP → Director → Worker)
     """
     coo = get_coo()
+    # Thread and preference writes are disk I/O; keep them off the event loop
+    thread_id, actions_taken, delegation_context = await get_storage().run(
+        _start_coo_turn, coo, request
+    )
+
+    # Generate COO response with full tool access and delegation awareness
+    context_metadata = None
+    try:
+        coo_response = _simple_greeting_response(request.message)
+        if coo_response:
+            logger.info(f"[DEBUG] Using simple greeting response")
+        else:
+            system_prompt, prompt, context_metadata = await _build_coo_prompts(
+                coo, request, thread_id, delegation_context
+            )
+            llm_request = _build_coo_llm_request(request, system_prompt, prompt)
+
+            logger.info(f"[DEBUG] About to call Claude CLI (likely_delegation={delegation_context.get('likely_delegation')}, images={len(llm_request.images)})")
+            # Run LLM execution in thread pool to avoid blocking the async event loop
+            response = await asyncio.to_thread(coo.llm.execute, llm_request)
+
+            logger.info(f"[DEBUG] LLM response received: success={response.success}")
+
+            if response.success:
+                coo_response = await _finish_coo_response_async(
+                    coo, response.content, delegation_context, thread_id, actions_taken
+                )
+            else:
+                # Include the actual error for debugging
+                error_detail = response.error or "Unknown error"
+                coo_response = f"I apologize, I'm having trouble processing that right now. Error: {error_detail}"
+
+    except Exception as e:
+        coo_response = f"I encountered an issue: {str(e)}. Let me try to help anyway - what would you like to know?"
+
+    # Add COO response to thread
+    await get_storage().run(
+        coo.add_message_to_thread,
+        thread_id=thread_id,
+        role='assistant',
+        content=coo_response,
+        message_type='message'
+    )
+
+    return COOMessageResponse(
+        response=coo_response,
+        thread_id=thread_id,
+        timestamp=datetime.utcnow().isoformat(),
+        actions_taken=actions_taken,
+        context_sources=context_metadata
+    )
+
+
+@app.post("/api/coo/message/stream")
+async def stream_coo_message(request: COOMessageRequest):
+    """
+    Send a message to the COO and stream the response as Server-Sent Events.
+
+    Same turn as POST /api/coo/message, but text deltas, thinking and
+    tool-use events are forwarded as the COO produces them, so the first
+    words reach the CEO long before the full reply is finished.
+
+    Events:
+    - start:   {"thread_id": ...}
+    - context: per-source context latency/status
+    - content | thinking | tool_use | tool_input | tool_result | error:
+               the stream event (see src/api/streaming.py)
+    - done:    the final COOMessageResponse, after delegation handling
+
+    The reply is appended to the thread only once it is final. If the
+    client disconnects mid-stream, the LLM run is stopped and nothing is
+    appended.
+    """
+    coo = get_coo()
+    thread_id, actions_taken, delegation_context = await get_storage().run(
+        _start_coo_turn, coo, request
+    )
+
+    async def events():
+        yield format_sse('start', {'thread_id': thread_id})
+
+        context_metadata = None
+        try:
+            coo_response = _simple_greeting_response(request.message)
+            if coo_response:
+                yield format_sse('content', {'type': 'content', 'content': coo_response})
+            else:
+                system_prompt, prompt, context_metadata = await _build_coo_prompts(
+                    coo, request, thread_id, delegation_context
+                )
+                yield format_sse('context', context_metadata)
+
+                llm_request = _build_coo_llm_request(request, system_prompt, prompt)
+                backend = getattr(coo.llm, 'backend', coo.llm)
+
+                parts = []
+                final_text = None
+                error = None
+                async for event in stream_llm_events(backend, llm_request):
+                    if event.event_type == 'done':
+                        continue
+                    if event.event_type == 'content':
+                        parts.append(event.content)
+                    elif event.event_type == 'error':
+                        error = event.content
+                    elif (event.event_type == 'tool_result'
+                            and event.data.get('type') == 'result'
+                            and not event.data.get('is_error')):
+                        # The CLI's final result is the authoritative reply text
+                        final_text = event.tool_result
+                    yield format_sse(event.event_type, event_to_dict(event))
+
+                # Deltas only stand in when no final result arrived
+                content = final_text if final_text is not None else "".join(parts)
+                if content:
+                    coo_response = await _finish_coo_response_async(
+                        coo, content, delegation_context, thread_id, actions_taken
+                    )
+                else:
+                    coo_response = f"I apologize, I'm having trouble processing that right now. Error: {error or 'No response'}"
+
+        except Exception as e:
+            coo_response = f"I encountered an issue: {str(e)}. Let me try to help anyway - what would you like to know?"
+
+        # Final message only - partial output from a dropped client is never stored
+        await get_storage().run(
+            coo.add_message_to_thread,
+            thread_id=thread_id,
+            role='assistant',
+            content=coo_response,
+            message_type='message'
+        )
+
+        yield format_sse('done', {
+            'response': coo_response,
+            'thread_id': thread_id,
+            'timestamp': datetime.utcnow().isoformat(),
+            'actions_taken': actions_taken,
+            'context_sources': context_metadata,
+        })
+
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 
+def _start_coo_turn(coo, request: COOMessageRequest):
+    """
+    Record the CEO's message and run the cheap pre-LLM analysis.
+
+    Returns:
+        Tuple of (thread_id, actions_taken, delegation_context)
+    """
     # Debug: Log incoming images with details
-    import logging
     if request.images:
         image_details = [(img.media_type, len(img.data) if img.data else 0) for img in request.images]
         logging.info(f"COO message received. Images count: {len(request.images)}, details: {image_details}")
@@ -1148,69 +1406,106 @@ async def send_coo_message(request: COOMessageRequest):
         })
     delegation_context = _analyze_for_delegation(request.message)
 
-    # Generate COO response with full tool access and delegation awareness
-    try:
+    return thread_id, actions_taken, delegation_context
 
-        # Build context from thread and system state
-        # Use smart context with rolling summarization for long conversations
-        thread_context = get_smart_thread_context(
-            coo=coo,
-            thread_id=thread_id,
-            max_messages=10,
-            summarization_threshold=20
-        )
 
-        # Get system status for context
-        monitor = get_monitor()
-        metrics = monitor.collect_metrics()
-        molecules = get_molecule_engine()
-        active_molecules = molecules.list_active_molecules()
-
-        # Load organizational context including CEO preferences
-        org_context = coo.get_context_summary_for_llm()
-
-        # === Query-Aware Memory Retrieval ===
-        # Search for relevant context based on what the user is actually asking about
-        query_relevant_context = coo.get_relevant_context_for_query(request.message)
-        query_context_str = coo.format_relevant_context_for_prompt(query_relevant_context)
-
-        # Log retrieval stats for debugging
-        qa = query_relevant_context.get('query_analysis', {})
-        logger.debug(f"Query-aware retrieval: intent={qa.get('intent')}, "
-                    f"complexity={qa.get('complexity_score', 0):.2f}, "
-                    f"decisions={len(query_relevant_context.get('relevant_decisions', []))}, "
-                    f"lessons={len(query_relevant_context.get('relevant_lessons', []))}, "
-                    f"history={len(query_relevant_context.get('relevant_history', []))}")
-
-        # Combine static and query-relevant context
-        combined_context = org_context
-        if query_context_str:
-            combined_context += f"\n\n{query_context_str}"
-
-        # === Outcome-Based Learning: Surface relevant past work ===
-        # Proactively find similar past work to inform this task
-        lessons_context = get_relevant_lessons_for_task(request.message, max_results=3)
-        if lessons_context:
-            combined_context += f"\n\n{lessons_context}"
-            logger.debug(f"Surfaced lessons for task: {len(lessons_context)} chars")
+def _simple_greeting_response(message: str) -> Optional[str]:
+    """Canned reply for simple greetings, which skip the LLM call"""
+    simple_greetings = ['hello', 'hello?', 'hi', 'hey', 'test', 'ping', 'hey?', 'hi?']
+    if message.lower().strip() in simple_greetings:
+        return "Hello! I'm the COO. What would you like to work on today? I can help with project planning, codebase reviews, or delegating tasks to the team."
+    return None
+
+
+async def _build_coo_prompts(coo, request: COOMessageRequest, thread_id: str, delegation_context: Dict[str, Any]):
+    """
+    Assemble context and build the COO's system prompt and prompt.
+
+    Returns:
+        Tuple of (system_prompt, prompt, context_metadata)
+    """
+    # Build context from thread, system state and memory concurrently.
+    # Each source has its own timeout; a slow source falls back to its
+    # default instead of delaying the reply.
+    assembled = await get_context_assembler().assemble(
+        _coo_context_sources(coo, thread_id, request.message)
+    )
+    context_metadata = assembled.get_metadata()
+
+    thread_context = assembled.values['thread_context']
+    system_state = assembled.values['system_state']
+    org_context = assembled.values['org_context']
+    query_relevant_context = assembled.values['query_context']
+    query_context_str = coo.format_relevant_context_for_prompt(query_relevant_context)
+
+    # Log retrieval stats for debugging
+    qa = query_relevant_context.get('query_analysis', {})
+    logger.debug(f"Query-aware retrieval: intent={qa.get('intent')}, "
+                f"complexity={qa.get('complexity_score', 0):.2f}, "
+                f"decisions={len(query_relevant_context.get('relevant_decisions', []))}, "
+                f"lessons={len(query_relevant_context.get('relevant_lessons', []))}, "
+                f"history={len(query_relevant_context.get('relevant_history', []))}")
+
+    # Combine static and query-relevant context
+    combined_context = org_context
+    if query_context_str:
+        combined_context += f"\n\n{query_context_str}"
+
+    # === Outcome-Based Learning: Surface relevant past work ===
+    # Proactively find similar past work to inform this task
+    lessons_context = assembled.values['lessons']
+    if lessons_context:
+        combined_context += f"\n\n{lessons_context}"
+        logger.debug(f"Surfaced lessons for task: {len(lessons_context)} chars")
+
+    # Stable instructions first (cached prefix), per-message context after
+    system_prompt = combined_context
+
+    prompt = f"""CONVERSATION CONTEXT:
+{thread_context}
+
+CURRENT SYSTEM STATE:
+- Active agents: {system_state.get('agents_active', 0)}
+- Active projects: {system_state.get('projects_active', 0)}
+- System health: Operational
+- Corp path: {get_corp_path()}
+
+DELEGATION ANALYSIS:
+{json.dumps(delegation_context, indent=2)}
+
+CEO'S MESSAGE:
+{request.message}
+{f'{chr(10)}[CEO has attached {len(request.images)} image(s)/screenshot(s) - review them carefully]' if request.images else ''}
+
+Respond naturally as the COO. Handle simple things directly. For bigger asks, propose a plan. When you're ready to start work, include [DELEGATE] in your response."""
 
-        system_prompt = f"""You are the COO of AI Corp, a strategic partner to the CEO. Be natural and conversational.
+    return system_prompt, prompt, context_metadata
 
-{combined_context}
+
+@functools.lru_cache(maxsize=8)
+def _coo_system_prompt_prefix(corp_path: Path) -> str:
+    """
+    Static part of the COO system prompt.
+
+    Formatted once per corp path and reused, so every request sends an
+    identical prefix that backends with prompt caching can serve from
+    cache. Per-message context goes in the system prompt after it.
+    """
+    return f"""You are the COO of AI Corp, a strategic partner to the CEO. Be natural and conversational.
 
 ## HOW YOU WORK (Architecture)
 
 You are a Claude instance running inside the AI Corp API server (FastAPI). Here's how the system works:
 
-1. **You run in-process** - You are part of the Python FastAPI server at {get_corp_path().parent}
+1. **You run in-process** - You are part of the Python FastAPI server at {corp_path.parent}
 2. **You can READ files** - Use tools like Read, Glob, Grep to access local files directly. NO HTTP/curl needed.
 3. **Delegation is a Python function call** - When you delegate work, the API calls CorporationExecutor directly (no network)
 4. **Workers are Claude Code CLI instances** - Each VP/Director/Worker is a separate Claude CLI subprocess
-5. **All paths are local** - The corp path is {get_corp_path()}
+5. **All paths are local** - The corp path is {corp_path}
 
 **FILE ACCESS:**
 - You have FULL read access to the entire codebase - use Read, Glob, Grep freely
-- You CAN write, edit, and delete files in the corp directory ({get_corp_path()})
+- You CAN write, edit, and delete files in the corp directory ({corp_path})
   - This includes: molecules, hooks, channels, beads, gates, contracts, etc.
   - Use this to manage organization state, clear old data, fix stuck workflows
 - You MUST NOT edit system source code (src/*, tests/*, *.py outside corp/)
@@ -1218,9 +1513,10 @@ You are a Claude instance running inside the AI Corp API server (FastAPI). Here'
   - But delegate actual code changes to Workers - they implement, you manage
 
 **LIVE ACTIVITY VISIBILITY:**
-- Real-time activity is logged to: {get_corp_path()}/live/activity.log
+- Real-time activity is logged to: {corp_path}/live/activity.log
 - This file shows what's happening RIGHT NOW during delegations
-- Use `Read` or `tail` to see recent activity (auto-truncates to ~100 events)
+- Use `Read` to see recent activity (fixed-size ring of the last ~100 events;
+  the newest entry is just above the '>>> newest above' marker line)
 - Format: [TIMESTAMP] EVENT_TYPE | [MOL-ID] message
 - Check this when the CEO asks "what's happening?" or "what did the team do?"
 
@@ -1302,122 +1598,143 @@ For quick questions or specific lookups (read one file, check one thing), you ca
 - No jargon (discovery session, molecule, success contract)
 - Get confirmation before starting team projects"""
 
-        prompt = f"""CONVERSATION CONTEXT:
-{thread_context}
 
-CURRENT SYSTEM STATE:
-- Active agents: {len(metrics.agents) if metrics.agents else 0}
-- Active projects: {len(active_molecules)}
-- System health: Operational
-- Corp path: {get_corp_path()}
+def _build_coo_llm_request(request: COOMessageRequest, system_prompt: str, prompt: str) -> LLMRequest:
+    """LLM request for a COO turn, with any attached images"""
+    # Convert images to LLM format if present
+    llm_images = []
+    if request.images:
+        for img in request.images:
+            llm_images.append({
+                "data": img.data,
+                "media_type": img.media_type
+            })
 
-DELEGATION ANALYSIS:
-{json.dumps(delegation_context, indent=2)}
+    # COO always has full tool access - system prompt guides appropriate usage
+    return LLMRequest(
+        prompt=prompt,
+        system_prompt_prefix=_coo_system_prompt_prefix(get_corp_path()),
+        system_prompt=system_prompt,
+        working_directory=get_corp_path(),
+        tools=None,  # None = use defaults (all tools)
+        images=llm_images
+    )
 
-CEO'S MESSAGE:
-{request.message}
-{f'{chr(10)}[CEO has attached {len(request.images)} image(s)/screenshot(s) - review them carefully]' if request.images else ''}
 
-Respond naturally as the COO. Handle simple things directly. For bigger asks, propose a plan. When you're ready to start work, include [DELEGATE] in your response."""
+async def _finish_coo_response_async(
+    coo,
+    coo_response: str,
+    delegation_context: Dict[str, Any],
+    thread_id: str,
+    actions_taken: List[Dict[str, Any]]
+) -> str:
+    """
+    Run _finish_coo_response off the event loop, then start the
+    corporation cycle for a delegated molecule on the loop.
 
-        # For simple greetings, respond directly without LLM call
-        simple_greetings = ['hello', 'hello?', 'hi', 'hey', 'test', 'ping', 'hey?', 'hi?']
-        if request.message.lower().strip() in simple_greetings:
-            coo_response = "Hello! I'm the COO. What would you like to work on today? I can help with project planning, codebase reviews, or delegating tasks to the team."
-            logger.info(f"[DEBUG] Using simple greeting response")
-        else:
-            # Convert images to LLM format if present
-            llm_images = []
-            if request.images:
-                for img in request.images:
-                    llm_images.append({
-                        "data": img.data,
-                        "media_type": img.media_type
-                    })
+    Returns:
+        The final reply text
+    """
+    coo_response, molecule_id = await get_storage().run(
+        _finish_coo_response, coo, coo_response, delegation_context, thread_id, actions_taken
+    )
+    if molecule_id:
+        # Spawn background task to run the corporation cycle
+        logger.info(f"Delegation successful - spawning background execution for molecule {molecule_id}")
+        asyncio.create_task(_run_corporation_cycle_async(molecule_id))
+    return coo_response
 
-            # COO always has full tool access - system prompt guides appropriate usage
-            tools_to_use = None  # None = use defaults (all tools)
 
-            logger.info(f"[DEBUG] About to call Claude CLI (likely_delegation={delegation_context.get('likely_delegation')}, tools={tools_to_use}, images={len(llm_images)})")
-            # Run LLM execution in thread pool to avoid blocking the async event loop
-            llm_request = LLMRequest(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                working_directory=get_corp_path(),
-                tools=tools_to_use,
-                images=llm_images
-            )
-            response = await asyncio.to_thread(coo.llm.execute, llm_request)
+def _finish_coo_response(
+    coo,
+    coo_response: str,
+    delegation_context: Dict[str, Any],
+    thread_id: str,
+    actions_taken: List[Dict[str, Any]]
+) -> Tuple[str, Optional[str]]:
+    """
+    Act on a completed COO reply: start delegation if it contains the
+    [DELEGATE] marker and strip markers from the text shown to the CEO.
 
-            logger.info(f"[DEBUG] LLM response received: success={response.success}")
+    Blocking (molecule and thread writes); call it off the event loop.
 
-            if response.success:
-                coo_response = response.content
-
-                # Check if COO included [DELEGATE] marker to trigger delegation
-                should_delegate, cleaned_response = _check_for_delegation_marker(coo_response)
-
-                if should_delegate:
-                    logger.info(f"[DEBUG] COO triggered delegation via [DELEGATE] marker")
-
-                    # Check for COO-defined molecule structure [MOLECULE]...[/MOLECULE]
-                    molecule_def = _parse_molecule_block(coo_response)
-                    if molecule_def:
-                        logger.info(f"[DEBUG] COO defined molecule structure: {molecule_def.get('title')} with {len(molecule_def.get('phases', []))} phases")
-                        # Also clean the molecule block from the response
-                        cleaned_response = _clean_molecule_block(cleaned_response)
-
-                    # Build pending delegation context from conversation
-                    pending = {
-                        'proposed_at': datetime.utcnow().isoformat(),
-                        'project_type': delegation_context.get('suggested_project_type', 'research'),
-                        'departments': delegation_context.get('suggested_departments', ['research', 'engineering']),
-                        'context': delegation_context
-                    }
-
-                    # Execute delegation with optional molecule definition
-                    result = _execute_delegation(coo, pending, thread_id, molecule_def=molecule_def)
-                    logger.info(f"[DEBUG] Delegation result: {result.get('success')}")
-
-                    if result.get('success'):
-                        # Use COO's response (without marker) + add status info
-                        coo_response = cleaned_response
-                        if not coo_response.strip():
-                            coo_response = f"Done! I've created '{result['molecule_name']}' and the team is starting on {result['step_count']} phases."
-
-                        actions_taken.append({
-                            'action': 'delegation',
-                            'molecule_id': result['molecule_id'],
-                            'delegations': result['delegations']
-                        })
-
-                        # Spawn background task to run the corporation cycle
-                        logger.info(f"Delegation successful - spawning background execution for molecule {result['molecule_id']}")
-                        asyncio.create_task(_run_corporation_cycle_async(result['molecule_id']))
-                    else:
-                        coo_response = f"{cleaned_response}\n\n(Note: I ran into an issue setting that up: {result.get('error')})"
-            else:
-                # Include the actual error for debugging
-                error_detail = response.error or "Unknown error"
-                coo_response = f"I apologize, I'm having trouble processing that right now. Error: {error_detail}"
+    Returns:
+        Tuple of (final reply text, id of the delegated molecule or None)
+    """
+    # Check if COO included [DELEGATE] marker to trigger delegation
+    should_delegate, cleaned_response = _check_for_delegation_marker(coo_response)
+
+    if not should_delegate:
+        return coo_response, None
+
+    logger.info(f"[DEBUG] COO triggered delegation via [DELEGATE] marker")
+
+    # Check for COO-defined molecule structure [MOLECULE]...[/MOLECULE]
+    molecule_def = _parse_molecule_block(coo_response)
+    if molecule_def:
+        logger.info(f"[DEBUG] COO defined molecule structure: {molecule_def.get('title')} with {len(molecule_def.get('phases', []))} phases")
+        # Also clean the molecule block from the response
+        cleaned_response = _clean_molecule_block(cleaned_response)
+
+    # Build pending delegation context from conversation
+    pending = {
+        'proposed_at': datetime.utcnow().isoformat(),
+        'project_type': delegation_context.get('suggested_project_type', 'research'),
+        'departments': delegation_context.get('suggested_departments', ['research', 'engineering']),
+        'context': delegation_context
+    }
 
-    except Exception as e:
-        coo_response = f"I encountered an issue: {str(e)}. Let me try to help anyway - what would you like to know?"
+    # Execute delegation with optional molecule definition
+    result = _execute_delegation(coo, pending, thread_id, molecule_def=molecule_def)
+    logger.info(f"[DEBUG] Delegation result: {result.get('success')}")
 
-    # Add COO response to thread
-    coo.add_message_to_thread(
-        thread_id=thread_id,
-        role='assistant',
-        content=coo_response,
-        message_type='message'
-    )
+    if not result.get('success'):
+        return f"{cleaned_response}\n\n(Note: I ran into an issue setting that up: {result.get('error')})", None
 
-    return COOMessageResponse(
-        response=coo_response,
-        thread_id=thread_id,
-        timestamp=datetime.utcnow().isoformat(),
-        actions_taken=actions_taken
-    )
+    # Use COO's response (without marker) + add status info
+    coo_response = cleaned_response
+    if not coo_response.strip():
+        coo_response = f"Done! I've created '{result['molecule_name']}' and the team is starting on {result['step_count']} phases."
+
+    actions_taken.append({
+        'action': 'delegation',
+        'molecule_id': result['molecule_id'],
+        'delegations': result['delegations']
+    })
+    return coo_response, result['molecule_id']
+
+
+def _coo_context_sources(coo, thread_id: str, message: str) -> List[ContextSource]:
+    """
+    Independent context lookups for a COO message.
+
+    Timeouts favour conversation history, which may need an LLM
+    summarization pass; the other sources are local file lookups.
+    """
+    async def system_state():
+        snapshot = await get_current_dashboard()
+        return snapshot.get_metrics()
+
+    return [
+        ContextSource(
+            'thread_context', get_smart_thread_context,
+            kwargs={'coo': coo, 'thread_id': thread_id, 'max_messages': 10, 'summarization_threshold': 20},
+            timeout=15.0, default=''
+        ),
+        ContextSource('system_state', system_state, timeout=2.0, default={}),
+        ContextSource(
+            'org_context', coo.get_context_summary_for_llm,
+            timeout=3.0, default='', max_chars=12000
+        ),
+        ContextSource(
+            'query_context', coo.get_relevant_context_for_query, args=(message,),
+            timeout=3.0, default={}
+        ),
+        ContextSource(
+            'lessons', get_relevant_lessons_for_task, args=(message,), kwargs={'max_results': 3},
+            timeout=3.0, default='', max_chars=4000
+        ),
+    ]
 
 
 def _analyze_for_delegation(message: str) -> Dict[str, Any]:
@@ -2013,6 +2330,25 @@ def _execute_delegation(coo, pending: Dict[str, Any], thread_id: str, molecule_d
         return {'success': False, 'error': str(e)}
 
 
+@app.get("/api/coo/usage")
+async def get_coo_llm_usage():
+    """
+    Token usage of the COO's LLM backend, including prompt-cache reads.
+
+    Only backends that report usage (the direct API backend) have stats;
+    a high cache_hit_rate means the static system prompt prefix is being
+    served from cache.
+    """
+    coo = get_coo()
+    backend = getattr(coo.llm, 'backend', None)
+    get_usage = getattr(backend, 'get_usage_stats', None)
+    return {
+        'backend': backend.backend_type.value if backend else None,
+        'usage': get_usage() if get_usage else None,
+        'prefix_cache': _coo_system_prompt_prefix.cache_info()._asdict(),
+    }
+
+
 @app.get("/api/coo/threads")
 async def list_coo_threads():
     """List all conversation threads with the COO."""
@@ -2336,120 +2672,104 @@ async def finalize_discovery(session_id: str):
 # =============================================================================
 
 @app.get("/api/dashboard")
-async def get_dashboard():
-    """Get full dashboard data."""
-    molecules = get_molecule_engine()
-    gates = get_gate_keeper()
-    monitor = get_monitor()
-    beads = get_bead_ledger()
-
-    # Get metrics
-    metrics = monitor.collect_metrics()
-
-    # Get active projects
-    active_molecules = molecules.list_active_molecules()
-    projects = []
-    for mol in active_molecules[:10]:  # Limit to 10
-        progress = mol.get_progress()
-        projects.append({
-            'id': mol.id,
-            'name': mol.name,
-            'status': mol.status.value,
-            'progress': progress['percent_complete'],
-            'priority': mol.priority,
-            'workers_active': len([s for s in mol.steps if s.status.value == 'in_progress']),
-            'current_phase': mol.steps[0].name if mol.steps else None
-        })
+async def get_dashboard(request: Request):
+    """
+    Get full dashboard data.
 
-    # Get pending gates
-    pending_gates = gates.get_pending_submissions()
-
-    # Get recent activity
-    recent_beads = beads.get_recent_entries(limit=20)
-    activity = [
-        {
-            'id': b.id,
-            'action': b.action,
-            'agent_id': b.agent_id,
-            'message': b.message,
-            'timestamp': b.timestamp
-        }
-        for b in recent_beads
-    ]
+    Served from the materialized snapshot with an ETag; clients sending
+    If-None-Match with the current ETag get 304 Not Modified.
+    """
+    snapshot = await get_current_dashboard()
+    body, etag = snapshot.get()
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
 
-    return {
-        'metrics': {
-            'agents_active': len(metrics.agents) if metrics.agents else 0,
-            'agents_total': 15,  # TODO: Get from config
-            'projects_active': len(active_molecules),
-            'gates_pending': len(pending_gates),
-            'queue_depth': 0  # TODO: Calculate from hooks
-        },
-        'projects': projects,
-        'gates_pending': [
-            {
-                'id': g.gate_id,
-                'title': g.gate_id,  # TODO: Get gate title
-                'submitted_at': g.submitted_at,
-                'submitted_by': g.submitted_by
-            }
-            for g in pending_gates[:5]
-        ],
-        'activity': activity,
-        'alerts': []  # TODO: Get from monitor
-    }
+    if _etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type='application/json', headers=headers)
 
 
 @app.get("/api/dashboard/metrics")
 async def get_metrics():
     """Get just the KPI metrics."""
-    monitor = get_monitor()
-    molecules = get_molecule_engine()
-    gates = get_gate_keeper()
-
-    metrics = monitor.collect_metrics()
-    active_molecules = molecules.list_active_molecules()
-    pending_gates = gates.get_pending_submissions()
+    snapshot = await get_current_dashboard()
+    metrics = snapshot.get_metrics()
 
     return DashboardMetrics(
-        agents_active=len(metrics.agents) if metrics.agents else 0,
-        agents_total=15,
-        projects_active=len(active_molecules),
-        gates_pending=len(pending_gates),
-        queue_depth=0
+        agents_active=metrics['agents_active'],
+        agents_total=metrics['agents_total'],
+        projects_active=metrics['projects_active'],
+        gates_pending=metrics['gates_pending'],
+        queue_depth=metrics['queue_depth']
     )
 
 
+@app.get("/api/metering/usage")
+async def get_metered_usage(by: str = 'hour', limit: Optional[int] = 48, since: Optional[str] = None):
+    """
+    Metered LLM usage: corp-wide totals plus a rollup.
+
+    `by` is one of hour, agent, molecule or backend; `since` (an ISO hour
+    such as 2026-10-18T09) filters the hourly rollup.
+    """
+    if by not in ROLLUP_DIMENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"by must be one of: {', '.join(ROLLUP_DIMENSIONS)}"
+        )
+    meter = get_usage_meter(get_corp_path())
+    return {
+        'summary': meter.get_summary(),
+        'by': by,
+        'rollup': meter.rollup(by, limit=limit, since=since)
+    }
+
+
 # =============================================================================
 # Projects/Molecules Endpoints
 # =============================================================================
 
+def _page_params(cursor: Optional[str], limit: Optional[int]) -> tuple:
+    """Decode a cursor and clamp the page size (400 on a malformed cursor)."""
+    try:
+        return decode_cursor(cursor), clamp_limit(limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/api/projects")
 @app.get("/api/molecules")  # Alias for frontend compatibility
-async def list_projects(status: Optional[str] = None):
-    """List all projects/molecules."""
-    molecules = get_molecule_engine()
+async def list_projects(
+    status: Optional[str] = None,
+    owner: Optional[str] = None,
+    department: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    include_completed: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    List projects/molecules, most recently updated first.
 
-    # Currently only supports listing active molecules
-    # TODO: Add support for completed/all molecules
-    mol_list = molecules.list_active_molecules()
-
-    projects = []
-    for mol in mol_list:
-        progress = mol.get_progress()
-        projects.append({
-            'id': mol.id,
-            'name': mol.name,
-            'description': mol.description,
-            'status': mol.status.value,
-            'progress': progress['percent_complete'],
-            'priority': mol.priority,
-            'created_at': mol.created_at,
-            'steps_total': len(mol.steps),
-            'steps_completed': progress['completed']
-        })
+    Served from the molecule summary index, so a page costs the same no
+    matter how many molecules the corp has. Completed molecules are
+    included with include_completed=true or any status filter. Pass
+    next_cursor back as cursor for the following page.
+    """
+    key, limit = _page_params(cursor, limit)
+    # A status filter searches completed molecules too (failed ones are archived there)
+    location = None if include_completed or status else 'active'
+
+    summaries, next_key = await get_storage().run(
+        get_molecule_engine().list_molecule_summaries,
+        status=status, owner=owner, department=department, location=location,
+        updated_since=updated_since, cursor=key, limit=limit
+    )
 
-    return {'projects': projects}
+    return {
+        'projects': summaries,
+        'count': len(summaries),
+        'next_cursor': encode_cursor(next_key)
+    }
 
 
 @app.get("/api/projects/{project_id}")
@@ -2493,7 +2813,14 @@ async def get_project(project_id: str):
 async def list_gates():
     """List all gates."""
     gates = get_gate_keeper()
-    all_gates = gates.list_gates()
+    storage = get_storage()
+
+    # One pending scan, grouped by gate, instead of one scan per gate
+    all_gates, pending = await asyncio.gather(
+        storage.list_gates(gates),
+        storage.get_pending_submissions(gates),
+    )
+    pending_gate_ids = {p.gate_id for p in pending}
 
     return {
         'gates': [
@@ -2501,7 +2828,7 @@ async def list_gates():
                 'id': g.id,
                 'name': g.name,
                 'gate_type': g.gate_type.value,
-                'status': 'pending' if gates.get_pending_submissions(g.id) else 'clear'
+                'status': 'pending' if g.id in pending_gate_ids else 'clear'
             }
             for g in all_gates
         ]
@@ -2509,22 +2836,42 @@ async def list_gates():
 
 
 @app.get("/api/gates/pending")
-async def get_pending_gates():
-    """Get gates pending CEO review."""
-    gates = get_gate_keeper()
-    pending = gates.get_pending_submissions()
+async def get_pending_gates(
+    owner: Optional[str] = None,
+    molecule_id: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    Get gate submissions pending review, newest first.
+
+    owner filters by the gate's owner role; updated_since by submission
+    time. Pass next_cursor back as cursor for the following page.
+    """
+    key, limit = _page_params(cursor, limit)
+    pending = await get_storage().get_pending_submissions(get_gate_keeper(), owner)
+
+    if molecule_id:
+        pending = [p for p in pending if p.molecule_id == molecule_id]
+    if updated_since:
+        pending = [p for p in pending if (p.submitted_at or '') >= updated_since]
+    page, next_key = paginate(pending, lambda p: (p.submitted_at or '', p.id), key, limit)
 
     return {
         'pending': [
             {
                 'gate_id': p.gate_id,
                 'submission_id': p.id,
+                'molecule_id': p.molecule_id,
                 'submitted_by': p.submitted_by,
                 'submitted_at': p.submitted_at,
                 'artifacts': p.artifacts
             }
-            for p in pending
-        ]
+            for p in page
+        ],
+        'count': len(page),
+        'next_cursor': encode_cursor(next_key)
     }
 
 
@@ -2767,24 +3114,94 @@ async def get_preference_history(preference_id: str):
     }
 
 
+# =============================================================================
+# Entity Lookup Endpoints
+# =============================================================================
+
+@app.get("/api/entities/search")
+async def search_entities(
+    q: str,
+    mode: str = "prefix",
+    entity_type: Optional[str] = None,
+    limit: int = 10
+):
+    """
+    Typeahead lookup for people, organizations, and other entities.
+
+    Args:
+        q: Query text
+        mode: "prefix" matches the start of any word (name, description, alias);
+              "contains" matches anywhere
+        entity_type: Optional filter (person, organization, project, ...)
+        limit: Maximum results
+    """
+    if mode not in ("prefix", "contains"):
+        raise HTTPException(status_code=400, detail=f"Invalid mode: {mode}")
+
+    try:
+        type_filter = EntityType(entity_type) if entity_type else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid entity type: {entity_type}")
+
+    store = get_entity_graph().entity_store
+    start = time.perf_counter()
+    if mode == "prefix":
+        entities = store.typeahead(q, entity_type=type_filter, limit=limit)
+    else:
+        entities = store.search_entities(q, entity_type=type_filter, limit=limit)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        'results': [
+            {
+                'id': e.id,
+                'name': e.name,
+                'entity_type': e.entity_type.value,
+                'aliases': [a.value for a in e.aliases],
+                'interaction_count': e.interaction_count
+            }
+            for e in entities
+        ],
+        'count': len(entities),
+        'query_ms': round(elapsed_ms, 3)
+    }
+
+
 # =============================================================================
 # Activity Feed REST Endpoints
 # =============================================================================
 
 @app.get("/api/activity")
-async def get_activity_history(limit: int = 50):
+async def get_activity_history(
+    event_type: Optional[str] = None,
+    molecule_id: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE
+):
     """
-    Get recent activity events (REST alternative to WebSocket).
+    Get recent activity events, newest first (REST alternative to WebSocket).
 
     Use this for initial page load or clients that don't support WebSocket.
-    For real-time updates, connect to /ws/activity.
+    For real-time updates, connect to /ws/activity. Pass next_cursor back
+    as cursor for older events.
     """
+    key, limit = _page_params(cursor, limit)
     broadcaster = get_activity_broadcaster()
-    events = broadcaster.get_history(limit=limit)
+    events = broadcaster.get_history()
+
+    if event_type:
+        events = [e for e in events if e.get('event_type') == event_type]
+    if molecule_id:
+        events = [e for e in events if e.get('molecule_id') == molecule_id]
+    if updated_since:
+        events = [e for e in events if e.get('timestamp', '') >= updated_since]
+    page, next_key = paginate(events, lambda e: (e.get('timestamp', ''), e.get('event_id', '')), key, limit)
 
     return {
-        'events': events,
-        'count': len(events),
+        'events': page,
+        'count': len(page),
+        'next_cursor': encode_cursor(next_key),
         'connections': broadcaster.get_connection_count()
     }
 
@@ -2797,7 +3214,8 @@ async def get_activity_stats():
     return {
         'connections': broadcaster.get_connection_count(),
         'history_size': len(broadcaster.get_history()),
-        'max_history': broadcaster._max_history
+        'max_history': broadcaster._max_history,
+        'delivery': broadcaster.get_delivery_stats()
     }
 
 
@@ -2825,6 +3243,27 @@ async def health_check():
     }
 
 
+@app.get("/api/health/loop")
+async def loop_health():
+    """
+    Event loop blocking time per endpoint, plus storage offload stats.
+
+    Endpoints with high avg_blocked_ms are running blocking code on the
+    event loop and delay every other request and WebSocket.
+    """
+    return {
+        'endpoints': loop_block_tracker.get_stats(),
+        'storage': get_storage().get_stats(),
+        'dashboard': get_dashboard_snapshot().get_stats()
+    }
+
+
+@app.get("/api/health/stores")
+async def store_health():
+    """Shared store instances per corp, their cache sizes and parse-cache hits."""
+    return get_store_registry().get_stats()
+
+
 # =============================================================================
 # WebSocket for Real-time Updates
 # =============================================================================
@@ -2887,11 +3326,29 @@ async def activity_feed_websocket(websocket: WebSocket):
     - Client can send: {"type": "ping"} for keepalive (server responds with {"type": "pong"})
     - Client can send: {"type": "get_history", "limit": 50} to request history
     - Client can send: {"type": "get_stats"} to get connection/history stats
+    - Bursts arrive as one frame: {"type": "batch", "messages": [...], "count": N};
+      handle each message in order. Slow clients lose the oldest queued messages.
     - On connect: {"type": "history", "events": [...], "count": N} with recent events
+    - On connect: {"type": "dashboard.snapshot", "version": N, "etag": "...", "document": {...}}
+    - Dashboard changes: {"type": "dashboard.delta", "version": N, "etag": "...",
+        "changes": [{"op": "upsert|remove|replace", "section": "projects", "id": "...", "value": ...}]}
+      Apply deltas in version order; on a version gap, refetch /api/dashboard.
     """
     broadcaster = get_activity_broadcaster()
     await broadcaster.subscribe(websocket)
 
+    # Send the current dashboard so deltas can be applied on top of it
+    try:
+        snapshot = await get_current_dashboard()
+        await websocket.send_json({
+            "type": "dashboard.snapshot",
+            "version": snapshot.version,
+            "etag": snapshot.etag,
+            "document": snapshot.get_document()
+        })
+    except Exception as e:
+        logger.warning(f"Failed to send dashboard snapshot to new client: {e}")
+
     try:
         while True:
             # Process any queued sync events
@@ -3031,60 +3488,12 @@ Execute this task using your available tools. Read files, run commands, make cha
                 "content": "Starting execution..."
             })
 
-            # Use asyncio.Queue for true streaming between thread and websocket
-            import asyncio
-            import queue
-            from concurrent.futures import ThreadPoolExecutor
-
-            event_queue: queue.Queue = queue.Queue()
+            # Events arrive from a worker thread with bounded buffering;
+            # deltas are merged if this socket falls behind
             all_events: list = []
-
-            def run_streaming():
-                """Run streaming in thread, put events in queue"""
-                try:
-                    for event in backend.execute_streaming(llm_request):
-                        event_queue.put(event)
-                except Exception as e:
-                    from src.core.llm import StreamEvent
-                    event_queue.put(StreamEvent(event_type='error', content=str(e)))
-                finally:
-                    event_queue.put(None)  # Signal completion
-
-            # Start streaming in background thread
-            executor = ThreadPoolExecutor(max_workers=1)
-            future = executor.submit(run_streaming)
-
-            # Stream events to websocket as they arrive
-            try:
-                while True:
-                    # Non-blocking check with timeout
-                    try:
-                        event = event_queue.get(timeout=0.1)
-                    except queue.Empty:
-                        # Check if thread is still running
-                        if future.done():
-                            break
-                        continue
-
-                    if event is None:  # Completion signal
-                        break
-
-                    all_events.append(event)
-
-                    event_dict = {
-                        "type": event.event_type,
-                        "content": event.content,
-                    }
-                    if event.tool_name:
-                        event_dict["tool_name"] = event.tool_name
-                    if event.tool_input:
-                        event_dict["tool_input"] = event.tool_input
-                    if event.tool_result:
-                        event_dict["tool_result"] = event.tool_result
-
-                    await websocket.send_json(event_dict)
-            finally:
-                executor.shutdown(wait=False)
+            async for event in stream_llm_events(backend, llm_request):
+                all_events.append(event)
+                await websocket.send_json(event_to_dict(event))
 
             # Add COO response to thread if thread_id provided
             if thread_id:
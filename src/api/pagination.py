@@ -0,0 +1,72 @@
+"""
+Cursor Pagination for List Endpoints
+
+List endpoints return pages newest first. Each page carries an opaque
+`next_cursor` (the sort key of its last item); passing it back returns
+the items strictly after that key, so pages stay stable while new items
+arrive at the head and a deep page costs no more than the first.
+
+Stores with their own index (the molecule summary index) page
+themselves and only use encode_cursor/decode_cursor here. Small
+in-memory lists (pending gate submissions, activity history) use
+paginate().
+"""
+
+import base64
+import json
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Page size within 1..MAX_PAGE_SIZE"""
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def encode_cursor(key: Optional[Sequence[str]]) -> Optional[str]:
+    """Opaque cursor for a sort key (None stays None)"""
+    if key is None:
+        return None
+    raw = json.dumps(list(key), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Sort key from a cursor. Raises ValueError for malformed cursors."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, list) or not all(isinstance(k, str) for k in key):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return tuple(key)
+
+
+def paginate(
+    items: Sequence[T],
+    sort_key: Callable[[T], Tuple[str, ...]],
+    cursor: Optional[Tuple[str, ...]] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[T], Optional[Tuple[str, ...]]]:
+    """
+    One page of items, newest (largest sort key) first.
+
+    Returns (page, next_key); next_key is None on the last page.
+    """
+    keyed = [(sort_key(item), item) for item in items]
+    if cursor is not None:
+        keyed = [(key, item) for key, item in keyed if key < cursor]
+    keyed.sort(key=lambda pair: pair[0], reverse=True)
+
+    page = keyed[:limit]
+    next_key = page[-1][0] if len(keyed) > limit else None
+    return [item for _, item in page], next_key
@@ -0,0 +1,170 @@
+"""
+Memory-Mapped Activity Ring Log
+
+`live/activity.log` gives the COO (and anyone running `tail`) a view of
+recent activity. It used to be appended to and periodically rewritten to
+keep it near 100 lines, with that I/O running inside the broadcast path.
+
+The ring log is a fixed-size file mapped into memory:
+
+- A fixed-width text header (4 lines), the last of which records the
+  next slot to write.
+- `capacity + 1` fixed-width slots, one line each. New entries overwrite
+  the oldest slot, and the slot after the newest entry holds a marker
+  line, so the file stays readable as plain text: entries run oldest to
+  newest from just below the marker, wrapping around to just above it.
+
+Appending is a memcpy into the mapping - no reads, no truncation passes,
+and no flush per entry (the kernel writes pages back on its own).
+Entries longer than a slot are truncated.
+"""
+
+import logging
+import mmap
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 100
+DEFAULT_SLOT_SIZE = 256
+
+# Header lines are padded to this width (including the newline)
+HEADER_LINE_SIZE = 80
+HEADER_LINES = 4
+
+MARKER = ">>> newest above, oldest below <<<"
+
+_CURSOR_RE = re.compile(rb"next=(\d{6})")
+
+
+class ActivityRingLog:
+    """
+    Fixed-size, memory-mapped ring of text lines.
+
+    Thread-safe. Reopening an existing ring file with the same geometry
+    continues where it left off; any other file at the path is replaced.
+    """
+
+    def __init__(self, path: Path, capacity: int = DEFAULT_CAPACITY,
+                 slot_size: int = DEFAULT_SLOT_SIZE):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.path = Path(path)
+        self.capacity = capacity
+        self.slot_size = slot_size
+        self._slots = capacity + 1  # One slot always holds the marker
+        self._header_size = HEADER_LINE_SIZE * HEADER_LINES
+        self._size = self._header_size + self._slots * slot_size
+        self._lock = threading.Lock()
+        self._cursor = 0
+        self._written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        reusable = self._reusable()
+        self._file = open(self.path, 'r+b' if reusable else 'w+b')
+        if not reusable:
+            self._format()
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+
+        match = _CURSOR_RE.search(self._mmap[:self._header_size])
+        self._cursor = int(match.group(1)) % self._slots if match else 0
+
+    # =========================================================================
+    # File Layout
+    # =========================================================================
+
+    def _reusable(self) -> bool:
+        """Whether the existing file is a ring log with this geometry"""
+        try:
+            if self.path.stat().st_size != self._size:
+                return False
+            with open(self.path, 'rb') as f:
+                return bool(_CURSOR_RE.search(f.read(self._header_size)))
+        except OSError:
+            return False
+
+    def _header_line(self, text: str) -> bytes:
+        data = text.encode('utf-8')[:HEADER_LINE_SIZE - 1]
+        return data.ljust(HEADER_LINE_SIZE - 1) + b"\n"
+
+    def _cursor_line(self) -> bytes:
+        return self._header_line(f"# Ring buffer, newest entry is just above the marker line. next={self._cursor:06d}")
+
+    def _slot(self, text: str) -> bytes:
+        data = text.encode('utf-8')[:self.slot_size - 1].decode('utf-8', 'ignore').encode('utf-8')
+        return data.ljust(self.slot_size - 1) + b"\n"
+
+    def _format(self) -> None:
+        """Write an empty ring (header, marker, blank slots)"""
+        self._cursor = 0
+        header = (
+            self._header_line(f"# AI Corp Activity Log (ring buffer, last {self.capacity} events)")
+            + self._header_line(f"# Started: {datetime.utcnow().isoformat()}Z")
+            + self._header_line("# Format: [TIMESTAMP] EVENT_TYPE | message")
+            + self._cursor_line()
+        )
+        self._file.seek(0)
+        self._file.write(header)
+        self._file.write(self._slot(MARKER))
+        self._file.write(self._slot("") * (self._slots - 1))
+        self._file.truncate(self._size)
+        self._file.flush()
+
+    def _offset(self, slot: int) -> int:
+        return self._header_size + slot * self.slot_size
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def append(self, line: str) -> None:
+        """Write an entry over the oldest slot"""
+        entry = self._slot(line.rstrip("\n").replace("\n", " "))
+        with self._lock:
+            if self._mmap is None:
+                return
+            offset = self._offset(self._cursor)
+            self._mmap[offset:offset + self.slot_size] = entry
+
+            self._cursor = (self._cursor + 1) % self._slots
+            offset = self._offset(self._cursor)
+            self._mmap[offset:offset + self.slot_size] = self._slot(MARKER)
+
+            cursor_at = self._header_size - HEADER_LINE_SIZE
+            self._mmap[cursor_at:self._header_size] = self._cursor_line()
+            self._written += 1
+
+    def read_lines(self, limit: Optional[int] = None) -> List[str]:
+        """Entries oldest to newest (at most `limit` of the newest)"""
+        with self._lock:
+            if self._mmap is None:
+                return []
+            order = [(self._cursor + 1 + i) % self._slots for i in range(self._slots - 1)]
+            lines = []
+            for slot in order:
+                offset = self._offset(slot)
+                text = self._mmap[offset:offset + self.slot_size].decode('utf-8', 'ignore').rstrip()
+                if text:
+                    lines.append(text)
+        return lines[-limit:] if limit else lines
+
+    def get_stats(self) -> dict:
+        return {
+            'path': str(self.path),
+            'capacity': self.capacity,
+            'slot_size': self.slot_size,
+            'file_size': self._size,
+            'written': self._written,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+                self._mmap.close()
+                self._mmap = None
+                self._file.close()
@@ -0,0 +1,276 @@
+"""
+Non-blocking Storage Access for API Endpoints
+
+The core stores (MoleculeEngine, GateKeeper, SystemMonitor, BeadLedger,
+...) are synchronous and scan YAML/JSON files on disk. Calling them
+directly from an `async def` handler runs that scan on the event loop,
+stalling every other request and WebSocket until it finishes.
+
+This module provides:
+- AsyncStorageFacade: runs blocking store calls on a dedicated, bounded
+  thread pool (separate from the default executor used for LLM calls, so
+  dashboard polling cannot starve COO chat) and coalesces identical
+  concurrent reads so N browser tabs polling the dashboard trigger one
+  scan, not N (single-flight)
+- LoopBlockMiddleware: ASGI middleware that measures how long each
+  endpoint actually runs on the event loop thread, i.e. time spent
+  between awaits, as opposed to time spent waiting on offloaded work
+
+Usage:
+    storage = AsyncStorageFacade(max_workers=8)
+
+    # Coalesced read - concurrent callers with the same key share a result
+    molecules = await storage.list_active_molecules(engine)
+
+    # Arbitrary blocking call
+    result = await storage.run(coo.get_context_summary_for_llm)
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Worker threads for store I/O. Store scans are disk bound, so a small
+# pool is enough; it only needs to keep the event loop free and leave room
+# for the COO's concurrent context lookups alongside dashboard reloads.
+DEFAULT_STORAGE_WORKERS = 8
+
+
+# =============================================================================
+# Async Storage Facade
+# =============================================================================
+
+class AsyncStorageFacade:
+    """
+    Async access to the synchronous core stores.
+
+    Blocking calls run on a bounded thread pool. Calls made with a `key`
+    are single-flight: while one is in progress, further calls with the
+    same key await the same result instead of starting another scan.
+    Only use keys for read-only calls whose results callers do not mutate.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_STORAGE_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='store-io'
+        )
+        # (loop id, key) -> future of the in-progress call
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        self._calls = 0
+        self._coalesced = 0
+        self._offloaded_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        key: Optional[Hashable] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run a blocking callable off the event loop.
+
+        Args:
+            func: Synchronous callable
+            *args, **kwargs: Passed to func
+            key: Coalescing key. Concurrent calls with an equal key share
+                one execution and its result (or exception).
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+
+        if key is None:
+            return await self._submit(loop, func, args, kwargs)
+
+        flight_key = (id(loop), key)
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            with self._stats_lock:
+                self._coalesced += 1
+        else:
+            future = asyncio.ensure_future(self._submit(loop, func, args, kwargs))
+            self._inflight[flight_key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(future)
+
+    async def _submit(self, loop, func, args, kwargs) -> Any:
+        call = functools.partial(func, *args, **kwargs) if kwargs else functools.partial(func, *args)
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, call)
+        finally:
+            with self._stats_lock:
+                self._calls += 1
+                self._offloaded_seconds += time.perf_counter() - start
+
+    # =========================================================================
+    # Common Store Reads
+    # =========================================================================
+
+    async def collect_metrics(self, monitor) -> Any:
+        """SystemMonitor.collect_metrics, coalesced"""
+        return await self.run(monitor.collect_metrics, key=('collect_metrics', id(monitor)))
+
+    async def list_active_molecules(self, engine) -> Any:
+        """MoleculeEngine.list_active_molecules, coalesced"""
+        return await self.run(engine.list_active_molecules, key=('active_molecules', id(engine)))
+
+    async def list_gates(self, gate_keeper) -> Any:
+        """GateKeeper.list_gates, coalesced"""
+        return await self.run(gate_keeper.list_gates, key=('gates', id(gate_keeper)))
+
+    async def get_pending_submissions(self, gate_keeper, owner_role: Optional[str] = None) -> Any:
+        """GateKeeper.get_pending_submissions, coalesced per owner role"""
+        return await self.run(
+            gate_keeper.get_pending_submissions, owner_role,
+            key=('pending_submissions', id(gate_keeper), owner_role)
+        )
+
+    async def get_recent_entries(self, ledger, limit: int = 20) -> Any:
+        """BeadLedger.get_recent_entries, coalesced per limit"""
+        return await self.run(
+            ledger.get_recent_entries, limit=limit,
+            key=('recent_beads', id(ledger), limit)
+        )
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pool"""
+        self._executor.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get offload and coalescing statistics"""
+        with self._stats_lock:
+            calls = self._calls
+            return {
+                'max_workers': self.max_workers,
+                'calls': calls,
+                'coalesced': self._coalesced,
+                'inflight': len(self._inflight),
+                'avg_offloaded_ms': round(self._offloaded_seconds * 1000 / calls, 2) if calls else 0.0,
+            }
+
+
+# =============================================================================
+# Event Loop Blocking Measurement
+# =============================================================================
+
+@dataclass
+class EndpointLoopStats:
+    """Event loop time consumed by one endpoint"""
+    requests: int = 0
+    blocked_seconds: float = 0.0
+    max_blocked_seconds: float = 0.0
+
+    def record(self, blocked: float) -> None:
+        self.requests += 1
+        self.blocked_seconds += blocked
+        if blocked > self.max_blocked_seconds:
+            self.max_blocked_seconds = blocked
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'avg_blocked_ms': round(self.blocked_seconds * 1000 / self.requests, 2) if self.requests else 0.0,
+            'max_blocked_ms': round(self.max_blocked_seconds * 1000, 2),
+            'total_blocked_ms': round(self.blocked_seconds * 1000, 2),
+        }
+
+
+class LoopBlockTracker:
+    """Per-endpoint record of event loop blocking time"""
+
+    def __init__(self):
+        self._stats: Dict[str, EndpointLoopStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, blocked: float) -> None:
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = EndpointLoopStats()
+            stats.record(blocked)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get stats per endpoint, worst average first"""
+        with self._lock:
+            items = sorted(
+                self._stats.items(),
+                key=lambda item: item[1].blocked_seconds / max(item[1].requests, 1),
+                reverse=True
+            )
+            return {name: stats.to_dict() for name, stats in items}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+@types.coroutine
+def _timed_steps(coro, elapsed: list):
+    """
+    Drive a coroutine step by step, adding the time of each step to
+    elapsed[0].
+
+    Each send()/throw() runs the coroutine on the loop thread until its
+    next await, so the summed step time is exactly the time it held the
+    event loop.
+    """
+    value, error = None, None
+    while True:
+        start = time.perf_counter()
+        try:
+            if error is not None:
+                yielded = coro.throw(error)
+            else:
+                yielded = coro.send(value)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            elapsed[0] += time.perf_counter() - start
+
+        try:
+            value, error = (yield yielded), None
+        except BaseException as e:
+            value, error = None, e
+
+
+class LoopBlockMiddleware:
+    """
+    ASGI middleware recording how long each HTTP endpoint blocks the loop.
+
+    Synchronous (`def`) endpoints already run in a thread pool and record
+    near-zero; `async def` endpoints that call blocking code show up here.
+    """
+
+    def __init__(self, app, tracker: LoopBlockTracker):
+        self.app = app
+        self.tracker = tracker
+
+    async def __call__(self, scope, receive, send):
+        if scope.get('type') != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        elapsed = [0.0]
+        try:
+            await _timed_steps(self.app(scope, receive, send), elapsed)
+        finally:
+            endpoint = scope.get('endpoint')
+            name = getattr(endpoint, '__name__', None) or scope.get('path', 'unknown')
+            self.tracker.record(name, elapsed[0])
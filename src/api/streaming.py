@@ -0,0 +1,165 @@
+"""
+LLM Event Streaming for API Endpoints
+
+Bridges a backend's synchronous `execute_streaming()` generator (which
+reads the Claude CLI's stream-json output on a worker thread) to an async
+iterator that endpoints can forward over Server-Sent Events or WebSocket.
+
+Backpressure:
+- At most `max_buffered` events wait between the worker thread and the
+  consumer. When the buffer is full the worker blocks, which in turn stops
+  it reading the CLI's stdout pipe.
+- Whenever the consumer falls behind (slow client), the buffered text,
+  thinking and tool-input deltas are merged into single events, so a slow
+  client receives fewer, larger messages instead of an ever-growing queue.
+- If the consumer stops early (client disconnected), the worker is told to
+  stop and closes the backend generator, which ends the CLI subprocess.
+
+Backends without `execute_streaming` fall back to one `execute()` call
+whose result is delivered as a single content event.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import threading
+from typing import Any, AsyncIterator, Dict, Optional
+
+from src.core.llm import LLMRequest, StreamEvent
+
+logger = logging.getLogger(__name__)
+
+# Events buffered between the backend thread and the consumer
+DEFAULT_MAX_BUFFERED_EVENTS = 256
+
+# Event types whose consecutive payloads can be concatenated
+MERGEABLE_EVENT_TYPES = ('content', 'thinking', 'tool_input')
+
+# How often a blocked producer re-checks whether the consumer has gone
+_PRODUCER_POLL_SECONDS = 0.5
+
+_DONE = object()
+
+
+def event_to_dict(event: StreamEvent) -> Dict[str, Any]:
+    """Client-facing payload for a stream event"""
+    event_dict: Dict[str, Any] = {
+        "type": event.event_type,
+        "content": event.content,
+    }
+    if event.tool_name:
+        event_dict["tool_name"] = event.tool_name
+    if event.tool_input:
+        event_dict["tool_input"] = event.tool_input
+    if event.tool_result:
+        event_dict["tool_result"] = event.tool_result
+    return event_dict
+
+
+def _can_merge(pending: StreamEvent, nxt: StreamEvent) -> bool:
+    """Whether nxt's payload can be appended to pending's"""
+    if nxt.event_type != pending.event_type or nxt.event_type not in MERGEABLE_EVENT_TYPES:
+        return False
+    if nxt.event_type == 'tool_input':
+        # Partial JSON only concatenates within the same tool call
+        return (nxt.tool_name == pending.tool_name
+                and nxt.data.get('index') == pending.data.get('index'))
+    return True
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Encode one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _iter_backend_events(backend, request: LLMRequest):
+    """Yield stream events from a backend, falling back to a single execute()"""
+    if hasattr(backend, 'execute_streaming'):
+        yield from backend.execute_streaming(request)
+        return
+
+    response = backend.execute(request)
+    if response.success:
+        yield StreamEvent(event_type='content', content=response.content)
+    else:
+        yield StreamEvent(event_type='error', content=response.error or "Unknown error")
+    yield StreamEvent(event_type='done')
+
+
+async def stream_llm_events(
+    backend,
+    request: LLMRequest,
+    max_buffered: int = DEFAULT_MAX_BUFFERED_EVENTS
+) -> AsyncIterator[StreamEvent]:
+    """
+    Run a backend's streaming execution on a worker thread and yield its
+    events asynchronously, merging deltas when the consumer falls behind.
+
+    Args:
+        backend: LLM backend (uses execute_streaming when available)
+        request: The LLM request
+        max_buffered: Maximum events held between producer and consumer
+
+    Yields:
+        StreamEvent objects, ending after the backend's 'done' event
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = threading.Semaphore(max_buffered)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        """Hand an item to the loop, waiting for buffer space. False if stopped."""
+        while not slots.acquire(timeout=_PRODUCER_POLL_SECONDS):
+            if stop.is_set():
+                return False
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+        return True
+
+    def produce() -> None:
+        events = _iter_backend_events(backend, request)
+        try:
+            for event in events:
+                if stop.is_set() or not put(event):
+                    break
+        except Exception as e:
+            logger.warning(f"Streaming execution failed: {e}")
+            put(StreamEvent(event_type='error', content=str(e)))
+        finally:
+            close = getattr(events, 'close', None)
+            if close:
+                close()
+            # The end marker does not need a slot; skip it if nobody is listening
+            if not stop.is_set():
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+                except RuntimeError:
+                    pass  # Loop closed after the consumer went away
+
+    worker = threading.Thread(target=produce, name='llm-stream', daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            slots.release()
+
+            # Merge whatever else is already waiting (consumer fell behind)
+            pending: Optional[StreamEvent] = item
+            while not queue.empty():
+                nxt = queue.get_nowait()
+                if nxt is _DONE:
+                    yield pending
+                    return
+                slots.release()
+                if _can_merge(pending, nxt):
+                    pending = dataclasses.replace(pending, content=pending.content + nxt.content)
+                else:
+                    yield pending
+                    pending = nxt
+            yield pending
+    finally:
+        stop.set()
@@ -23,6 +23,7 @@ Usage:
     ai-corp gates [list|show]                 Manage quality gates
     ai-corp contracts [list|show|create|check|link|activate]  Manage success contracts
     ai-corp knowledge [list|show|add|search|stats|remove]     Manage knowledge base
+    ai-corp learning [status|rebuild|daemon]  Evolution daemon state, rebuild, or run it
 
 CEO Command Flow:
     The --execute flag runs the full agent hierarchy after task delegation:
@@ -72,6 +73,8 @@ from src.core.preset import PresetManager, init_from_preset
 from src.core.contract import ContractManager, SuccessContract, ContractStatus
 from src.core.knowledge import KnowledgeBase, KnowledgeScope, KnowledgeType
 from src.core.ingest import DocumentProcessor, ingest_file
+from src.core.learning import get_learning_system
+from src.core.evolution_runner import EvolutionRunner, CycleBudget
 from src.cli.dashboard import Dashboard, run_dashboard, get_status_line
 
 
@@ -1029,6 +1032,64 @@ def cmd_knowledge(args):
         print(f"Unknown action: {args.action}")
 
 
+def cmd_learning(args):
+    """Inspect, rebuild or run the Evolution Daemon"""
+    corp_path = get_corp_path()
+    learning = get_learning_system(corp_path)
+    daemon = learning.evolution
+
+    if args.action == 'status':
+        stats = daemon.get_stats()
+
+        print("Evolution Daemon")
+        print("=" * 40)
+        print(f"Last fast run:   {stats['last_fast_run'] or 'never'}")
+        print(f"Last medium run: {stats['last_medium_run'] or 'never'}")
+        print(f"Last slow run:   {stats['last_slow_run'] or 'never'}")
+        print(f"Pending suggestions: {stats['pending_suggestions']}")
+        print()
+        print("Watermarks:")
+        for name, position in stats['watermarks'].items():
+            print(f"  {name}: {position}")
+        print()
+        holder = EvolutionRunner(learning).lock_holder()
+        print(f"Daemon process: {f'running (pid {holder})' if holder else 'not running'}")
+        print(f"Queued completions: {learning.completion_queue.pending()}")
+
+    elif args.action == 'rebuild':
+        # A running daemon would advance the same watermarks mid-rebuild
+        runner = EvolutionRunner(learning)
+        if not runner.acquire_lock():
+            holder = runner.lock_holder()
+            print(f"Error: evolution daemon is running (pid {holder or 'unknown'}); "
+                  f"stop it before rebuilding")
+            return
+        try:
+            print("Rebuilding evolution aggregates from full history...")
+            for result in daemon.rebuild(medium_days=args.medium_days, slow_days=args.slow_days):
+                print(f"  {result.cycle_type.value}: {result.patterns_discovered} patterns discovered, "
+                      f"{result.insights_generated} insights, {result.suggestions_generated} suggestions")
+                for error in result.errors:
+                    print(f"    Error: {error}")
+        finally:
+            runner.release_lock()
+
+    elif args.action == 'daemon':
+        runner = EvolutionRunner(
+            learning,
+            poll_interval=args.poll,
+            budget=CycleBudget(max_seconds=args.max_seconds, max_cpu_seconds=args.max_cpu_seconds)
+        )
+        print(f"Evolution daemon running for {corp_path} (Ctrl+C to stop)")
+        try:
+            runner.run_forever(niceness=args.nice)
+        except RuntimeError as e:
+            print(f"Error: {e}")
+
+    else:
+        print(f"Unknown action: {args.action}")
+
+
 def cmd_dashboard(args):
     """Show the terminal dashboard"""
     corp_path = get_corp_path()
@@ -1204,6 +1265,23 @@ def main():
     knowledge_parser.add_argument('--query', '-q', help='Search query (for search)')
     knowledge_parser.set_defaults(func=cmd_knowledge)
 
+    # Learning command
+    learning_parser = subparsers.add_parser('learning', help='Evolution daemon state and rebuild')
+    learning_parser.add_argument('action', choices=['status', 'rebuild', 'daemon'], default='status', nargs='?')
+    learning_parser.add_argument('--medium-days', type=int, default=7,
+                                 help='Insight window for the rebuilt medium cycle (default: 7)')
+    learning_parser.add_argument('--slow-days', type=int, default=30,
+                                 help='Analysis window for the rebuilt slow cycle (default: 30)')
+    learning_parser.add_argument('--poll', type=float, default=5.0,
+                                 help='Seconds between daemon ticks (default: 5)')
+    learning_parser.add_argument('--max-seconds', type=float, default=30.0,
+                                 help='Wall-clock budget per daemon tick (default: 30)')
+    learning_parser.add_argument('--max-cpu-seconds', type=float, default=10.0,
+                                 help='CPU budget per daemon tick (default: 10)')
+    learning_parser.add_argument('--nice', type=int, default=10,
+                                 help='Niceness added to the daemon process (default: 10)')
+    learning_parser.set_defaults(func=cmd_learning)
+
     # Dashboard command
     dashboard_parser = subparsers.add_parser('dashboard', help='View terminal dashboard')
     dashboard_parser.add_argument('-l', '--live', action='store_true',
@@ -60,12 +60,28 @@ from .interactions import (
     Interaction, InteractionType, InteractionStore, InteractionProcessor,
     ExtractedEntity, ActionItem
 )
+from .search_index import NgramIndex
+from .threads import ConversationThreadStore
+from .versions import VersionedCache, bump_version, get_version, get_versions
+from .molecule_index import MoleculeSummaryIndex, molecule_summary
+from .registry import (
+    StoreRegistry, get_store_registry, get_hook_manager, get_molecule_engine, get_gate_keeper
+)
+from .relationship_columns import RelationshipColumns, DEFAULT_STRENGTH_HALF_LIFE_DAYS
+from .outcome_columns import OutcomeColumns
+from .insight_index import InsightHashIndex
+from .trigger_automaton import TriggerAutomaton
+from .evolution_runner import EvolutionRunner, CycleBudget, LearningEventQueue
+from .failure_index import FailureIndex
+from .metering import (
+    UsageMeter, UsageRecord, usage_scope, get_usage_meter, activate_usage_meter, estimate_cost
+)
 from .entity_resolver import (
     EntityResolver, ResolutionCandidate, MergeDecision, MatchType
 )
 from .entity_summarizer import (
     EntitySummarizer, SummaryStore, Summary, SummaryType, SummaryScope,
-    EntityProfile
+    EntityProfile, SummaryCache
 )
 from .graph import (
     EntityGraph, EntityContext, get_entity_graph,
@@ -152,9 +168,17 @@ __all__ = [
     'Relationship', 'RelationshipType', 'ConfidenceLevel',
     'Interaction', 'InteractionType', 'InteractionStore', 'InteractionProcessor',
     'ExtractedEntity', 'ActionItem',
+    'NgramIndex', 'ConversationThreadStore',
+    'VersionedCache', 'bump_version', 'get_version', 'get_versions',
+    'MoleculeSummaryIndex', 'molecule_summary',
+    'StoreRegistry', 'get_store_registry', 'get_hook_manager', 'get_molecule_engine', 'get_gate_keeper',
+    'RelationshipColumns', 'DEFAULT_STRENGTH_HALF_LIFE_DAYS',
+    'OutcomeColumns', 'InsightHashIndex', 'TriggerAutomaton',
+    'EvolutionRunner', 'CycleBudget', 'LearningEventQueue', 'FailureIndex',
+    'UsageMeter', 'UsageRecord', 'usage_scope', 'get_usage_meter', 'activate_usage_meter', 'estimate_cost',
     'EntityResolver', 'ResolutionCandidate', 'MergeDecision', 'MatchType',
     'EntitySummarizer', 'SummaryStore', 'Summary', 'SummaryType', 'SummaryScope',
-    'EntityProfile',
+    'EntityProfile', 'SummaryCache',
     'EntityGraph', 'EntityContext', 'get_entity_graph',
     'DepthConfig', 'get_depth_for_level',
     'AGENT_LEVEL_DEPTH_DEFAULTS', 'AGENT_LEVEL_CONTEXT_LIMITS',
@@ -30,6 +30,9 @@ import json
 import logging
 import re
 
+from .search_index import NgramIndex
+from .relationship_columns import RelationshipColumns, DEFAULT_STRENGTH_HALF_LIFE_DAYS
+
 logger = logging.getLogger(__name__)
 
 
@@ -490,12 +493,24 @@ class EntityStore:
         self.entities_index = self.entities_path / "entities_index.yaml"
         self.relationships_index = self.entities_path / "relationships_index.yaml"
         self.alias_index_file = self.entities_path / "alias_index.yaml"
+        self.relationship_strengths_file = self.entities_path / "relationship_strengths.bin"
 
         # In-memory caches
         self.entities: Dict[str, Entity] = {}
         self.relationships: Dict[str, Relationship] = {}
         self.alias_index: Dict[str, str] = {}  # alias_key -> entity_id
 
+        # Relationship strength/recency columns and per-entity edge index
+        self.relationship_columns = RelationshipColumns()
+
+        # Substring indexes (maintained incrementally, never persisted)
+        self.alias_search_index = NgramIndex()   # alias_key -> alias_key
+        self.entity_search_index = NgramIndex()  # entity_id -> name/description/aliases
+
+        # Change counters for cache invalidation (in-memory only)
+        self._versions: Dict[str, int] = {}  # entity_id -> version
+        self._generation = 0                  # bumped by store-wide changes
+
         self._load()
 
     def _load(self) -> None:
@@ -514,6 +529,11 @@ class EntityStore:
                 rel = Relationship.from_dict(rel_data)
                 self.relationships[rel.id] = rel
 
+        # Strengths may have been decayed since the YAML was last written
+        self.relationship_columns.rebuild(self.relationships.values())
+        if self.relationship_columns.load_strengths(self.relationship_strengths_file):
+            self.relationship_columns.sync_to(self.relationships)
+
         # Build alias index
         self._rebuild_alias_index()
 
@@ -527,7 +547,11 @@ class EntityStore:
         }
         self.entities_index.write_text(yaml.dump(entities_data, default_flow_style=False))
 
-        # Save relationships
+        # Save relationships. Objects mirror the columns (decay writes back),
+        # so any difference is an edit made on the object, e.g. rel.end()
+        for rel_id in self.relationship_columns.refresh(self.relationships.values()):
+            rel = self.relationships[rel_id]
+            self.bump_version(rel.source_id, rel.target_id)
         rel_data = {
             'updated_at': datetime.utcnow().isoformat(),
             'relationship_count': len(self.relationships),
@@ -543,22 +567,73 @@ class EntityStore:
         }
         self.alias_index_file.write_text(yaml.dump(alias_data, default_flow_style=False))
 
+        self.relationship_columns.save(self.relationship_strengths_file)
+
     def _save_relationships(self) -> None:
         """Alias for _save - saves all data including relationships"""
         self._save()
 
+    def save_relationship_strengths(self) -> None:
+        """Persist only relationship strengths (no YAML rewrite)"""
+        self.relationship_columns.save(self.relationship_strengths_file)
+
     def _rebuild_alias_index(self) -> None:
         """Rebuild the alias lookup index"""
         self.alias_index = {}
+        self.alias_search_index.clear()
+        self.entity_search_index.clear()
         for entity in self.entities.values():
-            for alias in entity.aliases:
-                key = self._alias_key(alias.value, alias.alias_type)
-                self.alias_index[key] = entity.id
+            self._index_entity(entity)
 
     def _alias_key(self, value: str, alias_type: str) -> str:
         """Create a normalized key for alias lookup"""
         return f"{alias_type}:{value.lower().strip()}"
 
+    # =========================================================================
+    # Change Tracking
+    # =========================================================================
+
+    def get_version(self, entity_id: str) -> int:
+        """
+        Get the change counter for an entity.
+
+        Increases whenever the entity, its aliases, or its relationships
+        change (including store-wide changes like relationship decay), so
+        derived data such as profiles can be cached until it moves.
+        """
+        return self._generation + self._versions.get(entity_id, 0)
+
+    def bump_version(self, *entity_ids: str) -> None:
+        """Mark entities as changed"""
+        for entity_id in entity_ids:
+            self._versions[entity_id] = self._versions.get(entity_id, 0) + 1
+
+    def bump_generation(self) -> None:
+        """Mark every entity as changed"""
+        self._generation += 1
+
+    def _index_entity(self, entity: Entity) -> None:
+        """Add an entity's aliases and searchable text to the indexes"""
+        for alias in entity.aliases:
+            key = self._alias_key(alias.value, alias.alias_type)
+            self.alias_index[key] = entity.id
+            self.alias_search_index.add(key, [key])
+
+        self.entity_search_index.add(
+            entity.id,
+            [f"{entity.name} {entity.description}"] + [a.value for a in entity.aliases]
+        )
+
+    def _unindex_entity(self, entity: Entity) -> None:
+        """Remove an entity's aliases and searchable text from the indexes"""
+        for alias in entity.aliases:
+            key = self._alias_key(alias.value, alias.alias_type)
+            if self.alias_index.get(key) == entity.id:
+                del self.alias_index[key]
+                self.alias_search_index.remove(key)
+
+        self.entity_search_index.remove(entity.id)
+
     # =========================================================================
     # Entity Operations
     # =========================================================================
@@ -588,11 +663,8 @@ class EntityStore:
     def add_entity(self, entity: Entity) -> Entity:
         """Add an entity to the store"""
         self.entities[entity.id] = entity
-
-        # Index aliases
-        for alias in entity.aliases:
-            key = self._alias_key(alias.value, alias.alias_type)
-            self.alias_index[key] = entity.id
+        self._index_entity(entity)
+        self.bump_version(entity.id)
 
         self._save()
         logger.info(f"Added entity: {entity.id} ({entity.name})")
@@ -614,9 +686,9 @@ class EntityStore:
 
         alias = entity.add_alias(value, alias_type, source, confidence, is_primary)
 
-        # Update alias index
-        key = self._alias_key(value, alias_type)
-        self.alias_index[key] = entity_id
+        # Update alias and search indexes
+        self._index_entity(entity)
+        self.bump_version(entity_id)
 
         self._save()
         return alias
@@ -636,11 +708,13 @@ class EntityStore:
     def find_by_any_alias(self, value: str) -> List[Entity]:
         """Find entities matching any alias type"""
         results = []
-        value_lower = value.lower().strip()
-        for key, entity_id in self.alias_index.items():
-            if value_lower in key:
+        seen: Set[str] = set()
+        for key in self.alias_search_index.search(value.strip()):
+            entity_id = self.alias_index.get(key)
+            if entity_id and entity_id not in seen:
                 entity = self.entities.get(entity_id)
-                if entity and entity not in results:
+                if entity:
+                    seen.add(entity_id)
                     results.append(entity)
         return results
 
@@ -651,26 +725,41 @@ class EntityStore:
         limit: int = 20
     ) -> List[Entity]:
         """Search entities by name, description, or aliases"""
-        query_lower = query.lower()
-        results = []
+        results = [
+            self.entities[entity_id]
+            for entity_id in self.entity_search_index.search(query)
+            if entity_id in self.entities
+        ]
 
-        for entity in self.entities.values():
-            if entity_type and entity.entity_type != entity_type:
-                continue
+        if entity_type:
+            results = [e for e in results if e.entity_type == entity_type]
 
-            # Search in name and description
-            searchable = f"{entity.name} {entity.description}".lower()
-            if query_lower in searchable:
-                results.append(entity)
-                continue
+        # Sort by interaction count (most relevant first)
+        results.sort(key=lambda e: e.interaction_count, reverse=True)
+        return results[:limit]
 
-            # Search in aliases
-            for alias in entity.aliases:
-                if query_lower in alias.value.lower():
-                    results.append(entity)
-                    break
+    def typeahead(
+        self,
+        prefix: str,
+        entity_type: Optional[EntityType] = None,
+        limit: int = 10
+    ) -> List[Entity]:
+        """
+        Find entities with a word in their name, description, or aliases
+        starting with `prefix`.
+
+        Used for autocomplete lookups, so results come straight from the
+        n-gram index without scanning the address book.
+        """
+        results = [
+            self.entities[entity_id]
+            for entity_id in self.entity_search_index.search_prefix(prefix)
+            if entity_id in self.entities
+        ]
+
+        if entity_type:
+            results = [e for e in results if e.entity_type == entity_type]
 
-        # Sort by interaction count (most relevant first)
         results.sort(key=lambda e: e.interaction_count, reverse=True)
         return results[:limit]
 
@@ -697,10 +786,9 @@ class EntityStore:
         entity.updated_at = datetime.utcnow().isoformat()
         self.entities[entity.id] = entity
 
-        # Rebuild alias index for this entity
-        for alias in entity.aliases:
-            key = self._alias_key(alias.value, alias.alias_type)
-            self.alias_index[key] = entity.id
+        # Re-index this entity (aliases, name, and description may have changed)
+        self._index_entity(entity)
+        self.bump_version(entity.id)
 
         self._save()
         return entity
@@ -712,20 +800,18 @@ class EntityStore:
 
         entity = self.entities[entity_id]
 
-        # Remove from alias index
-        for alias in entity.aliases:
-            key = self._alias_key(alias.value, alias.alias_type)
-            self.alias_index.pop(key, None)
+        # Remove from alias and search indexes
+        self._unindex_entity(entity)
 
         # Remove relationships
-        rel_ids_to_remove = [
-            r.id for r in self.relationships.values()
-            if r.source_id == entity_id or r.target_id == entity_id
-        ]
+        rel_ids_to_remove = self.relationship_columns.ids_for_entity(entity_id)
         for rel_id in rel_ids_to_remove:
-            del self.relationships[rel_id]
+            rel = self.relationships.pop(rel_id)
+            self.relationship_columns.remove(rel_id)
+            self.bump_version(rel.source_id, rel.target_id)
 
         del self.entities[entity_id]
+        self.bump_version(entity_id)
         self._save()
         return True
 
@@ -762,6 +848,8 @@ class EntityStore:
     def add_relationship(self, relationship: Relationship) -> Relationship:
         """Add a relationship to the store"""
         self.relationships[relationship.id] = relationship
+        self.relationship_columns.upsert(relationship)
+        self.bump_version(relationship.source_id, relationship.target_id)
         self._save()
         logger.info(f"Added relationship: {relationship.id} ({relationship.relationship_type.value})")
         return relationship
@@ -777,8 +865,9 @@ class EntityStore:
         relationship_type: Optional[RelationshipType] = None
     ) -> Optional[Relationship]:
         """Find a specific relationship between two entities"""
-        for rel in self.relationships.values():
-            if rel.source_id == source_id and rel.target_id == target_id:
+        for rel_id in self.relationship_columns.ids_for_entity(source_id):
+            rel = self.relationships.get(rel_id)
+            if rel and rel.source_id == source_id and rel.target_id == target_id:
                 if relationship_type is None or rel.relationship_type == relationship_type:
                     return rel
         return None
@@ -788,12 +877,23 @@ class EntityStore:
         entity_id: str,
         direction: str = "both",  # "outgoing", "incoming", "both"
         relationship_type: Optional[RelationshipType] = None,
-        active_only: bool = True
+        active_only: bool = True,
+        limit: Optional[int] = None
     ) -> List[Relationship]:
-        """Get all relationships for an entity"""
-        results = []
+        """
+        Get relationships for an entity, strongest first.
+
+        Uses the per-entity edge index and ranks by the strength column,
+        so only this entity's edges are touched. With a limit, only the
+        top `limit` are selected.
+        """
+        matching = []
+
+        for rel_id in self.relationship_columns.ids_for_entity(entity_id):
+            rel = self.relationships.get(rel_id)
+            if rel is None:
+                continue
 
-        for rel in self.relationships.values():
             if active_only and not rel.is_active():
                 continue
 
@@ -801,11 +901,15 @@ class EntityStore:
                 continue
 
             if direction in ("outgoing", "both") and rel.source_id == entity_id:
-                results.append(rel)
+                matching.append(rel_id)
             elif direction in ("incoming", "both") and rel.target_id == entity_id:
-                results.append(rel)
+                matching.append(rel_id)
 
-        results.sort(key=lambda r: r.strength, reverse=True)
+        results = []
+        for rel_id in self.relationship_columns.rank(matching, limit):
+            rel = self.relationships[rel_id]
+            rel.strength = self.relationship_columns.strength(rel_id)
+            results.append(rel)
         return results
 
     # Alias for convenience
@@ -853,10 +957,50 @@ class EntityStore:
         traverse(entity_id, 1)
         return results
 
+    def repoint_relationships(self, old_entity_id: str, new_entity_id: str) -> int:
+        """
+        Move every relationship endpoint from one entity to another.
+
+        Used when merging entities. Returns the number of relationships
+        changed. Does not save - callers save once after the merge.
+        """
+        moved = 0
+        for rel_id in self.relationship_columns.ids_for_entity(old_entity_id):
+            rel = self.relationships.get(rel_id)
+            if rel is None:
+                continue
+            if rel.source_id == old_entity_id:
+                rel.source_id = new_entity_id
+            if rel.target_id == old_entity_id:
+                rel.target_id = new_entity_id
+            self.relationship_columns.upsert(rel)
+            self.bump_version(rel.source_id, rel.target_id)
+            moved += 1
+        return moved
+
+    def decay_relationship_strengths(
+        self,
+        half_life_days: float = DEFAULT_STRENGTH_HALF_LIFE_DAYS
+    ) -> int:
+        """
+        Exponentially decay every relationship's strength by elapsed time.
+
+        Runs as one pass over the strength column and persists only the
+        strengths file. Cached Relationship objects are updated too.
+        Returns the number of relationships decayed.
+        """
+        decayed = self.relationship_columns.decay(half_life_days)
+        self.relationship_columns.sync_to(self.relationships)
+        self.bump_generation()
+        self.save_relationship_strengths()
+        return decayed
+
     def update_relationship(self, relationship: Relationship) -> Relationship:
         """Update an existing relationship"""
         relationship.updated_at = datetime.utcnow().isoformat()
         self.relationships[relationship.id] = relationship
+        self.relationship_columns.upsert(relationship)
+        self.bump_version(relationship.source_id, relationship.target_id)
         self._save()
         return relationship
 
@@ -879,6 +1023,7 @@ class EntityStore:
         return {
             'total_entities': len(self.entities),
             'total_relationships': len(self.relationships),
+            'average_relationship_strength': round(self.relationship_columns.mean_strength(), 2),
             'total_aliases': len(self.alias_index),
             'entities_by_type': type_counts,
             'relationships_by_type': rel_type_counts,
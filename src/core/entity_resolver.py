@@ -362,11 +362,7 @@ class EntityResolver:
         primary.updated_at = datetime.utcnow().isoformat()
 
         # Update relationships pointing to secondary
-        for rel in self.entity_store.relationships.values():
-            if rel.source_id == secondary.id:
-                rel.source_id = primary.id
-            if rel.target_id == secondary.id:
-                rel.target_id = primary.id
+        self.entity_store.repoint_relationships(secondary.id, primary.id)
 
         # Save primary and delete secondary
         self.entity_store.update_entity(primary)
@@ -13,9 +13,10 @@ Inspired by:
 - The need for Claude to understand "who is Tim?" without reading all interactions
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple, Hashable
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
@@ -181,6 +182,66 @@ class SummaryStore:
                 file_path.unlink()
 
 
+class SummaryCache:
+    """
+    In-memory memo of generated profiles and summaries.
+
+    Each entry is stored with the version counters of the inputs it was
+    built from (see EntityStore.get_version and
+    InteractionStore.get_participant_version). An entry is reused until
+    any of those counters move or its wall-clock validity runs out - the
+    latter only matters for time-scoped views like "recent" activity,
+    which change as interactions age out of the window.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[Tuple[int, ...], str, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, versions: Tuple[int, ...]) -> Optional[Any]:
+        """Get a cached value if it was built from the given versions"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_versions, valid_until, value = entry
+            if cached_versions == versions and datetime.utcnow().isoformat() <= valid_until:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def put(
+        self,
+        key: Hashable,
+        versions: Tuple[int, ...],
+        value: Any,
+        valid_until: str
+    ) -> None:
+        """Cache a value built from the given versions"""
+        self._entries[key] = (versions, valid_until, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached values"""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+        }
+
+
 class EntitySummarizer:
     """
     Generates hierarchical summaries of entities and their relationships.
@@ -200,6 +261,17 @@ class EntitySummarizer:
         self.interaction_store = interaction_store
         self.summary_store = summary_store
 
+        # Memoized profiles/summaries, invalidated by store version counters
+        self.cache = SummaryCache()
+
+    def _input_versions(self, *entity_ids: str) -> Tuple[int, ...]:
+        """Version counters for everything a summary of these entities reads"""
+        versions: List[int] = []
+        for entity_id in entity_ids:
+            versions.append(self.entity_store.get_version(entity_id))
+            versions.append(self.interaction_store.get_participant_version(entity_id))
+        return tuple(versions)
+
     # =========================================================================
     # Entity Summaries
     # =========================================================================
@@ -218,6 +290,12 @@ class EntitySummarizer:
         if not entity:
             return None
 
+        cache_key = ('entity', entity_id, scope)
+        versions = self._input_versions(entity_id)
+        cached = self.cache.get(cache_key, versions)
+        if cached is not None:
+            return cached
+
         # Get interactions involving this entity
         interactions = self._get_scoped_interactions(entity_id, scope)
 
@@ -288,6 +366,7 @@ class EntitySummarizer:
         )
 
         self.summary_store.save_summary(summary)
+        self.cache.put(cache_key, versions, summary, summary.valid_until)
         return summary
 
     def generate_entity_profile(self, entity_id: str) -> Optional[EntityProfile]:
@@ -296,11 +375,20 @@ class EntitySummarizer:
 
         This is the full context package for Claude to understand
         everything about this entity.
+
+        Profiles are memoized until the entity, its relationships, or its
+        interactions change.
         """
         entity = self.entity_store.get_entity(entity_id)
         if not entity:
             return None
 
+        cache_key = ('profile', entity_id)
+        versions = self._input_versions(entity_id)
+        cached = self.cache.get(cache_key, versions)
+        if cached is not None:
+            return cached
+
         # Get all interactions
         all_interactions = self._get_scoped_interactions(entity_id, SummaryScope.ALL_TIME)
         recent_interactions = self._get_scoped_interactions(entity_id, SummaryScope.RECENT)
@@ -360,7 +448,7 @@ class EntitySummarizer:
         # Interaction frequency
         frequency = self._calculate_frequency(all_interactions)
 
-        return EntityProfile(
+        profile = EntityProfile(
             entity=entity,
             summary=summary,
             key_facts=key_facts,
@@ -373,6 +461,13 @@ class EntitySummarizer:
             interaction_frequency=frequency
         )
 
+        # Recent activity ages out of the window, so bound reuse by the
+        # same validity as a recent-scope summary
+        self.cache.put(
+            cache_key, versions, profile, self._calculate_validity(SummaryScope.RECENT)
+        )
+        return profile
+
     # =========================================================================
     # Relationship Summaries
     # =========================================================================
@@ -394,6 +489,12 @@ class EntitySummarizer:
         if not entity1 or not entity2:
             return None
 
+        cache_key = ('relationship', entity1_id, entity2_id, scope)
+        versions = self._input_versions(entity1_id, entity2_id)
+        cached = self.cache.get(cache_key, versions)
+        if cached is not None:
+            return cached
+
         # Get shared interactions
         interactions1 = set(self._get_interaction_ids(entity1_id, scope))
         interactions2 = set(self._get_interaction_ids(entity2_id, scope))
@@ -459,6 +560,7 @@ class EntitySummarizer:
         )
 
         self.summary_store.save_summary(summary)
+        self.cache.put(cache_key, versions, summary, summary.valid_until)
         return summary
 
     # =========================================================================
@@ -560,20 +662,11 @@ class EntitySummarizer:
             if not entity:
                 continue
 
-            # Get or generate entity summary
-            existing = self.summary_store.find_summaries(
-                subject_ids=[entity_id],
-                summary_type=SummaryType.ENTITY,
-                scope=SummaryScope.RECENT
+            # Get or generate entity summary (memoized until inputs change)
+            entity_summary = self.generate_entity_summary(
+                entity_id, SummaryScope.RECENT
             )
 
-            if existing and not self._is_stale(existing[0]):
-                entity_summary = existing[0]
-            else:
-                entity_summary = self.generate_entity_summary(
-                    entity_id, SummaryScope.RECENT
-                )
-
             if entity_summary:
                 content_parts.append(f"**{entity.name}**: {entity_summary.content}")
                 key_points.extend(entity_summary.key_points[:3])
@@ -690,16 +783,8 @@ class EntitySummarizer:
         return [i.id for i in interactions]
 
     def _get_period_interactions(self, scope: SummaryScope) -> List[Interaction]:
-        """Get all interactions within a time scope"""
-        cutoff = self._get_scope_cutoff(scope)
-        result = []
-
-        for interaction in self.interaction_store.interactions.values():
-            if interaction.timestamp >= cutoff:
-                result.append(interaction)
-
-        result.sort(key=lambda x: x.timestamp, reverse=True)
-        return result
+        """Get all interactions within a time scope, most recent first"""
+        return self.interaction_store.get_since(self._get_scope_cutoff(scope))
 
     def _get_scope_cutoff(self, scope: SummaryScope) -> str:
         """Get the cutoff timestamp for a scope"""
@@ -0,0 +1,432 @@
+"""
+Evolution Runner - Scheduled Evolution Daemon Cycles Off the Request Path
+
+EvolutionDaemon's fast/medium/slow cycles are plain methods. Before this
+module, molecule completion distilled insights inline (via
+LearningSystem.on_molecule_complete), so completing a molecule waited on
+learning work, and nothing ran the periodic cycles at all.
+
+- LearningEventQueue: a durable, append-only queue of molecule completion
+  events. MoleculeEngine enqueues (one short locked append) and returns;
+  any process can enqueue, one daemon consumes.
+- EvolutionRunner: runs the cycles on their own schedule, either on a
+  background thread (`start`/`stop`) or in the foreground of a dedicated
+  process (`run_forever`, used by `ai-corp learning daemon`). Each tick
+  drains queued events in small fast-cycle batches and runs the medium
+  and slow cycles when they are due, all within a CycleBudget of wall
+  and CPU time. Between batches the runner sleeps briefly so it yields
+  to request-serving threads; work left over when the budget runs out
+  waits for the next tick.
+
+Budget tradeoffs:
+- The budget is checked between batches, never inside one. A catch-up
+  batch distilled on the process pool can run past max_seconds; the
+  overrun is bounded by one batch (catchup_batch_size events).
+- CPU time counts the runner thread plus distillation pool workers once
+  they have exited (RUSAGE_CHILDREN), capped in parallelism by
+  max_distill_workers. Other threads of the process are not counted.
+- Only `run_forever` lowers scheduling priority (niceness). Under
+  `start()` the runner and its pool workers compete with request
+  threads at normal priority, so keep max_distill_workers small there.
+
+A lock file makes sure only one runner works on a corp at a time.
+
+Storage:
+    learning/evolution/
+        events.jsonl     # queued completion events (compacted once drained)
+        events.offset    # bytes of events.jsonl already processed
+        daemon.lock      # flock-held by the running daemon; contains its pid
+"""
+
+import fcntl
+import json
+import logging
+import os
+import resource
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .learning import CycleResult, LearningSystem
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Event Queue
+# =============================================================================
+
+class LearningEventQueue:
+    """
+    File-backed queue of molecule completion events.
+
+    Producers append one JSON line under an exclusive flock. The consumer
+    reads from a byte offset and acknowledges what it processed, so events
+    survive a crash between read and ack (at-least-once delivery). Once
+    everything is acknowledged the file is truncated.
+    """
+
+    def __init__(self, events_file: Path):
+        self.events_file = Path(events_file)
+        self.offset_file = self.events_file.with_suffix('.offset')
+        self.lock_path = self.events_file.with_suffix('.jsonl.lock')
+        self.events_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def _locked(self):
+        """Exclusive cross-process lock around queue file updates"""
+        lock_file = open(self.lock_path, 'w')
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        return lock_file
+
+    @staticmethod
+    def _unlock(lock_file) -> None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+    def _read_offset(self) -> int:
+        try:
+            return int(self.offset_file.read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _write_offset(self, offset: int) -> None:
+        tmp = self.offset_file.with_suffix('.offset.tmp')
+        tmp.write_text(str(offset))
+        os.replace(tmp, self.offset_file)
+
+    def put(self, molecule_data: Dict[str, Any]) -> None:
+        """Queue a completed molecule for the next fast cycle"""
+        line = json.dumps({
+            'molecule': molecule_data,
+            'queued_at': datetime.now().isoformat()
+        }, default=str) + '\n'
+        lock_file = self._locked()
+        try:
+            with open(self.events_file, 'a') as f:
+                f.write(line)
+        finally:
+            self._unlock(lock_file)
+
+    def peek(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Up to `limit` unprocessed events, oldest first.
+
+        Each event carries the '_end' byte offset to pass to `ack`.
+        """
+        events = []
+        offset = self._read_offset()
+        if not self.events_file.exists():
+            return events
+        with open(self.events_file, 'rb') as f:
+            if offset > os.fstat(f.fileno()).st_size:
+                offset = 0      # File was replaced; start over
+            f.seek(offset)
+            while len(events) < limit:
+                raw = f.readline()
+                if not raw or not raw.endswith(b'\n'):
+                    break       # End of file, or a line still being written
+                offset += len(raw)
+                try:
+                    event = json.loads(raw)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt line in {self.events_file}")
+                    continue
+                event['_end'] = offset
+                events.append(event)
+        return events
+
+    def ack(self, end_offset: int) -> None:
+        """Mark events up to end_offset processed, compacting a drained file"""
+        lock_file = self._locked()
+        try:
+            size = self.events_file.stat().st_size if self.events_file.exists() else 0
+            if end_offset >= size:
+                self.events_file.write_text('')
+                end_offset = 0
+            self._write_offset(end_offset)
+        finally:
+            self._unlock(lock_file)
+
+    def pending(self) -> int:
+        """Number of queued, unprocessed events"""
+        if not self.events_file.exists():
+            return 0
+        with open(self.events_file, 'rb') as f:
+            f.seek(min(self._read_offset(), os.fstat(f.fileno()).st_size))
+            return sum(1 for line in f if line.endswith(b'\n'))
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+@dataclass
+class CycleBudget:
+    """Per-tick limits on how much work the runner does"""
+    max_seconds: float = 30.0        # Wall-clock time per tick
+    max_cpu_seconds: float = 10.0    # CPU time of the runner thread per tick
+    batch_size: int = 20             # Events per fast-cycle batch
+    yield_seconds: float = 0.05      # Pause between batches
+    catchup_batch_size: int = 1000   # Batch size while this many events are backed up
+    max_distill_workers: int = 2     # Distillation pool processes (1 = in-process)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'max_seconds': self.max_seconds,
+            'max_cpu_seconds': self.max_cpu_seconds,
+            'batch_size': self.batch_size,
+            'yield_seconds': self.yield_seconds,
+            'catchup_batch_size': self.catchup_batch_size,
+            'max_distill_workers': self.max_distill_workers
+        }
+
+
+def _children_cpu_time() -> float:
+    """CPU time of this process's exited, reaped child processes"""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+class _BudgetClock:
+    """Wall time and CPU time (runner thread plus pool workers) since the tick started"""
+
+    def __init__(self, budget: CycleBudget):
+        self.budget = budget
+        self.wall_start = time.monotonic()
+        self.cpu_start = time.thread_time() + _children_cpu_time()
+
+    def cpu_seconds(self) -> float:
+        return time.thread_time() + _children_cpu_time() - self.cpu_start
+
+    def exhausted(self) -> bool:
+        return (time.monotonic() - self.wall_start >= self.budget.max_seconds or
+                self.cpu_seconds() >= self.budget.max_cpu_seconds)
+
+
+class EvolutionRunner:
+    """
+    Runs EvolutionDaemon cycles on a schedule, outside the request path.
+
+    Usage:
+        runner = EvolutionRunner(learning_system)
+        runner.start()          # Background thread in this process
+        ...
+        runner.stop()
+
+    or, in a dedicated process:
+        EvolutionRunner(learning_system).run_forever()
+    """
+
+    def __init__(
+        self,
+        learning_system: 'LearningSystem',
+        fast_interval: float = 3600,
+        medium_interval: float = 86400,
+        slow_interval: float = 604800,
+        poll_interval: float = 5.0,
+        budget: Optional[CycleBudget] = None
+    ):
+        self.learning = learning_system
+        self.daemon = learning_system.evolution
+        self.queue = learning_system.completion_queue
+        self.fast_interval = fast_interval
+        self.medium_interval = medium_interval
+        self.slow_interval = slow_interval
+        self.poll_interval = poll_interval
+        self.budget = budget or CycleBudget()
+
+        self.lock_path = self.daemon.evolution_path / "daemon.lock"
+        self._lock_file = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.ticks = 0
+        self.events_processed = 0
+        self.budget_exhausted = 0
+        self.last_tick: Optional[str] = None
+
+    # =========================================================================
+    # Single-Daemon Lock
+    # =========================================================================
+
+    def acquire_lock(self) -> bool:
+        """Take the corp's daemon lock; False if another daemon holds it"""
+        if self._lock_file is not None:
+            return True
+        lock_file = open(self.lock_path, 'a+')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._lock_file = lock_file
+        return True
+
+    def release_lock(self) -> None:
+        if self._lock_file is None:
+            return
+        self._lock_file.seek(0)
+        self._lock_file.truncate()
+        fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def lock_holder(self) -> Optional[int]:
+        """Pid of the daemon holding the lock, if any"""
+        probe = open(self.lock_path, 'a+')
+        try:
+            fcntl.flock(probe.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            probe.seek(0)
+            pid = probe.read().strip()
+            return int(pid) if pid.isdigit() else None
+        finally:
+            probe.close()
+        return None
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    @staticmethod
+    def _is_due(last_run: Optional[str], interval: float) -> bool:
+        if not last_run:
+            return True
+        try:
+            elapsed = (datetime.now() - datetime.fromisoformat(last_run)).total_seconds()
+        except ValueError:
+            return True
+        return elapsed >= interval
+
+    def tick(self) -> List['CycleResult']:
+        """
+        Do one round of due work within the budget.
+
+        Queued completion events go through the fast cycle in batches;
+        the medium and slow cycles run if they are due and budget is left.
+        """
+        clock = _BudgetClock(self.budget)
+        results = []
+
+        fast_due = self._is_due(self.daemon.last_fast_run, self.fast_interval)
+        # A backlog (e.g. after downtime) is distilled in large batches,
+        # which KnowledgeDistiller spreads over a process pool
+        batch_size = self.budget.batch_size
+        if self.queue.pending() >= self.budget.catchup_batch_size:
+            batch_size = self.budget.catchup_batch_size
+        while not self._stop.is_set():
+            events = self.queue.peek(batch_size)
+            if not events and not fast_due:
+                break
+            result = self.daemon.run_fast_cycle(
+                [e['molecule'] for e in events], workers=self.budget.max_distill_workers
+            )
+            results.append(result)
+            fast_due = False
+            if result.failed:
+                # Leave the batch queued; it is retried on the next tick
+                logger.warning(f"Fast cycle failed; {len(events)} queued events kept for retry")
+                break
+            if events:
+                self.queue.ack(events[-1]['_end'])
+                self.events_processed += len(events)
+            if len(events) < batch_size:
+                break
+            if clock.exhausted():
+                break
+            # Yield to other threads between batches
+            self._stop.wait(self.budget.yield_seconds)
+
+        for last_run, interval, run in (
+            (self.daemon.last_medium_run, self.medium_interval, self.daemon.run_medium_cycle),
+            (self.daemon.last_slow_run, self.slow_interval, self.daemon.run_slow_cycle),
+        ):
+            if self._stop.is_set() or clock.exhausted():
+                break
+            if self._is_due(last_run, interval):
+                results.append(run())
+
+        if clock.exhausted():
+            self.budget_exhausted += 1
+            logger.info("Evolution runner budget exhausted; remaining work deferred to next tick")
+
+        self.ticks += 1
+        self.last_tick = datetime.now().isoformat()
+        return results
+
+    # =========================================================================
+    # Thread / Process Modes
+    # =========================================================================
+
+    def _loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.tick()
+                except Exception as e:
+                    logger.error(f"Evolution runner tick failed: {e}")
+                self._stop.wait(self.poll_interval)
+        finally:
+            # Persist outcome statistics the cycles accumulated in memory
+            self.learning.meta.checkpoint()
+            self.release_lock()
+
+    def start(self) -> None:
+        """Run ticks on a background thread in this process"""
+        if self._thread and self._thread.is_alive():
+            return
+        if not self.acquire_lock():
+            raise RuntimeError(f"Another evolution daemon holds {self.lock_path}")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='evolution-daemon', daemon=True)
+        self._thread.start()
+        logger.info("Evolution runner started")
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Stop the background thread after its current cycle"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.info("Evolution runner stopped")
+
+    def run_forever(self, niceness: int = 0) -> None:
+        """
+        Run ticks in the foreground (for a dedicated daemon process).
+
+        Args:
+            niceness: Added to the process's scheduling niceness so the
+                daemon yields CPU to serving processes
+        """
+        if not self.acquire_lock():
+            raise RuntimeError(f"Another evolution daemon holds {self.lock_path}")
+        if niceness:
+            os.nice(niceness)
+        self._stop.clear()
+        try:
+            self._loop()
+        except KeyboardInterrupt:
+            self._stop.set()
+        finally:
+            self.release_lock()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Runner statistics"""
+        return {
+            'running': self._lock_file is not None,
+            'ticks': self.ticks,
+            'last_tick': self.last_tick,
+            'events_processed': self.events_processed,
+            'events_pending': self.queue.pending(),
+            'budget_exhausted': self.budget_exhausted,
+            'budget': self.budget.to_dict()
+        }
@@ -0,0 +1,205 @@
+"""
+Failure Index - Similar-Failure Lookup for Ralph Mode Retries
+
+RalphModeExecutor used to find "similar past failures" by scanning every
+failure bead of every molecule and comparing error_type strings, on each
+retry. FailureIndex keeps failures bucketed three ways:
+
+- by classified FailureType value
+- by raw error_type
+- by MinHash LSH bands of the normalized error message: numbers and ids
+  are folded to one token, the message becomes a set of unigrams and
+  bigrams, and its MINHASH_PERMUTATIONS-slot signature is split into
+  MINHASH_BANDS bands. Messages with high token overlap share a band.
+
+A lookup gathers candidates from the query's buckets, taking at most
+MAX_BUCKET_CANDIDATES (the most recent) from each bucket, so its cost
+does not grow with the size of the failure history. Candidates are
+scored by estimated message similarity plus error_type and FailureType
+agreement and ranked by score, then recency.
+
+Persists as one append-only file next to the failure log:
+
+    learning/failures/index.jsonl   # {"id", "molecule_id", "failure_type",
+                                    #  "error_type", "created_at", "signature"}
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .insight_index import normalize_content
+
+logger = logging.getLogger(__name__)
+
+MINHASH_PERMUTATIONS = 32
+MINHASH_BANDS = 8
+ROWS_PER_BAND = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
+# Most recent entries taken from each bucket per lookup
+MAX_BUCKET_CANDIDATES = 50
+
+# Score weights; a shared error_type alone reaches MIN_FAILURE_SIMILARITY
+MESSAGE_WEIGHT = 0.6
+ERROR_TYPE_WEIGHT = 0.25
+FAILURE_TYPE_WEIGHT = 0.15
+MIN_FAILURE_SIMILARITY = 0.25
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_PERMUTATIONS)
+]
+_NUMERIC_RE = re.compile(r"\d")
+
+
+def failure_shingles(error_message: str) -> set:
+    """Token unigrams and bigrams of a normalized error message"""
+    tokens = ['#' if _NUMERIC_RE.search(t) else t for t in normalize_content(error_message).split()]
+    return set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def minhash_signature(error_message: str) -> List[int]:
+    """MinHash signature of an error message (empty message: empty list)"""
+    shingles = failure_shingles(error_message)
+    if not shingles:
+        return []
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+        for s in shingles
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def signature_similarity(a: List[int], b: List[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    if not a or not b:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / MINHASH_PERMUTATIONS
+
+
+def _band_keys(signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [
+        (band, tuple(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]))
+        for band in range(MINHASH_BANDS)
+    ] if signature else []
+
+
+class FailureIndex:
+    """
+    Persistent failure-type, error-type and MinHash index over failure beads.
+
+    Stores ids and fingerprints only; the beads themselves stay with
+    RalphModeExecutor.
+    """
+
+    def __init__(self, index_file: Optional[Path] = None):
+        self.index_file = Path(index_file) if index_file else None
+        self._entries: Dict[str, Dict] = {}
+        self._by_failure_type: Dict[str, List[str]] = {}
+        self._by_error_type: Dict[str, List[str]] = {}
+        self._by_band: Dict[Tuple[int, Tuple[int, ...]], List[str]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.index_file or not self.index_file.exists():
+            return
+        with open(self.index_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    logger.warning(f"Skipping corrupt line in {self.index_file}")
+
+    def _apply(self, entry: Dict) -> None:
+        failure_id = entry['id']
+        if failure_id in self._entries:
+            return
+        self._entries[failure_id] = entry
+        self._by_failure_type.setdefault(entry['failure_type'], []).append(failure_id)
+        self._by_error_type.setdefault(entry['error_type'], []).append(failure_id)
+        for key in _band_keys(entry['signature']):
+            self._by_band.setdefault(key, []).append(failure_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, failure_id: str) -> bool:
+        return failure_id in self._entries
+
+    def add(
+        self,
+        failure_id: str,
+        molecule_id: str,
+        failure_type: str,
+        error_type: str,
+        error_message: str,
+        created_at: str
+    ) -> None:
+        """Index a failure and append it to the index file"""
+        if failure_id in self._entries:
+            return
+        entry = {
+            'id': failure_id,
+            'molecule_id': molecule_id,
+            'failure_type': failure_type,
+            'error_type': error_type,
+            'created_at': created_at,
+            'signature': minhash_signature(error_message),
+        }
+        self._apply(entry)
+
+        if self.index_file:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def find_similar(
+        self,
+        failure_type: str,
+        error_type: str,
+        error_message: str,
+        exclude_id: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Tuple[str, float]]:
+        """
+        Failures similar to the given one, best first.
+
+        Returns (failure id, score) pairs ranked by score, then by
+        recency. Scores below MIN_FAILURE_SIMILARITY are dropped.
+        """
+        signature = minhash_signature(error_message)
+        buckets = [
+            self._by_error_type.get(error_type, []),
+            self._by_failure_type.get(failure_type, []),
+        ] + [self._by_band.get(key, []) for key in _band_keys(signature)]
+
+        candidates = set()
+        for bucket in buckets:
+            candidates.update(bucket[-MAX_BUCKET_CANDIDATES:])
+        candidates.discard(exclude_id)
+
+        scored = []
+        for failure_id in candidates:
+            entry = self._entries[failure_id]
+            score = MESSAGE_WEIGHT * signature_similarity(signature, entry['signature'])
+            if entry['error_type'] == error_type:
+                score += ERROR_TYPE_WEIGHT
+            if entry['failure_type'] == failure_type:
+                score += FAILURE_TYPE_WEIGHT
+            if score >= MIN_FAILURE_SIMILARITY:
+                scored.append((round(score, 6), entry['created_at'], failure_id))
+
+        scored.sort(reverse=True)
+        return [(failure_id, score) for score, _, failure_id in scored[:limit]]
@@ -27,6 +27,9 @@ from dataclasses import dataclass, field, asdict
 from concurrent.futures import ThreadPoolExecutor, Future
 import yaml
 
+from src.core.versions import bump_version
+from src.core.registry import load_yaml_file
+
 logger = logging.getLogger(__name__)
 
 # ==================== Command Security ====================
@@ -723,10 +726,10 @@ class GateKeeper:
             }
         ]
 
+        # One scan for all stages rather than one per default gate
+        existing_stages = {gate.pipeline_stage for gate in self.list_gates()}
         for gate_config in default_gates:
-            # Check if gate already exists
-            existing = self.get_gate_by_stage(gate_config['pipeline_stage'])
-            if not existing:
+            if gate_config['pipeline_stage'] not in existing_stages:
                 self.create_gate(**gate_config)
 
     def create_gate(
@@ -750,7 +753,7 @@ class GateKeeper:
 
         gate_file = self.gates_path / f"{gate_id}.yaml"
         if gate_file.exists():
-            gate = Gate.from_yaml(gate_file.read_text())
+            gate = Gate.from_dict(load_yaml_file(gate_file))
             self._gates[gate_id] = gate
             return gate
         return None
@@ -758,7 +761,7 @@ class GateKeeper:
     def get_gate_by_stage(self, pipeline_stage: str) -> Optional[Gate]:
         """Get the gate for a pipeline stage"""
         for gate_file in self.gates_path.glob("GATE-*.yaml"):
-            gate = Gate.from_yaml(gate_file.read_text())
+            gate = Gate.from_dict(load_yaml_file(gate_file))
             if gate.pipeline_stage == pipeline_stage:
                 self._gates[gate.id] = gate
                 return gate
@@ -838,7 +841,7 @@ class GateKeeper:
         gates = []
         for gate_file in self.gates_path.glob("GATE-*.yaml"):
             try:
-                gate = Gate.from_yaml(gate_file.read_text())
+                gate = Gate.from_dict(load_yaml_file(gate_file))
                 self._gates[gate.id] = gate
                 gates.append(gate)
             except Exception as e:
@@ -849,6 +852,7 @@ class GateKeeper:
         """Save gate to disk"""
         gate_file = self.gates_path / f"{gate.id}.yaml"
         gate_file.write_text(gate.to_yaml())
+        bump_version(self.base_path, 'gates')
 
     def validate_against_contract(
         self,
@@ -31,6 +31,7 @@ from .entities import (
     Entity, EntityType, EntitySource, EntityStore, EntityAlias,
     Relationship, RelationshipType, ConfidenceLevel
 )
+from .relationship_columns import DEFAULT_STRENGTH_HALF_LIFE_DAYS
 from .interactions import (
     Interaction, InteractionType, InteractionStore, InteractionProcessor,
     ExtractedEntity, ActionItem
@@ -753,8 +754,7 @@ class EntityGraph:
             if rel.target_id == entity2_id or rel.source_id == entity2_id:
                 # Increase strength, cap at 1.0
                 rel.strength = min(1.0, rel.strength + interaction_weight)
-                rel.updated_at = datetime.utcnow().isoformat()
-                self.entity_store._save_relationships()
+                self.entity_store.update_relationship(rel)
                 return
 
         # No existing relationship, create one
@@ -765,22 +765,36 @@ class EntityGraph:
             context="Auto-created from interaction"
         )
 
-    def decay_relationships(self, decay_rate: float = 0.01) -> int:
+    def decay_relationships(
+        self,
+        half_life_days: float = DEFAULT_STRENGTH_HALF_LIFE_DAYS
+    ) -> int:
         """
         Apply time-based decay to relationship strengths.
 
         Should be called periodically (e.g., daily) to ensure
-        inactive relationships naturally weaken.
+        inactive relationships naturally weaken. Decay is exponential in
+        the time since the last decay, so it halves a strength every
+        `half_life_days` regardless of how often it runs.
         """
-        decayed_count = 0
-
-        for rel in self.entity_store.relationships.values():
-            if rel.strength > 0:
-                rel.strength = max(0, rel.strength - decay_rate)
-                decayed_count += 1
+        return self.entity_store.decay_relationship_strengths(half_life_days)
 
-        self.entity_store._save_relationships()
-        return decayed_count
+    def get_strongest_relationships(
+        self,
+        entity_id: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Relationship]:
+        """Get the strongest active relationships for an entity or the whole graph"""
+        if entity_id:
+            return self.entity_store.get_relationships_for_entity(entity_id, limit=limit)
+
+        store = self.entity_store
+        results = []
+        for rel_id in store.relationship_columns.strongest(limit):
+            rel = store.relationships[rel_id]
+            rel.strength = store.relationship_columns.strength(rel_id)
+            results.append(rel)
+        return results
 
     # =========================================================================
     # Merge Operations
@@ -870,9 +884,7 @@ class EntityGraph:
             int_dist[t] = int_dist.get(t, 0) + 1
 
         # Average relationship strength
-        avg_strength = 0
-        if relationships:
-            avg_strength = sum(r.strength for r in relationships) / len(relationships)
+        avg_strength = self.entity_store.relationship_columns.mean_strength()
 
         return {
             'total_entities': len(entities),
@@ -882,7 +894,8 @@ class EntityGraph:
             'relationship_types': rel_dist,
             'interaction_types': int_dist,
             'average_relationship_strength': round(avg_strength, 2),
-            'pending_merges': len(self.resolver.pending_merges)
+            'pending_merges': len(self.resolver.pending_merges),
+            'summary_cache': self.summarizer.cache.get_stats()
         }
 
 
@@ -27,6 +27,8 @@ from dataclasses import dataclass, field, asdict
 import yaml
 
 from src.core.time_utils import now, now_iso, parse_iso
+from src.core.versions import bump_version
+from src.core.registry import forget_yaml_file, load_yaml_file
 
 logger = logging.getLogger(__name__)
 
@@ -445,7 +447,7 @@ class HookManager:
 
         hook_file = self.hooks_path / f"{hook_id}.yaml"
         if hook_file.exists():
-            hook = Hook.from_yaml(hook_file.read_text())
+            hook = Hook.from_dict(load_yaml_file(hook_file))
             self._hooks[hook_id] = hook
             return hook
         return None
@@ -453,13 +455,13 @@ class HookManager:
     def get_hook_for_owner(self, owner_type: str, owner_id: str) -> Optional[Hook]:
         """Get the hook for a specific owner"""
         # Search in cache first
-        for hook in self._hooks.values():
+        for hook in list(self._hooks.values()):  # Cache may be shared across threads
             if hook.owner_type == owner_type and hook.owner_id == owner_id:
                 return hook
 
         # Search on disk
         for hook_file in self.hooks_path.glob("HOOK-*.yaml"):
-            hook = Hook.from_yaml(hook_file.read_text())
+            hook = Hook.from_dict(load_yaml_file(hook_file))
             if hook.owner_type == owner_type and hook.owner_id == owner_id:
                 self._hooks[hook.id] = hook
                 return hook
@@ -647,7 +649,7 @@ class HookManager:
         hooks = []
         for hook_file in self.hooks_path.glob("HOOK-*.yaml"):
             try:
-                hook = Hook.from_yaml(hook_file.read_text())
+                hook = Hook.from_dict(load_yaml_file(hook_file))
                 self._hooks[hook.id] = hook
                 hooks.append(hook)
             except Exception as e:
@@ -742,6 +744,7 @@ class HookManager:
         """Save hook to disk"""
         hook_file = self.hooks_path / f"{hook.id}.yaml"
         hook_file.write_text(hook.to_yaml())
+        bump_version(self.base_path, 'hooks')
 
     def refresh_hook(self, hook_id: str) -> Optional[Hook]:
         """
@@ -762,7 +765,7 @@ class HookManager:
         # Reload from disk
         hook_file = self.hooks_path / f"{hook_id}.yaml"
         if hook_file.exists():
-            hook = Hook.from_yaml(hook_file.read_text())
+            hook = Hook.from_dict(load_yaml_file(hook_file))
             self._hooks[hook_id] = hook
             return hook
         return None
@@ -780,7 +783,7 @@ class HookManager:
         """
         # Find the hook file on disk (not from cache)
         for hook_file in self.hooks_path.glob("HOOK-*.yaml"):
-            hook = Hook.from_yaml(hook_file.read_text())
+            hook = Hook.from_dict(load_yaml_file(hook_file))
             if hook.owner_type == owner_type and hook.owner_id == owner_id:
                 # Update cache with fresh data
                 self._hooks[hook.id] = hook
@@ -804,7 +807,7 @@ class HookManager:
         hooks = []
         for hook_file in self.hooks_path.glob("HOOK-*.yaml"):
             try:
-                hook = Hook.from_yaml(hook_file.read_text())
+                hook = Hook.from_dict(load_yaml_file(hook_file))
                 self._hooks[hook.id] = hook
                 hooks.append(hook)
             except Exception as e:
@@ -816,7 +819,9 @@ class HookManager:
         hook_file = self.hooks_path / f"{hook_id}.yaml"
         if hook_file.exists():
             hook_file.unlink()
+            forget_yaml_file(hook_file)
             self._hooks.pop(hook_id, None)
+            bump_version(self.base_path, 'hooks')
             return True
         return False
 
@@ -915,13 +920,13 @@ def clean_all_hooks(corp_path: Path) -> Dict[str, Any]:
         - hooks_modified: Number of hooks that were modified
         - hooks_scanned: Total number of hooks scanned
     """
-    from src.core.molecule import MoleculeEngine
+    from src.core.registry import get_hook_manager, get_molecule_engine
 
     corp_path = Path(corp_path)
 
-    # Initialize systems
-    hook_manager = HookManager(corp_path)
-    molecule_engine = MoleculeEngine(corp_path)
+    # Shared systems for this corp
+    hook_manager = get_hook_manager(corp_path)
+    molecule_engine = get_molecule_engine(corp_path)
 
     # Track statistics
     orphaned_molecules = set()
@@ -0,0 +1,257 @@
+"""
+Insight Hash Index - Constant-Time Insight Deduplication
+
+Every insight's content is normalized (lowercased, punctuation dropped,
+whitespace collapsed) and fingerprinted two ways:
+
+- A content digest (BLAKE2b) for exact duplicates: a dict lookup.
+- A 64-bit SimHash over word unigrams and bigrams for near duplicates:
+  contents that differ by a few words land within a few bits of each
+  other. The fingerprint is split into SIMHASH_BANDS bands and indexed
+  per band, so any fingerprint within SIMHASH_BANDS - 1 bits shares at
+  least one band with the query and only those candidates are compared.
+
+The index also records which monthly segment each insight lives in, so
+InsightStore can find an insight without loading every segment. It
+persists as one append-only file:
+
+    insights/index.jsonl       # {"id", "month", "digest", "simhash"} per insight
+
+Other processes' appends are picked up by following the file from the
+byte offset read so far (see `refresh`).
+
+Without an index file the index lives in memory only (KnowledgeDistiller
+uses one to deduplicate a batch before committing it).
+"""
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 8
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Largest Hamming distance the band index is guaranteed to find
+MAX_SIMILAR_DISTANCE = SIMHASH_BANDS - 1
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def normalize_content(content: str) -> str:
+    """Normalized form of insight content used for fingerprints"""
+    return ' '.join(_TOKEN_RE.findall(content.lower()))
+
+
+def content_digest(content: str) -> str:
+    """Digest of normalized content (equal for exact duplicates)"""
+    return hashlib.blake2b(normalize_content(content).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def simhash(content: str) -> int:
+    """64-bit SimHash of the content's word unigrams and bigrams"""
+    tokens = normalize_content(content).split()
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if not features:
+        return 0
+
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def content_fingerprint(content: str) -> Tuple[str, int]:
+    """(content digest, SimHash), computable ahead of an index lookup"""
+    return content_digest(content), simhash(content)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def _bands(fingerprint: int) -> Iterable[Tuple[int, int]]:
+    for band in range(SIMHASH_BANDS):
+        yield band, (fingerprint >> (band * BAND_BITS)) & BAND_MASK
+
+
+class InsightHashIndex:
+    """
+    Persistent content-digest and SimHash index over insights.
+
+    Not thread-safe on its own; InsightStore serializes access.
+    """
+
+    def __init__(self, index_file: Optional[Path] = None):
+        self.index_file = Path(index_file) if index_file else None
+        self._month: Dict[str, str] = {}                       # id -> segment month
+        self._order: List[str] = []                           # ids in the order added
+        self._digest: Dict[str, str] = {}                     # id -> content digest
+        self._digest_ids: Dict[str, List[str]] = {}           # digest -> ids, oldest first
+        self._fingerprint: Dict[str, int] = {}                # id -> simhash
+        self._band_ids: List[Dict[int, Set[str]]] = [{} for _ in range(SIMHASH_BANDS)]
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Apply index lines appended since the last read (by any process)"""
+        if not self.index_file:
+            return
+        try:
+            stat = self.index_file.stat()
+        except FileNotFoundError:
+            return
+
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            self._clear()
+            self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.index_file, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                self._apply(entry['id'], entry['month'], entry['digest'], entry['simhash'])
+            except (json.JSONDecodeError, KeyError):
+                logger.warning(f"Skipping corrupt line in {self.index_file}")
+        self._offset += end
+
+    def _clear(self) -> None:
+        self._month.clear()
+        self._order.clear()
+        self._digest.clear()
+        self._digest_ids.clear()
+        self._fingerprint.clear()
+        for band_ids in self._band_ids:
+            band_ids.clear()
+        self._offset = 0
+
+    def _apply(self, insight_id: str, month: str, digest: str, fingerprint: int) -> None:
+        if insight_id in self._month:
+            return
+        self._month[insight_id] = month
+        self._order.append(insight_id)
+        self._digest[insight_id] = digest
+        self._digest_ids.setdefault(digest, []).append(insight_id)
+        self._fingerprint[insight_id] = fingerprint
+        for band, key in _bands(fingerprint):
+            self._band_ids[band].setdefault(key, set()).add(insight_id)
+
+    def __len__(self) -> int:
+        return len(self._month)
+
+    def __contains__(self, insight_id: str) -> bool:
+        return insight_id in self._month
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def add(self, insight_id: str, month: str, content: str) -> None:
+        """Index an insight and append it to the index file"""
+        self.add_many([(insight_id, month, content)])
+
+    def add_many(self, entries: List[Tuple[str, str, str]],
+                 fingerprints: Optional[List[Tuple[str, int]]] = None) -> None:
+        """
+        Index (id, month, content) entries with a single append.
+
+        fingerprints, if given, holds each entry's content_fingerprint.
+        """
+        self.refresh()
+        lines = []
+        for n, (insight_id, month, content) in enumerate(entries):
+            if insight_id in self._month:
+                continue
+            digest, fingerprint = fingerprints[n] if fingerprints else content_fingerprint(content)
+            self._apply(insight_id, month, digest, fingerprint)
+            lines.append(json.dumps({
+                'id': insight_id, 'month': month, 'digest': digest, 'simhash': fingerprint
+            }) + '\n')
+
+        if lines and self.index_file:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'a') as f:
+                f.write(''.join(lines))
+            # Moves the offset past our own lines (already applied)
+            self.refresh()
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def month_of(self, insight_id: str) -> Optional[str]:
+        return self._month.get(insight_id)
+
+    def ids(self) -> List[str]:
+        """All indexed ids, in the order they were added"""
+        return list(self._order)
+
+    def ids_since(self, position: int) -> List[str]:
+        """Ids added after the first `position` ids (position = len(index) is a watermark)"""
+        return self._order[position:]
+
+    def months(self) -> List[str]:
+        """Segment months that hold at least one insight, oldest first"""
+        return sorted(set(self._month.values()))
+
+    def find_exact(self, content: str, digest: Optional[str] = None) -> Optional[str]:
+        """Id of the first insight with the same normalized content"""
+        ids = self._digest_ids.get(digest or content_digest(content))
+        return ids[0] if ids else None
+
+    def find_similar(self, content: str,
+                     max_distance: int = MAX_SIMILAR_DISTANCE,
+                     fingerprint: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Insights whose SimHash is within max_distance bits of the content's.
+
+        Returns (id, distance) pairs, closest first. max_distance is capped
+        at MAX_SIMILAR_DISTANCE, the most the band index can guarantee.
+        Pass a precomputed SimHash as `fingerprint` to skip hashing.
+        """
+        max_distance = min(max_distance, MAX_SIMILAR_DISTANCE)
+        if fingerprint is None:
+            fingerprint = simhash(content)
+        candidates: Set[str] = set()
+        for band, key in _bands(fingerprint):
+            candidates.update(self._band_ids[band].get(key, ()))
+
+        matches = []
+        for insight_id in candidates:
+            distance = hamming_distance(fingerprint, self._fingerprint[insight_id])
+            if distance <= max_distance:
+                matches.append((insight_id, distance))
+        matches.sort(key=lambda m: (m[1], m[0]))
+        return matches
+
+    def digest_group(self, insight_id: str) -> List[str]:
+        """Ids with the same normalized content as insight_id (itself included), oldest first"""
+        digest = self._digest.get(insight_id)
+        if digest is None:
+            return []
+        return list(self._digest_ids[digest])
+
+    def duplicate_groups(self) -> List[List[str]]:
+        """Groups of ids sharing normalized content (groups of two or more)"""
+        return [list(ids) for ids in self._digest_ids.values() if len(ids) > 1]
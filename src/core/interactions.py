@@ -18,19 +18,30 @@ Integrates with:
 """
 
 import uuid
-from datetime import datetime
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 import json
 import logging
+import re
 
 from .entities import EntitySource, EntityStore, Entity, Relationship
+from .search_index import NgramIndex
 
 logger = logging.getLogger(__name__)
 
+# Tokens for the interaction inverted index
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['._@-][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens (emails and dotted names stay whole)"""
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
 
 class InteractionType(Enum):
     """Types of interactions"""
@@ -303,10 +314,13 @@ class InteractionStore:
     Persistent storage for interactions.
 
     Stores interactions with efficient retrieval by:
-    - Time range
+    - Time range (timestamp-ordered timeline, bisect range queries)
     - Participant
-    - Type
+    - Type (per-type timelines)
     - Thread
+    - Text (token inverted index plus n-gram substring index)
+
+    Range queries such as "last 7 days" cost O(log n + k) for k results.
     """
 
     def __init__(self, corp_path: Path):
@@ -321,6 +335,18 @@ class InteractionStore:
         self.by_participant: Dict[str, List[str]] = {}  # entity_id -> [interaction_ids]
         self.by_thread: Dict[str, List[str]] = {}       # thread_id -> [interaction_ids]
         self.by_date: Dict[str, List[str]] = {}         # YYYY-MM-DD -> [interaction_ids]
+        self.text_index = NgramIndex()                  # subject/summary/preview substrings
+        self.by_token: Dict[str, Set[str]] = {}         # token -> {interaction_ids}
+
+        # Timestamp-ordered (timestamp, id) lists, overall and per type
+        self._timeline: List[Tuple[str, str]] = []
+        self._type_timelines: Dict[InteractionType, List[Tuple[str, str]]] = {}
+        # interaction_id -> (timestamp, type, tokens) as currently indexed
+        self._indexed: Dict[str, Tuple[str, InteractionType, Set[str]]] = {}
+        self._with_action_items: Set[str] = set()
+
+        # Per-participant change counters for cache invalidation (in-memory only)
+        self._participant_versions: Dict[str, int] = {}
 
         self._load()
 
@@ -331,7 +357,12 @@ class InteractionStore:
             for int_data in data.get('interactions', []):
                 interaction = Interaction.from_dict(int_data)
                 self.interactions[interaction.id] = interaction
-                self._index_interaction(interaction)
+                self._index_interaction(interaction, ordered=False)
+
+            # Timelines were appended unordered during bulk load - sort once
+            self._timeline.sort()
+            for timeline in self._type_timelines.values():
+                timeline.sort()
 
     def _save(self) -> None:
         """Save interactions to disk"""
@@ -342,8 +373,21 @@ class InteractionStore:
         }
         self.index_file.write_text(yaml.dump(data, default_flow_style=False, allow_unicode=True))
 
-    def _index_interaction(self, interaction: Interaction) -> None:
-        """Index an interaction for efficient lookup"""
+    def _index_interaction(self, interaction: Interaction, ordered: bool = True) -> None:
+        """
+        Index an interaction for efficient lookup.
+
+        Safe to call again after an interaction changes - time, type and
+        token entries from the previous indexing are replaced.
+
+        Args:
+            interaction: Interaction to index
+            ordered: Keep timelines sorted on insert. Bulk loads pass False
+                and sort once at the end.
+        """
+        previous = self._indexed.get(interaction.id)
+        if previous:
+            self._unindex_time_and_tokens(interaction.id, *previous)
         # By participant
         for participant in interaction.participants:
             if participant not in self.by_participant:
@@ -365,10 +409,104 @@ class InteractionStore:
         if interaction.id not in self.by_date[date_key]:
             self.by_date[date_key].append(interaction.id)
 
+        # By time and type
+        entry = (interaction.timestamp, interaction.id)
+        type_timeline = self._type_timelines.setdefault(interaction.interaction_type, [])
+        if ordered:
+            insort(self._timeline, entry)
+            insort(type_timeline, entry)
+        else:
+            self._timeline.append(entry)
+            type_timeline.append(entry)
+
+        # By text (replaces any previous entry, so updates stay consistent)
+        searchable = f"{interaction.subject} {interaction.summary} {interaction.content_preview}"
+        self.text_index.add(interaction.id, [searchable])
+        tokens = set(tokenize(searchable))
+        for token in tokens:
+            self.by_token.setdefault(token, set()).add(interaction.id)
+
+        # Interactions carrying action items
+        if interaction.action_items:
+            self._with_action_items.add(interaction.id)
+        else:
+            self._with_action_items.discard(interaction.id)
+
+        self._indexed[interaction.id] = (
+            interaction.timestamp, interaction.interaction_type, tokens
+        )
+
+    def _unindex_time_and_tokens(
+        self,
+        interaction_id: str,
+        timestamp: str,
+        interaction_type: InteractionType,
+        tokens: Set[str]
+    ) -> None:
+        """Remove an interaction's previous time, type, date and token entries"""
+        entry = (timestamp, interaction_id)
+        for timeline in (self._timeline, self._type_timelines.get(interaction_type, [])):
+            pos = bisect_left(timeline, entry)
+            if pos < len(timeline) and timeline[pos] == entry:
+                del timeline[pos]
+
+        date_ids = self.by_date.get(timestamp[:10])
+        if date_ids and interaction_id in date_ids:
+            date_ids.remove(interaction_id)
+            if not date_ids:
+                del self.by_date[timestamp[:10]]
+
+        for token in tokens:
+            ids = self.by_token.get(token)
+            if ids is not None:
+                ids.discard(interaction_id)
+                if not ids:
+                    del self.by_token[token]
+
+    def _iter_timeline(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interaction_type: Optional[InteractionType] = None
+    ) -> Iterator[Interaction]:
+        """
+        Iterate interactions with start <= timestamp < end, newest first.
+
+        Bounds are located by bisection, so only matching entries are visited.
+        """
+        if interaction_type:
+            timeline = self._type_timelines.get(interaction_type, [])
+        else:
+            timeline = self._timeline
+
+        lo = bisect_left(timeline, (start,)) if start else 0
+        hi = bisect_left(timeline, (end,)) if end else len(timeline)
+
+        for pos in range(hi - 1, lo - 1, -1):
+            interaction = self.interactions.get(timeline[pos][1])
+            if interaction:
+                yield interaction
+
+    def get_participant_version(self, entity_id: str) -> int:
+        """
+        Get the change counter for a participant's interactions.
+
+        Increases whenever an interaction involving the entity is added
+        or updated.
+        """
+        return self._participant_versions.get(entity_id, 0)
+
+    def _bump_participants(self, interaction: Interaction) -> None:
+        for participant in interaction.participants:
+            self._participant_versions[participant] = (
+                self._participant_versions.get(participant, 0) + 1
+            )
+
     def add(self, interaction: Interaction) -> Interaction:
         """Add an interaction to the store"""
         self.interactions[interaction.id] = interaction
         self._index_interaction(interaction)
+        self._bump_participants(interaction)
         self._save()
         logger.info(f"Added interaction: {interaction.id} ({interaction.interaction_type.value})")
         return interaction
@@ -408,29 +546,30 @@ class InteractionStore:
         interaction_type: Optional[InteractionType] = None,
         participant: Optional[str] = None
     ) -> List[Interaction]:
-        """Get interactions in a date range"""
-        results = []
-
-        for date_key in sorted(self.by_date.keys()):
-            if date_key < start_date:
-                continue
-            if date_key > end_date:
-                break
-
-            for int_id in self.by_date[date_key]:
-                interaction = self.interactions.get(int_id)
-                if not interaction:
-                    continue
-
-                if interaction_type and interaction.interaction_type != interaction_type:
-                    continue
-
-                if participant and participant not in interaction.participants:
-                    continue
+        """Get interactions in a date range (YYYY-MM-DD, both days inclusive)"""
+        # Every timestamp on end_date sorts before end_date + a high sentinel
+        results = self._iter_timeline(
+            start=start_date[:10],
+            end=end_date[:10] + "\uffff",
+            interaction_type=interaction_type
+        )
 
-                results.append(interaction)
+        if participant:
+            return [i for i in results if participant in i.participants]
+        return list(results)
 
-        results.sort(key=lambda i: i.timestamp, reverse=True)
+    def get_since(
+        self,
+        cutoff: str,
+        interaction_type: Optional[InteractionType] = None,
+        limit: Optional[int] = None
+    ) -> List[Interaction]:
+        """Get interactions with timestamp >= cutoff, most recent first"""
+        results = []
+        for interaction in self._iter_timeline(start=cutoff, interaction_type=interaction_type):
+            if limit is not None and len(results) >= limit:
+                break
+            results.append(interaction)
         return results
 
     def get_recent(
@@ -440,34 +579,47 @@ class InteractionStore:
         interaction_type: Optional[InteractionType] = None
     ) -> List[Interaction]:
         """Get recent interactions"""
-        from datetime import timedelta
         cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        return self.get_since(cutoff, interaction_type=interaction_type, limit=limit)
 
+    def search(
+        self,
+        query: str,
+        limit: int = 50
+    ) -> List[Interaction]:
+        """Search interactions by subject, summary, or content"""
         results = [
-            i for i in self.interactions.values()
-            if i.timestamp >= cutoff
+            self.interactions[iid]
+            for iid in self.text_index.search(query)
+            if iid in self.interactions
         ]
 
-        if interaction_type:
-            results = [r for r in results if r.interaction_type == interaction_type]
-
         results.sort(key=lambda i: i.timestamp, reverse=True)
         return results[:limit]
 
-    def search(
+    def search_terms(
         self,
         query: str,
         limit: int = 50
     ) -> List[Interaction]:
-        """Search interactions by subject, summary, or content"""
-        query_lower = query.lower()
-        results = []
-
-        for interaction in self.interactions.values():
-            searchable = f"{interaction.subject} {interaction.summary} {interaction.content_preview}".lower()
-            if query_lower in searchable:
-                results.append(interaction)
+        """
+        Search interactions containing every word in the query.
 
+        Uses the token inverted index, so unlike search() words may appear
+        in any order and field.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        postings = sorted((self.by_token.get(t, set()) for t in tokens), key=len)
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            matched &= posting
+            if not matched:
+                return []
+
+        results = [self.interactions[iid] for iid in matched if iid in self.interactions]
         results.sort(key=lambda i: i.timestamp, reverse=True)
         return results[:limit]
 
@@ -479,7 +631,11 @@ class InteractionStore:
         """Get all action items across interactions"""
         items = []
 
-        for interaction in self.interactions.values():
+        for interaction_id in self._with_action_items:
+            interaction = self.interactions.get(interaction_id)
+            if not interaction:
+                continue
+
             for action in interaction.action_items:
                 if action.status != status:
                     continue
@@ -498,8 +654,12 @@ class InteractionStore:
 
     def update(self, interaction: Interaction) -> Interaction:
         """Update an existing interaction"""
+        previous = self.interactions.get(interaction.id)
+        if previous is not None and previous is not interaction:
+            self._bump_participants(previous)
         self.interactions[interaction.id] = interaction
         self._index_interaction(interaction)
+        self._bump_participants(interaction)
         self._save()
         return interaction
 
@@ -19,18 +19,57 @@ Integration points:
 - Bead Ledger: Persist all learning data
 """
 
+import atexit
+import fcntl
 import logging
 import json
 import hashlib
-from datetime import datetime
-from dataclasses import dataclass, field
+import multiprocessing
+import os
+import time
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
+from .evolution_runner import LearningEventQueue
+from .failure_index import FailureIndex
+from .insight_index import InsightHashIndex, MAX_SIMILAR_DISTANCE, content_fingerprint
+from .metering import UsageMeter, UsageRecord, get_usage_meter
+from .outcome_columns import OutcomeColumns
+from .trigger_automaton import TriggerAutomaton
+from .versions import VersionedCache, bump_version, get_version
+
 logger = logging.getLogger(__name__)
 
+# Distilled insights whose SimHash differs by at most this many bits from
+# a stored insight are treated as duplicates (a reworded error message,
+# not a different step count)
+INSIGHT_DUPLICATE_DISTANCE = 6
+
+# MetaLearner success rates are running means for the first
+# 1 / META_DECAY_ALPHA samples, then exponentially decayed averages
+META_DECAY_ALPHA = 0.02
+
+# Minimum seconds between MetaLearner checkpoints while outcomes arrive
+META_CHECKPOINT_INTERVAL = 30.0
+
+# Batches smaller than this are distilled in-process; process start-up
+# costs more than the extraction itself
+PARALLEL_DISTILL_MIN_BATCH = 200
+
+# Task signatures whose synthesized learning context is kept
+CONTEXT_CACHE_SIZE = 256
+
+# Rewrite an insight segment once it holds this many superseded lines
+SEGMENT_COMPACT_SLACK = 256
+
 
 # =============================================================================
 # Enums
@@ -521,76 +560,293 @@ class ConfidenceBucket:
 # =============================================================================
 
 class InsightStore:
-    """Persist and retrieve insights"""
+    """
+    Persist and retrieve insights.
+
+    Insights are packed into monthly segment files (segments/YYYY-MM.jsonl,
+    append-only, the last line for an ID wins) and a segment is only read
+    when one of its insights is needed. Validations append full copies,
+    so a segment is rewritten with one line per insight once it holds
+    SEGMENT_COMPACT_SLACK superseded lines; appends and compaction take
+    an flock on a sidecar YYYY-MM.jsonl.lock. Startup reads a single hash index
+    (see insight_index.py), which also makes exact duplicate checks a dict
+    lookup and near-duplicate checks a SimHash band lookup. Reads follow
+    the index and every segment read so far from their byte offsets, so
+    insights added or validated by other processes are picked up.
+    """
 
     def __init__(self, store_path: Path):
         self.store_path = store_path
-        self.insights: Dict[str, Insight] = {}
-        self.index_path = store_path / "index.yaml"
+        self.segments_path = store_path / "segments"
+        self.index_path = store_path / "index.jsonl"
+        self._insights: Dict[str, Insight] = {}
+        # Bytes read so far and inode of each segment that has been read
+        self._segment_offsets: Dict[str, int] = {}
+        self._segment_inodes: Dict[str, int] = {}
+        # Lines read and insight ids (in first-seen order) per segment
+        self._segment_lines: Dict[str, int] = {}
+        self._segment_ids: Dict[str, Dict[str, None]] = {}
+        self._type_counts: Dict[InsightType, int] = {}
+        self._counted = 0
         self._load()
 
     def _load(self):
-        """Load insights from disk"""
+        """Load the hash index, migrating legacy per-insight YAML files"""
         self.store_path.mkdir(parents=True, exist_ok=True)
+        self.segments_path.mkdir(parents=True, exist_ok=True)
 
-        if self.index_path.exists():
-            with open(self.index_path) as f:
-                index = yaml.safe_load(f) or {}
-                for insight_id in index.get('insights', []):
-                    insight_path = self._get_insight_path(insight_id)
-                    if insight_path.exists():
-                        with open(insight_path) as pf:
-                            data = yaml.safe_load(pf)
-                            self.insights[insight_id] = Insight.from_dict(data)
-
-    def _save_index(self):
-        """Save index to disk"""
-        index = {'insights': list(self.insights.keys())}
-        with open(self.index_path, 'w') as f:
-            yaml.dump(index, f)
-
-    def _get_insight_path(self, insight_id: str) -> Path:
-        """Get path for an insight file"""
-        # Organize by month
-        month = insight_id[:7] if len(insight_id) > 7 else datetime.now().strftime("%Y-%m")
-        month_dir = self.store_path / month
-        month_dir.mkdir(parents=True, exist_ok=True)
-        return month_dir / f"{insight_id}.yaml"
+        legacy_index = self.store_path / "index.yaml"
+        if legacy_index.exists() and not self.index_path.exists():
+            self._migrate_legacy(legacy_index)
 
-    def add(self, insight: Insight) -> str:
-        """Add an insight to the store"""
-        self.insights[insight.id] = insight
+        self.hash_index = InsightHashIndex(self.index_path)
+
+    def _migrate_legacy(self, legacy_index: Path):
+        """
+        Pack insights from index.yaml + one YAML file each into segments.
+
+        The hash index is built in a temp file and moved into place once
+        every insight is packed; an interrupted migration leaves no index
+        and is redone on the next start (re-appended lines supersede
+        their earlier copies).
+        """
+        with open(legacy_index) as f:
+            index = yaml.safe_load(f) or {}
+
+        tmp_index = self.index_path.with_suffix('.jsonl.tmp')
+        tmp_index.unlink(missing_ok=True)
+        migrated = InsightHashIndex(tmp_index)
+        entries = []
+        for insight_id in index.get('insights', []):
+            month = insight_id[:7] if len(insight_id) > 7 else datetime.now().strftime("%Y-%m")
+            insight_path = self.store_path / month / f"{insight_id}.yaml"
+            if not insight_path.exists():
+                continue
+            with open(insight_path) as pf:
+                insight = Insight.from_dict(yaml.safe_load(pf))
+            self._append_to_segment(self._month_of(insight), [insight])
+            entries.append((insight.id, self._month_of(insight), insight.content))
+
+        migrated.add_many(entries)
+        if tmp_index.exists():
+            os.replace(tmp_index, self.index_path)
+        legacy_index.rename(legacy_index.with_suffix('.yaml.migrated'))
+        logger.info(f"Migrated {len(migrated)} insights to monthly segments")
+
+    # =========================================================================
+    # Segments
+    # =========================================================================
+
+    @staticmethod
+    def _month_of(insight: Insight) -> str:
+        """Segment month of an insight (from its created_at)"""
+        month = (insight.created_at or '')[:7]
+        return month if len(month) == 7 else datetime.now().strftime("%Y-%m")
 
-        # Save to disk
-        insight_path = self._get_insight_path(insight.id)
-        with open(insight_path, 'w') as f:
-            yaml.dump(insight.to_dict(), f)
+    def _segment_path(self, month: str) -> Path:
+        return self.segments_path / f"{month}.jsonl"
 
-        self._save_index()
+    @contextmanager
+    def _segment_lock(self, month: str):
+        """Cross-process flock on a segment's sidecar lock file"""
+        lock_file = open(self._segment_path(month).with_suffix('.jsonl.lock'), 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+    def _append_to_segment(self, month: str, insights: List[Insight]):
+        """Append insights to a segment, compacting it once superseded lines pile up"""
+        with self._segment_lock(month):
+            # Never appends to a segment another process has just compacted away
+            with open(self._segment_path(month), 'a') as f:
+                f.write(''.join(json.dumps(i.to_dict()) + '\n' for i in insights))
+
+            # Also picks up every other process's appends before compacting
+            self._read_segment(month)
+            for insight in insights:
+                self._insights[insight.id] = insight
+            if self._segment_lines[month] > len(self._segment_ids[month]) + SEGMENT_COMPACT_SLACK:
+                self._compact_segment(month)
+
+    def _compact_segment(self, month: str):
+        """Replace a segment with the latest line per insight (_segment_lock held)"""
+        segment = self._segment_path(month)
+        ids = self._segment_ids[month]
+        tmp = segment.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w') as f:
+            f.write(''.join(json.dumps(self._insights[i].to_dict()) + '\n' for i in ids))
+        os.replace(tmp, segment)
+
+        stat = segment.stat()
+        self._segment_inodes[month] = stat.st_ino
+        self._segment_offsets[month] = stat.st_size
+        self._segment_lines[month] = len(ids)
+        logger.info(f"Compacted insight segment {month} to {len(ids)} lines")
+
+    def _load_month(self, month: str):
+        """Read one segment into memory (later reads follow it via _refresh)"""
+        if month not in self._segment_offsets:
+            self._read_segment(month)
+
+    def _read_segment(self, month: str):
+        """Apply segment lines appended since the last read (by any process)"""
+        segment = self._segment_path(month)
+        offset = self._segment_offsets.setdefault(month, 0)
+        try:
+            stat = segment.stat()
+        except FileNotFoundError:
+            return
+
+        if stat.st_ino != self._segment_inodes.get(month) or stat.st_size < offset:
+            # Replaced (compacted): it still holds the latest line per insight
+            offset = 0
+            self._segment_inodes[month] = stat.st_ino
+            self._segment_lines[month] = 0
+            self._segment_ids[month] = {}
+        if stat.st_size == offset:
+            self._segment_offsets[month] = offset
+            return
+
+        with open(segment, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        ids = self._segment_ids[month]
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            self._segment_lines[month] += 1
+            try:
+                insight = Insight.from_dict(json.loads(line))
+            except (json.JSONDecodeError, KeyError, ValueError):
+                logger.warning(f"Skipping corrupt line in {segment}")
+                continue
+            self._insights[insight.id] = insight
+            ids[insight.id] = None
+        self._segment_offsets[month] = offset + end
+
+    def _refresh(self):
+        """Follow the index and the segments read so far"""
+        self.hash_index.refresh()
+        for month in list(self._segment_offsets):
+            self._read_segment(month)
+
+    def _load_months(self, months: List[str]) -> List[Insight]:
+        """Insights in the given segment months, in the order they were added"""
+        for month in months:
+            self._load_month(month)
+        wanted = set(months)
+        return [
+            self._insights[insight_id] for insight_id in self.hash_index.ids()
+            if insight_id in self._insights and self.hash_index.month_of(insight_id) in wanted
+        ]
+
+    @property
+    def insights(self) -> Dict[str, Insight]:
+        """All insights by ID (loads every segment)"""
+        self._refresh()
+        self._load_months(self.hash_index.months())
+        return self._insights
+
+    # =========================================================================
+    # Store Operations
+    # =========================================================================
+
+    def add(self, insight: Insight) -> str:
+        """Add an insight to the store"""
+        month = self._month_of(insight)
+        self._load_month(month)
+        self._append_to_segment(month, [insight])
+        self.hash_index.add(insight.id, month, insight.content)
+        bump_version(self.store_path, 'insights')
         logger.info(f"Added insight {insight.id}: {insight.content[:50]}...")
         return insight.id
 
+    def add_many(self, insights: List[Insight],
+                 fingerprints: Optional[List[Tuple[str, int]]] = None) -> List[str]:
+        """
+        Add insights with one append per segment and one index append.
+
+        fingerprints, if given, holds each insight's content_fingerprint.
+        """
+        by_month: Dict[str, List[Insight]] = {}
+        for insight in insights:
+            by_month.setdefault(self._month_of(insight), []).append(insight)
+
+        for month, group in by_month.items():
+            self._load_month(month)
+            self._append_to_segment(month, group)
+
+        self.hash_index.add_many(
+            [(i.id, self._month_of(i), i.content) for i in insights], fingerprints
+        )
+        if insights:
+            bump_version(self.store_path, 'insights')
+            logger.info(f"Added {len(insights)} insights")
+        return [i.id for i in insights]
+
     def get(self, insight_id: str) -> Optional[Insight]:
         """Get an insight by ID"""
-        return self.insights.get(insight_id)
+        self._refresh()
+        return self._get(insight_id)
+
+    def _get(self, insight_id: str) -> Optional[Insight]:
+        month = self.hash_index.month_of(insight_id)
+        if month is None:
+            return None
+        self._load_month(month)
+        return self._insights.get(insight_id)
 
     def get_all(self) -> List[Insight]:
         """Get all insights"""
-        return list(self.insights.values())
+        self._refresh()
+        return self._load_months(self.hash_index.months())
+
+    def get_added_since(self, position: int) -> Tuple[List[Insight], int]:
+        """
+        Insights added after the first `position` insights.
+
+        Returns (insights, new position); pass the new position back next
+        time to read only what has been added since.
+        """
+        self._refresh()
+        ids = self.hash_index.ids_since(position)
+        found = [i for i in (self._get(insight_id) for insight_id in ids) if i is not None]
+        return found, position + len(ids)
+
+    def update(self, insight: Insight):
+        """Persist changes to a stored insight"""
+        self.hash_index.refresh()
+        if insight.id in self.hash_index:
+            self._append_to_segment(self.hash_index.month_of(insight.id), [insight])
+            bump_version(self.store_path, 'insights')
 
     def get_by_type(self, insight_type: InsightType) -> List[Insight]:
         """Get insights by type"""
-        return [i for i in self.insights.values() if i.type == insight_type]
+        return [i for i in self.get_all() if i.type == insight_type]
+
+    def count_by_type(self, insight_type: InsightType) -> int:
+        """Number of insights of a type (counts only insights added since the last call)"""
+        added, self._counted = self.get_added_since(self._counted)
+        for insight in added:
+            self._type_counts[insight.type] = self._type_counts.get(insight.type, 0) + 1
+        return self._type_counts.get(insight_type, 0)
 
     def get_by_tags(self, tags: List[str]) -> List[Insight]:
         """Get insights that have any of the given tags"""
-        return [i for i in self.insights.values() if any(t in i.tags for t in tags)]
+        return [i for i in self.get_all() if any(t in i.tags for t in tags)]
 
     def get_since(self, days: int) -> List[Insight]:
         """Get insights from the last N days"""
         cutoff = datetime.now().timestamp() - (days * 86400)
+        first_month = datetime.fromtimestamp(cutoff).strftime("%Y-%m")
+        self._refresh()
+        months = [m for m in self.hash_index.months() if m >= first_month]
         results = []
-        for insight in self.insights.values():
+        for insight in self._load_months(months):
             try:
                 insight_time = datetime.fromisoformat(insight.created_at).timestamp()
                 if insight_time >= cutoff:
@@ -599,20 +855,49 @@ class InsightStore:
                 pass
         return results
 
-    def is_duplicate(self, insight: Insight) -> bool:
-        """Check if an insight is a duplicate of an existing one"""
-        # Simple content hash comparison
-        new_hash = hashlib.md5(insight.content.encode()).hexdigest()[:16]
-        for existing in self.insights.values():
-            existing_hash = hashlib.md5(existing.content.encode()).hexdigest()[:16]
-            if new_hash == existing_hash:
-                return True
+    def is_duplicate(self, insight: Insight, max_distance: int = 0,
+                     fingerprint: Optional[Tuple[str, int]] = None) -> bool:
+        """
+        Check if an insight is a duplicate of an existing one.
+
+        Args:
+            insight: Candidate insight
+            max_distance: Also count insights whose SimHash is within this
+                many bits (0 = identical normalized content only)
+            fingerprint: The content's precomputed content_fingerprint
+        """
+        digest, simhash_value = fingerprint or (None, None)
+        self.hash_index.refresh()
+        if self.hash_index.find_exact(insight.content, digest) is not None:
+            return True
+        if max_distance > 0:
+            return bool(self.hash_index.find_similar(insight.content, max_distance, simhash_value))
         return False
 
+    def find_similar(self, content: str, max_distance: int = MAX_SIMILAR_DISTANCE) -> List[Insight]:
+        """Insights with the same or nearly the same content, closest first"""
+        self._refresh()
+        found = []
+        for insight_id, _ in self.hash_index.find_similar(content, max_distance):
+            insight = self._get(insight_id)
+            if insight is not None:
+                found.append(insight)
+        return found
+
+    def duplicate_groups(self) -> List[List[Insight]]:
+        """Groups of insights with identical normalized content, oldest first"""
+        self._refresh()
+        groups = []
+        for ids in self.hash_index.duplicate_groups():
+            group = [i for i in (self._get(insight_id) for insight_id in ids) if i is not None]
+            if len(group) > 1:
+                groups.append(group)
+        return groups
+
     def validate(self, insight_id: str, success: bool):
         """Validate an insight based on outcome"""
-        if insight_id in self.insights:
-            insight = self.insights[insight_id]
+        insight = self.get(insight_id)
+        if insight is not None:
             insight.validation_count += 1
 
             # Update confidence based on validation
@@ -622,10 +907,9 @@ class InsightStore:
             else:
                 insight.confidence = max(0.0, insight.confidence - 0.15)
 
-            # Re-save
-            insight_path = self._get_insight_path(insight_id)
-            with open(insight_path, 'w') as f:
-                yaml.dump(insight.to_dict(), f)
+            # Re-save (the new version supersedes the old line in its segment)
+            self._append_to_segment(self._month_of(insight), [insight])
+            bump_version(self.store_path, 'insights')
 
 
 # =============================================================================
@@ -633,71 +917,171 @@ class InsightStore:
 # =============================================================================
 
 class OutcomeTracker:
-    """Track success/failure outcomes for learning"""
+    """
+    Track success/failure outcomes for learning.
+
+    Outcomes are appended to outcomes.jsonl (one line per outcome, the
+    last line for an ID wins) instead of rewriting a YAML file per
+    outcome. Their measurements are also held in OutcomeColumns, so
+    success rates, durations and the evolution daemon's time-windowed
+    analysis are array aggregations rather than loops over Outcome
+    objects. Outcomes appended by other processes are picked up by
+    following the log.
+    """
+
+    LOG_FILE = "outcomes.jsonl"
+    LEGACY_FILE = "outcomes.yaml"
 
     def __init__(self, store_path: Path):
         self.store_path = store_path
         self.outcomes: Dict[str, Outcome] = {}
+        self.columns = OutcomeColumns()
+        self._by_molecule: Dict[str, List[str]] = {}
+        self._log_offset = 0
         self._load()
 
+    @property
+    def log_file(self) -> Path:
+        return self.store_path / self.LOG_FILE
+
     def _load(self):
-        """Load outcomes from disk"""
+        """Load outcomes from disk, migrating a legacy outcomes.yaml"""
         self.store_path.mkdir(parents=True, exist_ok=True)
-        outcomes_file = self.store_path / "outcomes.yaml"
+        legacy_file = self.store_path / self.LEGACY_FILE
 
-        if outcomes_file.exists():
-            with open(outcomes_file) as f:
+        if legacy_file.exists() and not self.log_file.exists():
+            with open(legacy_file) as f:
                 data = yaml.safe_load(f) or {}
-                for outcome_id, outcome_data in data.get('outcomes', {}).items():
-                    self.outcomes[outcome_id] = Outcome.from_dict(outcome_data)
+            outcomes = [Outcome.from_dict(o) for o in data.get('outcomes', {}).values()]
+            outcomes.sort(key=lambda o: o.created_at)
+            tmp = self.log_file.with_suffix('.jsonl.tmp')
+            with open(tmp, 'w') as f:
+                for outcome in outcomes:
+                    f.write(json.dumps(outcome.to_dict()) + '\n')
+            tmp.replace(self.log_file)
+            legacy_file.rename(legacy_file.with_suffix('.yaml.migrated'))
+            logger.info(f"Migrated {len(outcomes)} outcomes to {self.log_file}")
+
+        self._refresh()
+
+    def _refresh(self):
+        """Apply outcomes appended to the log since the last read"""
+        try:
+            size = self.log_file.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._log_offset:
+            return
 
-    def _save(self):
-        """Save outcomes to disk"""
-        outcomes_file = self.store_path / "outcomes.yaml"
-        data = {
-            'outcomes': {oid: o.to_dict() for oid, o in self.outcomes.items()}
-        }
-        with open(outcomes_file, 'w') as f:
-            yaml.dump(data, f)
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(Outcome.from_dict(json.loads(line)))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logger.warning(f"Skipping corrupt line in {self.log_file}")
+        self._log_offset += end
+
+    def _apply(self, outcome: Outcome):
+        previous = self.outcomes.get(outcome.id)
+        if previous is not None and previous.molecule_id != outcome.molecule_id:
+            ids = self._by_molecule.get(previous.molecule_id, [])
+            if outcome.id in ids:
+                ids.remove(outcome.id)
+        if previous is None or previous.molecule_id != outcome.molecule_id:
+            self._by_molecule.setdefault(outcome.molecule_id, []).append(outcome.id)
+        self.outcomes[outcome.id] = outcome
+        self.columns.upsert(outcome)
 
     def record(self, outcome: Outcome) -> str:
         """Record an outcome"""
-        self.outcomes[outcome.id] = outcome
-        self._save()
+        self._refresh()
+        with open(self.log_file, 'ab') as f:
+            f.write((json.dumps(outcome.to_dict()) + '\n').encode('utf-8'))
+        self._refresh()
+        bump_version(self.store_path, 'outcomes')
         logger.info(f"Recorded outcome {outcome.id}: {'success' if outcome.success else 'failure'}")
         return outcome.id
 
     def get(self, outcome_id: str) -> Optional[Outcome]:
         """Get an outcome by ID"""
+        self._refresh()
         return self.outcomes.get(outcome_id)
 
     def get_by_molecule(self, molecule_id: str) -> List[Outcome]:
         """Get all outcomes for a molecule"""
-        return [o for o in self.outcomes.values() if o.molecule_id == molecule_id]
+        self._refresh()
+        return [self.outcomes[oid] for oid in self._by_molecule.get(molecule_id, [])]
 
     def get_by_agent(self, agent_id: str) -> List[Outcome]:
         """Get all outcomes for an agent"""
-        return [o for o in self.outcomes.values() if o.assigned_to == agent_id]
+        self._refresh()
+        return [self.outcomes[oid] for oid in self.columns.ids_for('agent', agent_id)]
 
     def get_success_rate(self, agent_id: str) -> Tuple[float, int]:
         """Get success rate for an agent (rate, sample_size)"""
-        agent_outcomes = self.get_by_agent(agent_id)
-        if not agent_outcomes:
+        self._refresh()
+        stats = self.columns.summarize(agent=agent_id)
+        if not stats['total']:
             return 0.5, 0  # Default to 50% with no data
-
-        successes = sum(1 for o in agent_outcomes if o.success)
-        return successes / len(agent_outcomes), len(agent_outcomes)
+        return stats['success_rate'], stats['total']
 
     def get_by_type(self, molecule_type: str) -> List[Outcome]:
         """Get all outcomes for a molecule type"""
-        return [o for o in self.outcomes.values() if o.molecule_type == molecule_type]
+        self._refresh()
+        return [self.outcomes[oid] for oid in self.columns.ids_for('type', molecule_type)]
 
     def get_average_duration(self, molecule_type: str) -> Optional[float]:
         """Get average duration for a molecule type"""
-        type_outcomes = [o for o in self.get_by_type(molecule_type) if o.success]
-        if not type_outcomes:
-            return None
-        return sum(o.duration_seconds for o in type_outcomes) / len(type_outcomes)
+        self._refresh()
+        return self.columns.summarize(molecule_type=molecule_type)['avg_success_duration']
+
+    # =========================================================================
+    # Aggregations
+    # =========================================================================
+
+    @staticmethod
+    def _since(days: Optional[float]) -> Optional[float]:
+        return datetime.now().timestamp() - days * 86400 if days is not None else None
+
+    def summarize(self, days: Optional[float] = None, by: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Totals for outcomes in the last N days (all outcomes if None).
+
+        Args:
+            days: Window length in days
+            by: Also group by 'type' or 'agent' (under 'groups')
+        """
+        self._refresh()
+        since = self._since(days)
+        summary = self.columns.summarize(since=since)
+        if by:
+            summary['groups'] = self.columns.group_by(by, since=since)
+        return summary
+
+    def get_duration_percentiles(self, molecule_type: Optional[str] = None,
+                                 days: Optional[float] = None,
+                                 quantiles: Tuple[float, ...] = (50, 90, 99)) -> Dict[float, float]:
+        """Percentiles of successful outcome durations"""
+        self._refresh()
+        return self.columns.percentiles(
+            'duration', quantiles, since=self._since(days),
+            molecule_type=molecule_type, successful_only=True
+        )
+
+    def get_rolling_success_rate(self, days: float = 30, window_days: float = 7,
+                                 agent_id: Optional[str] = None,
+                                 molecule_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Daily points of the success rate over the trailing window_days"""
+        self._refresh()
+        return self.columns.rolling_success_rate(
+            window_days=window_days, step_days=1.0, since=self._since(days),
+            molecule_type=molecule_type, agent=agent_id
+        )
 
 
 # =============================================================================
@@ -705,11 +1089,21 @@ class OutcomeTracker:
 # =============================================================================
 
 class PatternLibrary:
-    """Store and retrieve validated patterns"""
+    """
+    Store and retrieve validated patterns.
+
+    match() runs every pattern's triggers through one compiled
+    TriggerAutomaton and checks context requirements through a
+    key -> pattern index, so a match costs one scan of the context
+    rather than one per trigger. Both are rebuilt lazily after add.
+    """
 
     def __init__(self, store_path: Path):
         self.store_path = store_path
         self.patterns: Dict[str, Pattern] = {}
+        self._triggers: Optional[TriggerAutomaton] = None
+        self._by_requirement: Dict[str, List[str]] = {}   # context key -> pattern ids
+        self._by_trigger: Dict[str, List[str]] = {}       # trigger -> pattern ids
         self._load()
 
     def _load(self):
@@ -745,11 +1139,13 @@ class PatternLibrary:
         pattern_path = pattern_dir / f"{pattern.id}.yaml"
         with open(pattern_path, 'w') as f:
             yaml.dump(pattern.to_dict(), f)
+        bump_version(self.store_path, 'patterns')
 
     def add(self, pattern: Pattern) -> str:
         """Add a pattern to the library"""
         self.patterns[pattern.id] = pattern
         self._save_pattern(pattern)
+        self._triggers = None
         logger.info(f"Added pattern {pattern.id}: {pattern.name}")
         return pattern.id
 
@@ -757,6 +1153,11 @@ class PatternLibrary:
         """Get a pattern by ID"""
         return self.patterns.get(pattern_id)
 
+    def update(self, pattern: Pattern):
+        """Persist changes to a stored pattern"""
+        if pattern.id in self.patterns:
+            self._save_pattern(pattern)
+
     def get_all(self) -> List[Pattern]:
         """Get all patterns"""
         return list(self.patterns.values())
@@ -765,37 +1166,68 @@ class PatternLibrary:
         """Get only promoted patterns (ready for autonomous use)"""
         return [p for p in self.patterns.values() if p.promoted]
 
+    def _build_matchers(self) -> TriggerAutomaton:
+        """Compile triggers and index context requirements"""
+        self._by_requirement = {}
+        self._by_trigger = {}
+        for pattern in self.patterns.values():
+            for key in pattern.context_requirements:
+                self._by_requirement.setdefault(key, []).append(pattern.id)
+            for trigger in pattern.triggers:
+                self._by_trigger.setdefault(trigger, []).append(pattern.id)
+        self._triggers = TriggerAutomaton(
+            (trigger, pattern.id)
+            for pattern in self.patterns.values()
+            for trigger in pattern.triggers
+        )
+        return self._triggers
+
     def match(self, context: Dict[str, Any]) -> List[Pattern]:
-        """Find patterns that match current context"""
-        matches = []
+        """
+        Find patterns that match current context.
 
-        for pattern in self.patterns.values():
-            if self._pattern_matches(pattern, context):
-                matches.append(pattern)
+        A pattern matches when one of its triggers occurs in the context
+        (keyword match over the serialized context), or when it has
+        context requirements and none conflicts with the context
+        (requirements on keys absent from the context are ignored).
+        """
+        # Not `or`: an automaton with no triggers is falsy (len 0) but built
+        triggers = self._triggers if self._triggers is not None else self._build_matchers()
+
+        # Serialize once for every trigger
+        matched = triggers.search(json.dumps(context).lower())
+
+        # Requirement-only matches: every pattern with requirements, less
+        # those with a conflicting value for a key the context has
+        conflicting = set()
+        for key, value in context.items():
+            for pattern_id in self._by_requirement.get(key, ()):
+                if pattern_id in matched or pattern_id in conflicting:
+                    continue
+                required = self.patterns[pattern_id].context_requirements[key]
+                if isinstance(required, list):
+                    if value not in required:
+                        conflicting.add(pattern_id)
+                elif value != required:
+                    conflicting.add(pattern_id)
+        for pattern_ids in self._by_requirement.values():
+            matched.update(p for p in pattern_ids if p not in conflicting)
+
+        matches = [self.patterns[pattern_id] for pattern_id in matched]
 
         # Sort by confidence and recency
         matches.sort(key=lambda p: (p.confidence, p.occurrences), reverse=True)
         return matches
 
-    def _pattern_matches(self, pattern: Pattern, context: Dict[str, Any]) -> bool:
-        """Check if a pattern matches the given context"""
-        # Check triggers
-        for trigger in pattern.triggers:
-            # Simple keyword matching in context values
-            context_str = json.dumps(context).lower()
-            if trigger.lower() in context_str:
-                return True
-
-        # Check context requirements
-        for key, value in pattern.context_requirements.items():
-            if key in context:
-                if isinstance(value, list):
-                    if context[key] not in value:
-                        return False
-                elif context[key] != value:
-                    return False
-
-        return bool(pattern.triggers) or bool(pattern.context_requirements)
+    def get_by_triggers(self, tags: List[str]) -> List[Pattern]:
+        """Patterns with any of the given tags as an exact trigger"""
+        if self._triggers is None:
+            self._build_matchers()
+        pattern_ids: Dict[str, None] = {}
+        for tag in tags:
+            for pattern_id in self._by_trigger.get(tag, ()):
+                pattern_ids[pattern_id] = None
+        return [self.patterns[pattern_id] for pattern_id in pattern_ids]
 
     def apply(self, pattern_id: str, outcome: bool):
         """Record pattern application outcome"""
@@ -835,6 +1267,11 @@ class PatternLibrary:
 
         return False
 
+    @staticmethod
+    def group_key(insight: Insight) -> str:
+        """Key grouping insights that may form one pattern (type and leading tags)"""
+        return f"{insight.type.value}:{','.join(sorted(insight.tags[:3]))}"
+
     def discover(self, insights: List[Insight]) -> List[Pattern]:
         """Discover new patterns from insights"""
         new_patterns = []
@@ -842,7 +1279,7 @@ class PatternLibrary:
         # Group insights by type and tags
         groups: Dict[str, List[Insight]] = {}
         for insight in insights:
-            key = f"{insight.type.value}:{','.join(sorted(insight.tags[:3]))}"
+            key = self.group_key(insight)
             if key not in groups:
                 groups[key] = []
             groups[key].append(insight)
@@ -905,14 +1342,27 @@ class PatternLibrary:
 # =============================================================================
 
 class MetaLearner:
-    """Learn how to learn - track what works, adjust strategies"""
+    """
+    Learn how to learn - track what works, adjust strategies.
 
-    def __init__(self, store_path: Path):
+    Source effectiveness and confidence calibration are online estimators
+    updated in memory with a few arithmetic operations per outcome.
+    Attention weights are renormalized lazily, on the next read after an
+    update. Changes are checkpointed to disk at most every
+    checkpoint_interval seconds, on `checkpoint()`, and at exit.
+    """
+
+    def __init__(self, store_path: Path, checkpoint_interval: float = META_CHECKPOINT_INTERVAL):
         self.store_path = store_path
+        self.checkpoint_interval = checkpoint_interval
         self.source_effectiveness: Dict[str, SourceEffectiveness] = {}
         self.confidence_buckets: List[ConfidenceBucket] = []
         self.attention_weights: Dict[str, float] = {}
+        self._attention_stale = False
+        self._dirty = False
+        self._last_checkpoint = time.monotonic()
         self._load()
+        _open_meta_learners.add(self)
 
     def _load(self):
         """Load meta-learning data from disk"""
@@ -955,6 +1405,8 @@ class MetaLearner:
 
     def _save(self):
         """Save meta-learning data to disk"""
+        self._rebalance_attention()
+
         # Save source effectiveness
         se_path = self.store_path / "source_effectiveness.yaml"
         se_data = {sid: se.to_dict() for sid, se in self.source_effectiveness.items()}
@@ -972,6 +1424,21 @@ class MetaLearner:
         with open(aw_path, 'w') as f:
             yaml.dump(self.attention_weights, f)
 
+    def checkpoint(self) -> bool:
+        """Write pending changes to disk; returns whether anything was written"""
+        if not self._dirty:
+            return False
+        self._save()
+        self._dirty = False
+        self._last_checkpoint = time.monotonic()
+        return True
+
+    @staticmethod
+    def _decayed_rate(rate: float, sample_size: int, success: bool) -> float:
+        """Fold one outcome into a success rate (sample_size includes it)"""
+        alpha = max(1.0 / sample_size, META_DECAY_ALPHA)
+        return rate + alpha * ((1.0 if success else 0.0) - rate)
+
     def record_outcome(
         self,
         task_type: str,
@@ -983,31 +1450,26 @@ class MetaLearner:
     ):
         """Record a task outcome for learning"""
         # Update source effectiveness
+        now = datetime.now().isoformat()
         for source in sources_used:
-            if source not in self.source_effectiveness:
-                self.source_effectiveness[source] = SourceEffectiveness(source_id=source)
-
-            se = self.source_effectiveness[source]
+            se = self.source_effectiveness.get(source)
+            if se is None:
+                se = self.source_effectiveness[source] = SourceEffectiveness(source_id=source)
             se.sample_size += 1
-            # Running average
-            se.success_rate = (
-                (se.success_rate * (se.sample_size - 1) + (1 if success else 0))
-                / se.sample_size
-            )
-            se.last_updated = datetime.now().isoformat()
+            se.success_rate = self._decayed_rate(se.success_rate, se.sample_size, success)
+            se.last_updated = now
 
         # Update confidence calibration
         bucket = self._get_bucket(confidence)
         if bucket:
             bucket.sample_size += 1
-            bucket.actual_accuracy = (
-                (bucket.actual_accuracy * (bucket.sample_size - 1) + (1 if success else 0))
-                / bucket.sample_size
-            )
+            bucket.actual_accuracy = self._decayed_rate(bucket.actual_accuracy, bucket.sample_size, success)
 
-        # Rebalance attention weights
-        self._rebalance_attention()
-        self._save()
+        if sources_used:
+            self._attention_stale = True
+        self._dirty = True
+        if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
 
     def _get_bucket(self, confidence: float) -> Optional[ConfidenceBucket]:
         """Get the calibration bucket for a confidence score"""
@@ -1018,8 +1480,9 @@ class MetaLearner:
 
     def _rebalance_attention(self):
         """Adjust attention weights based on source effectiveness"""
-        if not self.source_effectiveness:
+        if not self._attention_stale or not self.source_effectiveness:
             return
+        self._attention_stale = False
 
         # Calculate weighted effectiveness
         total = sum(
@@ -1034,6 +1497,7 @@ class MetaLearner:
 
     def get_attention_weights(self) -> Dict[str, float]:
         """Get current attention weights for context sources"""
+        self._rebalance_attention()
         return self.attention_weights.copy()
 
     def get_calibrated_confidence(self, raw_confidence: float) -> float:
@@ -1057,6 +1521,19 @@ class MetaLearner:
         return 0.5, 0
 
 
+_open_meta_learners: 'weakref.WeakSet[MetaLearner]' = weakref.WeakSet()
+
+
+@atexit.register
+def _checkpoint_meta_learners() -> None:
+    for meta in list(_open_meta_learners):
+        try:
+            if meta.store_path.exists():
+                meta.checkpoint()
+        except Exception as e:
+            logger.warning(f"MetaLearner checkpoint at exit failed: {e}")
+
+
 # =============================================================================
 # Knowledge Distiller
 # =============================================================================
@@ -1064,12 +1541,37 @@ class MetaLearner:
 def generate_insight_id() -> str:
     """Generate a unique insight ID"""
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    random_suffix = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:6]
+    # Random, not time-derived: batches (and pool workers) create many per second
+    random_suffix = uuid.uuid4().hex
     return f"INS-{timestamp}-{random_suffix}"
 
 
+def _extract_for_batch(
+    molecule_data: Dict[str, Any]
+) -> Tuple[List[Tuple[Insight, Tuple[str, int]]], Optional[str]]:
+    """
+    Pool worker: a molecule's insights with their content fingerprints,
+    or the error that stopped extraction.
+
+    Fingerprinting is the costly part of deduplication, so it is done
+    here, in parallel, rather than in the committing process.
+    """
+    try:
+        insights = KnowledgeDistiller.extract(molecule_data)
+    except Exception as e:
+        return [], f"Distill error for {molecule_data.get('id', 'unknown')}: {e}"
+    return [(i, content_fingerprint(i.content)) for i in insights], None
+
+
 class KnowledgeDistiller:
-    """Extract reusable insights from completed work"""
+    """
+    Extract reusable insights from completed work.
+
+    Extraction is pure (molecule data in, insights out), so
+    `distill_batch` can run it on a process pool. Whatever the batch size,
+    new insights are deduplicated in memory and committed to the store
+    in one write.
+    """
 
     def __init__(self, insight_store: InsightStore, outcome_tracker: OutcomeTracker):
         self.store = insight_store
@@ -1077,28 +1579,96 @@ class KnowledgeDistiller:
 
     def distill(self, molecule_data: Dict[str, Any]) -> List[Insight]:
         """Extract insights from a completed molecule"""
+        return self._commit(self._fingerprinted(self.extract(molecule_data)))
+
+    def distill_batch(
+        self,
+        molecules: List[Dict[str, Any]],
+        workers: Optional[int] = None,
+        errors: Optional[List[str]] = None
+    ) -> List[Insight]:
+        """
+        Extract insights from many completed molecules.
+
+        Batches of PARALLEL_DISTILL_MIN_BATCH or more are spread over a
+        process pool; smaller ones (or workers=1) run in this process.
+
+        Args:
+            molecules: Completed molecule data dicts
+            workers: Pool size (default: CPU count)
+            errors: If given, per-molecule extraction errors are appended
+
+        Returns:
+            The insights stored (duplicates dropped), in molecule order
+        """
+        workers = workers or os.cpu_count() or 1
+        results = None
+        if workers > 1 and len(molecules) >= PARALLEL_DISTILL_MIN_BATCH:
+            chunksize = max(1, len(molecules) // (workers * 4))
+            try:
+                # Spawn, not fork: the runner may share a multithreaded process
+                # (storage pool, meter flusher, uvicorn) and a forked child can
+                # inherit a lock held by another thread. Unlike forkserver, the
+                # workers stay our children, so once the block joins them their
+                # CPU time shows up in RUSAGE_CHILDREN for the runner's budget
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    results = list(pool.map(_extract_for_batch, molecules, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Parallel distillation failed, distilling in-process: {e}")
+        if results is None:
+            results = [_extract_for_batch(m) for m in molecules]
+
+        extracted = []
+        for molecule_insights, error in results:
+            extracted.extend(molecule_insights)
+            if error:
+                logger.warning(error)
+                if errors is not None:
+                    errors.append(error)
+        return self._commit(extracted)
+
+    @staticmethod
+    def _fingerprinted(insights: List[Insight]) -> List[Tuple[Insight, Tuple[str, int]]]:
+        return [(i, content_fingerprint(i.content)) for i in insights]
+
+    def _commit(self, extracted: List[Tuple[Insight, Tuple[str, int]]]) -> List[Insight]:
+        """Store the insights that duplicate neither the store nor each other"""
+        batch_index = InsightHashIndex()
+        new, fingerprints = [], []
+        for insight, fingerprint in extracted:
+            digest, simhash_value = fingerprint
+            if self.store.is_duplicate(insight, INSIGHT_DUPLICATE_DISTANCE, fingerprint):
+                continue
+            if (batch_index.find_exact(insight.content, digest) is not None or
+                    batch_index.find_similar(insight.content, INSIGHT_DUPLICATE_DISTANCE, simhash_value)):
+                continue
+            batch_index.add_many([(insight.id, '', insight.content)], [fingerprint])
+            new.append(insight)
+            fingerprints.append(fingerprint)
+
+        self.store.add_many(new, fingerprints)
+        return new
+
+    @classmethod
+    def extract(cls, molecule_data: Dict[str, Any]) -> List[Insight]:
+        """Insights in a completed molecule (nothing is stored)"""
         insights = []
 
         # 1. Structural insights (no LLM needed)
-        insights.extend(self._extract_structural(molecule_data))
+        insights.extend(cls._extract_structural(molecule_data))
 
         # 2. Timing insights
-        insights.extend(self._extract_timing(molecule_data))
+        insights.extend(cls._extract_timing(molecule_data))
 
         # 3. Failure insights
         if not molecule_data.get('success', True):
-            insights.extend(self._extract_failure(molecule_data))
+            insights.extend(cls._extract_failure(molecule_data))
 
-        # 4. Store and deduplicate
-        stored = []
-        for insight in insights:
-            if not self.store.is_duplicate(insight):
-                self.store.add(insight)
-                stored.append(insight)
-
-        return stored
+        return insights
 
-    def _extract_structural(self, molecule_data: Dict[str, Any]) -> List[Insight]:
+    @staticmethod
+    def _extract_structural(molecule_data: Dict[str, Any]) -> List[Insight]:
         """Extract patterns from molecule structure"""
         insights = []
 
@@ -1136,7 +1706,8 @@ class KnowledgeDistiller:
 
         return insights
 
-    def _extract_timing(self, molecule_data: Dict[str, Any]) -> List[Insight]:
+    @staticmethod
+    def _extract_timing(molecule_data: Dict[str, Any]) -> List[Insight]:
         """Extract timing insights"""
         insights = []
 
@@ -1169,7 +1740,8 @@ class KnowledgeDistiller:
 
         return insights
 
-    def _extract_failure(self, molecule_data: Dict[str, Any]) -> List[Insight]:
+    @staticmethod
+    def _extract_failure(molecule_data: Dict[str, Any]) -> List[Insight]:
         """Extract insights from failures"""
         insights = []
 
@@ -1245,13 +1817,7 @@ class KnowledgeDistiller:
                 ))
 
         # Store insights
-        stored = []
-        for insight in insights:
-            if not self.store.is_duplicate(insight):
-                self.store.add(insight)
-                stored.append(insight)
-
-        return stored
+        return self._commit(self._fingerprinted(insights))
 
 
 # =============================================================================
@@ -1266,38 +1832,133 @@ def generate_failure_bead_id() -> str:
 
 
 class BudgetTracker:
-    """Track spending per molecule for cost caps"""
+    """
+    Track spending per molecule for cost caps.
+
+    With a UsageMeter, spend is the molecule's metered LLM cost, so it
+    includes every call tagged with the molecule and survives restarts;
+    add_cost records a manual usage entry and reset saves a baseline to
+    metering/budget_baselines.json next to the usage log. Without one,
+    spend is kept in memory.
+    """
 
-    def __init__(self):
+    def __init__(self, meter: Optional[UsageMeter] = None):
+        self.meter = meter
+        # Without a meter: spend per molecule. With one: metered cost at the last reset
         self.spending: Dict[str, float] = {}
+        self.baselines_file = meter.metering_path / "budget_baselines.json" if meter else None
+        self._baselines_mtime: Optional[int] = None
+        self._load_baselines()
+
+    def _load_baselines(self):
+        """Re-read saved baselines if they changed since last read"""
+        if not self.baselines_file:
+            return
+        try:
+            mtime = self.baselines_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._baselines_mtime:
+            return
+        try:
+            self.spending = json.loads(self.baselines_file.read_text())
+            self._baselines_mtime = mtime
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to load budget baselines: {e}")
 
     def add_cost(self, molecule_id: str, cost: float):
         """Add cost to a molecule's budget"""
+        if self.meter:
+            self.meter.record(UsageRecord(backend='manual', molecule_id=molecule_id, cost_usd=cost))
+            return
         self.spending[molecule_id] = self.spending.get(molecule_id, 0.0) + cost
 
     def get_spent(self, molecule_id: str) -> float:
         """Get total spent on a molecule"""
+        if self.meter:
+            self._load_baselines()
+            spent = self.meter.get_molecule_cost(molecule_id) - self.spending.get(molecule_id, 0.0)
+            return max(spent, 0.0)
         return self.spending.get(molecule_id, 0.0)
 
     def reset(self, molecule_id: str):
         """Reset spending for a molecule"""
-        self.spending[molecule_id] = 0.0
+        if not self.meter:
+            self.spending[molecule_id] = 0.0
+            return
+
+        # Other processes save baselines too; merge under the lock
+        self.baselines_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.baselines_file.with_suffix('.json.lock'), 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                self._load_baselines()
+                self.spending[molecule_id] = self.meter.get_molecule_cost(molecule_id)
+                tmp = self.baselines_file.with_suffix('.json.tmp')
+                tmp.write_text(json.dumps(self.spending))
+                os.replace(tmp, self.baselines_file)
+                self._baselines_mtime = self.baselines_file.stat().st_mtime_ns
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
 
 
 class RalphModeExecutor:
-    """Execute molecules with failure-as-context feedback loop"""
+    """
+    Execute molecules with failure-as-context feedback loop.
+
+    Failure beads are kept per molecule in `failure_store` and indexed by
+    FailureType, error type and error-message MinHash (see
+    failure_index.py) for similar-failure lookups. With a store_path,
+    beads are appended to failures.jsonl and the index to index.jsonl.
+    """
 
     def __init__(
         self,
         pattern_library: PatternLibrary,
         distiller: KnowledgeDistiller,
-        outcome_tracker: OutcomeTracker
+        outcome_tracker: OutcomeTracker,
+        store_path: Optional[Path] = None,
+        usage_meter: Optional[UsageMeter] = None
     ):
         self.patterns = pattern_library
         self.distiller = distiller
         self.outcomes = outcome_tracker
-        self.budget = BudgetTracker()
+        self.budget = BudgetTracker(usage_meter)
         self.failure_store: Dict[str, List[FailureBead]] = {}
+        self._failures_by_id: Dict[str, FailureBead] = {}
+
+        self.store_path = store_path
+        self.failures_file = store_path / "failures.jsonl" if store_path else None
+        self.failure_index = FailureIndex(store_path / "index.jsonl" if store_path else None)
+        self._load_failures()
+
+    def _load_failures(self):
+        """Load failure beads, indexing any the index file is missing"""
+        if not self.failures_file or not self.failures_file.exists():
+            return
+        with open(self.failures_file) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    failure = FailureBead.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    logger.warning(f"Skipping corrupt line in {self.failures_file}")
+                    continue
+                self._store_failure(failure)
+
+    def _store_failure(self, failure: FailureBead):
+        """Add a failure to the in-memory store and the index"""
+        self.failure_store.setdefault(failure.molecule_id, []).append(failure)
+        self._failures_by_id[failure.id] = failure
+        self.failure_index.add(
+            failure.id,
+            failure.molecule_id,
+            failure.classified_failure.value,
+            failure.error_type,
+            failure.error_message,
+            failure.created_at
+        )
 
     def build_failure_context(
         self,
@@ -1334,18 +1995,18 @@ class RalphModeExecutor:
         )
 
     def _find_similar_failures(self, failure: Optional[FailureBead]) -> List[FailureBead]:
-        """Find similar failures from other molecules"""
+        """Find similar past failures, most similar (then most recent) first"""
         if not failure:
             return []
 
-        similar = []
-        for mol_failures in self.failure_store.values():
-            for fb in mol_failures:
-                # Simple similarity: same error type
-                if fb.error_type == failure.error_type and fb.id != failure.id:
-                    similar.append(fb)
-
-        return similar[:10]  # Return up to 10
+        matches = self.failure_index.find_similar(
+            failure_type=failure.classified_failure.value,
+            error_type=failure.error_type,
+            error_message=failure.error_message,
+            exclude_id=failure.id,
+            limit=10  # Return up to 10
+        )
+        return [self._failures_by_id[fid] for fid, _ in matches if fid in self._failures_by_id]
 
     def record_failure(
         self,
@@ -1368,9 +2029,11 @@ class RalphModeExecutor:
         )
 
         # Store for lookup
-        if molecule_id not in self.failure_store:
-            self.failure_store[molecule_id] = []
-        self.failure_store[molecule_id].append(failure)
+        if self.failures_file:
+            self.failures_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.failures_file, 'a') as f:
+                f.write(json.dumps(failure.to_dict(), default=str) + '\n')
+        self._store_failure(failure)
 
         return failure
 
@@ -1488,6 +2151,7 @@ class CycleResult:
     patterns_promoted: int = 0
     suggestions_generated: int = 0
     errors: List[str] = field(default_factory=list)
+    failed: bool = False  # The cycle itself raised (errors may also hold per-item errors)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -1499,7 +2163,8 @@ class CycleResult:
             'patterns_discovered': self.patterns_discovered,
             'patterns_promoted': self.patterns_promoted,
             'suggestions_generated': self.suggestions_generated,
-            'errors': self.errors
+            'errors': self.errors,
+            'failed': self.failed
         }
 
 
@@ -1534,6 +2199,11 @@ class ImprovementSuggestion:
         return cls(**data)
 
 
+# Positions in the append-only sources that the cycles have already read
+# (insight counts; byte offsets into the organizational memory logs)
+DAEMON_WATERMARKS = ('insights_medium', 'insights_slow', 'memory_outcomes_offset', 'memory_lessons_offset')
+
+
 class EvolutionDaemon:
     """
     Background learning process that continuously improves the system.
@@ -1542,6 +2212,13 @@ class EvolutionDaemon:
     - Fast (hourly): Process recent outcomes, update predictions
     - Medium (daily): Analyze patterns, suggest improvements
     - Slow (weekly): Deep analysis, generate Foundation tasks
+
+    The medium and slow cycles are incremental. Watermarks in the daemon
+    state record how far into the insight index and the organizational
+    memory files each cycle has read; a cycle processes only what was
+    appended since and merges it into running aggregates
+    (evolution/aggregates.yaml). `rebuild` discards both and reprocesses
+    everything.
     """
 
     def __init__(
@@ -1578,9 +2255,23 @@ class EvolutionDaemon:
         # Running state (for async operation)
         self.running = False
 
+        # Incremental cycle state
+        self.watermarks: Dict[str, int] = dict.fromkeys(DAEMON_WATERMARKS, 0)
+        self.aggregates: Dict[str, Dict[str, Any]] = self._empty_aggregates()
+        self._org_memory = None
+
         self._load_state()
         logger.info("Evolution Daemon initialized")
 
+    @staticmethod
+    def _empty_aggregates() -> Dict[str, Dict[str, Any]]:
+        return {
+            'insight_groups': {},       # discover() group key -> [[insight id, created_at], ...]
+            'pending_validation': {},   # insight id -> created_at, not validated yet
+            'credited_insights': {},    # insight id -> created_at, already counted for patterns
+            'lesson_categories': {},    # category -> running outcome/lesson counts
+        }
+
     def _load_state(self):
         """Load daemon state from disk"""
         state_file = self.evolution_path / "daemon_state.yaml"
@@ -1590,9 +2281,18 @@ class EvolutionDaemon:
                 self.last_fast_run = state.get('last_fast_run')
                 self.last_medium_run = state.get('last_medium_run')
                 self.last_slow_run = state.get('last_slow_run')
+                self.watermarks.update(state.get('watermarks') or {})
             except Exception as e:
                 logger.warning(f"Failed to load daemon state: {e}")
 
+        # Load running aggregates
+        aggregates_file = self.evolution_path / "aggregates.yaml"
+        if aggregates_file.exists():
+            try:
+                self.aggregates.update(yaml.safe_load(aggregates_file.read_text()) or {})
+            except Exception as e:
+                logger.warning(f"Failed to load evolution aggregates: {e}")
+
         # Load suggestions
         suggestions_file = self.evolution_path / "suggestions.yaml"
         if suggestions_file.exists():
@@ -1608,7 +2308,8 @@ class EvolutionDaemon:
         state = {
             'last_fast_run': self.last_fast_run,
             'last_medium_run': self.last_medium_run,
-            'last_slow_run': self.last_slow_run
+            'last_slow_run': self.last_slow_run,
+            'watermarks': self.watermarks
         }
         state_file.write_text(yaml.dump(state, default_flow_style=False))
 
@@ -1619,17 +2320,35 @@ class EvolutionDaemon:
             default_flow_style=False
         ))
 
+    def _save_aggregates(self):
+        """Save running aggregates to disk"""
+        aggregates_file = self.evolution_path / "aggregates.yaml"
+        aggregates_file.write_text(yaml.dump(self.aggregates, default_flow_style=False, sort_keys=False))
+
+    def _get_org_memory(self):
+        """OrganizationalMemory for lesson synthesis (created once)"""
+        if self._org_memory is None:
+            from .memory import OrganizationalMemory
+            self._org_memory = OrganizationalMemory(self.base_path)
+        return self._org_memory
+
     # =========================================================================
     # Cycle Execution (Synchronous versions for non-async contexts)
     # =========================================================================
 
-    def run_fast_cycle(self, completed_molecules: Optional[List[Dict[str, Any]]] = None) -> CycleResult:
+    def run_fast_cycle(
+        self,
+        completed_molecules: Optional[List[Dict[str, Any]]] = None,
+        workers: Optional[int] = None
+    ) -> CycleResult:
         """
         Fast cycle (hourly): Process recent outcomes.
 
         Args:
             completed_molecules: List of completed molecule data dicts.
                                 If None, looks for unprocessed molecules.
+            workers: Distillation pool size for large batches
+                     (default: CPU count)
         """
         started = datetime.now().isoformat()
         result = CycleResult(
@@ -1642,14 +2361,8 @@ class EvolutionDaemon:
             molecules = completed_molecules or []
             result.molecules_processed = len(molecules)
 
-            # 1. Distill each molecule
-            all_insights = []
-            for mol_data in molecules:
-                try:
-                    insights = self.distiller.distill(mol_data)
-                    all_insights.extend(insights)
-                except Exception as e:
-                    result.errors.append(f"Distill error for {mol_data.get('id', 'unknown')}: {e}")
+            # 1. Distill the batch (parallel for large catch-up batches)
+            all_insights = self.distiller.distill_batch(molecules, workers=workers, errors=result.errors)
 
             result.insights_generated = len(all_insights)
 
@@ -1667,13 +2380,14 @@ class EvolutionDaemon:
             # 3. Quick pattern check - promote any ready patterns
             for pattern in self.patterns.get_all():
                 if not pattern.promoted and pattern.confidence > 0.8 and pattern.occurrences >= 5:
-                    self.patterns.promote(pattern)
-                    result.patterns_promoted += 1
+                    if self.patterns.promote(pattern.id):
+                        result.patterns_promoted += 1
 
             self.last_fast_run = started
 
         except Exception as e:
             result.errors.append(f"Fast cycle error: {e}")
+            result.failed = True
             logger.error(f"Fast cycle failed: {e}")
 
         result.completed_at = datetime.now().isoformat()
@@ -1689,6 +2403,10 @@ class EvolutionDaemon:
         """
         Medium cycle (daily): Pattern analysis and improvement suggestions.
 
+        Only insights added since the last medium cycle are read. They are
+        merged into the running insight groups, and pattern discovery runs
+        on the groups they touched.
+
         Args:
             days: Number of days of insights to analyze
         """
@@ -1700,33 +2418,39 @@ class EvolutionDaemon:
         )
 
         try:
-            # 1. Get recent insights
-            recent_insights = self.insights.get_since(days)
-
-            # 2. Discover new patterns
-            new_patterns = self.patterns.discover(recent_insights)
+            # 1. Get insights added since the last medium cycle
+            new_insights, position = self.insights.get_added_since(self.watermarks['insights_medium'])
+            cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+            recent_insights = [i for i in new_insights if (i.created_at or '') >= cutoff]
+
+            # 2. Discover new patterns in the groups the new insights joined
+            touched = self._merge_insight_groups(recent_insights, cutoff)
+            new_patterns = self.patterns.discover(self._insight_group_members(touched))
             for pattern in new_patterns:
                 self.patterns.add(pattern)
             result.patterns_discovered = len(new_patterns)
 
             # 3. Validate existing patterns against new data
-            validated_count = self._validate_patterns(recent_insights)
+            self._validate_patterns(recent_insights, cutoff)
 
             # 4. Promote high-confidence patterns
             for pattern in self.patterns.get_all():
                 if not pattern.promoted and pattern.confidence > 0.8 and pattern.occurrences >= 3:
-                    self.patterns.promote(pattern)
-                    result.patterns_promoted += 1
+                    if self.patterns.promote(pattern.id):
+                        result.patterns_promoted += 1
 
             # 5. Generate improvement suggestions
             suggestions = self._generate_suggestions(new_patterns)
             self.suggestions.extend(suggestions)
             result.suggestions_generated = len(suggestions)
 
+            self.watermarks['insights_medium'] = position
+            self._save_aggregates()
             self.last_medium_run = started
 
         except Exception as e:
             result.errors.append(f"Medium cycle error: {e}")
+            result.failed = True
             logger.error(f"Medium cycle failed: {e}")
 
         result.completed_at = datetime.now().isoformat()
@@ -1785,19 +2509,19 @@ class EvolutionDaemon:
             # 6. Synthesize lessons from OrganizationalMemory
             # This analyzes outcomes and lessons to identify patterns
             try:
-                from .memory import OrganizationalMemory
-                org_memory = OrganizationalMemory(self.base_path)
-                synthesized = self._synthesize_lessons_from_memory(org_memory)
+                synthesized = self._synthesize_lessons_from_memory(self._get_org_memory())
                 result.insights_generated += synthesized
                 logger.info(f"Slow cycle: synthesized {synthesized} lesson insights")
             except Exception as e:
                 result.errors.append(f"Lesson synthesis error: {e}")
                 logger.warning(f"Lesson synthesis failed in slow cycle: {e}")
 
+            self._save_aggregates()
             self.last_slow_run = started
 
         except Exception as e:
             result.errors.append(f"Slow cycle error: {e}")
+            result.failed = True
             logger.error(f"Slow cycle failed: {e}")
 
         result.completed_at = datetime.now().isoformat()
@@ -1813,26 +2537,72 @@ class EvolutionDaemon:
     # Analysis Helpers
     # =========================================================================
 
-    def _validate_patterns(self, insights: List[Insight]) -> int:
-        """Validate existing patterns against new insights"""
+    def _merge_insight_groups(self, insights: List[Insight], cutoff: str) -> List[str]:
+        """
+        Merge new insights into the running discover() groups.
+
+        Members older than cutoff are pruned. Returns the keys of the
+        groups the insights joined.
+        """
+        groups = self.aggregates['insight_groups']
+        touched: Dict[str, None] = {}
+        for insight in insights:
+            key = self.patterns.group_key(insight)
+            members = groups.setdefault(key, [])
+            if all(member[0] != insight.id for member in members):
+                members.append([insight.id, insight.created_at])
+            touched[key] = None
+
+        for key in list(groups):
+            groups[key] = [m for m in groups[key] if (m[1] or '') >= cutoff]
+            if not groups[key]:
+                del groups[key]
+        return [key for key in touched if key in groups]
+
+    def _insight_group_members(self, keys: List[str]) -> List[Insight]:
+        """Insights in the given running groups, oldest first"""
+        members = []
+        for key in keys:
+            for insight_id, _ in self.aggregates['insight_groups'].get(key, []):
+                insight = self.insights.get(insight_id)
+                if insight is not None:
+                    members.append(insight)
+        return members
+
+    def _validate_patterns(self, insights: List[Insight], cutoff: str) -> int:
+        """
+        Validate existing patterns against new insights.
+
+        A validated insight counts once for each pattern sharing one of
+        its tags. New insights that are not validated yet wait in the
+        pending set and are checked again each cycle until they are
+        validated or fall out of the window.
+        """
+        pending = self.aggregates['pending_validation']
+        credited = self.aggregates['credited_insights']
+        for insight_id, created_at in list(credited.items()):
+            if (created_at or '') < cutoff:
+                del credited[insight_id]
+        for insight in insights:
+            if insight.tags and insight.id not in credited:
+                pending[insight.id] = insight.created_at
+
         validated = 0
-        for pattern in self.patterns.get_all():
-            # Check if pattern is relevant to any insight
-            for insight in insights:
-                if self._pattern_relevant_to_insight(pattern, insight):
-                    # Update pattern based on insight
-                    if insight.validated:
-                        pattern.occurrences += 1
-                        validated += 1
+        for insight_id, created_at in list(pending.items()):
+            insight = self.insights.get(insight_id)
+            if insight is None or (created_at or '') < cutoff:
+                del pending[insight_id]
+                continue
+            if not insight.validated:
+                continue
+            del pending[insight_id]
+            credited[insight_id] = created_at
+            for pattern in self.patterns.get_by_triggers(insight.tags):
+                pattern.occurrences += 1
+                self.patterns.update(pattern)
+                validated += 1
         return validated
 
-    def _pattern_relevant_to_insight(self, pattern: Pattern, insight: Insight) -> bool:
-        """Check if a pattern is relevant to an insight"""
-        # Simple matching based on tags and type
-        pattern_tags = set(pattern.triggers)
-        insight_tags = set(insight.tags)
-        return bool(pattern_tags & insight_tags)
-
     def _generate_suggestions(self, patterns: List[Pattern]) -> List[ImprovementSuggestion]:
         """Generate improvement suggestions from patterns"""
         suggestions = []
@@ -1870,11 +2640,71 @@ class EvolutionDaemon:
 
         return suggestions
 
+    def _merge_memory_records(self, org_memory) -> List[str]:
+        """
+        Merge outcomes and lessons recorded since the last slow cycle into
+        the running per-category counts.
+
+        Outcomes are grouped by task_type. A lesson joins the first known
+        category named in its title or situation, else 'general'.
+
+        Returns:
+            Categories that received new records
+        """
+        categories = self.aggregates['lesson_categories']
+        touched: Dict[str, None] = {}
+
+        for kind in ('outcomes', 'lessons'):
+            # State saved before byte-offset watermarks held record counts
+            count = self.watermarks.pop(f'memory_{kind}', None)
+            if count:
+                self.watermarks[f'memory_{kind}_offset'] = org_memory.record_offset(kind, count)
+
+        def category_stats(category: str) -> Dict[str, Any]:
+            touched[category] = None
+            return categories.setdefault(category, {
+                'items': 0, 'outcomes': 0, 'successes': 0, 'failures': 0,
+                'blockers': {}, 'learnings': 0
+            })
+
+        outcomes, outcome_position = org_memory.get_records_since(
+            'outcomes', self.watermarks['memory_outcomes_offset']
+        )
+        for outcome in outcomes:
+            stats = category_stats(outcome.get('task_type', 'general'))
+            stats['items'] += 1
+            stats['outcomes'] += 1
+            if outcome.get('outcome') == 'success':
+                stats['successes'] += 1
+            elif outcome.get('outcome') == 'failed':
+                stats['failures'] += 1
+            for b in outcome.get('blockers', []):
+                # Normalize blocker text
+                b_key = b.lower()[:50]
+                stats['blockers'][b_key] = stats['blockers'].get(b_key, 0) + 1
+            stats['learnings'] += len(outcome.get('key_learnings', []))
+
+        lessons, lesson_position = org_memory.get_records_since(
+            'lessons', self.watermarks['memory_lessons_offset']
+        )
+        for lesson in lessons:
+            lesson_text = f"{lesson.get('title', '')} {lesson.get('situation', '')}".lower()
+            category = next((c for c in categories if c.lower() in lesson_text), 'general')
+            stats = category_stats(category)
+            stats['items'] += 1
+            if lesson.get('lesson'):
+                stats['learnings'] += 1
+
+        self.watermarks['memory_outcomes_offset'] = outcome_position
+        self.watermarks['memory_lessons_offset'] = lesson_position
+        return list(touched)
+
     def _synthesize_lessons_from_memory(self, org_memory) -> int:
         """
         Synthesize patterns from OrganizationalMemory lessons and outcomes.
 
-        Aggregates lessons by category and identifies recurring patterns like:
+        Merges new lessons and outcomes into the running category counts
+        and identifies recurring patterns in the categories that changed:
         - "Tasks involving X tend to have blocker Y"
         - "Feature implementations in engineering succeed 80% of the time"
 
@@ -1887,24 +2717,17 @@ class EvolutionDaemon:
         insights_created = 0
 
         try:
-            # Aggregate lessons by category
-            categories = org_memory.aggregate_lessons_by_category()
+            touched = self._merge_memory_records(org_memory)
+            categories = self.aggregates['lesson_categories']
 
-            for category, items in categories.items():
-                if len(items) < 2:  # Need multiple items to identify patterns
-                    continue
-
-                # Count outcomes and blockers
-                outcomes = [i for i in items if i.get('source') == 'outcome']
-                lessons = [i for i in items if i.get('source') == 'lesson']
-
-                if not outcomes and not lessons:
+            for category in touched:
+                stats = categories[category]
+                if stats['items'] < 2:  # Need multiple items to identify patterns
                     continue
 
                 # Analyze success/failure rates for this category
-                success_count = len([o for o in outcomes if o.get('outcome') == 'success'])
-                failure_count = len([o for o in outcomes if o.get('outcome') == 'failed'])
-                total_outcomes = success_count + failure_count
+                success_count = stats['successes']
+                total_outcomes = success_count + stats['failures']
 
                 if total_outcomes >= 3:
                     success_rate = success_count / total_outcomes
@@ -1931,57 +2754,36 @@ class EvolutionDaemon:
                     )
                     insights_created += 1
 
-                # Identify common blockers
-                all_blockers = []
-                for o in outcomes:
-                    all_blockers.extend(o.get('blockers', []))
-
-                if all_blockers:
-                    # Count blocker frequency
-                    blocker_counts = {}
-                    for b in all_blockers:
-                        # Normalize blocker text
-                        b_key = b.lower()[:50]
-                        blocker_counts[b_key] = blocker_counts.get(b_key, 0) + 1
-
-                    # Find frequent blockers (appear in 30%+ of outcomes)
-                    for blocker, count in blocker_counts.items():
-                        if count >= max(2, len(outcomes) * 0.3):
-                            pattern = f"Tasks in '{category}' frequently encounter: {blocker}"
-                            confidence = min(count / len(outcomes), 0.9)
-
-                            org_memory.store_synthesized_insight(
-                                insight_id=f"synth-{category}-blocker-{datetime.now().strftime('%Y%m%d%H%M')}",
-                                category=category,
-                                pattern=pattern,
-                                confidence=confidence,
-                                evidence_count=count,
-                                recommendations=[
-                                    f"Plan for this blocker when starting '{category}' tasks",
-                                    "Consider mitigation strategies before delegation"
-                                ],
-                                source_cycle="evolution_daemon_slow"
-                            )
-                            insights_created += 1
-
-                # Extract learnings from lessons
-                all_learnings = []
-                for o in outcomes:
-                    all_learnings.extend(o.get('learnings', []))
-                for l in lessons:
-                    if l.get('lesson'):
-                        all_learnings.append(l['lesson'])
+                # Find frequent blockers (appear in 30%+ of outcomes)
+                for blocker, count in stats['blockers'].items():
+                    if count >= max(2, stats['outcomes'] * 0.3):
+                        pattern = f"Tasks in '{category}' frequently encounter: {blocker}"
+                        confidence = min(count / stats['outcomes'], 0.9)
+
+                        org_memory.store_synthesized_insight(
+                            insight_id=f"synth-{category}-blocker-{datetime.now().strftime('%Y%m%d%H%M')}",
+                            category=category,
+                            pattern=pattern,
+                            confidence=confidence,
+                            evidence_count=count,
+                            recommendations=[
+                                f"Plan for this blocker when starting '{category}' tasks",
+                                "Consider mitigation strategies before delegation"
+                            ],
+                            source_cycle="evolution_daemon_slow"
+                        )
+                        insights_created += 1
 
                 # If there are recurring themes in learnings, note them
-                if len(all_learnings) >= 3:
+                if stats['learnings'] >= 3:
                     # Simple pattern: if many learnings, create a summary insight
-                    pattern = f"Category '{category}' has {len(all_learnings)} documented learnings"
+                    pattern = f"Category '{category}' has {stats['learnings']} documented learnings"
                     org_memory.store_synthesized_insight(
                         insight_id=f"synth-{category}-learnings-{datetime.now().strftime('%Y%m%d')}",
                         category=category,
                         pattern=pattern,
                         confidence=0.7,
-                        evidence_count=len(all_learnings),
+                        evidence_count=stats['learnings'],
                         recommendations=["Review accumulated learnings before starting similar work"],
                         source_cycle="evolution_daemon_slow"
                     )
@@ -1995,48 +2797,25 @@ class EvolutionDaemon:
 
     def _analyze_outcomes(self, days: int) -> Dict[str, Any]:
         """Analyze outcomes for the specified period"""
-        # Get outcomes from tracker
-        all_outcomes = self.outcomes.outcomes
-
-        # Filter by date
-        cutoff = datetime.now().isoformat()[:10]  # Just date part
-        recent_outcomes = [o for o in all_outcomes
-                         if o.created_at[:10] >= cutoff[:10]]  # Simplified date comparison
-
-        total = len(recent_outcomes)
-        successes = len([o for o in recent_outcomes if o.success])
-        failures = total - successes
-
-        # Calculate averages
-        total_duration = sum(o.duration_seconds for o in recent_outcomes)
-        avg_duration = total_duration / total if total > 0 else 0
-
-        total_cost = sum(o.cost_usd for o in recent_outcomes)
-        avg_cost = total_cost / total if total > 0 else 0
-
-        # Group by type
-        by_type: Dict[str, List[Outcome]] = {}
-        for o in recent_outcomes:
-            by_type.setdefault(o.molecule_type, []).append(o)
-
-        type_stats = {}
-        for mol_type, outcomes in by_type.items():
-            type_successes = len([o for o in outcomes if o.success])
-            type_stats[mol_type] = {
-                'total': len(outcomes),
-                'success_rate': type_successes / len(outcomes) if outcomes else 0,
-                'avg_duration': sum(o.duration_seconds for o in outcomes) / len(outcomes) if outcomes else 0
-            }
+        summary = self.outcomes.summarize(days=days, by='type')
+        total = summary['total']
 
         return {
             'total_outcomes': total,
-            'success_count': successes,
-            'failure_count': failures,
-            'success_rate': successes / total if total > 0 else 0,
-            'avg_duration_seconds': avg_duration,
-            'total_cost_usd': total_cost,
-            'avg_cost_usd': avg_cost,
-            'by_type': type_stats
+            'success_count': summary['successes'],
+            'failure_count': total - summary['successes'],
+            'success_rate': summary['success_rate'],
+            'avg_duration_seconds': summary['avg_duration'] or 0,
+            'total_cost_usd': summary['total_cost'],
+            'avg_cost_usd': summary['total_cost'] / total if total > 0 else 0,
+            'by_type': {
+                mol_type: {
+                    'total': stats['total'],
+                    'success_rate': stats['success_rate'],
+                    'avg_duration': stats['avg_duration'],
+                }
+                for mol_type, stats in summary['groups'].items()
+            }
         }
 
     def _identify_systematic_issues(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -2081,29 +2860,35 @@ class EvolutionDaemon:
         return issues
 
     def _consolidate_insights(self) -> int:
-        """Consolidate similar insights"""
-        # Simple consolidation - increase validation count for similar insights
-        all_insights = self.insights.get_all()
-        consolidated = 0
-
-        # Group by content hash
-        content_groups: Dict[str, List[Insight]] = {}
-        for insight in all_insights:
-            content_hash = hashlib.md5(insight.content.lower().encode()).hexdigest()[:8]
-            content_groups.setdefault(content_hash, []).append(insight)
-
-        # For groups with multiple insights, consolidate
-        for group in content_groups.values():
-            if len(group) > 1:
-                # Keep the first, increase its validation
-                primary = group[0]
-                for other in group[1:]:
-                    primary.validation_count += 1
-                    primary.confidence = min(1.0, primary.confidence + 0.05)
-                    # Mark others as validated (pointing to primary)
-                    other.validated = True
-                consolidated += len(group) - 1
+        """
+        Consolidate insights added since the last slow cycle.
 
+        A new insight whose normalized content matches an earlier one is
+        folded into the earliest (primary) insight of its content group.
+        """
+        # Simple consolidation - increase validation count for duplicate insights
+        consolidated = 0
+        new_insights, position = self.insights.get_added_since(self.watermarks['insights_slow'])
+
+        for other in new_insights:
+            # Groups of identical normalized content come from the hash index
+            group = self.insights.hash_index.digest_group(other.id)
+            if len(group) < 2 or group[0] == other.id:
+                continue
+            primary = self.insights.get(group[0])
+            if primary is None:
+                continue
+
+            # Keep the first, increase its validation
+            primary.validation_count += 1
+            primary.confidence = min(1.0, primary.confidence + 0.05)
+            # Mark others as validated (pointing to primary)
+            other.validated = True
+            self.insights.update(primary)
+            self.insights.update(other)
+            consolidated += 1
+
+        self.watermarks['insights_slow'] = position
         return consolidated
 
     def _generate_performance_report(self, days: int, analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -2175,6 +2960,30 @@ class EvolutionDaemon:
                 return True
         return False
 
+    def rebuild(self, medium_days: int = 7, slow_days: int = 30) -> List[CycleResult]:
+        """
+        Recompute the running aggregates from all history.
+
+        For recovery when the daemon state or aggregates are lost or
+        suspect. Consolidation and pattern validation are not replayed:
+        their results are written into the insights and patterns
+        themselves, so the insights_slow watermark and the validation
+        bookkeeping are kept.
+
+        Returns:
+            Results of the medium and slow cycles that rebuilt the state
+        """
+        aggregates = self._empty_aggregates()
+        for name in ('pending_validation', 'credited_insights'):
+            aggregates[name] = self.aggregates[name]
+        self.aggregates = aggregates
+        for name in ('insights_medium', 'memory_outcomes_offset', 'memory_lessons_offset'):
+            self.watermarks[name] = 0
+        for name in ('memory_outcomes', 'memory_lessons'):
+            self.watermarks.pop(name, None)
+        logger.info("Rebuilding evolution aggregates from full history")
+        return [self.run_medium_cycle(medium_days), self.run_slow_cycle(slow_days)]
+
     def get_cycle_history(self, cycle_type: Optional[CycleType] = None,
                          limit: int = 10) -> List[CycleResult]:
         """Get recent cycle history"""
@@ -2191,7 +3000,8 @@ class EvolutionDaemon:
             'last_slow_run': self.last_slow_run,
             'pending_suggestions': len(self.get_pending_suggestions()),
             'total_suggestions': len(self.suggestions),
-            'cycle_runs': len(self.cycle_history)
+            'cycle_runs': len(self.cycle_history),
+            'watermarks': dict(self.watermarks)
         }
 
 
@@ -2268,23 +3078,57 @@ class SynthesizedContext:
         }
 
 
+def normalize_task_context(task_context: Dict[str, Any]) -> Dict[str, Any]:
+    """Task context with capabilities deduplicated and sorted"""
+    normalized = dict(task_context)
+    if isinstance(normalized.get('capabilities'), (list, tuple, set)):
+        normalized['capabilities'] = sorted(set(normalized['capabilities']))
+    return normalized
+
+
+def task_signature(task_context: Dict[str, Any]) -> str:
+    """Cache key shared by task contexts that synthesize the same learning context"""
+    return json.dumps(normalize_task_context(task_context), sort_keys=True, default=str)
+
+
+def _store_versions(
+    patterns: PatternLibrary,
+    insights: InsightStore,
+    outcomes: Optional[OutcomeTracker] = None
+) -> Tuple[int, int, int]:
+    """Change counters of the stores a learning context is derived from"""
+    return (
+        get_version(patterns.store_path, 'patterns'),
+        get_version(insights.store_path, 'insights'),
+        get_version(outcomes.store_path, 'outcomes') if outcomes else 0
+    )
+
+
 class ContextSynthesizer:
     """
     Transform raw context into understanding.
 
     Takes multiple context sources and synthesizes them into
     a coherent understanding with patterns, predictions, and recommendations.
+
+    A synthesized context depends only on the task context and the
+    pattern, insight and outcome stores, so it is cached per task
+    signature until one of those stores changes (see versions.py).
+    Attention weights are read fresh on every call.
     """
 
     def __init__(
         self,
         pattern_library: PatternLibrary,
         meta_learner: MetaLearner,
-        insight_store: InsightStore
+        insight_store: InsightStore,
+        outcome_tracker: Optional[OutcomeTracker] = None
     ):
         self.patterns = pattern_library
         self.meta = meta_learner
         self.insights = insight_store
+        self.outcomes = outcome_tracker
+        self._cache = VersionedCache(max_entries=CONTEXT_CACHE_SIZE)
         logger.info("Context Synthesizer initialized")
 
     def synthesize(
@@ -2296,34 +3140,57 @@ class ContextSynthesizer:
         """
         Synthesize understanding from query and context.
 
+        Results are cached per task signature. Each call returns its own
+        lists, but their items (themes, patterns, predictions) are shared
+        with the cache and must be treated as read-only.
+
         Args:
             query: The task description or question
             task_context: Dict with task_type, capabilities, department, etc.
             additional_context: Optional additional context to include
         """
-        # 1. Get attention weights from meta-learner
-        weights = self.meta.get_attention_weights()
+        task_context = normalize_task_context(task_context)
+        context = self._cache.get(
+            task_signature(task_context),
+            _store_versions(self.patterns, self.insights, self.outcomes),
+            lambda: self._build(query, task_context)
+        )
+        # Get attention weights from meta-learner
+        return replace(
+            context,
+            themes=list(context.themes),
+            patterns=list(context.patterns),
+            predictions=list(context.predictions),
+            gaps=list(context.gaps),
+            recommendations=list(context.recommendations),
+            attention_weights=self.meta.get_attention_weights()
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self._cache.get_stats()
 
-        # 2. Gather relevant patterns
+    def _build(self, query: str, task_context: Dict[str, Any]) -> SynthesizedContext:
+        """Synthesize a context (without attention weights)"""
+        # 1. Gather relevant patterns
         patterns = self.patterns.match(task_context)
 
-        # 3. Get relevant insights
+        # 2. Get relevant insights
         tags = [task_context.get('task_type', '')] + task_context.get('capabilities', [])
         relevant_insights = self.insights.get_by_tags([t for t in tags if t])
 
-        # 4. Cluster into themes
+        # 3. Cluster into themes
         themes = self._cluster_themes(query, relevant_insights, patterns)
 
-        # 5. Generate predictions
+        # 4. Generate predictions
         predictions = self._generate_predictions(task_context, patterns)
 
-        # 6. Identify gaps
+        # 5. Identify gaps
         gaps = self._identify_gaps(themes, task_context)
 
-        # 7. Generate recommendations
+        # 6. Generate recommendations
         recommendations = self._generate_recommendations(patterns, gaps, task_context)
 
-        # 8. Synthesize summary
+        # 7. Synthesize summary
         summary = self._synthesize_summary(query, themes, patterns, task_context)
 
         return SynthesizedContext(
@@ -2333,7 +3200,7 @@ class ContextSynthesizer:
             predictions=predictions,
             gaps=gaps,
             recommendations=recommendations,
-            attention_weights=weights
+            attention_weights={}
         )
 
     def _cluster_themes(
@@ -2404,8 +3271,8 @@ class ContextSynthesizer:
     def _estimate_success_rate(self, task_type: str) -> float:
         """Estimate success rate from historical outcomes"""
         # Simple estimation from insight patterns
-        success_insights = len(self.insights.get_by_type(InsightType.SUCCESS_PATTERN))
-        failure_insights = len(self.insights.get_by_type(InsightType.FAILURE_PATTERN))
+        success_insights = self.insights.count_by_type(InsightType.SUCCESS_PATTERN)
+        failure_insights = self.insights.count_by_type(InsightType.FAILURE_PATTERN)
         total = success_insights + failure_insights
         if total == 0:
             return 0.7  # Default estimate
@@ -2518,7 +3385,10 @@ class LearningSystem:
         self.patterns = PatternLibrary(learning_path / "patterns")
         self.meta = MetaLearner(learning_path / "meta")
         self.distiller = KnowledgeDistiller(self.insights, self.outcomes)
-        self.ralph = RalphModeExecutor(self.patterns, self.distiller, self.outcomes)
+        self.ralph = RalphModeExecutor(
+            self.patterns, self.distiller, self.outcomes, store_path=learning_path / "failures",
+            usage_meter=get_usage_meter(base_path)
+        )
 
         # Initialize Phase 2 components
         self.evolution = EvolutionDaemon(
@@ -2532,31 +3402,52 @@ class LearningSystem:
         self.synthesizer = ContextSynthesizer(
             pattern_library=self.patterns,
             meta_learner=self.meta,
-            insight_store=self.insights
+            insight_store=self.insights,
+            outcome_tracker=self.outcomes
         )
+        self._context_cache = VersionedCache(max_entries=CONTEXT_CACHE_SIZE)
+
+        # Completed molecules waiting for the evolution runner's fast cycle
+        self.completion_queue = LearningEventQueue(self.evolution.evolution_path / "events.jsonl")
 
         logger.info(f"Learning System initialized at {learning_path}")
 
+    @staticmethod
+    def _completed_molecule_data(molecule_or_data: Any) -> Dict[str, Any]:
+        """Molecule data dict from a Molecule object or a dict"""
+        # Handle both Molecule objects and dicts
+        if hasattr(molecule_or_data, 'to_dict'):
+            return molecule_or_data.to_dict()
+        if isinstance(molecule_or_data, dict):
+            return molecule_or_data
+        # Try to extract what we can
+        return {
+            'id': getattr(molecule_or_data, 'id', 'unknown'),
+            'type': getattr(molecule_or_data, 'type', 'unknown'),
+            'status': 'completed'
+        }
+
     def on_molecule_complete(self, molecule_or_data: Any) -> List[Insight]:
         """
         Handle molecule completion - extract insights.
 
+        Runs synchronously; MoleculeEngine uses queue_molecule_complete
+        so completion does not wait on learning work.
+
         Args:
             molecule_or_data: Either a Molecule object or a Dict with molecule data
         """
-        # Handle both Molecule objects and dicts
-        if hasattr(molecule_or_data, 'to_dict'):
-            molecule_data = molecule_or_data.to_dict()
-        elif isinstance(molecule_or_data, dict):
-            molecule_data = molecule_or_data
-        else:
-            # Try to extract what we can
-            molecule_data = {
-                'id': getattr(molecule_or_data, 'id', 'unknown'),
-                'type': getattr(molecule_or_data, 'type', 'unknown'),
-                'status': 'completed'
-            }
-        return self.distiller.distill(molecule_data)
+        return self.distiller.distill(self._completed_molecule_data(molecule_or_data))
+
+    def queue_molecule_complete(self, molecule_or_data: Any) -> None:
+        """
+        Queue a completed molecule for the evolution runner's fast cycle
+        (distillation and meta-learner outcome) instead of processing it now.
+
+        Args:
+            molecule_or_data: Either a Molecule object or a Dict with molecule data
+        """
+        self.completion_queue.put(self._completed_molecule_data(molecule_or_data))
 
     def on_molecule_fail(
         self,
@@ -2606,27 +3497,43 @@ class LearningSystem:
         capabilities: List[str],
         department: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Get learning-enhanced context for a task"""
-        context = {
+        """
+        Get learning-enhanced context for a task.
+
+        Cached per task signature until the pattern, insight or outcome
+        store changes, so work items sharing a task type, capabilities
+        and department reuse one lookup. Each call returns its own lists;
+        the pattern and insight dicts in them are shared with the cache
+        and must be treated as read-only.
+        """
+        context = normalize_task_context({
             'task_type': task_type,
             'capabilities': capabilities,
             'department': department
-        }
+        })
 
-        # Get matching patterns
-        patterns = self.patterns.match(context)
+        def build() -> Dict[str, Any]:
+            # Get matching patterns
+            patterns = self.patterns.match(context)
 
-        # Get attention weights
-        weights = self.meta.get_attention_weights()
+            # Get recent insights for this task type
+            relevant_insights = self.insights.get_by_tags([task_type] + context['capabilities'])
 
-        # Get recent insights for this task type
-        relevant_insights = self.insights.get_by_tags([task_type] + capabilities)
+            return {
+                'patterns': [p.to_dict() for p in patterns[:5]],
+                'recent_insights': [i.to_dict() for i in relevant_insights[:10]],
+                'recommendations': [p.recommendation for p in patterns if p.promoted][:5]
+            }
 
+        cached = self._context_cache.get(
+            task_signature(context),
+            _store_versions(self.patterns, self.insights, self.outcomes),
+            build
+        )
+        # Get attention weights
         return {
-            'patterns': [p.to_dict() for p in patterns[:5]],
-            'attention_weights': weights,
-            'recent_insights': [i.to_dict() for i in relevant_insights[:10]],
-            'recommendations': [p.recommendation for p in patterns if p.promoted][:5]
+            **{key: list(value) for key, value in cached.items()},
+            'attention_weights': self.meta.get_attention_weights()
         }
 
     def record_task_outcome(
@@ -2728,7 +3635,8 @@ class LearningSystem:
         """
         Get total cost incurred by a molecule.
 
-        Used by Ralph Mode to check cost caps.
+        Metered LLM spend (see metering.py); used by Ralph Mode to check
+        cost caps.
         """
         return self.ralph.budget.get_spent(molecule_id)
 
@@ -2779,7 +3687,9 @@ class LearningSystem:
             'total_patterns': len(self.patterns.get_all()),
             'promoted_patterns': len(self.patterns.get_promoted()),
             'total_outcomes': len(self.outcomes.outcomes),
-            'attention_weights': self.meta.get_attention_weights()
+            'attention_weights': self.meta.get_attention_weights(),
+            'context_cache': self._context_cache.get_stats(),
+            'synthesis_cache': self.synthesizer.get_cache_stats()
         }
 
 
@@ -19,6 +19,8 @@ import subprocess
 import logging
 import tempfile
 import base64
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable, TYPE_CHECKING, Iterator
@@ -31,6 +33,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 
+from .metering import record_llm_call
+
 
 class BackendType(Enum):
     """Available LLM backend types"""
@@ -44,6 +48,10 @@ class LLMRequest:
     """A request to the LLM backend"""
     prompt: str
     system_prompt: Optional[str] = None
+    # Stable leading part of the system prompt (identical across requests).
+    # Backends that support prompt caching cache it; system_prompt then
+    # holds only the per-request part that follows it.
+    system_prompt_prefix: Optional[str] = None
     context: Dict[str, Any] = field(default_factory=dict)
     tools: Optional[List[str]] = None  # None = use defaults, [] = no tools
     skills: List[str] = field(default_factory=list)
@@ -59,6 +67,11 @@ class LLMRequest:
     # For continuation
     conversation_id: Optional[str] = None
 
+    def full_system_prompt(self) -> Optional[str]:
+        """System prompt with the stable prefix first, for backends without cache markers"""
+        parts = [p for p in (self.system_prompt_prefix, self.system_prompt) if p]
+        return "\n\n".join(parts) if parts else None
+
 
 @dataclass
 class LLMResponse:
@@ -370,9 +383,11 @@ class ClaudeCodeBackend(LLMBackend):
         # Add model
         cmd.extend(['--model', request.model])
 
-        # Add system prompt if provided
-        if request.system_prompt:
-            cmd.extend(['--system-prompt', request.system_prompt])
+        # Add system prompt if provided (stable prefix first so the CLI's
+        # own prompt caching can reuse it across calls)
+        system_prompt = request.full_system_prompt()
+        if system_prompt:
+            cmd.extend(['--system-prompt', system_prompt])
 
         # Determine tools to enable
         # None = use all tools (default), [] = no tools, list = specific tools
@@ -450,6 +465,7 @@ class ClaudeCodeBackend(LLMBackend):
             logger.debug(f"Executing Claude CLI command: {' '.join(cmd)}")
             logger.debug(f"Prompt length: {len(full_prompt)} chars")
 
+            started = time.monotonic()
             result = subprocess.run(
                 shell_cmd,
                 shell=True,
@@ -468,13 +484,21 @@ class ClaudeCodeBackend(LLMBackend):
                 except OSError:
                     pass
 
+            # --print output carries no token counts; only latency is metered
+            latency_ms = (time.monotonic() - started) * 1000
+            record_llm_call(
+                self.backend_type.value, request,
+                latency_ms=latency_ms, success=result.returncode == 0
+            )
+
             if result.returncode == 0:
                 return LLMResponse(
                     content=result.stdout,
                     success=True,
                     metadata={
                         'stderr': result.stderr,
-                        'returncode': result.returncode
+                        'returncode': result.returncode,
+                        'latency_ms': latency_ms
                     }
                 )
             else:
@@ -491,11 +515,16 @@ class ClaudeCodeBackend(LLMBackend):
                     error=error_msg,
                     metadata={
                         'stderr': result.stderr,
-                        'returncode': result.returncode
+                        'returncode': result.returncode,
+                        'latency_ms': latency_ms
                     }
                 )
 
         except subprocess.TimeoutExpired:
+            record_llm_call(
+                self.backend_type.value, request,
+                latency_ms=(time.monotonic() - started) * 1000, success=False
+            )
             # Clean up temp files on timeout
             if 'temp_file' in locals():
                 try:
@@ -559,8 +588,9 @@ class ClaudeCodeBackend(LLMBackend):
         cmd.extend(['--output-format', 'stream-json'])
         cmd.extend(['--model', request.model])
 
-        if request.system_prompt:
-            cmd.extend(['--system-prompt', request.system_prompt])
+        system_prompt = request.full_system_prompt()
+        if system_prompt:
+            cmd.extend(['--system-prompt', system_prompt])
 
         # Add tools
         tools_to_use = request.tools if request.tools else ALL_TOOLS
@@ -574,6 +604,10 @@ class ClaudeCodeBackend(LLMBackend):
         if request.context:
             env['AI_CORP_CONTEXT'] = json.dumps(request.context)
 
+        process = None
+        final_result: Dict[str, Any] = {}
+        succeeded = False
+        started = time.monotonic()
         try:
             process = subprocess.Popen(
                 cmd,
@@ -603,6 +637,8 @@ class ClaudeCodeBackend(LLMBackend):
 
                     try:
                         event_data = json.loads(line)
+                        if event_data.get('type') == 'result':
+                            final_result = event_data
                         event = self._parse_stream_event(event_data)
                         if event:
                             yield event
@@ -619,6 +655,7 @@ class ClaudeCodeBackend(LLMBackend):
 
             # Wait for process to complete
             process.wait()
+            succeeded = process.returncode == 0
 
             # Check for errors
             if process.returncode != 0 and stderr_output:
@@ -634,6 +671,22 @@ class ClaudeCodeBackend(LLMBackend):
                 event_type='error',
                 content=str(e)
             )
+        finally:
+            # Consumer stopped early (e.g. client disconnected) - end the CLI
+            if process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
+
+            # Meter every started call, including abandoned streams; the
+            # final stream-json result (if it arrived) reports usage and cost
+            if process is not None:
+                record_llm_call(
+                    self.backend_type.value, request,
+                    usage=final_result.get('usage'),
+                    latency_ms=(time.monotonic() - started) * 1000,
+                    success=succeeded,
+                    cost_usd=final_result.get('total_cost_usd')
+                )
 
     def _parse_stream_event(self, data: Dict[str, Any]) -> Optional[StreamEvent]:
         """Parse a JSON stream event from Claude CLI"""
@@ -729,11 +782,27 @@ class ClaudeAPIBackend(LLMBackend):
 
     Useful for programmatic access without CLI overhead.
     Requires ANTHROPIC_API_KEY environment variable.
+
+    Prompt caching:
+        When a request has a system_prompt_prefix, it is sent as its own
+        system block with a cache_control marker, so repeated requests
+        sharing the prefix are billed and processed at the cached rate.
+        Cache reads and writes reported by the API are accumulated in
+        get_usage_stats() and, per call, reported to the active UsageMeter
+        (see metering.py).
     """
 
     def __init__(self):
         self.api_key = os.environ.get('ANTHROPIC_API_KEY')
         self._client = None
+        self._usage_lock = threading.Lock()
+        self._usage = {
+            'requests': 0,
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'cache_creation_input_tokens': 0,
+            'cache_read_input_tokens': 0,
+        }
 
     def _get_client(self):
         """Lazy-load the Anthropic client"""
@@ -788,22 +857,40 @@ class ClaudeAPIBackend(LLMBackend):
                 "messages": messages
             }
 
-            if request.system_prompt:
-                kwargs["system"] = request.system_prompt
+            system = self._build_system(request)
+            if system:
+                kwargs["system"] = system
 
-            response = client.messages.create(**kwargs)
+            started = time.monotonic()
+            try:
+                response = client.messages.create(**kwargs)
+            except Exception:
+                record_llm_call(
+                    self.backend_type.value, request,
+                    latency_ms=(time.monotonic() - started) * 1000, success=False
+                )
+                raise
+            latency_ms = (time.monotonic() - started) * 1000
 
             response_text = ""
             for block in response.content:
                 if hasattr(block, 'text'):
                     response_text += block.text
 
+            usage = self._record_usage(response.usage)
+            record_llm_call(
+                self.backend_type.value, request,
+                model=response.model, usage=usage, latency_ms=latency_ms
+            )
+
             return LLMResponse(
                 content=response_text,
                 success=True,
                 metadata={
                     'model': response.model,
-                    'stop_reason': response.stop_reason
+                    'stop_reason': response.stop_reason,
+                    'usage': usage,
+                    'latency_ms': latency_ms
                 },
                 tokens_used=response.usage.input_tokens + response.usage.output_tokens
             )
@@ -816,6 +903,50 @@ class ClaudeAPIBackend(LLMBackend):
             )
 
 
+    @staticmethod
+    def _build_system(request: LLMRequest):
+        """System parameter, with the stable prefix marked for caching"""
+        if not request.system_prompt_prefix:
+            return request.system_prompt
+
+        blocks = [{
+            "type": "text",
+            "text": request.system_prompt_prefix,
+            "cache_control": {"type": "ephemeral"}
+        }]
+        if request.system_prompt:
+            blocks.append({"type": "text", "text": request.system_prompt})
+        return blocks
+
+    def _record_usage(self, usage) -> Dict[str, int]:
+        """Accumulate token usage, including prompt-cache reads and writes"""
+        counts = {
+            'input_tokens': getattr(usage, 'input_tokens', 0) or 0,
+            'output_tokens': getattr(usage, 'output_tokens', 0) or 0,
+            'cache_creation_input_tokens': getattr(usage, 'cache_creation_input_tokens', 0) or 0,
+            'cache_read_input_tokens': getattr(usage, 'cache_read_input_tokens', 0) or 0,
+        }
+        with self._usage_lock:
+            self._usage['requests'] += 1
+            for key, value in counts.items():
+                self._usage[key] += value
+        return counts
+
+    def get_usage_stats(self) -> Dict[str, Any]:
+        """Accumulated token usage and the share of input served from cache"""
+        with self._usage_lock:
+            stats = dict(self._usage)
+        total_input = (
+            stats['input_tokens']
+            + stats['cache_creation_input_tokens']
+            + stats['cache_read_input_tokens']
+        )
+        stats['cache_hit_rate'] = (
+            round(stats['cache_read_input_tokens'] / total_input, 3) if total_input else 0.0
+        )
+        return stats
+
+
 class MockBackend(LLMBackend):
     """
     Mock backend for testing without actual LLM calls.
@@ -18,16 +18,22 @@ References:
 """
 
 import logging
+import os
 import re
 import json
+import threading
 import uuid
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable, Union
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import yaml
 
+from .versions import bump_version
+
 
 # =============================================================================
 # SimpleMem-Inspired Adaptive Retrieval
@@ -906,12 +912,20 @@ class ContextCompressor:
         return points[:max_points]
 
 
+_org_memory_logger = logging.getLogger(__name__ + '.organizational')
+
+
 class OrganizationalMemory:
     """
     Long-term organizational memory for AI Corp.
 
     Stores collective knowledge, decisions, and lessons learned
     that persist across agent lifecycles.
+
+    Lessons and molecule outcomes are append-only JSON-lines logs (one
+    record per line), so recording one is a single append and
+    incremental readers resume from a byte offset (see
+    get_records_since). Legacy YAML lists are migrated on first use.
     """
 
     def __init__(self, corp_path: Path):
@@ -920,7 +934,7 @@ class OrganizationalMemory:
         self.memory_path.mkdir(parents=True, exist_ok=True)
 
         self.decisions_file = self.memory_path / "decisions.yaml"
-        self.lessons_file = self.memory_path / "lessons_learned.yaml"
+        self.lessons_file = self.memory_path / "lessons_learned.jsonl"
         self.patterns_file = self.memory_path / "patterns.yaml"
 
     def record_decision(
@@ -1015,15 +1029,13 @@ class OrganizationalMemory:
             'recorded_at': datetime.utcnow().isoformat()
         }
 
-        lessons = self._load_file(self.lessons_file)
-        lessons.append(lesson_entry)
-        self._save_file(self.lessons_file, lessons)
+        self._append_record(self.lessons_file, lesson_entry)
 
         return lesson_entry
 
     def get_relevant_lessons(self, context: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """Get lessons relevant to a given context"""
-        lessons = self._load_file(self.lessons_file)
+        lessons = self._load_records(self.lessons_file)
 
         # Simple relevance scoring based on keyword overlap
         scored = []
@@ -1536,7 +1548,7 @@ class OrganizationalMemory:
     @property
     def outcomes_file(self) -> Path:
         """Path to molecule outcomes file"""
-        return self.memory_path / "molecule_outcomes.yaml"
+        return self.memory_path / "molecule_outcomes.jsonl"
 
     @property
     def synthesized_insights_file(self) -> Path:
@@ -1600,9 +1612,7 @@ class OrganizationalMemory:
         }
 
         # Save to outcomes file
-        outcomes = self._load_file(self.outcomes_file)
-        outcomes.append(outcome_entry)
-        self._save_file(self.outcomes_file, outcomes)
+        self._append_record(self.outcomes_file, outcome_entry)
 
         # Also create a lesson from this outcome if there are learnings
         if key_learnings:
@@ -1653,7 +1663,7 @@ class OrganizationalMemory:
             return []
 
         # Search molecule outcomes first (higher priority)
-        outcomes = self._load_file(self.outcomes_file)
+        outcomes = self._load_records(self.outcomes_file)
         for outcome in outcomes:
             if not include_failed and outcome.get('outcome') == 'failed':
                 continue
@@ -1696,7 +1706,7 @@ class OrganizationalMemory:
             })
 
         # Search lessons learned (skip auto-generated lessons from outcomes we already found)
-        lessons = self._load_file(self.lessons_file)
+        lessons = self._load_records(self.lessons_file)
         for lesson in lessons:
             # Skip lessons auto-generated from outcomes we already included
             lesson_id = lesson.get('id', '')
@@ -1752,7 +1762,7 @@ class OrganizationalMemory:
         task_type_lower = task_type.lower()
 
         # Search outcomes by task_type
-        outcomes = self._load_file(self.outcomes_file)
+        outcomes = self._load_records(self.outcomes_file)
         for outcome in outcomes:
             if outcome.get('task_type', '').lower() == task_type_lower:
                 results.append({
@@ -1761,7 +1771,7 @@ class OrganizationalMemory:
                 })
 
         # Search lessons (by title/situation keyword match)
-        lessons = self._load_file(self.lessons_file)
+        lessons = self._load_records(self.lessons_file)
         for lesson in lessons:
             lesson_text = f"{lesson.get('title', '')} {lesson.get('situation', '')}".lower()
             if task_type_lower in lesson_text:
@@ -1784,7 +1794,7 @@ class OrganizationalMemory:
         categories: Dict[str, List[Dict[str, Any]]] = {}
 
         # Group outcomes by task_type
-        outcomes = self._load_file(self.outcomes_file)
+        outcomes = self._load_records(self.outcomes_file)
         for outcome in outcomes:
             task_type = outcome.get('task_type', 'general')
             if task_type not in categories:
@@ -1798,7 +1808,7 @@ class OrganizationalMemory:
             })
 
         # Add lessons to categories (infer from title/situation)
-        lessons = self._load_file(self.lessons_file)
+        lessons = self._load_records(self.lessons_file)
         for lesson in lessons:
             # Try to infer category from lesson content
             lesson_text = f"{lesson.get('title', '')} {lesson.get('situation', '')}".lower()
@@ -1827,6 +1837,47 @@ class OrganizationalMemory:
 
         return categories
 
+    def _records_path(self, kind: str) -> Path:
+        paths = {'outcomes': self.outcomes_file, 'lessons': self.lessons_file}
+        if kind not in paths:
+            raise ValueError(f"Unknown record kind: {kind}")
+        return paths[kind]
+
+    def get_records_since(self, kind: str, position: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Outcome or lesson records appended after byte offset `position`.
+
+        Both logs only grow by appending, so the returned offset works as
+        a watermark for incremental readers (the Evolution Daemon); only
+        the lines past it are read and parsed.
+
+        Args:
+            kind: 'outcomes' or 'lessons'
+            position: Byte offset already read
+
+        Returns:
+            (new records, new position). If the log is shorter than
+            `position` it was replaced, and every record is returned.
+        """
+        return self._read_records(self._records_path(kind), position)
+
+    def record_offset(self, kind: str, count: int) -> int:
+        """Byte offset just past the first `count` outcome or lesson records"""
+        path = self._records_path(kind)
+        self._migrate_yaml_log(path)
+        offset = 0
+        if count > 0 and path.exists():
+            with open(path, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    offset += len(line)
+                    if line.strip():
+                        count -= 1
+                        if count == 0:
+                            break
+        return offset
+
     def store_synthesized_insight(
         self,
         insight_id: str,
@@ -1973,9 +2024,59 @@ class OrganizationalMemory:
         data = yaml.safe_load(path.read_text())
         return data if isinstance(data, list) else []
 
+    def _load_records(self, path: Path) -> List[Dict[str, Any]]:
+        """Load every record of a JSON-lines log"""
+        return self._read_records(path, 0)[0]
+
+    def _read_records(self, path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Complete records of a JSON-lines log past a byte offset, and the new offset"""
+        self._migrate_yaml_log(path)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return [], 0
+        if offset > size:
+            offset = 0
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        end = data.rfind(b'\n') + 1
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                _org_memory_logger.warning(f"Skipping corrupt line in {path}")
+        return records, offset + end
+
+    def _append_record(self, path: Path, record: Dict[str, Any]) -> None:
+        """Append one record to a JSON-lines log"""
+        self._migrate_yaml_log(path)
+        with open(path, 'ab') as f:
+            f.write((json.dumps(record, default=str) + '\n').encode('utf-8'))
+        bump_version(self.corp_path, f"memory.{path.stem}")
+
+    def _migrate_yaml_log(self, path: Path) -> None:
+        """Convert the legacy YAML list next to a JSON-lines log, once"""
+        legacy = path.with_suffix('.yaml')
+        if path.exists() or not legacy.exists():
+            return
+        records = self._load_file(legacy)
+        tmp = path.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + '\n')
+        os.replace(tmp, path)
+        legacy.rename(legacy.with_suffix('.yaml.migrated'))
+        _org_memory_logger.info(f"Migrated {len(records)} records to {path}")
+
     def _save_file(self, path: Path, data: List[Dict[str, Any]]) -> None:
         """Save data to a YAML file"""
         path.write_text(yaml.dump(data, default_flow_style=False))
+        bump_version(self.corp_path, f"memory.{path.stem}")
 
 
 # Convenience functions for common operations
@@ -2207,6 +2308,49 @@ def get_entity_context_for_message(
 _summarizer_logger = logging.getLogger(__name__ + '.summarizer')
 
 
+def _message_fingerprint(message: Dict[str, Any]) -> tuple:
+    """Cheap identity for a message, used to detect rewritten thread history"""
+    return (
+        message.get('id') or message.get('timestamp'),
+        message.get('role'),
+        len(message.get('content', '') or '')
+    )
+
+
+@dataclass
+class ThreadSummaryState:
+    """
+    Incremental summarization state for one conversation thread.
+
+    Messages are classified once, in order; `classified_count` is how far
+    classification has got. `important_indices` lists the important
+    messages in index order and `detections` holds their detection
+    results. `summarized_count` is how many leading messages
+    `rolling_summary` covers.
+    """
+    thread_id: str
+    classified_count: int = 0
+    important_indices: List[int] = field(default_factory=list)
+    detections: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    summarized_count: int = 0
+    rolling_summary: str = ""
+    last_fingerprint: Optional[tuple] = None
+
+    def reset(self) -> None:
+        """Forget everything derived from the thread"""
+        self.classified_count = 0
+        self.important_indices = []
+        self.detections = {}
+        self.summarized_count = 0
+        self.rolling_summary = ""
+        self.last_fingerprint = None
+
+    def important_between(self, start: int, end: int) -> List[int]:
+        """Indices of important messages in [start, end)"""
+        indices = self.important_indices
+        return indices[bisect_left(indices, start):bisect_left(indices, end)]
+
+
 class ConversationSummarizer:
     """
     Intelligent conversation summarization with rolling summaries.
@@ -2231,6 +2375,11 @@ class ConversationSummarizer:
             existing_summary="Previous context...",
             max_recent=10
         )
+
+    Passing thread_id to create_rolling_summary, get_conversation_context
+    or extract_important_messages keeps per-thread state (classified
+    messages, rolling summary), so each turn only processes messages
+    appended since the previous one.
     """
 
     # Default thresholds
@@ -2257,7 +2406,21 @@ class ConversationSummarizer:
         r"(?:from now on)",
     ]
 
-    def __init__(self, llm_client=None):
+    # Maximum number of threads with cached summarization state
+    DEFAULT_MAX_THREAD_STATES = 256
+
+    # Combined alternation of both pattern groups, compiled once. At any
+    # position the decision alternatives are tried first, so a preference
+    # match at position p means no decision match starts at or before p.
+    _IMPORTANCE_RE = re.compile(
+        "(?P<decision>" + "|".join(DECISION_PATTERNS) + ")"
+        "|(?P<preference>" + "|".join(PREFERENCE_PATTERNS) + ")",
+        re.IGNORECASE
+    )
+    _DECISION_RE = re.compile("|".join(DECISION_PATTERNS), re.IGNORECASE)
+    _PREFERENCE_RE = re.compile("|".join(PREFERENCE_PATTERNS), re.IGNORECASE)
+
+    def __init__(self, llm_client=None, max_thread_states: int = DEFAULT_MAX_THREAD_STATES):
         """
         Initialize the summarizer.
 
@@ -2265,8 +2428,14 @@ class ConversationSummarizer:
             llm_client: LLM client for generating summaries.
                        Should have execute(LLMRequest) method.
                        If None, summarization will use a fallback method.
+            max_thread_states: Number of threads to keep incremental
+                       summarization state for (least recently used
+                       threads are dropped first)
         """
         self.llm = llm_client
+        self.max_thread_states = max_thread_states
+        self._thread_states: 'OrderedDict[str, ThreadSummaryState]' = OrderedDict()
+        self._state_lock = threading.RLock()
 
     def needs_summarization(
         self,
@@ -2295,7 +2464,7 @@ class ConversationSummarizer:
         Returns:
             Dict with 'is_important', 'importance_type', 'reasons'
         """
-        content = message.get('content', '').lower()
+        content = message.get('content', '') or ''
         msg_type = message.get('type', 'message')
 
         result = {
@@ -2311,38 +2480,51 @@ class ConversationSummarizer:
             result['reasons'].append('marked as decision')
             return result
 
-        # Check for decision patterns
-        for pattern in self.DECISION_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                result['is_important'] = True
-                result['importance_type'] = 'decision'
-                result['reasons'].append('matches decision pattern')
-                break
+        match = self._IMPORTANCE_RE.search(content)
+        if not match:
+            return result
 
-        # Check for preference patterns
-        for pattern in self.PREFERENCE_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                result['is_important'] = True
-                if result['importance_type'] != 'decision':
-                    result['importance_type'] = 'preference'
-                result['reasons'].append('matches preference pattern')
-                break
+        # One combined scan finds the leftmost hit; the other group only
+        # needs checking from that point on
+        if match.lastgroup == 'decision':
+            is_decision = True
+            is_preference = self._PREFERENCE_RE.search(content, match.start()) is not None
+        else:
+            is_preference = True
+            is_decision = self._DECISION_RE.search(content, match.start() + 1) is not None
+
+        result['is_important'] = True
+        if is_decision:
+            result['importance_type'] = 'decision'
+            result['reasons'].append('matches decision pattern')
+        if is_preference:
+            if not is_decision:
+                result['importance_type'] = 'preference'
+            result['reasons'].append('matches preference pattern')
 
         return result
 
     def extract_important_messages(
         self,
-        messages: List[Dict[str, Any]]
+        messages: List[Dict[str, Any]],
+        thread_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract messages that should be preserved in full.
 
         Args:
             messages: List of message dicts
+            thread_id: If given, `messages` is the full message list of that
+                thread and only messages appended since the last call are
+                classified
 
         Returns:
             List of important messages with their importance metadata
         """
+        if thread_id is not None:
+            state = self._sync_thread_state(thread_id, messages)
+            return self._important_from_state(state, messages, 0, len(messages))
+
         important = []
 
         for i, msg in enumerate(messages):
@@ -2356,11 +2538,83 @@ class ConversationSummarizer:
 
         return important
 
+    # =========================================================================
+    # Per-Thread Incremental State
+    # =========================================================================
+
+    def get_thread_state(self, thread_id: str) -> Optional[ThreadSummaryState]:
+        """Get the cached summarization state for a thread, if any"""
+        with self._state_lock:
+            return self._thread_states.get(thread_id)
+
+    def reset_thread_state(self, thread_id: Optional[str] = None) -> None:
+        """Drop cached state for one thread, or for all threads"""
+        with self._state_lock:
+            if thread_id is None:
+                self._thread_states.clear()
+            else:
+                self._thread_states.pop(thread_id, None)
+
+    def _sync_thread_state(
+        self,
+        thread_id: str,
+        messages: List[Dict[str, Any]]
+    ) -> ThreadSummaryState:
+        """
+        Bring a thread's state up to date with its message list.
+
+        Only messages past `classified_count` are classified. If the thread
+        was truncated or its history rewritten, the state is rebuilt.
+        """
+        with self._state_lock:
+            state = self._thread_states.get(thread_id)
+            if state is None:
+                state = ThreadSummaryState(thread_id=thread_id)
+                self._thread_states[thread_id] = state
+                while len(self._thread_states) > self.max_thread_states:
+                    self._thread_states.popitem(last=False)
+            else:
+                self._thread_states.move_to_end(thread_id)
+
+            done = state.classified_count
+            if done > len(messages) or (
+                done and _message_fingerprint(messages[done - 1]) != state.last_fingerprint
+            ):
+                _summarizer_logger.debug(f"Thread {thread_id} history changed, rebuilding state")
+                state.reset()
+                done = 0
+
+            for i in range(done, len(messages)):
+                detection = self.detect_important_message(messages[i])
+                if detection['is_important']:
+                    state.important_indices.append(i)
+                    state.detections[i] = detection
+
+            if len(messages) > done:
+                state.classified_count = len(messages)
+                state.last_fingerprint = _message_fingerprint(messages[-1])
+
+            return state
+
+    def _important_from_state(
+        self,
+        state: ThreadSummaryState,
+        messages: List[Dict[str, Any]],
+        start: int,
+        end: int
+    ) -> List[Dict[str, Any]]:
+        """Build important-message entries for messages[start:end] from cached classifications"""
+        return [
+            {**messages[i], '_importance': state.detections[i], '_index': i}
+            for i in state.important_between(start, end)
+        ]
+
     def summarize_segment(
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS,
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        previous_summary: Optional[str] = None
     ) -> str:
         """
         Summarize a segment of conversation messages.
@@ -2371,28 +2625,42 @@ class ConversationSummarizer:
             messages: List of message dicts to summarize
             max_tokens: Target maximum tokens for summary
             context: Optional context about the conversation
+            previous_summary: Summary of the messages before this segment.
+                If given, the result covers both (rolling summary).
 
         Returns:
             Summary string
         """
         if not messages:
-            return ""
+            return previous_summary or ""
 
         # Extract important messages to preserve
         important_msgs = self.extract_important_messages(messages)
 
+        return self._summarize(messages, important_msgs, max_tokens, context, previous_summary)
+
+    def _summarize(
+        self,
+        messages: List[Dict[str, Any]],
+        important_msgs: List[Dict[str, Any]],
+        max_tokens: int,
+        context: Optional[str],
+        previous_summary: Optional[str] = None
+    ) -> str:
+        """Summarize with already-classified important messages."""
         # If LLM available, use it for smart summarization
         if self.llm:
-            return self._llm_summarize(messages, important_msgs, max_tokens, context)
+            return self._llm_summarize(messages, important_msgs, max_tokens, context, previous_summary)
         else:
-            return self._fallback_summarize(messages, important_msgs)
+            return self._fallback_summarize(messages, important_msgs, previous_summary, max_tokens)
 
     def _llm_summarize(
         self,
         messages: List[Dict[str, Any]],
         important_msgs: List[Dict[str, Any]],
         max_tokens: int,
-        context: Optional[str]
+        context: Optional[str],
+        previous_summary: Optional[str] = None
     ) -> str:
         """Generate summary using LLM."""
         from .llm import LLMRequest
@@ -2414,8 +2682,17 @@ class ConversationSummarizer:
                 important_items.append(f"- [{imp_type.upper()}] {content}")
             important_content = "\n".join(important_items)
 
+        previous_section = ""
+        if previous_summary:
+            previous_section = (
+                "SUMMARY OF EARLIER MESSAGES (fold this into your summary so it "
+                "covers the whole conversation so far):\n" + previous_summary
+            )
+
         prompt = f"""Summarize this conversation segment concisely while preserving key information.
 
+{previous_section}
+
 CONVERSATION:
 {chr(10).join(formatted_msgs)}
 
@@ -2441,25 +2718,32 @@ Summary:"""
                 return response.content.strip()
             else:
                 # Fall back to extractive if LLM fails
-                return self._fallback_summarize(messages, important_msgs)
+                return self._fallback_summarize(messages, important_msgs, previous_summary, max_tokens)
 
         except Exception as e:
             # Log error and fall back
             _summarizer_logger.warning(f"LLM summarization failed: {e}")
-            return self._fallback_summarize(messages, important_msgs)
+            return self._fallback_summarize(messages, important_msgs, previous_summary, max_tokens)
 
     def _fallback_summarize(
         self,
         messages: List[Dict[str, Any]],
-        important_msgs: List[Dict[str, Any]]
+        important_msgs: List[Dict[str, Any]],
+        previous_summary: Optional[str] = None,
+        max_tokens: int = DEFAULT_SUMMARY_MAX_TOKENS
     ) -> str:
         """
         Generate summary without LLM (extractive approach).
 
         Extracts key information from messages rather than generating new text.
+        A previous summary is carried over, so the result is trimmed to
+        max_tokens to keep a rolling summary from growing every turn.
         """
         parts = []
 
+        if previous_summary:
+            parts.append(previous_summary)
+
         # Count messages by role
         role_counts = {}
         for msg in messages:
@@ -2470,7 +2754,7 @@ Summary:"""
                     ", ".join(f"{count} {role}" for role, count in role_counts.items()) + "]")
 
         # Extract topics from first few messages
-        if messages:
+        if messages and not previous_summary:
             first_user = next((m for m in messages if m.get('role') in ('user', 'ceo')), None)
             if first_user:
                 content = first_user.get('content', '')[:150]
@@ -2485,14 +2769,40 @@ Summary:"""
                 role = imp.get('role', 'unknown').upper()
                 parts.append(f"  • [{imp_type}] {role}: {content}...")
 
-        return "\n".join(parts)
+        return self._trim_summary("\n".join(parts), max_tokens)
+
+    @staticmethod
+    def _trim_summary(summary: str, max_tokens: int) -> str:
+        """
+        Cut an extractive summary to about max_tokens (~4 characters each).
+
+        The oldest lines go first; the opening "Started with" line is kept.
+        """
+        max_chars = max_tokens * 4
+        if len(summary) <= max_chars:
+            return summary
+
+        marker = "[earlier summary trimmed]"
+        lines = [line for line in summary.split("\n") if line != marker]
+        head = [line for line in lines[:2] if line.startswith("Started with:")]
+        body = lines[lines.index(head[0]) + 1:] if head else lines
+
+        budget = max_chars - sum(len(line) + 1 for line in head) - len(marker) - 1
+        kept: List[str] = []
+        for line in reversed(body):
+            if len(line) + 1 > budget:
+                break
+            kept.append(line)
+            budget -= len(line) + 1
+        return "\n".join(head + [marker] + kept[::-1])
 
     def get_conversation_context(
         self,
         messages: List[Dict[str, Any]],
         existing_summary: Optional[str] = None,
         max_recent: int = DEFAULT_RECENT_MESSAGES,
-        include_important: bool = True
+        include_important: bool = True,
+        thread_id: Optional[str] = None
     ) -> str:
         """
         Get combined context for LLM from summary and recent messages.
@@ -2508,6 +2818,8 @@ Summary:"""
             existing_summary: Summary of older messages (if any)
             max_recent: Number of recent messages to include in full
             include_important: Whether to include important messages from summarized portion
+            thread_id: Thread the messages belong to. When given, cached
+                classifications are reused and only new messages are scanned.
 
         Returns:
             Formatted context string for LLM injection
@@ -2521,12 +2833,16 @@ Summary:"""
             parts.append("")
 
         # Split messages into summarized and recent
-        recent_messages = messages[-max_recent:] if len(messages) > max_recent else messages
-        older_messages = messages[:-max_recent] if len(messages) > max_recent else []
+        split = max(len(messages) - max_recent, 0)
+        recent_messages = messages[split:]
 
         # Include important messages from older portion
-        if include_important and older_messages:
-            important = self.extract_important_messages(older_messages)
+        if include_important and split:
+            if thread_id is not None:
+                state = self._sync_thread_state(thread_id, messages)
+                important = self._important_from_state(state, messages, 0, split)
+            else:
+                important = self.extract_important_messages(messages[:split])
             if important:
                 parts.append("## Key Moments from Earlier")
                 for imp in important:
@@ -2551,7 +2867,8 @@ Summary:"""
         messages: List[Dict[str, Any]],
         existing_summary: Optional[str] = None,
         threshold: int = DEFAULT_MESSAGE_THRESHOLD,
-        keep_recent: int = DEFAULT_RECENT_MESSAGES
+        keep_recent: int = DEFAULT_RECENT_MESSAGES,
+        thread_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create or update a rolling summary for a conversation.
@@ -2559,11 +2876,18 @@ Summary:"""
         This is the main entry point for maintaining conversation context
         across long conversations.
 
+        With a thread_id the summary is rolled forward: only messages that
+        have aged out of the recent window since the last call are
+        summarized (folded into the previous summary), and the summary is
+        returned unchanged when nothing new has aged out.
+
         Args:
             messages: All messages in the conversation
             existing_summary: Previous summary (if any)
             threshold: Message count that triggers summarization
             keep_recent: Number of recent messages to keep unsummarized
+            thread_id: Thread the messages belong to, enabling incremental
+                updates
 
         Returns:
             Dict with:
@@ -2585,9 +2909,15 @@ Summary:"""
 
         # Calculate split point
         summarize_up_to = total - keep_recent
-        to_summarize = messages[:summarize_up_to]
         recent = messages[summarize_up_to:]
 
+        if thread_id is not None:
+            return self._roll_thread_summary(
+                thread_id, messages, existing_summary, summarize_up_to, recent
+            )
+
+        to_summarize = messages[:summarize_up_to]
+
         # Create summary of older messages
         if existing_summary:
             # Combine old summary with newly old messages
@@ -2595,14 +2925,73 @@ Summary:"""
         else:
             context = None
 
-        new_summary = self.summarize_segment(to_summarize, context=context)
+        important = self.extract_important_messages(to_summarize)
+        new_summary = self._summarize(
+            to_summarize, important, self.DEFAULT_SUMMARY_MAX_TOKENS, context
+        )
+
+        return {
+            'summary': new_summary,
+            'summarized_count': summarize_up_to,
+            'recent_messages': recent,
+            'needs_update': True,
+            'important_preserved': len(important)
+        }
+
+    def _roll_thread_summary(
+        self,
+        thread_id: str,
+        messages: List[Dict[str, Any]],
+        existing_summary: Optional[str],
+        summarize_up_to: int,
+        recent: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Advance a thread's rolling summary over newly aged-out messages."""
+        state = self._sync_thread_state(thread_id, messages)
+
+        with self._state_lock:
+            start = state.summarized_count
+            previous = state.rolling_summary
+            if not previous or start > summarize_up_to:
+                # No usable rolling state (first call, restart, or the
+                # recent window grew) - summarize the whole older portion
+                start = 0
+                previous = ""
+
+        important_preserved = len(state.important_between(0, summarize_up_to))
+
+        if start == summarize_up_to:
+            return {
+                'summary': previous,
+                'summarized_count': summarize_up_to,
+                'recent_messages': recent,
+                'needs_update': False,
+                'important_preserved': important_preserved
+            }
+
+        segment = messages[start:summarize_up_to]
+        important = self._important_from_state(state, messages, start, summarize_up_to)
+        if previous:
+            new_summary = self._summarize(
+                segment, important, self.DEFAULT_SUMMARY_MAX_TOKENS, None,
+                previous_summary=previous
+            )
+        else:
+            context = f"Previous summary: {existing_summary}" if existing_summary else None
+            new_summary = self._summarize(
+                segment, important, self.DEFAULT_SUMMARY_MAX_TOKENS, context
+            )
+
+        with self._state_lock:
+            state.rolling_summary = new_summary
+            state.summarized_count = summarize_up_to
 
         return {
             'summary': new_summary,
             'summarized_count': summarize_up_to,
             'recent_messages': recent,
             'needs_update': True,
-            'important_preserved': len(self.extract_important_messages(to_summarize))
+            'important_preserved': important_preserved
         }
 
 
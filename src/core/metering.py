@@ -0,0 +1,583 @@
+"""
+Usage Metering - Durable Token and Cost Accounting for LLM Calls
+
+Token counts reported by the backends used to end up in
+LLMResponse.tokens_used and go no further, and BudgetTracker kept spend
+in a dict that reset on restart, so Ralph Mode cost caps forgot earlier
+attempts.
+
+Every LLM call now produces a UsageRecord: input, output and prompt-cache
+tokens, latency and cost, tagged with backend, model, agent, molecule
+and step. Tags come from the innermost `usage_scope` on the calling
+thread, falling back to agent_id/molecule_id/step_id in the request
+context.
+
+UsageMeter (one per corp, see get_usage_meter) folds each record into
+in-memory rollups at once, so queries and cost caps see it immediately,
+and buffers it for a background thread that appends batches to the log:
+
+    metering/
+        usage.jsonl      # one UsageRecord per line (append-only)
+        rollups.json     # totals by hour / agent / molecule / backend,
+                         # plus the log offset they cover
+
+Several processes (API server, CLI, learning daemon) append to the same
+log. Appends happen under an flock; before appending, and before
+answering a query, a meter folds in the lines other processes wrote
+since it last read the log (the flusher also does this on idle ticks),
+so spend recorded elsewhere counts toward cost caps here. The snapshot
+holds only what is in the log up to its offset (never buffered
+records), so on startup the snapshot is loaded and only log lines past
+its offset are replayed.
+
+Backends report to the *active* meter (activate_usage_meter); with none
+active, metering is a no-op.
+"""
+
+import atexit
+import contextvars
+import copy
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background flushes, and buffered records that trigger one early
+FLUSH_INTERVAL_SECONDS = 2.0
+FLUSH_BATCH_SIZE = 200
+
+ROLLUP_DIMENSIONS = ('hour', 'agent', 'molecule', 'backend')
+
+# USD per million tokens: (input, output, cache write, cache read)
+MODEL_PRICING = {
+    'opus': (5.00, 25.00, 6.25, 0.50),
+    'sonnet': (3.00, 15.00, 3.75, 0.30),
+    'haiku': (1.00, 5.00, 1.25, 0.10),
+}
+
+
+def estimate_cost(
+    model: Optional[str],
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_creation_input_tokens: int = 0,
+    cache_read_input_tokens: int = 0
+) -> float:
+    """Cost in USD of a call's tokens (0.0 for unknown models)"""
+    model_lower = (model or '').lower()
+    for family, (input_rate, output_rate, write_rate, read_rate) in MODEL_PRICING.items():
+        if family in model_lower:
+            return (
+                input_tokens * input_rate
+                + output_tokens * output_rate
+                + cache_creation_input_tokens * write_rate
+                + cache_read_input_tokens * read_rate
+            ) / 1_000_000
+    return 0.0
+
+
+# =============================================================================
+# Call Tags
+# =============================================================================
+
+_usage_tags: contextvars.ContextVar = contextvars.ContextVar('usage_tags', default={})
+
+
+@contextmanager
+def usage_scope(**tags: Optional[str]):
+    """
+    Tag LLM calls made inside the block (agent_id, molecule_id, step_id).
+
+    Nested scopes inherit outer tags; None values leave a tag unchanged.
+    """
+    merged = dict(_usage_tags.get())
+    merged.update({k: v for k, v in tags.items() if v is not None})
+    token = _usage_tags.set(merged)
+    try:
+        yield merged
+    finally:
+        _usage_tags.reset(token)
+
+
+def current_usage_tags() -> Dict[str, str]:
+    return dict(_usage_tags.get())
+
+
+# =============================================================================
+# Records and Rollups
+# =============================================================================
+
+@dataclass
+class UsageRecord:
+    """Metered usage of one LLM call"""
+    backend: str
+    model: Optional[str] = None
+    agent_id: Optional[str] = None
+    molecule_id: Optional[str] = None
+    step_id: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    success: bool = True
+    recorded_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'backend': self.backend,
+            'model': self.model,
+            'agent_id': self.agent_id,
+            'molecule_id': self.molecule_id,
+            'step_id': self.step_id,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cache_creation_input_tokens': self.cache_creation_input_tokens,
+            'cache_read_input_tokens': self.cache_read_input_tokens,
+            'latency_ms': self.latency_ms,
+            'cost_usd': self.cost_usd,
+            'success': self.success,
+            'recorded_at': self.recorded_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UsageRecord':
+        return cls(
+            backend=data['backend'],
+            model=data.get('model'),
+            agent_id=data.get('agent_id'),
+            molecule_id=data.get('molecule_id'),
+            step_id=data.get('step_id'),
+            input_tokens=data.get('input_tokens', 0),
+            output_tokens=data.get('output_tokens', 0),
+            cache_creation_input_tokens=data.get('cache_creation_input_tokens', 0),
+            cache_read_input_tokens=data.get('cache_read_input_tokens', 0),
+            latency_ms=data.get('latency_ms', 0.0),
+            cost_usd=data.get('cost_usd', 0.0),
+            success=data.get('success', True),
+            recorded_at=data.get('recorded_at', datetime.now().isoformat())
+        )
+
+    def rollup_keys(self) -> Dict[str, Optional[str]]:
+        """Key of this record in each rollup dimension (None = not rolled up)"""
+        return {
+            'hour': self.recorded_at[:13],
+            'agent': self.agent_id,
+            'molecule': self.molecule_id,
+            'backend': self.backend,
+        }
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        'calls': 0, 'failures': 0,
+        'input_tokens': 0, 'output_tokens': 0,
+        'cache_creation_input_tokens': 0, 'cache_read_input_tokens': 0,
+        'cost_usd': 0.0, 'latency_ms': 0.0
+    }
+
+
+def _add_to_totals(totals: Dict[str, Any], record: UsageRecord) -> None:
+    totals['calls'] += 1
+    if not record.success:
+        totals['failures'] += 1
+    totals['input_tokens'] += record.input_tokens
+    totals['output_tokens'] += record.output_tokens
+    totals['cache_creation_input_tokens'] += record.cache_creation_input_tokens
+    totals['cache_read_input_tokens'] += record.cache_read_input_tokens
+    totals['cost_usd'] += record.cost_usd
+    totals['latency_ms'] += record.latency_ms
+
+
+# =============================================================================
+# Usage Meter
+# =============================================================================
+
+class UsageMeter:
+    """
+    Append-only usage log with in-memory rollups and batched async flushes.
+
+    Thread-safe. Records are visible to queries as soon as `record`
+    returns and reach disk within FLUSH_INTERVAL_SECONDS (or on `flush`);
+    queries also see records other processes have flushed.
+    """
+
+    def __init__(self, corp_path: Path, flush_interval: float = FLUSH_INTERVAL_SECONDS,
+                 batch_size: int = FLUSH_BATCH_SIZE):
+        self.metering_path = Path(corp_path) / "metering"
+        self.log_file = self.metering_path / "usage.jsonl"
+        self.rollups_file = self.metering_path / "rollups.json"
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: List[UsageRecord] = []
+        # Durable rollups cover exactly the log up to _log_offset; live
+        # rollups add this process's buffered records on top
+        self._durable_rollups: Dict[str, Dict[str, Dict[str, Any]]] = {d: {} for d in ROLLUP_DIMENSIONS}
+        self._durable_totals = _empty_totals()
+        self._log_offset = 0
+        self._rollups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._totals: Dict[str, Any] = {}
+
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._load()
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _load(self) -> None:
+        """Load the rollups snapshot and replay log lines written after it"""
+        if self.rollups_file.exists():
+            try:
+                snapshot = json.loads(self.rollups_file.read_text())
+                self._durable_rollups.update(snapshot.get('rollups', {}))
+                self._durable_totals.update(snapshot.get('totals', {}))
+                self._log_offset = snapshot.get('log_offset', 0)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Failed to load usage rollups, replaying log: {e}")
+                self._reset_durable()
+
+        if self.log_file.exists():
+            with open(self.log_file, 'rb') as f:
+                for record in self._read_new_records(f):
+                    self._apply(record, self._durable_rollups, self._durable_totals)
+        self._rollups = copy.deepcopy(self._durable_rollups)
+        self._totals = dict(self._durable_totals)
+
+    def _reset_durable(self) -> None:
+        self._durable_rollups = {d: {} for d in ROLLUP_DIMENSIONS}
+        self._durable_totals = _empty_totals()
+        self._log_offset = 0
+
+    def _read_new_records(self, f) -> List[UsageRecord]:
+        """Complete log lines past _log_offset (advancing it)"""
+        if self._log_offset > os.fstat(f.fileno()).st_size:
+            # Log was replaced; the snapshot no longer describes it
+            logger.warning(f"{self.log_file} is shorter than the rollups snapshot; replaying it")
+            self._reset_durable()
+        f.seek(self._log_offset)
+        records = []
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            self._log_offset += len(raw)
+            try:
+                records.append(UsageRecord.from_dict(json.loads(raw)))
+            except (json.JSONDecodeError, KeyError):
+                logger.warning(f"Skipping corrupt line in {self.log_file}")
+        return records
+
+    @staticmethod
+    def _apply(record: UsageRecord, rollups: Dict[str, Dict[str, Dict[str, Any]]],
+               totals: Dict[str, Any]) -> None:
+        _add_to_totals(totals, record)
+        for dimension, key in record.rollup_keys().items():
+            if key:
+                _add_to_totals(rollups[dimension].setdefault(key, _empty_totals()), record)
+
+    def flush(self) -> int:
+        """
+        Append buffered records and save the rollups snapshot.
+
+        Under an exclusive flock on the log, lines other processes
+        appended since the last flush are folded in first, so the saved
+        offset is the real end of the log. Returns records written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+
+            self.metering_path.mkdir(parents=True, exist_ok=True)
+            data = ''.join(json.dumps(r.to_dict()) + '\n' for r in batch).encode('utf-8')
+            with open(self.log_file, 'a+b') as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    others = self._read_new_records(f)
+                    f.write(data)
+                    f.flush()
+                    end = f.tell()
+
+                    with self._lock:
+                        for record in others:
+                            self._apply(record, self._durable_rollups, self._durable_totals)
+                            self._apply(record, self._rollups, self._totals)
+                        for record in batch:
+                            self._apply(record, self._durable_rollups, self._durable_totals)
+                        self._log_offset = end
+                        snapshot = json.dumps({
+                            'log_offset': self._log_offset,
+                            'totals': self._durable_totals,
+                            'rollups': self._durable_rollups
+                        })
+                    tmp = self.rollups_file.with_suffix('.json.tmp')
+                    tmp.write_text(snapshot)
+                    os.replace(tmp, self.rollups_file)
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return len(batch)
+
+    def refresh(self) -> int:
+        """
+        Fold in log lines other processes appended since this meter last
+        read the log.
+
+        A single stat when nothing is new. Returns records folded in.
+        """
+        try:
+            if self.log_file.stat().st_size == self._log_offset:
+                return 0
+        except FileNotFoundError:
+            return 0
+
+        with self._flush_lock:
+            with open(self.log_file, 'rb') as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                try:
+                    others = self._read_new_records(f)
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            with self._lock:
+                for record in others:
+                    self._apply(record, self._durable_rollups, self._durable_totals)
+                    self._apply(record, self._rollups, self._totals)
+            return len(others)
+
+    def _run_flusher(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                if not self.flush():
+                    self.refresh()
+            except Exception as e:
+                logger.error(f"Usage log flush failed: {e}")
+
+    def close(self) -> None:
+        """Stop the flusher thread and write anything still buffered"""
+        self._stopped.set()
+        self._wake.set()
+        if self._flusher:
+            self._flusher.join(timeout=5)
+            self._flusher = None
+        self.flush()
+
+    # =========================================================================
+    # Recording
+    # =========================================================================
+
+    def record(self, record: UsageRecord) -> UsageRecord:
+        """Meter one call; it is queryable immediately and flushed in the background"""
+        with self._lock:
+            self._apply(record, self._rollups, self._totals)
+            self._buffer.append(record)
+            buffered = len(self._buffer)
+            if self._flusher is None and not self._stopped.is_set():
+                self._flusher = threading.Thread(
+                    target=self._run_flusher, name='usage-meter-flush', daemon=True
+                )
+                self._flusher.start()
+        if buffered >= self.batch_size:
+            self._wake.set()
+        return record
+
+    def record_call(
+        self,
+        backend: str,
+        model: Optional[str] = None,
+        usage: Optional[Dict[str, int]] = None,
+        latency_ms: float = 0.0,
+        success: bool = True,
+        cost_usd: Optional[float] = None,
+        tags: Optional[Dict[str, Optional[str]]] = None
+    ) -> UsageRecord:
+        """
+        Meter an LLM call from its backend usage counts.
+
+        Args:
+            backend: Backend type value (e.g. 'claude_api')
+            model: Model name (used for pricing when cost_usd is not given)
+            usage: input_tokens, output_tokens, cache_creation_input_tokens,
+                cache_read_input_tokens
+            latency_ms: Wall-clock duration of the call
+            success: Whether the call succeeded
+            cost_usd: Cost reported by the backend, if any
+            tags: agent_id / molecule_id / step_id; defaults to the
+                current usage_scope
+        """
+        usage = usage or {}
+        tags = tags if tags is not None else current_usage_tags()
+        counts = {
+            key: int(usage.get(key, 0) or 0)
+            for key in ('input_tokens', 'output_tokens',
+                        'cache_creation_input_tokens', 'cache_read_input_tokens')
+        }
+        if cost_usd is None:
+            cost_usd = estimate_cost(model, **counts)
+        return self.record(UsageRecord(
+            backend=backend,
+            model=model,
+            agent_id=tags.get('agent_id'),
+            molecule_id=tags.get('molecule_id'),
+            step_id=tags.get('step_id'),
+            latency_ms=round(latency_ms, 1),
+            cost_usd=cost_usd,
+            success=success,
+            **counts
+        ))
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_molecule_cost(self, molecule_id: str) -> float:
+        """Total metered cost of a molecule in USD"""
+        self.refresh()
+        with self._lock:
+            totals = self._rollups['molecule'].get(molecule_id)
+            return totals['cost_usd'] if totals else 0.0
+
+    def get_totals(self, dimension: Optional[str] = None, key: Optional[str] = None) -> Dict[str, Any]:
+        """Totals overall, or for one key of a rollup dimension"""
+        self.refresh()
+        with self._lock:
+            if dimension is None:
+                return dict(self._totals)
+            return dict(self._rollups[dimension].get(key) or _empty_totals())
+
+    def rollup(self, dimension: str, limit: Optional[int] = None,
+               since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Totals per key of a rollup dimension.
+
+        Hours come back newest first; other dimensions by cost, highest
+        first. `since` (an ISO hour, e.g. '2026-10-18T09') only applies
+        to the 'hour' dimension.
+
+        Raises:
+            ValueError: for an unknown dimension
+        """
+        if dimension not in ROLLUP_DIMENSIONS:
+            raise ValueError(f"Unknown rollup dimension: {dimension}")
+        self.refresh()
+        with self._lock:
+            rows = [{'key': key, **totals} for key, totals in self._rollups[dimension].items()]
+        if dimension == 'hour':
+            if since:
+                rows = [r for r in rows if r['key'] >= since]
+            rows.sort(key=lambda r: r['key'], reverse=True)
+        else:
+            rows.sort(key=lambda r: r['cost_usd'], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Totals plus derived averages, for the dashboard"""
+        totals = self.get_totals()
+        calls = totals['calls']
+        total_input = (totals['input_tokens'] + totals['cache_creation_input_tokens']
+                       + totals['cache_read_input_tokens'])
+        with self._lock:
+            buffered = len(self._buffer)
+        return {
+            **totals,
+            'avg_latency_ms': round(totals['latency_ms'] / calls, 1) if calls else 0.0,
+            'avg_cost_usd': totals['cost_usd'] / calls if calls else 0.0,
+            'cache_hit_rate': (
+                round(totals['cache_read_input_tokens'] / total_input, 3) if total_input else 0.0
+            ),
+            'buffered_records': buffered
+        }
+
+
+# =============================================================================
+# Shared Meters
+# =============================================================================
+
+_meters: Dict[str, UsageMeter] = {}
+_meters_lock = threading.Lock()
+_active_meter: Optional[UsageMeter] = None
+
+
+def get_usage_meter(corp_path: Path) -> UsageMeter:
+    """The process-wide UsageMeter for a corp directory"""
+    key = str(Path(corp_path).resolve())
+    with _meters_lock:
+        meter = _meters.get(key)
+        if meter is None:
+            meter = UsageMeter(corp_path)
+            _meters[key] = meter
+        return meter
+
+
+def activate_usage_meter(corp_path: Path) -> UsageMeter:
+    """Make a corp's meter the one LLM backends report to"""
+    global _active_meter
+    _active_meter = get_usage_meter(corp_path)
+    return _active_meter
+
+
+def get_active_usage_meter() -> Optional[UsageMeter]:
+    return _active_meter
+
+
+def record_llm_call(
+    backend: str,
+    request: Any,
+    model: Optional[str] = None,
+    usage: Optional[Dict[str, int]] = None,
+    latency_ms: float = 0.0,
+    success: bool = True,
+    cost_usd: Optional[float] = None
+) -> Optional[UsageRecord]:
+    """
+    Report a backend call to the active meter (no-op without one).
+
+    Tags come from the current usage_scope, falling back to
+    agent_id / molecule_id / step_id in request.context.
+    """
+    meter = _active_meter
+    if meter is None:
+        return None
+    tags = current_usage_tags()
+    context = getattr(request, 'context', None) or {}
+    for key in ('agent_id', 'molecule_id', 'step_id'):
+        if not tags.get(key) and context.get(key):
+            tags[key] = context[key]
+    try:
+        return meter.record_call(
+            backend=backend,
+            model=model or getattr(request, 'model', None),
+            usage=usage,
+            latency_ms=latency_ms,
+            success=success,
+            cost_usd=cost_usd,
+            tags=tags
+        )
+    except Exception as e:
+        # Metering must never fail an LLM call
+        logger.warning(f"Usage metering failed: {e}")
+        return None
+
+
+@atexit.register
+def _flush_meters() -> None:
+    for meter in list(_meters.values()):
+        try:
+            meter.close()
+        except Exception:
+            pass
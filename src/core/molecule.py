@@ -24,6 +24,10 @@ from dataclasses import dataclass, field, asdict
 import yaml
 
 from src.core.time_utils import now_iso
+from src.core.versions import bump_version
+from src.core.metering import get_usage_meter
+from src.core.registry import forget_yaml_file, load_yaml_file
+from src.core.molecule_index import MoleculeSummaryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -574,7 +578,7 @@ class Molecule:
     # Economic Metadata - enables ROI reasoning and cost tracking
     estimated_cost: float = 0.0      # Estimated token/compute cost in USD
     estimated_value: float = 0.0     # Expected value of completion
-    actual_cost: float = 0.0         # Tracked during execution
+    actual_cost: float = 0.0         # Metered LLM spend, set on completion
     confidence: float = 0.5          # 0.0-1.0 confidence in estimates
     # Continuous Workflow Support
     workflow_type: WorkflowType = WorkflowType.PROJECT
@@ -998,10 +1002,53 @@ class MoleculeEngine:
         self.completed_path.mkdir(parents=True, exist_ok=True)
         self.templates_path.mkdir(parents=True, exist_ok=True)
 
+        # Summary index for paged listings (loaded on first use)
+        self._summary_index: Optional[MoleculeSummaryIndex] = None
+
     def set_learning_system(self, learning_system: 'LearningSystem') -> None:
         """Set the learning system for callbacks"""
         self.learning_system = learning_system
 
+    @property
+    def summary_index(self) -> MoleculeSummaryIndex:
+        """Summary index of active and completed molecules"""
+        if self._summary_index is None:
+            self._summary_index = MoleculeSummaryIndex(
+                self.base_path / "molecules" / "index.jsonl",
+                scan=self._scan_all_molecules
+            )
+        return self._summary_index
+
+    def _scan_all_molecules(self):
+        """Yield (molecule, location) for every molecule file (index rebuilds)"""
+        for location, path in (('active', self.active_path), ('completed', self.completed_path)):
+            for file in path.glob("MOL-*.yaml"):
+                try:
+                    yield Molecule.from_dict(load_yaml_file(file)), location
+                except Exception as e:
+                    logger.warning(f"Error loading molecule {file}: {e}")
+
+    def list_molecule_summaries(
+        self,
+        status: Optional[str] = None,
+        owner: Optional[str] = None,
+        department: Optional[str] = None,
+        location: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        cursor: Optional[tuple] = None,
+        limit: int = 50
+    ) -> tuple:
+        """
+        A page of molecule summaries (active and completed), newest first.
+
+        Reads the summary index rather than molecule files. Returns
+        (summaries, next_cursor); pass next_cursor back for the next page.
+        """
+        return self.summary_index.query(
+            status=status, owner=owner, department=department, location=location,
+            updated_since=updated_since, cursor=cursor, limit=limit
+        )
+
     def create_molecule(
         self,
         name: str,
@@ -1070,12 +1117,12 @@ class MoleculeEngine:
         # Check active first
         active_file = self.active_path / f"{molecule_id}.yaml"
         if active_file.exists():
-            return Molecule.from_yaml(active_file.read_text())
+            return Molecule.from_dict(load_yaml_file(active_file))
 
         # Check completed
         completed_file = self.completed_path / f"{molecule_id}.yaml"
         if completed_file.exists():
-            return Molecule.from_yaml(completed_file.read_text())
+            return Molecule.from_dict(load_yaml_file(completed_file))
 
         return None
 
@@ -1084,7 +1131,7 @@ class MoleculeEngine:
         molecules = []
         for file in self.active_path.glob("MOL-*.yaml"):
             try:
-                molecules.append(Molecule.from_yaml(file.read_text()))
+                molecules.append(Molecule.from_dict(load_yaml_file(file)))
             except Exception as e:
                 print(f"Error loading molecule {file}: {e}")
         return sorted(molecules, key=lambda m: m.created_at, reverse=True)
@@ -1783,6 +1830,8 @@ class MoleculeEngine:
         """Save molecule to disk"""
         file_path = self.active_path / f"{molecule.id}.yaml"
         file_path.write_text(molecule.to_yaml())
+        bump_version(self.base_path, 'molecules')
+        self.summary_index.record(molecule, 'active')
 
     def _move_to_completed(self, molecule: Molecule) -> None:
         """Move a completed molecule to the completed directory"""
@@ -1790,15 +1839,23 @@ class MoleculeEngine:
         active_file = self.active_path / f"{molecule.id}.yaml"
         if active_file.exists():
             active_file.unlink()
+            forget_yaml_file(active_file)
+
+        # Record metered LLM spend
+        metered_cost = get_usage_meter(self.base_path).get_molecule_cost(molecule.id)
+        if metered_cost:
+            molecule.actual_cost = metered_cost
 
         # Save to completed
         completed_file = self.completed_path / f"{molecule.id}.yaml"
         completed_file.write_text(molecule.to_yaml())
+        bump_version(self.base_path, 'molecules')
+        self.summary_index.record(molecule, 'completed')
 
-        # Notify Learning System
+        # Queue for the Learning System (the evolution runner distills it later)
         if self.learning_system:
             try:
-                self.learning_system.on_molecule_complete(molecule)
+                self.learning_system.queue_molecule_complete(molecule)
             except Exception as e:
                 # Don't fail molecule completion if learning system has issues
                 print(f"Warning: Learning system callback failed: {e}")
@@ -1854,6 +1911,7 @@ class MoleculeEngine:
         active_file = self.active_path / f"{molecule_id}.yaml"
         if active_file.exists():
             active_file.unlink()
+            forget_yaml_file(active_file)
             result['deleted'] = True
             logger.info(f"Deleted active molecule: {molecule_id}")
 
@@ -1861,15 +1919,20 @@ class MoleculeEngine:
         completed_file = self.completed_path / f"{molecule_id}.yaml"
         if completed_file.exists():
             completed_file.unlink()
+            forget_yaml_file(completed_file)
             result['deleted'] = True
             logger.info(f"Deleted completed molecule: {molecule_id}")
 
+        if result['deleted']:
+            bump_version(self.base_path, 'molecules')
+            self.summary_index.remove(molecule_id)
+
         # Clean up related resources
         if result['deleted'] and cleanup_hooks:
             # 1. Clean up work items in hooks using existing HookManager method
             try:
-                from .hook import HookManager
-                hook_manager = HookManager(self.base_path)
+                from .registry import get_hook_manager
+                hook_manager = get_hook_manager(self.base_path)
 
                 # Use the existing cleanup method - it handles iteration and saving
                 removed = hook_manager.cleanup_molecule_work_items(molecule_id)
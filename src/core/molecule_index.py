@@ -0,0 +1,326 @@
+"""
+Molecule Summary Index - Paged Project Listings
+
+Listing projects used to parse every active molecule file and compute
+its progress, and completed molecules could not be listed at all. The
+summary index keeps one small record per molecule (active and completed)
+so listings read a page of summaries instead of the molecule files:
+
+    molecules/index.jsonl      # Append-only, last entry per molecule wins
+
+MoleculeEngine appends a summary whenever it saves, completes or deletes
+a molecule. Other processes' appends are picked up by following the
+file, the same way the conversation thread catalog is followed.
+
+Compaction replaces the file, so appends and compaction take an flock
+on a sidecar `index.jsonl.lock` (the index file's own inode changes).
+Before replacing, the compacting process re-reads whatever other
+processes appended, so no summary is lost.
+
+In memory the index keeps summaries ordered by (updated_at, id) plus
+sets per status, owner and department, so a page is found with a binary
+search (no filters) or by sorting only the matching molecules. Pages are
+returned newest first and continue from an opaque (updated_at, id)
+cursor, so page N costs the same as page 1.
+"""
+
+import bisect
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .molecule import Molecule
+
+logger = logging.getLogger(__name__)
+
+# Rewrite the index once it holds this many superseded lines
+INDEX_COMPACT_SLACK = 512
+
+# Longest description kept in a summary
+SUMMARY_DESCRIPTION_CHARS = 280
+
+SortKey = Tuple[str, str]
+
+
+def molecule_summary(molecule: 'Molecule', location: str) -> Dict[str, Any]:
+    """Summary record of a molecule ('active' or 'completed' location)"""
+    progress = molecule.get_progress()
+    description = molecule.description or ''
+    return {
+        'id': molecule.id,
+        'name': molecule.name,
+        'description': description[:SUMMARY_DESCRIPTION_CHARS],
+        'status': molecule.status.value,
+        'location': location,
+        'priority': molecule.priority,
+        'workflow_type': molecule.workflow_type.value,
+        'owner': molecule.raci.accountable if molecule.raci else None,
+        'departments': sorted({s.department for s in molecule.steps if s.department}),
+        'created_at': molecule.created_at,
+        'updated_at': molecule.updated_at or molecule.created_at,
+        'completed_at': molecule.completed_at,
+        'progress': progress['percent_complete'],
+        'steps_total': progress['total'],
+        'steps_completed': progress['completed'],
+    }
+
+
+class MoleculeSummaryIndex:
+    """
+    Filterable, cursor-paginated index of molecule summaries.
+
+    Thread-safe within a process. Built by scanning molecule files the
+    first time a corp is opened without an index file.
+    """
+
+    def __init__(self, index_file: Path,
+                 scan: Optional[Callable[[], Iterable[Tuple['Molecule', str]]]] = None):
+        self.index_file = Path(index_file)
+        self.lock_file = self.index_file.with_suffix('.jsonl.lock')
+        self._scan = scan
+        self._lock = threading.RLock()
+
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        self._order: List[SortKey] = []                        # Ascending (updated_at, id)
+        self._by_field: Dict[str, Dict[str, Set[str]]] = {
+            'status': {}, 'owner': {}, 'department': {}, 'location': {},
+        }
+
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._lines = 0
+
+        if not self.index_file.exists() and self._scan is not None:
+            self.rebuild()
+        self._refresh()
+
+    # =========================================================================
+    # File Following
+    # =========================================================================
+
+    def _refresh(self) -> None:
+        """Apply index lines appended since the last read (by any process)"""
+        with self._lock:
+            try:
+                stat = self.index_file.stat()
+            except FileNotFoundError:
+                return
+
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                self._clear()
+                self._inode = stat.st_ino
+
+            if stat.st_size == self._offset:
+                return
+
+            with open(self.index_file, 'rb') as f:
+                f.seek(self._offset)
+                data = f.read()
+
+            end = data.rfind(b'\n') + 1
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    logger.warning(f"Skipping corrupt line in {self.index_file}")
+                self._lines += 1
+            self._offset += end
+
+    def _clear(self) -> None:
+        self._summaries.clear()
+        self._order.clear()
+        for values in self._by_field.values():
+            values.clear()
+        self._offset = 0
+        self._lines = 0
+
+    @staticmethod
+    def _field_values(summary: Dict[str, Any], name: str) -> List[str]:
+        if name == 'department':
+            return summary.get('departments') or []
+        value = summary.get(name)
+        return [value] if value else []
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        molecule_id = entry['id']
+        old = self._summaries.pop(molecule_id, None)
+        if old is not None:
+            key = (old['updated_at'], molecule_id)
+            i = bisect.bisect_left(self._order, key)
+            if i < len(self._order) and self._order[i] == key:
+                del self._order[i]
+            for name, values in self._by_field.items():
+                for value in self._field_values(old, name):
+                    ids = values.get(value)
+                    if ids:
+                        ids.discard(molecule_id)
+                        if not ids:
+                            del values[value]
+
+        if entry.get('deleted'):
+            return
+
+        self._summaries[molecule_id] = entry
+        bisect.insort(self._order, (entry['updated_at'], molecule_id))
+        for name, values in self._by_field.items():
+            for value in self._field_values(entry, name):
+                values.setdefault(value, set()).add(molecule_id)
+
+    @contextmanager
+    def _locked(self):
+        """Thread lock plus the cross-process flock on the sidecar lock file"""
+        with self._lock:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self.lock_file, 'a')
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with self._locked():
+            # Never appends to a file another process has just compacted away
+            with open(self.index_file, 'ab') as f:
+                f.write((json.dumps(entry) + '\n').encode('utf-8'))
+
+            # Also picks up every other process's appends before compacting
+            self._refresh()
+            if self._lines > len(self._summaries) + INDEX_COMPACT_SLACK:
+                self._write_all(list(self._summaries.values()))
+
+    def _write_all(self, summaries: List[Dict[str, Any]]) -> None:
+        """Replace the index file with one line per molecule (_locked held)"""
+        tmp = self.index_file.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w') as f:
+            for summary in summaries:
+                f.write(json.dumps(summary) + '\n')
+        os.replace(tmp, self.index_file)
+
+        self._clear()
+        self._inode = None
+        self._refresh()
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def record(self, molecule: 'Molecule', location: str) -> None:
+        """Record the current state of a molecule"""
+        self._append(molecule_summary(molecule, location))
+
+    def remove(self, molecule_id: str) -> None:
+        """Record that a molecule was deleted"""
+        self._append({'id': molecule_id, 'deleted': True})
+
+    def rebuild(self) -> int:
+        """Rebuild the index from the molecule files. Returns molecules indexed."""
+        if self._scan is None:
+            raise ValueError("No molecule scanner configured")
+        with self._locked():
+            summaries = [molecule_summary(m, location) for m, location in self._scan()]
+            self._write_all(summaries)
+            return len(summaries)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get(self, molecule_id: str) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        summary = self._summaries.get(molecule_id)
+        return dict(summary) if summary else None
+
+    def count(self, **filters: Optional[str]) -> int:
+        """Number of molecules matching equality filters (status, owner, department, location)"""
+        self._refresh()
+        with self._lock:
+            candidates = self._candidates(filters)
+            return len(self._summaries) if candidates is None else len(candidates)
+
+    def _candidates(self, filters: Dict[str, Optional[str]]) -> Optional[Set[str]]:
+        """Ids matching all equality filters (None when there are no filters)"""
+        result: Optional[Set[str]] = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if name not in self._by_field:
+                raise ValueError(f"Unknown filter: {name}")
+            ids = self._by_field[name].get(value, set())
+            result = set(ids) if result is None else result & ids
+            if not result:
+                return set()
+        return result
+
+    def query(
+        self,
+        status: Optional[str] = None,
+        owner: Optional[str] = None,
+        department: Optional[str] = None,
+        location: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        cursor: Optional[SortKey] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict[str, Any]], Optional[SortKey]]:
+        """
+        A page of summaries, newest updated first.
+
+        Args:
+            status/owner/department/location: Equality filters
+            updated_since: Only molecules updated at or after this ISO timestamp
+            cursor: Sort key returned with the previous page
+            limit: Page size
+
+        Returns:
+            (summaries, next cursor or None when this is the last page)
+        """
+        self._refresh()
+        with self._lock:
+            cursor = tuple(cursor) if cursor else None
+            candidates = self._candidates({
+                'status': status, 'owner': owner,
+                'department': department, 'location': location,
+            })
+
+            if candidates is None:
+                # Walk the global order backwards from the cursor
+                hi = bisect.bisect_left(self._order, cursor) if cursor else len(self._order)
+                lo = bisect.bisect_left(self._order, (updated_since, '')) if updated_since else 0
+                keys = self._order[max(lo, hi - limit - 1):hi][::-1]
+            else:
+                # Sort only the matching molecules
+                keys = sorted(
+                    (
+                        key for key in ((self._summaries[i]['updated_at'], i) for i in candidates)
+                        if (cursor is None or key < cursor)
+                        and (updated_since is None or key[0] >= updated_since)
+                    ),
+                    reverse=True
+                )[:limit + 1]
+
+            page = [dict(self._summaries[molecule_id]) for _, molecule_id in keys[:limit]]
+            next_cursor = keys[limit - 1] if len(keys) > limit else None
+            return page, next_cursor
+
+    def __len__(self) -> int:
+        """Summaries held in memory (as of the last refresh)"""
+        return len(self._summaries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._refresh()
+        with self._lock:
+            return {
+                'molecules': len(self._summaries),
+                'index_lines': self._lines,
+                'by_location': {k: len(v) for k, v in self._by_field['location'].items()},
+                'by_status': {k: len(v) for k, v in self._by_field['status'].items()},
+            }
@@ -218,9 +218,7 @@ class SystemMonitor:
         - MoleculeEngine: Molecule progress
         - GateKeeper: Pending submissions
         """
-        from .hook import HookManager
-        from .molecule import MoleculeEngine
-        from .gate import GateKeeper
+        from .registry import get_gate_keeper, get_hook_manager, get_molecule_engine
 
         agents = {}
         queues = {}
@@ -232,7 +230,7 @@ class SystemMonitor:
 
         # Scan hooks for queue depths and agent status
         try:
-            hook_manager = HookManager(self.corp_path)
+            hook_manager = get_hook_manager(self.corp_path)
             for hook in hook_manager.list_hooks():
                 stats = hook.get_stats()
                 queue_depth = stats.get('queued', 0) + stats.get('in_progress', 0)
@@ -266,7 +264,7 @@ class SystemMonitor:
         # Scan molecules for progress
         active_molecules = 0
         try:
-            engine = MoleculeEngine(self.corp_path)
+            engine = get_molecule_engine(self.corp_path)
             for mol in engine.list_active_molecules():
                 progress = mol.get_progress()
                 molecules[mol.id] = progress.get('percent_complete', 0)
@@ -277,7 +275,7 @@ class SystemMonitor:
         # Scan gates for pending submissions
         pending_gates = 0
         try:
-            gate_keeper = GateKeeper(self.corp_path)
+            gate_keeper = get_gate_keeper(self.corp_path)
             pending_submissions = gate_keeper.get_pending_submissions()
             pending_gates = len(pending_submissions)
         except Exception as e:
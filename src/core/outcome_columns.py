@@ -0,0 +1,430 @@
+"""
+Outcome Columns - Array-Backed Outcome Aggregation
+
+Holds the numeric fields of every recorded outcome (timestamp, success,
+duration, cost) in parallel typed arrays, with molecule type and agent
+dictionary-encoded as small integer codes. Rows are kept in timestamp
+order, so a time window is a slice found by binary search, and the
+learning system's aggregations run over that slice:
+- Success counts, rates, durations and costs, grouped by type or agent
+- Rolling success rates over fixed-size windows
+- Duration/cost percentiles
+
+Storage is stdlib `array.array`. When NumPy is installed, aggregations
+run on zero-copy NumPy views (bincount for group-by, percentile);
+otherwise they fall back to plain Python loops over the same arrays.
+
+OutcomeTracker owns the full Outcome records; this module only holds
+what aggregations need.
+"""
+
+import bisect
+import math
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from .learning import Outcome
+
+SECONDS_PER_DAY = 86400.0
+
+# Dictionary-encoded columns
+GROUP_COLUMNS = ('type', 'agent')
+
+# Numeric columns that percentiles can be taken over
+VALUE_COLUMNS = ('duration', 'cost')
+
+
+def to_epoch(timestamp: Optional[str]) -> float:
+    """Convert an ISO timestamp to epoch seconds (naive timestamps are local time)"""
+    if not timestamp:
+        return 0.0
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of pre-sorted values (NumPy's default method)"""
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class OutcomeColumns:
+    """
+    Columnar, time-ordered store of outcome measurements.
+
+    Rows are addressed by outcome ID. Outcomes normally arrive in time
+    order and are appended; a late outcome is inserted at its position.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all rows"""
+        self._ids: List[str] = []
+        self._row: Optional[Dict[str, int]] = {}   # None when rows have shifted
+
+        self._ts = array('d')              # epoch seconds (created_at), ascending
+        self._success = array('b')         # 1 = success
+        self._duration = array('d')        # seconds
+        self._cost = array('d')            # USD
+        self._type = array('l')            # code into _names['type']
+        self._agent = array('l')           # code into _names['agent']
+
+        self._names: Dict[str, List[str]] = {'type': [], 'agent': []}
+        self._codes: Dict[str, Dict[str, int]] = {'type': {}, 'agent': {}}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, outcome_id: str) -> bool:
+        return outcome_id in self._rows()
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether NumPy acceleration is available"""
+        return np is not None
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (self._ts, self._success, self._duration, self._cost, self._type, self._agent)
+
+    def _rows(self) -> Dict[str, int]:
+        if self._row is None:
+            self._row = {outcome_id: i for i, outcome_id in enumerate(self._ids)}
+        return self._row
+
+    def _encode(self, column: str, value: Optional[str]) -> int:
+        value = value or ''
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = len(self._names[column])
+            codes[value] = code
+            self._names[column].append(value)
+        return code
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def upsert(self, outcome: 'Outcome') -> None:
+        """Insert a row for an outcome (replacing any row with the same ID)"""
+        if outcome.id in self._rows():
+            self.remove(outcome.id)
+
+        ts = to_epoch(outcome.created_at)
+        values = (
+            ts,
+            1 if outcome.success else 0,
+            float(outcome.duration_seconds or 0.0),
+            float(outcome.cost_usd or 0.0),
+            self._encode('type', outcome.molecule_type),
+            self._encode('agent', outcome.assigned_to),
+        )
+
+        if not self._ts or ts >= self._ts[-1]:
+            row = len(self._ids)
+            self._ids.append(outcome.id)
+            for column, value in zip(self._columns(), values):
+                column.append(value)
+            if self._row is not None:
+                self._row[outcome.id] = row
+        else:
+            row = bisect.bisect_right(self._ts, ts)
+            self._ids.insert(row, outcome.id)
+            for column, value in zip(self._columns(), values):
+                column.insert(row, value)
+            self._row = None
+
+    def remove(self, outcome_id: str) -> bool:
+        """Remove a row. Returns True if it existed."""
+        row = self._rows().get(outcome_id)
+        if row is None:
+            return False
+        del self._ids[row]
+        for column in self._columns():
+            del column[row]
+        self._row = None
+        return True
+
+    # =========================================================================
+    # Selection
+    # =========================================================================
+
+    def _window(self, since: Optional[float], until: Optional[float]) -> Tuple[int, int]:
+        """Row range [lo, hi) with since <= timestamp < until"""
+        lo = bisect.bisect_left(self._ts, since) if since is not None else 0
+        hi = bisect.bisect_left(self._ts, until) if until is not None else len(self._ts)
+        return lo, max(lo, hi)
+
+    def _select(self, since: Optional[float], until: Optional[float],
+                molecule_type: Optional[str], agent: Optional[str]):
+        """
+        Rows in the window matching the type/agent filters.
+
+        Returns (lo, hi, rows) where rows is None when every row in
+        [lo, hi) matches, else a NumPy index array or list of row numbers.
+        An unknown type or agent matches nothing.
+        """
+        lo, hi = self._window(since, until)
+        filters = []
+        for column, value in (('type', molecule_type), ('agent', agent)):
+            if value is None:
+                continue
+            code = self._codes[column].get(value)
+            if code is None:
+                return lo, lo, None
+            filters.append((self._type if column == 'type' else self._agent, code))
+
+        if not filters:
+            return lo, hi, None
+
+        if np is not None:
+            mask = np.ones(hi - lo, dtype=bool)
+            for codes, code in filters:
+                mask &= np.frombuffer(codes, dtype=codes.typecode)[lo:hi] == code
+            return lo, hi, np.flatnonzero(mask) + lo
+
+        rows = range(lo, hi)
+        for codes, code in filters:
+            rows = [r for r in rows if codes[r] == code]
+        return lo, hi, list(rows)
+
+    def _values(self, column: array, lo: int, hi: int, rows) -> Any:
+        """Column values for a selection (NumPy array or Python list)"""
+        if np is not None:
+            view = np.frombuffer(column, dtype=column.typecode)
+            return view[lo:hi] if rows is None else view[rows]
+        if rows is None:
+            return column[lo:hi]
+        return [column[r] for r in rows]
+
+    # =========================================================================
+    # Aggregations
+    # =========================================================================
+
+    def summarize(self, since: Optional[float] = None, until: Optional[float] = None,
+                  molecule_type: Optional[str] = None,
+                  agent: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Totals for outcomes in a time window.
+
+        Returns:
+            total, successes, success_rate, avg_duration,
+            avg_success_duration (None without successes), total_cost
+        """
+        lo, hi, rows = self._select(since, until, molecule_type, agent)
+        total = (hi - lo) if rows is None else len(rows)
+        if total == 0:
+            return {'total': 0, 'successes': 0, 'success_rate': 0.0, 'avg_duration': None,
+                    'avg_success_duration': None, 'total_cost': 0.0}
+
+        success = self._values(self._success, lo, hi, rows)
+        duration = self._values(self._duration, lo, hi, rows)
+        cost = self._values(self._cost, lo, hi, rows)
+
+        if np is not None:
+            ok = success.astype(bool)
+            successes = int(ok.sum())
+            total_duration = float(duration.sum())
+            success_duration = float(duration[ok].sum())
+            total_cost = float(cost.sum())
+        else:
+            successes = sum(success)
+            total_duration = sum(duration)
+            success_duration = sum(d for d, s in zip(duration, success) if s)
+            total_cost = sum(cost)
+
+        return {
+            'total': total,
+            'successes': successes,
+            'success_rate': successes / total,
+            'avg_duration': total_duration / total,
+            'avg_success_duration': success_duration / successes if successes else None,
+            'total_cost': total_cost,
+        }
+
+    def group_by(self, column: str, since: Optional[float] = None,
+                 until: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-group totals ('type' or 'agent') for outcomes in a time window.
+
+        Each group has total, successes, success_rate, avg_duration (over
+        all of the group's outcomes) and total_cost.
+        """
+        if column not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown group column: {column}")
+
+        lo, hi = self._window(since, until)
+        if lo == hi:
+            return {}
+        names = self._names[column]
+        source = self._type if column == 'type' else self._agent
+
+        if np is not None:
+            codes = np.frombuffer(source, dtype=source.typecode)[lo:hi]
+            size = len(names)
+            totals = np.bincount(codes, minlength=size)
+            successes = np.bincount(
+                codes, weights=np.frombuffer(self._success, dtype=np.int8)[lo:hi], minlength=size
+            )
+            durations = np.bincount(
+                codes, weights=np.frombuffer(self._duration, dtype=np.float64)[lo:hi], minlength=size
+            )
+            costs = np.bincount(
+                codes, weights=np.frombuffer(self._cost, dtype=np.float64)[lo:hi], minlength=size
+            )
+            present = np.flatnonzero(totals).tolist()
+            sums = {
+                code: (int(totals[code]), int(successes[code]),
+                       float(durations[code]), float(costs[code]))
+                for code in present
+            }
+        else:
+            acc: Dict[int, List[float]] = {}
+            success, duration, cost = self._success, self._duration, self._cost
+            for row in range(lo, hi):
+                entry = acc.get(source[row])
+                if entry is None:
+                    entry = acc[source[row]] = [0, 0, 0.0, 0.0]
+                entry[0] += 1
+                entry[1] += success[row]
+                entry[2] += duration[row]
+                entry[3] += cost[row]
+            sums = {code: (int(t), int(s), d, c) for code, (t, s, d, c) in acc.items()}
+
+        return {
+            names[code]: {
+                'total': total,
+                'successes': ok,
+                'success_rate': ok / total,
+                'avg_duration': duration / total,
+                'total_cost': cost,
+            }
+            for code, (total, ok, duration, cost) in sums.items()
+        }
+
+    def percentiles(self, column: str = 'duration',
+                    quantiles: Iterable[float] = (50, 90, 99),
+                    since: Optional[float] = None, until: Optional[float] = None,
+                    molecule_type: Optional[str] = None, agent: Optional[str] = None,
+                    successful_only: bool = False) -> Dict[float, float]:
+        """Percentiles (0-100) of a numeric column. Empty when nothing matches."""
+        if column not in VALUE_COLUMNS:
+            raise ValueError(f"Unknown value column: {column}")
+        quantiles = list(quantiles)
+        lo, hi, rows = self._select(since, until, molecule_type, agent)
+        source = self._duration if column == 'duration' else self._cost
+        values = self._values(source, lo, hi, rows)
+
+        if np is not None:
+            if successful_only:
+                values = values[self._values(self._success, lo, hi, rows).astype(bool)]
+            if len(values) == 0:
+                return {}
+            result = np.percentile(values, quantiles)
+            return {q: float(v) for q, v in zip(quantiles, result)}
+
+        if successful_only:
+            success = self._values(self._success, lo, hi, rows)
+            values = [v for v, s in zip(values, success) if s]
+        if len(values) == 0:
+            return {}
+        ordered = sorted(values)
+        return {q: _percentile(ordered, q) for q in quantiles}
+
+    def rolling_success_rate(self, window_days: float = 7.0, step_days: float = 1.0,
+                             since: Optional[float] = None, until: Optional[float] = None,
+                             molecule_type: Optional[str] = None,
+                             agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Success rate over a sliding window, one point per step.
+
+        Outcomes are bucketed by step; each point covers the `window_days`
+        ending at its `end` timestamp. Points with no outcomes in their
+        window have a success_rate of None.
+        """
+        if window_days <= 0 or step_days <= 0:
+            raise ValueError("window_days and step_days must be positive")
+
+        until = time.time() if until is None else until
+        if since is None:
+            since = self._ts[0] if self._ts else until
+        step = step_days * SECONDS_PER_DAY
+        steps = max(1, math.ceil((until - since) / step))
+        width = max(1, round(window_days / step_days))
+        start = until - steps * step
+
+        # Outcomes from the window before the first point count towards it
+        lo, hi, rows = self._select(start - (width - 1) * step, until, molecule_type, agent)
+        ts = self._values(self._ts, lo, hi, rows)
+        success = self._values(self._success, lo, hi, rows)
+        buckets = steps + width - 1
+
+        if np is not None:
+            index = np.clip(((ts - (start - (width - 1) * step)) // step).astype(np.int64),
+                            0, buckets - 1)
+            totals = np.bincount(index, minlength=buckets)
+            oks = np.bincount(index, weights=success, minlength=buckets)
+            totals_cum = np.concatenate(([0], np.cumsum(totals))).tolist()
+            oks_cum = np.concatenate(([0.0], np.cumsum(oks))).tolist()
+        else:
+            totals = [0] * buckets
+            oks = [0] * buckets
+            origin = start - (width - 1) * step
+            for t, s in zip(ts, success):
+                i = min(buckets - 1, max(0, int((t - origin) // step)))
+                totals[i] += 1
+                oks[i] += s
+            totals_cum, oks_cum = [0], [0]
+            for t, s in zip(totals, oks):
+                totals_cum.append(totals_cum[-1] + t)
+                oks_cum.append(oks_cum[-1] + s)
+
+        points = []
+        for k in range(steps):
+            # Point k covers buckets [k, k + width)
+            total = int(totals_cum[k + width] - totals_cum[k])
+            ok = oks_cum[k + width] - oks_cum[k]
+            points.append({
+                'end': datetime.fromtimestamp(start + (k + 1) * step).isoformat(),
+                'total': total,
+                'success_rate': ok / total if total else None,
+            })
+        return points
+
+    def ids_for(self, column: str, value: str) -> List[str]:
+        """IDs of outcomes with a given type or agent, oldest first"""
+        if column not in GROUP_COLUMNS:
+            raise ValueError(f"Unknown group column: {column}")
+        code = self._codes[column].get(value or '')
+        if code is None:
+            return []
+        source = self._type if column == 'type' else self._agent
+        if np is not None:
+            rows = np.flatnonzero(np.frombuffer(source, dtype=source.typecode) == code)
+            return [self._ids[r] for r in rows.tolist()]
+        return [self._ids[r] for r in range(len(source)) if source[r] == code]
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get storage statistics"""
+        return {
+            'rows': len(self._ids),
+            'types': len(self._names['type']),
+            'agents': len(self._names['agent']),
+            'vectorized': self.vectorized,
+            'bytes': sum(c.itemsize * len(c) for c in self._columns()),
+        }
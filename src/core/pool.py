@@ -534,8 +534,8 @@ class PoolManager:
 
         Returns number of workers cleaned up.
         """
-        from .molecule import MoleculeEngine  # Import here to avoid circular
-        engine = MoleculeEngine(self.base_path)
+        from .registry import get_molecule_engine  # Import here to avoid circular
+        engine = get_molecule_engine(self.base_path)
         cleaned = 0
 
         for worker in pool.workers:
@@ -0,0 +1,205 @@
+"""
+Shared Store Registry
+
+Hands out one HookManager, MoleculeEngine and GateKeeper per corp
+directory, so agents, the scheduler and the monitor share a single
+instance (and a single cache) instead of each constructing their own.
+GateKeeper's default-gate initialization runs once per corp instead of
+once per caller.
+
+Store files are also parsed through a process-wide cache keyed by path,
+modification time and size. Instances that are deliberately not shared
+(e.g. the API's MoleculeEngine with its lifecycle callbacks) still skip
+re-parsing YAML that has not changed.
+
+Usage:
+    from src.core.registry import get_hook_manager, get_store_registry
+
+    hook_manager = get_hook_manager(corp_path)
+    get_store_registry().get_stats()
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING
+
+import yaml
+
+if TYPE_CHECKING:
+    from .gate import GateKeeper
+    from .hook import HookManager
+    from .molecule import MoleculeEngine
+
+logger = logging.getLogger(__name__)
+
+# Files modified more recently than this may change again without their
+# mtime moving (coarse filesystem timestamps), so their parse is not cached
+RACY_WINDOW_SECONDS = 1.0
+
+# Upper bound on parsed files kept in memory (least recently used evicted)
+MAX_PARSED_FILES = 4096
+
+
+# =============================================================================
+# Parsed File Cache
+# =============================================================================
+
+_parsed: 'OrderedDict[str, Tuple[Tuple[int, int], Any]]' = OrderedDict()
+_parsed_lock = threading.Lock()
+_parse_stats = {'hits': 0, 'misses': 0}
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML store file, reusing the previous parse if it is unchanged.
+
+    Returns a private copy, so callers may mutate the result (from_dict
+    implementations pop keys). Raises FileNotFoundError like read_text().
+    """
+    key = str(path)
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _parsed_lock:
+        entry = _parsed.get(key)
+        if entry and entry[0] == signature:
+            _parsed.move_to_end(key)
+            _parse_stats['hits'] += 1
+            data = entry[1]
+        else:
+            _parse_stats['misses'] += 1
+            data = None
+    if data is not None:
+        return copy.deepcopy(data)
+
+    data = yaml.safe_load(Path(key).read_text())
+    if time.time() - stat.st_mtime_ns / 1e9 <= RACY_WINDOW_SECONDS:
+        return data
+
+    with _parsed_lock:
+        _parsed[key] = (signature, data)
+        _parsed.move_to_end(key)
+        while len(_parsed) > MAX_PARSED_FILES:
+            _parsed.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+def forget_yaml_file(path: Path) -> None:
+    """Drop a file's cached parse (call when the file is deleted)"""
+    with _parsed_lock:
+        _parsed.pop(str(path), None)
+
+
+def get_parse_cache_stats() -> Dict[str, Any]:
+    with _parsed_lock:
+        total = _parse_stats['hits'] + _parse_stats['misses']
+        return {
+            'files': len(_parsed),
+            'hits': _parse_stats['hits'],
+            'misses': _parse_stats['misses'],
+            'hit_rate': round(_parse_stats['hits'] / total, 3) if total else 0.0,
+        }
+
+
+# =============================================================================
+# Store Registry
+# =============================================================================
+
+# Attribute holding each store kind's in-memory object cache
+_CACHE_ATTRS = {
+    'hooks': '_hooks',
+    'molecules': '_summary_index',  # None until first listing
+    'gates': '_gates',
+}
+
+
+class StoreRegistry:
+    """
+    Process-wide shared store instances, one per (kind, corp path).
+
+    Instances are created lazily under a lock, so concurrent callers
+    always receive the same object.
+    """
+
+    def __init__(self):
+        self._stores: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, corp_path: Path, factory: Callable[[Path], Any]) -> Any:
+        """Get the shared store of a kind for a corp, creating it on first use"""
+        key = (kind, str(Path(corp_path).resolve()))
+        store = self._stores.get(key)
+        if store is not None:
+            return store
+
+        with self._lock:
+            store = self._stores.get(key)
+            if store is None:
+                logger.debug(f"Creating shared {kind} store for {key[1]}")
+                store = factory(Path(corp_path))
+                self._stores[key] = store
+            return store
+
+    def clear(self) -> None:
+        """Forget all shared instances (e.g. between tests)"""
+        with self._lock:
+            self._stores.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Number of shared managers and the size of each one's cache"""
+        with self._lock:
+            entries = list(self._stores.items())
+
+        stores = []
+        by_kind: Dict[str, int] = {}
+        for (kind, corp_path), store in entries:
+            by_kind[kind] = by_kind.get(kind, 0) + 1
+            cache = getattr(store, _CACHE_ATTRS.get(kind, ''), None)
+            stores.append({
+                'kind': kind,
+                'corp_path': corp_path,
+                'cached_items': len(cache) if cache is not None else 0,
+            })
+
+        return {
+            'managers': len(entries),
+            'by_kind': by_kind,
+            'stores': stores,
+            'parsed_files': get_parse_cache_stats(),
+        }
+
+
+_registry = StoreRegistry()
+
+
+def get_store_registry() -> StoreRegistry:
+    """Get the process-wide store registry"""
+    return _registry
+
+
+def get_hook_manager(corp_path: Path) -> 'HookManager':
+    """Get the shared HookManager for a corp"""
+    from .hook import HookManager
+    return _registry.get('hooks', corp_path, HookManager)
+
+
+def get_molecule_engine(corp_path: Path) -> 'MoleculeEngine':
+    """
+    Get the shared MoleculeEngine for a corp.
+
+    Callers that install lifecycle callbacks or a learning system should
+    construct their own engine instead, so the hooks don't leak to others.
+    """
+    from .molecule import MoleculeEngine
+    return _registry.get('molecules', corp_path, MoleculeEngine)
+
+
+def get_gate_keeper(corp_path: Path) -> 'GateKeeper':
+    """Get the shared GateKeeper for a corp"""
+    from .gate import GateKeeper
+    return _registry.get('gates', corp_path, GateKeeper)
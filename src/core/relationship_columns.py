@@ -0,0 +1,392 @@
+"""
+Relationship Columns - Array-Backed Relationship Strength Storage
+
+Holds the numeric state of every relationship edge (strength, last
+interaction time, interaction count, active flag) in parallel typed
+arrays instead of on individual Relationship objects. This lets the
+entity graph:
+- Decay every edge's strength in one vectorized pass
+- Pick an entity's strongest relationships with argpartition instead of
+  sorting Python objects
+- Persist strengths as a compact binary file without rewriting the
+  relationships YAML
+
+Storage is stdlib `array.array`. When NumPy is installed, operations run
+on zero-copy NumPy views of those arrays; otherwise they fall back to
+plain Python loops over the same arrays.
+
+Decay is exponential in elapsed time:
+    strength *= 0.5 ** (seconds_since_last_decay / half_life_seconds)
+so running it hourly or nightly gives the same result for the same
+elapsed time.
+"""
+
+import heapq
+import json
+import math
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Iterable, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from .entities import Relationship
+
+# Default half-life for relationship strength decay
+DEFAULT_STRENGTH_HALF_LIFE_DAYS = 30.0
+
+SECONDS_PER_DAY = 86400.0
+
+
+def _to_epoch(timestamp: str) -> float:
+    """Convert an ISO timestamp (naive timestamps are UTC) to epoch seconds"""
+    if not timestamp:
+        return 0.0
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class RelationshipColumns:
+    """
+    Columnar store for relationship strength and recency.
+
+    Rows are addressed by relationship ID. Removal swaps the last row into
+    the freed slot so every array stays dense.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all rows"""
+        self._ids: List[str] = []
+        self._row: Dict[str, int] = {}
+
+        self._strength = array('d')        # 0-1
+        self._decayed_at = array('d')      # epoch seconds strength was last brought current
+        self._last_interaction = array('d')  # epoch seconds
+        self._count = array('q')           # interaction count
+        self._active = array('b')          # 1 = ongoing, 0 = ended
+
+        # Endpoint index for per-entity lookups (dicts keep insertion order)
+        self._endpoints: Dict[str, Tuple[str, str]] = {}
+        self._by_entity: Dict[str, Dict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, rel_id: str) -> bool:
+        return rel_id in self._row
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether NumPy acceleration is available"""
+        return np is not None
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def rebuild(self, relationships: Iterable['Relationship']) -> None:
+        """Replace all rows from relationship objects"""
+        self.clear()
+        for rel in relationships:
+            self.upsert(rel)
+
+    def upsert(self, rel: 'Relationship', now: Optional[float] = None) -> None:
+        """Insert or refresh a row from a relationship object"""
+        now = time.time() if now is None else now
+        row = self._row.get(rel.id)
+
+        if row is None:
+            row = len(self._ids)
+            self._ids.append(rel.id)
+            self._row[rel.id] = row
+            self._strength.append(rel.strength)
+            self._decayed_at.append(now)
+            self._last_interaction.append(_to_epoch(rel.last_interaction))
+            self._count.append(rel.interaction_count)
+            self._active.append(1 if rel.is_active() else 0)
+        else:
+            self._strength[row] = rel.strength
+            self._decayed_at[row] = now
+            self._last_interaction[row] = _to_epoch(rel.last_interaction)
+            self._count[row] = rel.interaction_count
+            self._active[row] = 1 if rel.is_active() else 0
+
+        endpoints = (rel.source_id, rel.target_id)
+        previous = self._endpoints.get(rel.id)
+        if previous != endpoints:
+            if previous:
+                self._unlink(rel.id, previous)
+            self._endpoints[rel.id] = endpoints
+            for entity_id in endpoints:
+                self._by_entity.setdefault(entity_id, {})[rel.id] = None
+
+    def refresh(self, relationships: Iterable['Relationship'], now: Optional[float] = None) -> List[str]:
+        """
+        Pick up edits made directly on relationship objects (e.g. end()).
+
+        Active flag, recency and count are always copied. Strength is only
+        taken from the object when it differs from the column, so decay
+        stamps survive a save. Returns IDs of rows that changed.
+        """
+        now = time.time() if now is None else now
+        changed = []
+        for rel in relationships:
+            row = self._row.get(rel.id)
+            if row is None:
+                self.upsert(rel, now)
+                changed.append(rel.id)
+                continue
+
+            active = 1 if rel.is_active() else 0
+            last_interaction = _to_epoch(rel.last_interaction)
+            if (self._active[row] == active
+                    and self._last_interaction[row] == last_interaction
+                    and self._count[row] == rel.interaction_count
+                    and self._strength[row] == rel.strength):
+                continue
+
+            self._active[row] = active
+            self._last_interaction[row] = last_interaction
+            self._count[row] = rel.interaction_count
+            if self._strength[row] != rel.strength:
+                self._strength[row] = rel.strength
+                self._decayed_at[row] = now
+            changed.append(rel.id)
+        return changed
+
+    def remove(self, rel_id: str) -> bool:
+        """Remove a row. Returns True if it existed."""
+        row = self._row.pop(rel_id, None)
+        if row is None:
+            return False
+
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._row[moved_id] = row
+            for column in self._columns():
+                column[row] = column[last]
+
+        self._ids.pop()
+        for column in self._columns():
+            column.pop()
+
+        self._unlink(rel_id, self._endpoints.pop(rel_id, ()))
+        return True
+
+    def _columns(self) -> Tuple[array, ...]:
+        return (
+            self._strength, self._decayed_at, self._last_interaction,
+            self._count, self._active
+        )
+
+    def _unlink(self, rel_id: str, endpoints: Iterable[str]) -> None:
+        for entity_id in endpoints:
+            ids = self._by_entity.get(entity_id)
+            if ids is not None:
+                ids.pop(rel_id, None)
+                if not ids:
+                    del self._by_entity[entity_id]
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    def strength(self, rel_id: str) -> Optional[float]:
+        """Get the current strength of a relationship"""
+        row = self._row.get(rel_id)
+        return self._strength[row] if row is not None else None
+
+    def ids_for_entity(self, entity_id: str) -> List[str]:
+        """Get IDs of relationships where the entity is either endpoint"""
+        return list(self._by_entity.get(entity_id, ()))
+
+    def sync_to(self, relationships: Dict[str, 'Relationship']) -> None:
+        """Copy current strengths back onto relationship objects"""
+        strength = self._strength
+        for rel_id, row in self._row.items():
+            rel = relationships.get(rel_id)
+            if rel is not None:
+                rel.strength = strength[row]
+
+    def mean_strength(self) -> float:
+        """Average strength over all rows"""
+        if not self._ids:
+            return 0.0
+        if np is not None:
+            return float(np.frombuffer(self._strength, dtype=np.float64).mean())
+        return sum(self._strength) / len(self._strength)
+
+    # =========================================================================
+    # Ranking
+    # =========================================================================
+
+    def rank(self, rel_ids: Iterable[str], limit: Optional[int] = None) -> List[str]:
+        """
+        Order relationship IDs by strength, strongest first.
+
+        With a limit, only the top `limit` are selected (argpartition) and
+        sorted; the rest are never ordered.
+        """
+        rows = [self._row[r] for r in rel_ids if r in self._row]
+        if not rows or (limit is not None and limit <= 0):
+            return []
+        if limit is None or limit >= len(rows):
+            limit = len(rows)
+
+        if np is not None:
+            idx = np.asarray(rows, dtype=np.intp)
+            values = np.frombuffer(self._strength, dtype=np.float64)[idx]
+            if limit < len(rows):
+                top = np.argpartition(-values, limit - 1)[:limit]
+            else:
+                top = np.arange(len(rows))
+            top = top[np.argsort(-values[top], kind='stable')]
+            return [self._ids[rows[i]] for i in top.tolist()]
+
+        strength = self._strength
+        top_rows = heapq.nlargest(limit, rows, key=strength.__getitem__)
+        return [self._ids[r] for r in top_rows]
+
+    def strongest(self, limit: int, active_only: bool = True) -> List[str]:
+        """Get the strongest relationships across the whole graph"""
+        if np is not None and self._ids:
+            values = np.frombuffer(self._strength, dtype=np.float64).copy()
+            if active_only:
+                values[np.frombuffer(self._active, dtype=np.int8) == 0] = -np.inf
+            limit = min(limit, len(values))
+            if limit <= 0:
+                return []
+            top = np.argpartition(-values, limit - 1)[:limit]
+            top = top[np.argsort(-values[top], kind='stable')]
+            return [self._ids[i] for i in top.tolist() if np.isfinite(values[i])]
+
+        rows = range(len(self._ids))
+        if active_only:
+            rows = [r for r in rows if self._active[r]]
+        top_rows = heapq.nlargest(limit, rows, key=self._strength.__getitem__)
+        return [self._ids[r] for r in top_rows]
+
+    # =========================================================================
+    # Decay
+    # =========================================================================
+
+    def decay(
+        self,
+        half_life_days: float = DEFAULT_STRENGTH_HALF_LIFE_DAYS,
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Apply exponential time decay to every row in one pass.
+
+        Each row decays by the time elapsed since it was last brought
+        current, then is stamped with `now`.
+
+        Returns:
+            Number of rows that had non-zero strength
+        """
+        if half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        if not self._ids:
+            return 0
+
+        now = time.time() if now is None else now
+        rate = math.log(2) / (half_life_days * SECONDS_PER_DAY)
+
+        if np is not None:
+            strength = np.frombuffer(self._strength, dtype=np.float64)
+            decayed_at = np.frombuffer(self._decayed_at, dtype=np.float64)
+            decayed = int(np.count_nonzero(strength > 0))
+            elapsed = np.maximum(now - decayed_at, 0.0)
+            strength *= np.exp(-rate * elapsed)
+            decayed_at.fill(now)
+            return decayed
+
+        strength = self._strength
+        decayed_at = self._decayed_at
+        decayed = 0
+        exp = math.exp
+        for row in range(len(strength)):
+            value = strength[row]
+            if value > 0:
+                decayed += 1
+                elapsed = now - decayed_at[row]
+                if elapsed > 0:
+                    strength[row] = value * exp(-rate * elapsed)
+            decayed_at[row] = now
+        return decayed
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, path: Path) -> None:
+        """
+        Persist strengths and decay stamps.
+
+        Format: one JSON header line (row IDs) followed by the raw
+        strength and decayed_at arrays.
+        """
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            header = {'rows': len(self._ids), 'ids': self._ids}
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            self._strength.tofile(f)
+            self._decayed_at.tofile(f)
+        tmp_path.replace(path)
+
+    def load_strengths(self, path: Path) -> int:
+        """
+        Overlay persisted strengths onto existing rows.
+
+        Rows not present in the file keep their current values.
+
+        Returns:
+            Number of rows updated
+        """
+        if not path.exists():
+            return 0
+
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                count = header['rows']
+                strength = array('d')
+                decayed_at = array('d')
+                strength.fromfile(f, count)
+                decayed_at.fromfile(f, count)
+        except (OSError, ValueError, KeyError, EOFError):
+            return 0
+
+        updated = 0
+        for i, rel_id in enumerate(header['ids']):
+            row = self._row.get(rel_id)
+            if row is not None:
+                self._strength[row] = strength[i]
+                self._decayed_at[row] = decayed_at[i]
+                updated += 1
+        return updated
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get storage statistics"""
+        return {
+            'rows': len(self._ids),
+            'entities_indexed': len(self._by_entity),
+            'vectorized': self.vectorized,
+            'bytes': sum(c.itemsize * len(c) for c in self._columns()),
+        }
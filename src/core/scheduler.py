@@ -23,12 +23,10 @@ from dataclasses import dataclass, field
 
 from .hook import (
     WorkItem, WorkItemPriority, WorkItemStatus,
-    Hook, HookManager
-)
-from .molecule import (
-    Molecule, MoleculeStep, MoleculeStatus, StepStatus,
-    MoleculeEngine
+    Hook
 )
+from .molecule import Molecule, MoleculeStep, MoleculeStatus, StepStatus
+from .registry import get_hook_manager, get_molecule_engine
 from .monitor import SystemMonitor, HealthState
 from .skills import SkillRegistry, CAPABILITY_SKILL_MAP
 
@@ -241,7 +239,7 @@ class LoadBalancer:
     ):
         self.corp_path = Path(corp_path)
         self.max_queue_depth = max_queue_depth
-        self.hook_manager = HookManager(corp_path)
+        self.hook_manager = get_hook_manager(corp_path)
 
         # Optional: integrate with monitor for health-aware balancing
         self.monitor: Optional[SystemMonitor] = None
@@ -349,7 +347,7 @@ class DependencyResolver:
 
     def __init__(self, corp_path: Path):
         self.corp_path = Path(corp_path)
-        self.molecule_engine = MoleculeEngine(corp_path)
+        self.molecule_engine = get_molecule_engine(corp_path)
 
     def is_step_ready(
         self,
@@ -596,7 +594,7 @@ class WorkScheduler:
         self.dependency_resolver = DependencyResolver(corp_path)
 
         # Integration with molecule engine
-        self.molecule_engine = MoleculeEngine(corp_path)
+        self.molecule_engine = get_molecule_engine(corp_path)
 
     def set_monitor(self, monitor: SystemMonitor) -> None:
         """Attach system monitor for health-aware scheduling"""
@@ -0,0 +1,201 @@
+"""
+Search Index - Shared N-gram Substring Index
+
+Provides fast substring and word-prefix lookup for the entity and
+interaction stores, replacing per-query scans like
+`query in f"{name} {description}".lower()` over every record.
+
+How it works:
+- Each document (entity, alias key, interaction) is registered under an ID
+  with one or more text fields, normalized to lowercase
+- Every field is broken into overlapping n-grams (trigrams by default);
+  a posting list maps each gram to the set of document IDs containing it
+- A query is broken into the same grams and the posting lists are
+  intersected, smallest first, to produce a small candidate set
+- Candidates are verified against the stored text, so results are exactly
+  the documents a linear `in` scan would return
+- Queries shorter than the gram size fall back to a scan of stored text
+
+Word-prefix search ("smi" -> "John Smith") indexes each field with a
+leading space so that grams spanning a word boundary start with " ".
+
+The index is maintained incrementally by the stores - callers add,
+replace, or remove single documents rather than rebuilding.
+"""
+
+from typing import Optional, List, Dict, Set, Iterable, Tuple, Callable
+
+
+# Default gram length. Trigrams balance posting-list selectivity against
+# the minimum query length that can use the index.
+DEFAULT_NGRAM_SIZE = 3
+
+
+class NgramIndex:
+    """
+    Incrementally maintained n-gram index for substring queries.
+
+    Documents are identified by string IDs. Results are returned in
+    document insertion order so callers get deterministic output that
+    matches what a scan over an insertion-ordered dict would produce.
+    """
+
+    def __init__(self, n: int = DEFAULT_NGRAM_SIZE):
+        if n < 1:
+            raise ValueError("N-gram size must be at least 1")
+        self.n = n
+
+        # gram -> document IDs containing it
+        self._postings: Dict[str, Set[str]] = {}
+        # document ID -> normalized fields (each prefixed with a space)
+        self._docs: Dict[str, Tuple[str, ...]] = {}
+        # document ID -> insertion sequence, for stable ordering
+        self._order: Dict[str, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._docs
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text for indexing and querying"""
+        return (text or "").lower()
+
+    def _grams(self, text: str) -> Set[str]:
+        """Extract the set of n-grams from normalized text"""
+        n = self.n
+        if len(text) < n:
+            return set()
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def add(self, doc_id: str, texts: Iterable[str]) -> None:
+        """
+        Add or replace a document.
+
+        Args:
+            doc_id: Document identifier
+            texts: Text fields to index. Substring matches never span
+                two fields.
+        """
+        fields = tuple(" " + self.normalize(t) for t in texts if t)
+
+        if doc_id in self._docs:
+            if self._docs[doc_id] == fields:
+                return
+            self._unpost(doc_id)
+        else:
+            self._order[doc_id] = self._next_seq
+            self._next_seq += 1
+
+        self._docs[doc_id] = fields
+        for field_text in fields:
+            for gram in self._grams(field_text):
+                self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document. Returns True if it was indexed."""
+        if doc_id not in self._docs:
+            return False
+        self._unpost(doc_id)
+        del self._docs[doc_id]
+        del self._order[doc_id]
+        return True
+
+    def clear(self) -> None:
+        """Remove all documents"""
+        self._postings.clear()
+        self._docs.clear()
+        self._order.clear()
+        self._next_seq = 0
+
+    def _unpost(self, doc_id: str) -> None:
+        """Remove a document's grams from the posting lists"""
+        for field_text in self._docs.get(doc_id, ()):
+            for gram in self._grams(field_text):
+                posting = self._postings.get(gram)
+                if posting is None:
+                    continue
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Find documents with a field containing `query` as a substring.
+
+        Equivalent to `query.lower() in field.lower()` over every field.
+        An empty query matches every document.
+        """
+        needle = self.normalize(query)
+        # Skip the synthetic leading space so it never takes part in a match
+        return self._query(needle, lambda f: f.find(needle, 1) != -1, limit)
+
+    def search_prefix(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Find documents with a word in some field starting with `query`.
+
+        Intended for typeahead: "smi" matches "John Smith".
+        """
+        needle = " " + self.normalize(query).lstrip()
+        return self._query(needle, lambda f: needle in f, limit)
+
+    def _query(
+        self,
+        needle: str,
+        matches_field: Callable[[str], bool],
+        limit: Optional[int]
+    ) -> List[str]:
+        if len(needle) < self.n:
+            # Too short to use the index - scan stored text
+            matches = [
+                doc_id for doc_id, fields in self._docs.items()
+                if any(matches_field(f) for f in fields)
+            ]
+            return matches[:limit] if limit is not None else matches
+
+        candidates = self._intersect(self._grams(needle))
+        if not candidates:
+            return []
+
+        matches = [
+            doc_id for doc_id in candidates
+            if any(matches_field(f) for f in self._docs[doc_id])
+        ]
+        matches.sort(key=self._order.__getitem__)
+        return matches[:limit] if limit is not None else matches
+
+    def _intersect(self, grams: Set[str]) -> Set[str]:
+        """Intersect posting lists, smallest first, stopping early on empty"""
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get index statistics"""
+        return {
+            'documents': len(self._docs),
+            'grams': len(self._postings),
+            'postings': sum(len(p) for p in self._postings.values()),
+        }
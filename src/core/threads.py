@@ -0,0 +1,438 @@
+"""
+Conversation Thread Store - Append-only CEO-COO Threads
+
+Stores each conversation thread as a directory:
+
+    conversations/ceo_coo/
+        catalog.jsonl              # Thread catalog (append-only, last entry wins)
+        thread-<id>/
+            header.json            # Title, status, tags, links, summary, decisions
+            messages.jsonl         # One message per line, append-only
+            tokens.jsonl           # Search tokens of each message, one line per message
+
+Adding a message appends one line to messages.jsonl, one to tokens.jsonl
+and one to the catalog - the cost does not grow with thread length.
+Listing threads reads only the catalog. History search uses an
+in-memory token index (token -> threads, and per thread token -> message
+positions) built from the token logs, so a query only reads the message
+logs of threads that actually match.
+
+Other processes (CLI) appending to the same store are picked up by
+following the catalog file: new catalog lines are read on the next call,
+and token logs are read from where indexing left off.
+
+Legacy single-file threads (thread-*.json) are migrated on first load.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .versions import bump_version
+
+logger = logging.getLogger(__name__)
+
+# Catalog fields kept per thread
+CATALOG_FIELDS = ('id', 'title', 'status', 'tags', 'created_at', 'updated_at', 'message_count')
+
+# Rewrite the catalog once it holds this many superseded lines
+CATALOG_COMPACT_SLACK = 256
+
+
+def message_tokens(text: str) -> Set[str]:
+    """Search tokens of a message (lowercased whitespace-separated words)"""
+    return set((text or '').lower().split())
+
+
+class ConversationThreadStore:
+    """
+    Append-only storage for CEO-COO conversation threads.
+
+    Thread-safe within a process; concurrent appends from other processes
+    are tolerated (each write is a single appended line).
+    """
+
+    CATALOG_FILE = "catalog.jsonl"
+
+    def __init__(self, store_path: Path):
+        self.store_path = Path(store_path)
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        self.catalog_file = self.store_path / self.CATALOG_FILE
+
+        self._lock = threading.RLock()
+
+        # Catalog: thread_id -> entry, and how much of the file has been read
+        self._catalog: Dict[str, Dict[str, Any]] = {}
+        self._catalog_offset = 0
+        self._catalog_inode: Optional[int] = None
+        self._catalog_lines = 0
+
+        # Token index
+        self._title_tokens: Dict[str, Set[str]] = {}               # thread_id -> title tokens
+        self._by_title_token: Dict[str, Set[str]] = {}             # token -> thread_ids
+        self._by_token: Dict[str, Set[str]] = {}                   # token -> thread_ids
+        self._positions: Dict[str, Dict[str, List[int]]] = {}      # thread_id -> token -> positions
+        self._indexed_count: Dict[str, int] = {}                   # thread_id -> messages indexed
+        self._token_offsets: Dict[str, int] = {}                   # thread_id -> bytes read
+
+        self._migrate_legacy()
+        self._refresh_catalog()
+
+    # =========================================================================
+    # Paths
+    # =========================================================================
+
+    def _thread_dir(self, thread_id: str) -> Path:
+        return self.store_path / thread_id
+
+    def _header_path(self, thread_id: str) -> Path:
+        return self._thread_dir(thread_id) / "header.json"
+
+    def _messages_path(self, thread_id: str) -> Path:
+        return self._thread_dir(thread_id) / "messages.jsonl"
+
+    def _tokens_path(self, thread_id: str) -> Path:
+        return self._thread_dir(thread_id) / "tokens.jsonl"
+
+    # =========================================================================
+    # Catalog
+    # =========================================================================
+
+    def _refresh_catalog(self) -> None:
+        """Read catalog lines appended since the last read (by any process)"""
+        with self._lock:
+            try:
+                stat = self.catalog_file.stat()
+            except FileNotFoundError:
+                return
+
+            # Compacted (replaced) by another process - reload from the start
+            if stat.st_ino != self._catalog_inode or stat.st_size < self._catalog_offset:
+                self._catalog.clear()
+                self._catalog_offset = 0
+                self._catalog_lines = 0
+                self._catalog_inode = stat.st_ino
+
+            if stat.st_size == self._catalog_offset:
+                return
+
+            with open(self.catalog_file, 'rb') as f:
+                f.seek(self._catalog_offset)
+                data = f.read()
+
+            # Only consume complete lines; a partial trailing line is read next time
+            end = data.rfind(b'\n') + 1
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    self._apply_catalog_entry(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt catalog line in {self.catalog_file}")
+                self._catalog_lines += 1
+            self._catalog_offset += end
+            if end:
+                bump_version(self.store_path, 'threads')
+
+    def _apply_catalog_entry(self, entry: Dict[str, Any]) -> None:
+        thread_id = entry['id']
+        self._catalog[thread_id] = entry
+
+        tokens = message_tokens(entry.get('title', ''))
+        old = self._title_tokens.get(thread_id, set())
+        if tokens != old:
+            for token in old - tokens:
+                threads = self._by_title_token.get(token)
+                if threads:
+                    threads.discard(thread_id)
+                    if not threads:
+                        del self._by_title_token[token]
+            for token in tokens - old:
+                self._by_title_token.setdefault(token, set()).add(thread_id)
+            self._title_tokens[thread_id] = tokens
+
+    def _write_catalog_entry(self, entry: Dict[str, Any]) -> None:
+        """Append a catalog entry and apply it (lock held)"""
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+        with open(self.catalog_file, 'ab') as f:
+            f.write(line)
+        # Pick up anything other processes appended before our line, then ours
+        self._refresh_catalog()
+
+        if self._catalog_lines > len(self._catalog) + CATALOG_COMPACT_SLACK:
+            self._compact_catalog()
+
+    def _compact_catalog(self) -> None:
+        """Rewrite the catalog with one line per thread (lock held)"""
+        tmp = self.catalog_file.with_suffix('.jsonl.tmp')
+        with open(tmp, 'w') as f:
+            for entry in self._catalog.values():
+                f.write(json.dumps(entry) + '\n')
+        os.replace(tmp, self.catalog_file)
+
+        stat = self.catalog_file.stat()
+        self._catalog_inode = stat.st_ino
+        self._catalog_offset = stat.st_size
+        self._catalog_lines = len(self._catalog)
+
+    @staticmethod
+    def _catalog_entry(header: Dict[str, Any], message_count: int, updated_at: str) -> Dict[str, Any]:
+        return {
+            'id': header['id'],
+            'title': header.get('title', ''),
+            'status': header.get('status', 'active'),
+            'tags': header.get('tags', []),
+            'created_at': header.get('created_at', ''),
+            'updated_at': updated_at,
+            'message_count': message_count,
+        }
+
+    # =========================================================================
+    # Threads
+    # =========================================================================
+
+    def exists(self, thread_id: str) -> bool:
+        self._refresh_catalog()
+        return thread_id in self._catalog or self._header_path(thread_id).exists()
+
+    def create(self, header: Dict[str, Any], messages: Iterable[Dict[str, Any]] = ()) -> None:
+        """
+        Create a thread.
+
+        Args:
+            header: Thread metadata including 'id' (any 'messages' key is ignored)
+            messages: Initial messages (used when migrating)
+        """
+        thread_id = header['id']
+        header = {k: v for k, v in header.items() if k != 'messages'}
+        messages = list(messages)
+
+        with self._lock:
+            thread_dir = self._thread_dir(thread_id)
+            thread_dir.mkdir(parents=True, exist_ok=True)
+            self._write_header(thread_id, header)
+
+            with open(self._messages_path(thread_id), 'w') as f:
+                for message in messages:
+                    f.write(json.dumps(message) + '\n')
+            with open(self._tokens_path(thread_id), 'w') as f:
+                for position, message in enumerate(messages):
+                    f.write(self._token_line(position, message))
+
+            self._write_catalog_entry(self._catalog_entry(
+                header, len(messages), header.get('updated_at', header.get('created_at', ''))
+            ))
+
+    def append_message(self, thread_id: str, message: Dict[str, Any]) -> None:
+        """Append a message to a thread (O(1) in thread length)"""
+        with self._lock:
+            self._refresh_catalog()
+            entry = self._catalog.get(thread_id)
+            if entry is None:
+                raise ValueError(f"Thread {thread_id} not found")
+
+            position = entry['message_count']
+            with open(self._messages_path(thread_id), 'a') as f:
+                f.write(json.dumps(message) + '\n')
+            with open(self._tokens_path(thread_id), 'a') as f:
+                f.write(self._token_line(position, message))
+
+            entry = dict(entry)
+            entry['message_count'] = position + 1
+            entry['updated_at'] = message.get('timestamp') or datetime.utcnow().isoformat()
+            self._write_catalog_entry(entry)
+
+    def get_header(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Get thread metadata without messages"""
+        path = self._header_path(thread_id)
+        if not path.exists():
+            return None
+        header = json.loads(path.read_text())
+        self._refresh_catalog()
+        entry = self._catalog.get(thread_id)
+        if entry:
+            header['updated_at'] = entry['updated_at']
+        return header
+
+    def update_header(self, thread_id: str, update: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Modify a thread's header.
+
+        Args:
+            thread_id: Thread to update
+            update: Callable that mutates the header dict in place
+
+        Returns:
+            The updated header
+        """
+        with self._lock:
+            header = self.get_header(thread_id)
+            if header is None:
+                raise ValueError(f"Thread {thread_id} not found")
+
+            update(header)
+            header['updated_at'] = datetime.utcnow().isoformat()
+            self._write_header(thread_id, header)
+
+            entry = self._catalog.get(thread_id, {})
+            self._write_catalog_entry(self._catalog_entry(
+                header, entry.get('message_count', 0), header['updated_at']
+            ))
+            return header
+
+    def _write_header(self, thread_id: str, header: Dict[str, Any]) -> None:
+        path = self._header_path(thread_id)
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(header, indent=2))
+        os.replace(tmp, path)
+
+    def read_messages(self, thread_id: str, start: int = 0) -> List[Dict[str, Any]]:
+        """Read a thread's messages from position `start` onward"""
+        path = self._messages_path(thread_id)
+        if not path.exists():
+            return []
+
+        messages = []
+        with open(path) as f:
+            for position, line in enumerate(f):
+                if position < start or not line.strip():
+                    continue
+                try:
+                    messages.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt message line {position} in {path}")
+        return messages
+
+    def get(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Get a full thread (header plus messages)"""
+        header = self.get_header(thread_id)
+        if header is None:
+            return None
+        header['messages'] = self.read_messages(thread_id)
+        return header
+
+    def list_threads(
+        self,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """List catalog entries, newest thread first"""
+        self._refresh_catalog()
+        with self._lock:
+            entries = sorted(self._catalog.values(), key=lambda e: e['id'], reverse=True)
+
+        threads = []
+        for entry in entries:
+            if status and entry.get('status') != status:
+                continue
+            if tags and not any(t in entry.get('tags', []) for t in tags):
+                continue
+            threads.append(dict(entry))
+            if len(threads) >= limit:
+                break
+        return threads
+
+    def get_catalog(self) -> Dict[str, Dict[str, Any]]:
+        """All catalog entries by thread ID (do not mutate)"""
+        self._refresh_catalog()
+        return self._catalog
+
+    # =========================================================================
+    # Token Index
+    # =========================================================================
+
+    @staticmethod
+    def _token_line(position: int, message: Dict[str, Any]) -> str:
+        tokens = sorted(message_tokens(message.get('content', '')))
+        return json.dumps({'i': position, 't': tokens}) + '\n'
+
+    def _sync_token_index(self) -> None:
+        """Index token log lines written since the last sync (lock held)"""
+        for thread_id, entry in self._catalog.items():
+            if self._indexed_count.get(thread_id, 0) >= entry['message_count']:
+                continue
+
+            path = self._tokens_path(thread_id)
+            if not path.exists():
+                continue
+            with open(path, 'rb') as f:
+                f.seek(self._token_offsets.get(thread_id, 0))
+                data = f.read()
+
+            end = data.rfind(b'\n') + 1
+            positions = self._positions.setdefault(thread_id, {})
+            count = self._indexed_count.get(thread_id, 0)
+            for line in data[:end].splitlines():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                for token in record['t']:
+                    positions.setdefault(token, []).append(record['i'])
+                    self._by_token.setdefault(token, set()).add(thread_id)
+                count = max(count, record['i'] + 1)
+
+            self._indexed_count[thread_id] = count
+            self._token_offsets[thread_id] = self._token_offsets.get(thread_id, 0) + end
+
+    def find_threads(self, tokens: Iterable[str]) -> Set[str]:
+        """Threads whose title or any message contains one of the tokens"""
+        self._refresh_catalog()
+        with self._lock:
+            self._sync_token_index()
+            found: Set[str] = set()
+            for token in tokens:
+                found |= self._by_token.get(token, set())
+                found |= self._by_title_token.get(token, set())
+            return found
+
+    def match_positions(self, thread_id: str, tokens: Iterable[str], start: int = 0) -> Dict[int, int]:
+        """
+        Message positions (>= start) in a thread containing any of the
+        tokens, mapped to how many of the tokens each contains.
+        """
+        with self._lock:
+            self._sync_token_index()
+            positions = self._positions.get(thread_id, {})
+            matches: Dict[int, int] = {}
+            for token in set(tokens):
+                for position in positions.get(token, ()):
+                    if position >= start:
+                        matches[position] = matches.get(position, 0) + 1
+            return matches
+
+    def title_tokens(self, thread_id: str) -> Set[str]:
+        return self._title_tokens.get(thread_id, set())
+
+    # =========================================================================
+    # Migration
+    # =========================================================================
+
+    def _migrate_legacy(self) -> None:
+        """Convert single-file thread-*.json threads to the append-only layout"""
+        for legacy_file in sorted(self.store_path.glob("thread-*.json")):
+            try:
+                data = json.loads(legacy_file.read_text())
+                thread_id = data['id']
+                if not self._header_path(thread_id).exists():
+                    self.create(data, data.get('messages', []))
+                legacy_file.rename(legacy_file.with_suffix('.json.migrated'))
+                logger.info(f"Migrated conversation thread {thread_id}")
+            except Exception as e:
+                logger.warning(f"Could not migrate thread file {legacy_file}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        self._refresh_catalog()
+        with self._lock:
+            return {
+                'threads': len(self._catalog),
+                'messages': sum(e['message_count'] for e in self._catalog.values()),
+                'catalog_lines': self._catalog_lines,
+                'indexed_threads': len(self._indexed_count),
+                'indexed_tokens': len(self._by_token),
+            }
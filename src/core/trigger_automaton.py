@@ -0,0 +1,88 @@
+"""
+Trigger Automaton - Multi-Keyword Matching for Pattern Triggers
+
+PatternLibrary.match used to serialize the task context once per trigger
+per pattern and run a substring test for each, so matching cost grew
+with patterns x triggers x context size.
+
+TriggerAutomaton compiles every trigger keyword into one Aho-Corasick
+automaton. A single pass over the (lowercased) context text reports
+every keyword that occurs anywhere in it, overlapping ones included, so
+a match call costs one scan of the context no matter how many patterns
+the library holds.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class TriggerAutomaton:
+    """
+    Aho-Corasick automaton over lowercase keywords.
+
+    Each keyword maps to the set of owner IDs (pattern IDs) it belongs to;
+    `search` returns the owners of every keyword found in a text.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str]] = ()):
+        """
+        Args:
+            keywords: (keyword, owner_id) pairs. Keywords are lowercased;
+                empty keywords are ignored.
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._owners: List[Set[str]] = [set()]    # Owners of keywords ending at each state
+        self.keyword_count = 0
+
+        for keyword, owner_id in keywords:
+            self._insert(keyword.lower(), owner_id)
+        self._link()
+
+    def _insert(self, keyword: str, owner_id: str) -> None:
+        if not keyword:
+            return
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._owners.append(set())
+            state = nxt
+        if not self._owners[state]:
+            self.keyword_count += 1
+        self._owners[state].add(owner_id)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Keywords that end at the fallback state also end here
+                self._owners[nxt] |= self._owners[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return self.keyword_count
+
+    def search(self, text: str) -> Set[str]:
+        """Owner IDs of every keyword occurring in text (text must be lowercase)"""
+        goto, fail, owners = self._goto, self._fail, self._owners
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if owners[state]:
+                found |= owners[state]
+        return found
@@ -0,0 +1,142 @@
+"""
+Store Change Counters and Versioned Caches
+
+Stores bump a process-wide change counter for their component whenever
+they write (molecules, gates, hooks, organizational memory files, COO
+threads). Readers that derive expensive views from those stores - such
+as the COO's session context - remember the counters they were built
+from and only recompute when a counter has moved.
+
+Counters are keyed by (store path, component), so every instance of a
+store opened on the same corp directory shares them. They are in-memory
+only: writes made by other processes are not counted, so cached views
+also expire after a maximum age.
+
+Usage:
+    bump_version(corp_path, 'molecules')           # in a store's save path
+
+    cache = VersionedCache(max_age_seconds=60)
+    molecules = cache.get(
+        'active_molecules',
+        get_versions(corp_path, ('molecules',)),
+        engine.list_active_molecules
+    )
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+# Cached views older than this are rebuilt even if no counter moved
+DEFAULT_MAX_AGE_SECONDS = 60.0
+
+_counters: Dict[Tuple[str, str], int] = {}
+_counters_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _scope(path: str) -> str:
+    return str(Path(path).resolve())
+
+
+def bump_version(path: Path, component: str) -> int:
+    """Record a write to a store component. Returns the new counter value."""
+    key = (_scope(str(path)), component)
+    with _counters_lock:
+        _counters[key] = _counters.get(key, 0) + 1
+        return _counters[key]
+
+
+def get_version(path: Path, component: str) -> int:
+    """Current change counter for a store component (0 if never written)"""
+    return _counters.get((_scope(str(path)), component), 0)
+
+
+def get_versions(path: Path, components: Iterable[str]) -> Tuple[int, ...]:
+    """Change counters for several components of the same store path"""
+    scope = _scope(str(path))
+    return tuple(_counters.get((scope, c), 0) for c in components)
+
+
+class VersionedCache:
+    """
+    Named values recomputed only when their versions change or they expire.
+
+    Each entry records the versions it was built from and a generation
+    number that increases on every rebuild, so callers can memoize
+    anything derived from several entries (e.g. a rendered prompt).
+
+    With max_entries, the least recently used entry is dropped when a new
+    one would exceed it (for caches keyed by open-ended names).
+    """
+
+    def __init__(self, max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+                 max_entries: Optional[int] = None):
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, Tuple[Hashable, Any, float, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, name: str, versions: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get a cached value, calling loader() if it is missing or stale.
+
+        Loader exceptions propagate and nothing is cached, so a failed
+        component is retried on the next call.
+        """
+        return self.get_with_generation(name, versions, loader)[0]
+
+    def get_with_generation(
+        self,
+        name: str,
+        versions: Hashable,
+        loader: Callable[[], Any]
+    ) -> Tuple[Any, int]:
+        """Like get(), also returning the build number of the value"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and entry[0] == versions and now - entry[2] <= self.max_age_seconds:
+                self._hits += 1
+                self._entries.move_to_end(name)
+                return entry[1], entry[3]
+            self._misses += 1
+
+        value = loader()
+
+        with self._lock:
+            self._generation += 1
+            self._entries[name] = (versions, value, now, self._generation)
+            self._entries.move_to_end(name)
+            if self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value, self._generation
+
+    def generation(self, name: str) -> Optional[int]:
+        """Build number of a cached entry (None if not cached)"""
+        entry = self._entries.get(name)
+        return entry[3] if entry else None
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one entry, or all entries"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'entries': len(self._entries),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / total, 3) if total else 0.0,
+            }
@@ -9,5 +9,6 @@ Common utilities for AI Corp:
 
 from .config import load_config, get_corp_path
 from .logging import get_logger
+from .helpers import hello_world
 
-__all__ = ['load_config', 'get_corp_path', 'get_logger']
+__all__ = ['load_config', 'get_corp_path', 'get_logger', 'hello_world']
@@ -0,0 +1,12 @@
+"""
+Helper utilities for AI Corp.
+"""
+
+
+def hello_world() -> str:
+    """Return a hello world greeting.
+
+    Returns:
+        A friendly greeting string.
+    """
+    return "Hello, World!"
@@ -439,3 +439,32 @@ class TestCOOEdgeCases:
         # All should have unique IDs
         ids = [mol1.id, mol2.id, mol3.id]
         assert len(ids) == len(set(ids))
+
+
+class TestCOOSessionContextCache:
+    """Tests for reusing session context between turns."""
+
+    def test_summary_reused_until_stores_change(self, initialized_corp):
+        """Test the rendered summary is rebuilt only after a store write."""
+        coo = COOAgent(corp_path=Path(initialized_corp))
+
+        first = coo.get_context_summary_for_llm()
+        assert coo.get_context_summary_for_llm() is first
+
+        coo.receive_ceo_task(title='Cache Buster', description='New work')
+        updated = coo.get_context_summary_for_llm()
+
+        assert updated is not first
+        assert 'Cache Buster' in updated
+
+    def test_unchanged_components_not_reloaded(self, initialized_corp):
+        """Test a molecule write leaves unrelated components cached."""
+        coo = COOAgent(corp_path=Path(initialized_corp))
+        coo.load_session_context()
+        prefs_generation = coo._session_cache.generation('ceo_preferences')
+
+        coo.receive_ceo_task(title='Another', description='Work')
+        context = coo.load_session_context()
+
+        assert coo._session_cache.generation('ceo_preferences') == prefs_generation
+        assert any(m['name'] == 'Another' for m in context['active_molecules'])
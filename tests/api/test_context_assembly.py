@@ -0,0 +1,79 @@
+"""
+Tests for parallel COO context assembly.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.api.context_assembly import ContextAssembler, ContextSource
+from src.api.storage import AsyncStorageFacade
+
+
+class TestContextAssembler:
+    """Test concurrency, timeouts and budgets."""
+
+    def setup_method(self):
+        self.storage = AsyncStorageFacade(max_workers=4)
+        self.assembler = ContextAssembler(self.storage)
+
+    def teardown_method(self):
+        self.storage.shutdown(wait=True)
+
+    def _assemble(self, sources):
+        return asyncio.run(self.assembler.assemble(sources))
+
+    def test_sources_run_concurrently(self):
+        """Total time should track the slowest source, not the sum."""
+        def slow(value):
+            time.sleep(0.1)
+            return value
+
+        result = self._assemble([
+            ContextSource(f'source_{i}', slow, args=(i,)) for i in range(4)
+        ])
+
+        assert result.values == {f'source_{i}': i for i in range(4)}
+        assert result.total_ms < 300
+        assert all(r['status'] == 'ok' for r in result.get_metadata()['sources'].values())
+
+    def test_slow_source_falls_back_to_default(self):
+        """A source exceeding its timeout should not hold up the rest."""
+        result = self._assemble([
+            ContextSource('slow', time.sleep, args=(0.5,), timeout=0.05, default='fallback'),
+            ContextSource('fast', lambda: 'ok'),
+        ])
+
+        assert result.values == {'slow': 'fallback', 'fast': 'ok'}
+        assert result.degraded == ['slow']
+        assert result.get_metadata()['sources']['slow']['status'] == 'timeout'
+
+    def test_failing_source_reports_error(self):
+        """Exceptions should be recorded and replaced by the default."""
+        def broken():
+            raise IOError("disk gone")
+
+        result = self._assemble([ContextSource('broken', broken, default={})])
+
+        assert result.values['broken'] == {}
+        assert result.get_metadata()['sources']['broken']['error'] == 'disk gone'
+
+    def test_character_budget_truncates(self):
+        """String results over max_chars should be truncated and flagged."""
+        result = self._assemble([
+            ContextSource('big', lambda: 'x' * 100, max_chars=10),
+        ])
+
+        assert result.values['big'].startswith('x' * 10)
+        assert len(result.values['big']) < 100
+        assert result.get_metadata()['sources']['big']['truncated'] is True
+
+    def test_async_sources_are_awaited(self):
+        """Coroutine functions should run on the loop, not the pool."""
+        async def state():
+            await asyncio.sleep(0)
+            return {'projects_active': 2}
+
+        result = self._assemble([ContextSource('state', state)])
+        assert result.values['state'] == {'projects_active': 2}
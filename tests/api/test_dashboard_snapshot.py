@@ -0,0 +1,214 @@
+"""
+Tests for the materialized dashboard snapshot.
+"""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.api.dashboard import DashboardSnapshot
+from src.core.hook import HookManager
+from src.core.molecule import MoleculeEngine, MoleculeStep, MoleculeStatus
+
+
+class TestDashboardSnapshot:
+    """Test loading, incremental updates and deltas."""
+
+    @pytest.fixture
+    def engine(self, temp_corp_path):
+        return MoleculeEngine(Path(temp_corp_path))
+
+    @pytest.fixture
+    def hooks(self, temp_corp_path):
+        return HookManager(Path(temp_corp_path))
+
+    @pytest.fixture
+    def snapshot(self, engine, hooks):
+        self.loads = []
+
+        def loader(section, func):
+            def load():
+                self.loads.append(section)
+                return func()
+            return load
+
+        snapshot = DashboardSnapshot(loaders={
+            'hooks': loader('hooks', hooks.list_hooks),
+            'molecules': loader('molecules', engine.list_active_molecules),
+            'gates': loader('gates', lambda: []),
+            'activity': loader('activity', lambda: []),
+        })
+        self.deltas = []
+        snapshot.add_listener(self.deltas.append)
+        return snapshot
+
+    def _create_molecule(self, engine, name):
+        molecule = engine.create_molecule(name=name, description="d", created_by="coo")
+        molecule.add_step(MoleculeStep.create(name="Research", description="r"))
+        engine._save_molecule(molecule)
+        return molecule
+
+    def test_initial_load_computes_queue_depth(self, snapshot, engine, hooks):
+        """Queue depth should be summed from hooks rather than hard-coded."""
+        hook = hooks.create_hook("worker", "worker", "worker-01")
+        hooks.add_work_to_hook(hook.id, "Task", "desc", molecule_id="MOL-1")
+        hooks.add_work_to_hook(hook.id, "Task 2", "desc", molecule_id="MOL-1")
+        self._create_molecule(engine, "Project A")
+
+        snapshot.refresh()
+        metrics = snapshot.get_metrics()
+
+        assert metrics['queue_depth'] == 2
+        assert metrics['agents_active'] == 1
+        assert metrics['projects_active'] == 1
+        assert snapshot.stale_sections() == []
+
+    def test_reads_are_cached(self, snapshot):
+        """Repeated reads should not reload sections or change the ETag."""
+        snapshot.refresh()
+        loads = len(self.loads)
+
+        body, etag = snapshot.get()
+        again, same_etag = snapshot.get()
+
+        assert body is again
+        assert etag == same_etag
+        assert len(self.loads) == loads
+        assert json.loads(body)['metrics']['queue_depth'] == 0
+
+    def test_apply_molecule_emits_delta(self, snapshot, engine):
+        """Lifecycle updates should change the document and push a delta."""
+        snapshot.refresh()
+        _, etag = snapshot.get()
+        molecule = self._create_molecule(engine, "Project B")
+
+        snapshot.apply_molecule(molecule)
+
+        body, new_etag = snapshot.get()
+        assert new_etag != etag
+        assert [p['id'] for p in json.loads(body)['projects']] == [molecule.id]
+
+        delta = self.deltas[-1]
+        assert delta['type'] == 'dashboard.delta'
+        assert delta['version'] == snapshot.version
+        ops = [(c['op'], c['section']) for c in delta['changes']]
+        assert ('upsert', 'projects') in ops
+        assert ('replace', 'metrics') in ops
+
+        molecule.status = MoleculeStatus.COMPLETED
+        snapshot.apply_molecule(molecule)
+        assert snapshot.get_metrics()['projects_active'] == 0
+        assert self.deltas[-1]['changes'][0] == {'op': 'remove', 'section': 'projects', 'id': molecule.id}
+
+    def test_unchanged_molecule_is_a_no_op(self, snapshot, engine):
+        """Re-applying an identical molecule should not bump the version."""
+        molecule = self._create_molecule(engine, "Project C")
+        snapshot.apply_molecule(molecule)
+        version = snapshot.version
+
+        snapshot.apply_molecule(molecule)
+        assert snapshot.version == version
+
+    def test_invalidate_reloads_only_dirty_sections(self, snapshot, hooks):
+        """Invalidated sections should be the only ones reloaded."""
+        snapshot.refresh()
+        self.loads.clear()
+
+        hook = hooks.create_hook("worker", "worker", "worker-02")
+        hooks.add_work_to_hook(hook.id, "Task", "desc", molecule_id="MOL-1")
+        snapshot.invalidate('hooks')
+
+        assert snapshot.refresh() == ['hooks']
+        assert self.loads == ['hooks']
+        assert snapshot.get_metrics()['queue_depth'] == 1
+
+
+class FakeWebSocket:
+    """Records what the broadcaster sends"""
+
+    def __init__(self):
+        self.sent = []
+        self.received = None
+
+    async def accept(self):
+        self.received = asyncio.Event()
+
+    async def send_json(self, message):
+        self.sent.append(message)
+        self.received.set()
+
+
+class TestDashboardDelivery:
+    """Test delivering dashboard refreshes and deltas from the API."""
+
+    def setup_method(self):
+        from src.api.main import reset_systems
+        reset_systems()
+
+    def teardown_method(self):
+        from src.api.main import reset_systems
+        reset_systems()
+
+    def test_push_from_worker_thread_publishes_on_loop(self, temp_corp_path, monkeypatch):
+        """Deltas pushed off the loop should be published on the loop thread."""
+        monkeypatch.setenv('AI_CORP_PATH', temp_corp_path)
+        from src.api.main import ActivityEventBroadcaster
+
+        broadcaster = ActivityEventBroadcaster(batch_window=0)
+        publish = broadcaster._publish
+        publishing_threads = []
+
+        def recording_publish(message):
+            publishing_threads.append(threading.current_thread())
+            publish(message)
+        broadcaster._publish = recording_publish
+
+        async def main():
+            websocket = FakeWebSocket()
+            await broadcaster.subscribe(websocket)
+            worker = threading.Thread(target=broadcaster.push_sync, args=({'type': 'dashboard_delta'},))
+            worker.start()
+            worker.join()
+            await asyncio.wait_for(websocket.received.wait(), timeout=2)
+            broadcaster.unsubscribe(websocket)
+            return websocket.sent
+
+        assert asyncio.run(main()) == [{'type': 'dashboard_delta'}]
+        assert publishing_threads == [threading.main_thread()]
+
+    def test_background_refresh_is_referenced_until_done(self, monkeypatch):
+        """Stale sections refresh in a task the module keeps alive."""
+        from src.api import main as api_main
+
+        release = threading.Event()
+
+        class StaleSnapshot:
+            refreshed = False
+
+            def stale_sections(self):
+                return ['molecules']
+
+            def is_loaded(self):
+                return True
+
+            def refresh(self):
+                release.wait(2)
+                self.refreshed = True
+
+        snapshot = StaleSnapshot()
+        monkeypatch.setattr(api_main, 'get_dashboard_snapshot', lambda: snapshot)
+
+        async def main():
+            assert await api_main.get_current_dashboard() is snapshot
+            pending = set(api_main._dashboard_refreshes)
+            release.set()
+            await asyncio.gather(*pending)
+            await asyncio.sleep(0)
+            return pending
+
+        assert len(asyncio.run(main())) == 1
+        assert snapshot.refreshed
+        assert not api_main._dashboard_refreshes
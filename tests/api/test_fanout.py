@@ -0,0 +1,84 @@
+"""
+Tests for per-client WebSocket fan-out.
+"""
+
+import asyncio
+import threading
+
+from src.api.fanout import ClientChannel, batch_frame, run_sender
+
+
+class TestClientChannel:
+    """Test bounded per-client queues."""
+
+    def test_drops_oldest_when_full(self):
+        async def main():
+            channel = ClientChannel(max_queued=3)
+            for i in range(5):
+                channel.put({'n': i})
+            batch = await channel.get_batch(batch_window=0)
+            return channel, batch
+
+        channel, batch = asyncio.run(main())
+        assert [m['n'] for m in batch] == [2, 3, 4]
+        assert channel.dropped == 2
+
+    def test_batches_burst(self):
+        """Messages arriving within the window should come back together."""
+        async def main():
+            channel = ClientChannel()
+
+            async def burst():
+                for i in range(10):
+                    channel.put({'n': i})
+                    await asyncio.sleep(0)
+
+            asyncio.get_running_loop().create_task(burst())
+            return await channel.get_batch(batch_window=0.05)
+
+        batch = asyncio.run(main())
+        assert [m['n'] for m in batch] == list(range(10))
+
+    def test_put_from_other_thread(self):
+        async def main():
+            channel = ClientChannel()
+            threading.Thread(target=channel.put, args=({'n': 1},)).start()
+            return await asyncio.wait_for(channel.get_batch(batch_window=0), timeout=2)
+
+        assert asyncio.run(main()) == [{'n': 1}]
+
+    def test_batch_frame(self):
+        assert batch_frame([{'a': 1}]) == {'a': 1}
+        assert batch_frame([{'a': 1}, {'b': 2}]) == {
+            'type': 'batch', 'messages': [{'a': 1}, {'b': 2}], 'count': 2
+        }
+
+
+class TestRunSender:
+    """Test per-client sender tasks."""
+
+    def test_slow_client_does_not_block_others(self):
+        """A stalled socket should time out without delaying another client."""
+        async def main():
+            fast_frames = []
+            fast, slow = ClientChannel(), ClientChannel()
+
+            async def send_fast(frame):
+                fast_frames.append(frame)
+
+            async def send_slow(frame):
+                await asyncio.sleep(10)
+
+            slow_task = asyncio.ensure_future(run_sender(slow, send_slow, batch_window=0, send_timeout=0.1))
+            fast_task = asyncio.ensure_future(run_sender(fast, send_fast, batch_window=0))
+            for channel in (fast, slow):
+                channel.put({'n': 1})
+
+            await asyncio.wait_for(slow_task, timeout=2)  # Returns once the send times out
+            await asyncio.sleep(0.01)
+            fast_task.cancel()
+            return fast_frames, fast
+
+        frames, fast = asyncio.run(main())
+        assert frames == [{'n': 1}]
+        assert fast.get_stats()['frames_sent'] == 1
@@ -0,0 +1,56 @@
+"""
+Tests for cursor pagination helpers.
+"""
+
+import pytest
+
+from src.api.pagination import (
+    MAX_PAGE_SIZE, clamp_limit, decode_cursor, encode_cursor, paginate
+)
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip(self):
+        key = ('2024-01-01T00:00:00', 'MOL-1')
+        assert decode_cursor(encode_cursor(key)) == key
+        assert encode_cursor(None) is None
+        assert decode_cursor(None) is None
+
+    def test_malformed_cursor_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor('not a cursor!')
+        with pytest.raises(ValueError):
+            decode_cursor(encode_cursor(('a',))[:-2] + '{{')
+
+    def test_clamp_limit(self):
+        assert clamp_limit(0) == 50
+        assert clamp_limit(10_000) == MAX_PAGE_SIZE
+        assert clamp_limit(-5) == 1
+
+
+class TestPaginate:
+    """Test in-memory keyset pagination."""
+
+    def test_walks_all_items_newest_first(self):
+        items = [{'t': f'2024-01-0{i}', 'id': str(i)} for i in range(1, 8)]
+        key = lambda item: (item['t'], item['id'])
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = paginate(items, key, cursor, limit=3)
+            seen.extend(item['id'] for item in page)
+            if cursor is None:
+                break
+
+        assert seen == ['7', '6', '5', '4', '3', '2', '1']
+
+    def test_stable_when_new_items_arrive(self):
+        items = [{'t': '2024-01-02', 'id': 'b'}, {'t': '2024-01-01', 'id': 'a'}]
+        key = lambda item: (item['t'], item['id'])
+        page, cursor = paginate(items, key, None, limit=1)
+
+        items.append({'t': '2024-01-03', 'id': 'c'})
+        page2, _ = paginate(items, key, cursor, limit=1)
+        assert [i['id'] for i in page + page2] == ['b', 'a']
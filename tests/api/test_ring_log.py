@@ -0,0 +1,62 @@
+"""
+Tests for the memory-mapped activity ring log.
+"""
+
+from src.api.ring_log import ActivityRingLog, MARKER
+
+
+class TestActivityRingLog:
+    """Test fixed-size ring file behavior."""
+
+    def test_keeps_newest_entries(self, tmp_path):
+        log = ActivityRingLog(tmp_path / 'activity.log', capacity=3, slot_size=64)
+        for i in range(5):
+            log.append(f'event {i}')
+
+        assert log.read_lines() == ['event 2', 'event 3', 'event 4']
+        assert log.read_lines(limit=1) == ['event 4']
+        log.close()
+
+    def test_file_size_fixed_and_readable(self, tmp_path):
+        path = tmp_path / 'activity.log'
+        log = ActivityRingLog(path, capacity=3, slot_size=64)
+        size = path.stat().st_size
+        for i in range(10):
+            log.append(f'event {i}')
+        log.close()
+
+        text = path.read_text()
+        assert path.stat().st_size == size
+        lines = [l.rstrip() for l in text.splitlines()]
+        # The newest entry sits just above the marker
+        assert lines[lines.index(MARKER) - 1] == 'event 9'
+
+    def test_reopen_continues(self, tmp_path):
+        path = tmp_path / 'activity.log'
+        log = ActivityRingLog(path, capacity=3, slot_size=64)
+        log.append('before restart')
+        log.close()
+
+        log = ActivityRingLog(path, capacity=3, slot_size=64)
+        log.append('after restart')
+        assert log.read_lines() == ['before restart', 'after restart']
+        log.close()
+
+    def test_replaces_plain_log(self, tmp_path):
+        """An old append-only log at the path is replaced by a ring."""
+        path = tmp_path / 'activity.log'
+        path.write_text('# old log\n[2024] event | hello\n')
+
+        log = ActivityRingLog(path, capacity=3, slot_size=64)
+        assert log.read_lines() == []
+        log.close()
+
+    def test_long_and_multiline_entries(self, tmp_path):
+        log = ActivityRingLog(tmp_path / 'activity.log', capacity=2, slot_size=16)
+        log.append('é' * 20)
+        log.append('two\nlines')
+
+        first, second = log.read_lines()
+        assert len(first.encode('utf-8')) <= 15
+        assert second == 'two lines'
+        log.close()
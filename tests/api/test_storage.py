@@ -0,0 +1,152 @@
+"""
+Tests for the async storage facade and event loop blocking measurement.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.api.storage import AsyncStorageFacade, LoopBlockMiddleware, LoopBlockTracker
+
+
+class TestAsyncStorageFacade:
+    """Test offloading and single-flight coalescing."""
+
+    def setup_method(self):
+        self.storage = AsyncStorageFacade(max_workers=2)
+
+    def teardown_method(self):
+        self.storage.shutdown(wait=True)
+
+    def test_runs_off_event_loop_thread(self):
+        """Blocking calls should run on a worker thread."""
+        async def main():
+            loop_thread = threading.get_ident()
+            worker_thread = await self.storage.run(threading.get_ident)
+            return loop_thread, worker_thread
+
+        loop_thread, worker_thread = asyncio.run(main())
+        assert loop_thread != worker_thread
+
+    def test_concurrent_keyed_calls_coalesce(self):
+        """Identical concurrent reads should share one execution."""
+        calls = []
+
+        def scan():
+            calls.append(1)
+            time.sleep(0.05)
+            return ['result']
+
+        async def main():
+            return await asyncio.gather(*[self.storage.run(scan, key='scan') for _ in range(10)])
+
+        results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert all(r == ['result'] for r in results)
+        assert self.storage.get_stats()['coalesced'] == 9
+        assert self.storage.get_stats()['inflight'] == 0
+
+    def test_sequential_calls_do_not_coalesce(self):
+        """Calls after completion should run again (no stale caching)."""
+        calls = []
+
+        async def main():
+            await self.storage.run(calls.append, 1, key='k')
+            await self.storage.run(calls.append, 2, key='k')
+
+        asyncio.run(main())
+        assert calls == [1, 2]
+
+    def test_exceptions_propagate_to_all_waiters(self):
+        """A failing shared call should raise in every caller."""
+        def fail():
+            time.sleep(0.02)
+            raise ValueError("scan failed")
+
+        async def main():
+            return await asyncio.gather(
+                *[self.storage.run(fail, key='fail') for _ in range(3)],
+                return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
+
+
+class TestLoopBlockMiddleware:
+    """Test per-endpoint loop blocking measurement."""
+
+    def test_counts_only_time_on_loop(self):
+        """Awaited time should not count as blocking; sync work should."""
+        tracker = LoopBlockTracker()
+
+        async def endpoint(scope, receive, send):
+            scope['endpoint'] = endpoint
+            await asyncio.sleep(0.1)
+            time.sleep(0.03)
+
+        middleware = LoopBlockMiddleware(endpoint, tracker)
+        asyncio.run(middleware({'type': 'http', 'path': '/x'}, None, None))
+
+        stats = tracker.get_stats()['endpoint']
+        assert stats['requests'] == 1
+        assert 25 <= stats['max_blocked_ms'] < 90
+
+    def test_records_failed_requests_by_path(self):
+        """Requests that raise before routing should still be recorded."""
+        tracker = LoopBlockTracker()
+
+        async def failing(scope, receive, send):
+            raise RuntimeError("boom")
+
+        middleware = LoopBlockMiddleware(failing, tracker)
+        with pytest.raises(RuntimeError):
+            asyncio.run(middleware({'type': 'http', 'path': '/broken'}, None, None))
+
+        assert tracker.get_stats()['/broken']['requests'] == 1
+
+
+class TestCOOTurnOffloading:
+    """Test COO reply handling runs on store workers, not the event loop."""
+
+    def setup_method(self):
+        self.storage = AsyncStorageFacade(max_workers=2)
+
+    def teardown_method(self):
+        self.storage.shutdown(wait=True)
+
+    def test_delegation_off_loop_cycle_on_loop(self, monkeypatch):
+        """Delegation writes run on a worker; the cycle task is started on the loop."""
+        from src.api import main
+
+        delegation_threads = []
+        cycles = []
+
+        def execute_delegation(coo, pending, thread_id, molecule_def=None):
+            delegation_threads.append(threading.get_ident())
+            return {'success': True, 'molecule_id': 'MOL-1', 'molecule_name': 'Research',
+                    'step_count': 1, 'delegations': []}
+
+        async def run_cycle(molecule_id):
+            cycles.append((molecule_id, threading.get_ident()))
+
+        monkeypatch.setattr(main, '_execute_delegation', execute_delegation)
+        monkeypatch.setattr(main, '_run_corporation_cycle_async', run_cycle)
+        monkeypatch.setattr(main, 'get_storage', lambda: self.storage)
+
+        async def turn():
+            actions = []
+            reply = await main._finish_coo_response_async(
+                None, "Starting now. [DELEGATE]", {}, 'THR-1', actions
+            )
+            await asyncio.sleep(0)
+            return threading.get_ident(), reply, actions
+
+        loop_thread, reply, actions = asyncio.run(turn())
+        assert delegation_threads and delegation_threads[0] != loop_thread
+        assert cycles == [('MOL-1', loop_thread)]
+        assert '[DELEGATE]' not in reply
+        assert actions[0]['molecule_id'] == 'MOL-1'
@@ -0,0 +1,155 @@
+"""
+Tests for bridging backend stream events to async consumers.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+from src.core.llm import LLMRequest, LLMResponse, StreamEvent
+from src.api.streaming import event_to_dict, format_sse, stream_llm_events
+
+
+class StreamingBackend:
+    """Backend yielding a fixed list of events"""
+
+    def __init__(self, events, delay=0.0):
+        self.events = events
+        self.delay = delay
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def execute_streaming(self, request):
+        try:
+            for event in self.events:
+                if self.delay:
+                    time.sleep(self.delay)
+                self.produced += 1
+                yield event
+        finally:
+            self.closed.set()
+
+
+class BlockingBackend:
+    """Backend with no streaming support"""
+
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self, request):
+        return self.response
+
+
+def collect(backend, consumer_delay=0.0, max_buffered=256):
+    async def main():
+        events = []
+        async for event in stream_llm_events(backend, LLMRequest(prompt='hi'), max_buffered=max_buffered):
+            events.append(event)
+            if consumer_delay:
+                await asyncio.sleep(consumer_delay)
+        return events
+    return asyncio.run(main())
+
+
+class TestStreamLLMEvents:
+    """Test the thread-to-async event bridge."""
+
+    def test_forwards_events_in_order(self):
+        """Events should arrive in order, ending with done."""
+        backend = StreamingBackend([
+            StreamEvent(event_type='tool_use', tool_name='Read'),
+            StreamEvent(event_type='content', content='Hello'),
+            StreamEvent(event_type='done'),
+        ], delay=0.01)
+
+        events = collect(backend)
+        assert [e.event_type for e in events] == ['tool_use', 'content', 'done']
+        assert events[0].tool_name == 'Read'
+
+    def test_slow_consumer_gets_merged_deltas(self):
+        """Deltas buffered behind a slow consumer should be merged, not lost."""
+        words = [f'w{i} ' for i in range(50)]
+        backend = StreamingBackend(
+            [StreamEvent(event_type='content', content=w) for w in words]
+            + [StreamEvent(event_type='done')]
+        )
+
+        events = collect(backend, consumer_delay=0.02)
+        content = [e for e in events if e.event_type == 'content']
+        assert ''.join(e.content for e in content) == ''.join(words)
+        assert len(content) < len(words)
+        assert events[-1].event_type == 'done'
+
+    def test_tool_input_merges_per_tool_call(self):
+        """Tool-input deltas should only merge within one tool call, keeping its fields."""
+        def delta(index, text):
+            return StreamEvent(event_type='tool_input', content=text,
+                               data={'type': 'content_block_delta', 'index': index})
+        backend = StreamingBackend(
+            [delta(1, '{"pa'), delta(1, 'th": 1}'), delta(2, '{"cmd'), delta(2, '": 2}')]
+            + [StreamEvent(event_type='done')]
+        )
+
+        events = collect(backend, consumer_delay=0.05)
+        inputs = [e for e in events if e.event_type == 'tool_input']
+        by_call = {}
+        for event in inputs:
+            by_call[event.data['index']] = by_call.get(event.data['index'], '') + event.content
+        assert by_call == {1: '{"path": 1}', 2: '{"cmd": 2}'}
+        assert len(inputs) < 4
+
+    def test_producer_waits_for_buffer_space(self):
+        """The producer should never run more than max_buffered events ahead."""
+        backend = StreamingBackend([StreamEvent(event_type='content', content='x')] * 20)
+        ahead = []
+
+        async def main():
+            consumed = 0
+            async for event in stream_llm_events(backend, LLMRequest(prompt='hi'), max_buffered=2):
+                consumed += len(event.content)  # Merged events carry several deltas
+                await asyncio.sleep(0.02)
+                ahead.append(backend.produced - consumed)
+        asyncio.run(main())
+
+        # Buffered events plus the one the producer is waiting to hand over
+        assert max(ahead) <= 3
+
+    def test_early_exit_stops_backend(self):
+        """Stopping iteration should close the backend generator."""
+        backend = StreamingBackend([StreamEvent(event_type='content', content='x')] * 1000, delay=0.001)
+
+        async def main():
+            async for event in stream_llm_events(backend, LLMRequest(prompt='hi'), max_buffered=4):
+                break
+        asyncio.run(main())
+
+        assert backend.closed.wait(timeout=2)
+        assert backend.produced < 1000
+
+    def test_falls_back_to_execute(self):
+        """Backends without streaming should yield one content event."""
+        ok = collect(BlockingBackend(LLMResponse(content='Full reply', success=True)))
+        assert [(e.event_type, e.content) for e in ok] == [('content', 'Full reply'), ('done', '')]
+
+        failed = collect(BlockingBackend(LLMResponse(content='', success=False, error='boom')))
+        assert [(e.event_type, e.content) for e in failed] == [('error', 'boom'), ('done', '')]
+
+
+class TestEventFormatting:
+    """Test client-facing event encoding."""
+
+    def test_event_to_dict_omits_empty_tool_fields(self):
+        assert event_to_dict(StreamEvent(event_type='content', content='hi')) == {
+            'type': 'content', 'content': 'hi'
+        }
+        tool = event_to_dict(StreamEvent(event_type='tool_use', tool_name='Bash', tool_input={'cmd': 'ls'}))
+        assert tool['tool_name'] == 'Bash'
+        assert tool['tool_input'] == {'cmd': 'ls'}
+
+    def test_format_sse(self):
+        message = format_sse('content', {'content': 'a\nb'})
+        event_line, data_line, blank, end = message.split('\n')
+        assert event_line == 'event: content'
+        assert json.loads(data_line[len('data: '):]) == {'content': 'a\nb'}
+        assert blank == '' and end == ''
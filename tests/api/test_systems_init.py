@@ -270,3 +270,47 @@ class TestEdgeCases:
                 f.result()
 
         assert len(errors) == 0, f"Errors during concurrent reset: {errors}"
+
+
+class TestEvolutionRunnerStartup:
+    """Test the API server consumes queued molecule completions."""
+
+    def setup_method(self):
+        from src.api.main import reset_systems
+        reset_systems()
+
+    def teardown_method(self):
+        from src.api.main import reset_systems
+        reset_systems()
+
+    def test_runner_started_and_stopped_with_server(self, temp_corp_path, monkeypatch):
+        """Startup runs the evolution runner; shutdown releases its lock."""
+        import asyncio
+        from src.api.main import (
+            get_evolution_runner, shutdown_evolution_runner, startup_evolution_runner
+        )
+        monkeypatch.setenv('AI_CORP_PATH', temp_corp_path)
+
+        asyncio.run(startup_evolution_runner())
+        runner = get_evolution_runner()
+        assert runner.get_stats()['running'] is True
+
+        asyncio.run(shutdown_evolution_runner())
+        assert runner.get_stats()['running'] is False
+        assert runner.lock_holder() is None
+
+    def test_defers_to_dedicated_daemon(self, temp_corp_path, monkeypatch):
+        """A running `ai-corp learning daemon` keeps the server from starting another."""
+        import asyncio
+        from src.api.main import get_evolution_runner, startup_evolution_runner
+        from src.core.evolution_runner import EvolutionRunner
+        from src.core.learning import get_learning_system
+        monkeypatch.setenv('AI_CORP_PATH', temp_corp_path)
+
+        daemon = EvolutionRunner(get_learning_system(Path(temp_corp_path)))
+        assert daemon.acquire_lock()
+        try:
+            asyncio.run(startup_evolution_runner())
+            assert get_evolution_runner().get_stats()['running'] is False
+        finally:
+            daemon.release_lock()
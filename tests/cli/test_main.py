@@ -24,6 +24,7 @@ from src.cli.main import (
     cmd_molecules,
     cmd_hooks,
     cmd_gates,
+    cmd_learning,
     main
 )
 
@@ -759,3 +760,29 @@ class TestCLIEdgeCases:
 
             captured = capsys.readouterr()
             assert len(captured.out) > 0
+
+
+class TestCmdLearning:
+    """Tests for cmd_learning command."""
+
+    def test_rebuild_refuses_while_daemon_runs(self, initialized_corp, capsys):
+        """Test rebuild waits for the daemon lock and releases it afterwards."""
+        from src.core.evolution_runner import EvolutionRunner
+        from src.core.learning import get_learning_system
+
+        with patch.dict(os.environ, {'AI_CORP_PATH': initialized_corp}):
+            daemon = EvolutionRunner(get_learning_system(Path(initialized_corp)))
+            assert daemon.acquire_lock()
+            args = argparse.Namespace(action='rebuild', medium_days=7, slow_days=30)
+            try:
+                cmd_learning(args)
+            finally:
+                daemon.release_lock()
+            captured = capsys.readouterr()
+            assert f'pid {os.getpid()}' in captured.out
+            assert 'Rebuilding' not in captured.out
+
+            cmd_learning(args)
+            assert 'Rebuilding' in capsys.readouterr().out
+            assert daemon.acquire_lock()
+            daemon.release_lock()
@@ -0,0 +1,141 @@
+"""
+Tests for ConversationSummarizer, including incremental per-thread state.
+"""
+
+import pytest
+
+from src.core.memory import ConversationSummarizer
+
+
+def _messages(count, start=0):
+    contents = ["hello there", "we decided to ship friday", "never deploy on weekends", "ok"]
+    return [
+        {
+            'id': f'msg-{i}',
+            'role': 'ceo' if i % 2 == 0 else 'assistant',
+            'content': contents[i % len(contents)]
+        }
+        for i in range(start, start + count)
+    ]
+
+
+class CountingSummarizer(ConversationSummarizer):
+    """Records how many messages are classified"""
+
+    def __init__(self):
+        super().__init__()
+        self.classified = 0
+
+    def detect_important_message(self, message):
+        self.classified += 1
+        return super().detect_important_message(message)
+
+
+class TestDetectImportantMessage:
+    """Tests for the combined importance regex"""
+
+    def test_decision_and_preference(self):
+        """Test both groups are reported when present"""
+        summarizer = ConversationSummarizer()
+        result = summarizer.detect_important_message(
+            {'content': "Always test first. Approved."}
+        )
+        assert result['importance_type'] == 'decision'
+        assert result['reasons'] == ['matches decision pattern', 'matches preference pattern']
+
+    def test_preference_only(self):
+        """Test preference-only messages"""
+        summarizer = ConversationSummarizer()
+        result = summarizer.detect_important_message({'content': "Don't use tabs"})
+        assert result['importance_type'] == 'preference'
+
+    def test_plain_message(self):
+        """Test messages without patterns are not important"""
+        summarizer = ConversationSummarizer()
+        assert summarizer.detect_important_message({'content': "hello"})['is_important'] is False
+
+
+class TestIncrementalThreadState:
+    """Tests for per-thread incremental classification and summaries"""
+
+    def test_only_new_messages_classified(self):
+        """Test repeated context builds scan only appended messages"""
+        summarizer = CountingSummarizer()
+        messages = _messages(500)
+
+        first = summarizer.get_conversation_context(messages, max_recent=10, thread_id='t1')
+        assert summarizer.classified == 500
+
+        messages.extend(_messages(2, start=500))
+        second = summarizer.get_conversation_context(messages, max_recent=10, thread_id='t1')
+        assert summarizer.classified == 502
+
+        stateless = ConversationSummarizer().get_conversation_context(messages, max_recent=10)
+        assert second == stateless
+        assert first != second
+
+    def test_rewritten_history_rebuilds_state(self):
+        """Test a changed thread history is reclassified from scratch"""
+        summarizer = CountingSummarizer()
+        messages = _messages(30)
+        summarizer.extract_important_messages(messages, thread_id='t1')
+
+        replaced = _messages(20, start=100)
+        important = summarizer.extract_important_messages(replaced, thread_id='t1')
+
+        assert summarizer.classified == 50
+        assert important == ConversationSummarizer().extract_important_messages(replaced)
+
+    def test_rolling_summary_advances_incrementally(self):
+        """Test only newly aged-out messages are summarized"""
+        summarizer = ConversationSummarizer()
+        segments = []
+        original = summarizer._summarize
+
+        def recording(messages, *args, **kwargs):
+            segments.append(len(messages))
+            return original(messages, *args, **kwargs)
+
+        summarizer._summarize = recording
+        messages = _messages(30)
+
+        result = summarizer.create_rolling_summary(messages, threshold=20, keep_recent=10, thread_id='t1')
+        assert result['summarized_count'] == 20
+        assert result['needs_update'] is True
+
+        unchanged = summarizer.create_rolling_summary(messages, threshold=20, keep_recent=10, thread_id='t1')
+        assert unchanged['needs_update'] is False
+        assert unchanged['summary'] == result['summary']
+
+        messages.extend(_messages(3, start=30))
+        rolled = summarizer.create_rolling_summary(messages, threshold=20, keep_recent=10, thread_id='t1')
+
+        assert segments == [20, 3]
+        assert rolled['summarized_count'] == 23
+        assert rolled['summary'].startswith(result['summary'])
+        assert summarizer.get_thread_state('t1').summarized_count == 23
+
+    def test_fallback_rolling_summary_is_bounded(self):
+        """Test the extractive rolling summary stops growing at the token target"""
+        summarizer = ConversationSummarizer()
+        messages = _messages(30)
+        summarizer.create_rolling_summary(messages, threshold=20, keep_recent=10, thread_id='t1')
+        for turn in range(40):
+            messages.extend(_messages(3, start=len(messages)))
+            rolled = summarizer.create_rolling_summary(
+                messages, threshold=20, keep_recent=10, thread_id='t1'
+            )
+
+        summary = rolled['summary']
+        assert len(summary) <= ConversationSummarizer.DEFAULT_SUMMARY_MAX_TOKENS * 4
+        assert summary.splitlines()[:2] == ["Started with: hello there...", "[earlier summary trimmed]"]
+        assert summary.splitlines()[-1].startswith("  •")
+
+    def test_thread_states_are_bounded(self):
+        """Test least recently used thread states are evicted"""
+        summarizer = ConversationSummarizer(max_thread_states=2)
+        for thread_id in ('a', 'b', 'c'):
+            summarizer.extract_important_messages(_messages(3), thread_id=thread_id)
+
+        assert summarizer.get_thread_state('a') is None
+        assert summarizer.get_thread_state('c') is not None
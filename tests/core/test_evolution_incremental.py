@@ -0,0 +1,201 @@
+"""
+Tests for the Evolution Daemon's incremental cycles: watermarks, running
+aggregates and the full rebuild.
+"""
+
+from datetime import datetime
+
+import pytest
+import yaml
+
+from src.core.learning import (
+    EvolutionDaemon, Insight, InsightStore, InsightType, KnowledgeDistiller,
+    MetaLearner, OutcomeTracker, Pattern, PatternLibrary, PatternType
+)
+from src.core.memory import OrganizationalMemory
+
+
+def _make_daemon(base):
+    insights = InsightStore(base / "learning" / "insights")
+    outcomes = OutcomeTracker(base / "learning" / "outcomes")
+    return EvolutionDaemon(
+        base_path=base,
+        insight_store=insights,
+        outcome_tracker=outcomes,
+        pattern_library=PatternLibrary(base / "learning" / "patterns"),
+        meta_learner=MetaLearner(base / "learning" / "meta"),
+        distiller=KnowledgeDistiller(insights, outcomes),
+    )
+
+
+def _insight(insight_id, content, tags, validated=False):
+    return Insight(
+        id=insight_id,
+        type=InsightType.FAILURE_PATTERN,
+        content=content,
+        confidence=0.6,
+        source_molecule='MOL-001',
+        tags=tags,
+        validated=validated,
+        created_at=datetime.now().isoformat(),
+    )
+
+
+def _record_outcome(memory, molecule_id, outcome, blockers=None):
+    memory.record_molecule_outcome(
+        molecule_id=molecule_id,
+        title=f"Build {molecule_id}",
+        description="",
+        outcome=outcome,
+        task_type='feature',
+        approach='standard',
+        departments=['engineering'],
+        blockers=blockers,
+    )
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    return _make_daemon(tmp_path)
+
+
+class TestIncrementalMediumCycle:
+    """Tests for the medium cycle reading only new insights"""
+
+    def test_pattern_discovered_across_cycles(self, daemon):
+        """Test insights from separate cycles still group into a pattern"""
+        daemon.insights.add(_insight('INS-1', "build timed out", ['build']))
+        first = daemon.run_medium_cycle()
+        assert first.patterns_discovered == 0
+        assert daemon.watermarks['insights_medium'] == 1
+
+        daemon.insights.add(_insight('INS-2', "build timed out again", ['build']))
+        second = daemon.run_medium_cycle()
+        assert second.errors == []
+        assert second.patterns_discovered == 1
+        assert daemon.watermarks['insights_medium'] == 2
+
+        # Nothing new: nothing to discover
+        assert daemon.run_medium_cycle().patterns_discovered == 0
+
+    def test_validated_insight_counted_once(self, daemon):
+        """Test an insight credits matching patterns once, even when validated late"""
+        daemon.patterns.add(Pattern(
+            id='PAT-1', name="build", description="", type=PatternType.FAILURE,
+            triggers=['build'], occurrences=1,
+        ))
+        daemon.insights.add(_insight('INS-1', "build timed out", ['build']))
+
+        daemon.run_medium_cycle()
+        assert daemon.patterns.get('PAT-1').occurrences == 1
+        assert 'INS-1' in daemon.aggregates['pending_validation']
+
+        daemon.insights.validate('INS-1', success=True)
+        daemon.run_medium_cycle()
+        daemon.run_medium_cycle()
+        assert daemon.patterns.get('PAT-1').occurrences == 2
+        assert daemon.aggregates['pending_validation'] == {}
+
+    def test_state_survives_restart(self, daemon, tmp_path):
+        """Test watermarks and aggregates are reloaded from disk"""
+        daemon.insights.add(_insight('INS-1', "build timed out", ['build']))
+        daemon.run_medium_cycle()
+
+        reloaded = _make_daemon(tmp_path)
+        assert reloaded.watermarks['insights_medium'] == 1
+        assert reloaded.aggregates['insight_groups'] == daemon.aggregates['insight_groups']
+
+
+class TestIncrementalSlowCycle:
+    """Tests for consolidation and lesson synthesis on deltas"""
+
+    def test_duplicates_consolidated_once(self, daemon):
+        """Test a duplicate is folded into the primary only on its first cycle"""
+        daemon.insights.add(_insight('INS-1', "Retry the build", ['build']))
+        daemon.insights.add(_insight('INS-2', "retry the build.", ['build']))
+
+        assert daemon._consolidate_insights() == 1
+        assert daemon._consolidate_insights() == 0
+
+        reopened = InsightStore(daemon.insights.store_path)
+        assert reopened.get('INS-1').validation_count == 1
+        assert reopened.get('INS-2').validated is True
+
+    def test_lesson_counts_merged_incrementally(self, daemon, tmp_path):
+        """Test outcomes recorded between cycles extend the category counts"""
+        memory = OrganizationalMemory(tmp_path)
+        _record_outcome(memory, 'MOL-1', 'success', ['flaky tests'])
+        _record_outcome(memory, 'MOL-2', 'failed', ['Flaky tests'])
+        daemon.run_slow_cycle()
+
+        stats = daemon.aggregates['lesson_categories']['feature']
+        assert (stats['outcomes'], stats['successes'], stats['failures']) == (2, 1, 1)
+        assert stats['blockers'] == {'flaky tests': 2}
+
+        _record_outcome(memory, 'MOL-3', 'success')
+        daemon.run_slow_cycle()
+
+        stats = daemon.aggregates['lesson_categories']['feature']
+        assert (stats['outcomes'], stats['successes']) == (3, 2)
+        assert daemon.watermarks['memory_outcomes_offset'] == memory.outcomes_file.stat().st_size
+        patterns = [i['pattern'] for i in memory.get_synthesized_insights(category='feature')]
+        assert "Tasks in 'feature' have moderate success rate (67%)" in patterns
+
+    def test_record_count_watermark_converted(self, daemon, tmp_path):
+        """Test a watermark saved as a record count resumes after those records"""
+        memory = OrganizationalMemory(tmp_path)
+        _record_outcome(memory, 'MOL-1', 'success')
+        _record_outcome(memory, 'MOL-2', 'success')
+        _record_outcome(memory, 'MOL-3', 'failed')
+        daemon.watermarks.pop('memory_outcomes_offset')
+        daemon.watermarks['memory_outcomes'] = 2
+
+        daemon.run_slow_cycle()
+
+        stats = daemon.aggregates['lesson_categories']['feature']
+        assert (stats['outcomes'], stats['failures']) == (1, 1)
+        assert 'memory_outcomes' not in daemon.watermarks
+
+    def test_rebuild_recomputes_aggregates(self, daemon, tmp_path):
+        """Test a rebuild reproduces the aggregates from full history"""
+        memory = OrganizationalMemory(tmp_path)
+        _record_outcome(memory, 'MOL-1', 'success')
+        _record_outcome(memory, 'MOL-2', 'failed')
+        daemon.run_slow_cycle()
+        expected = daemon.aggregates['lesson_categories']
+
+        daemon.aggregates['lesson_categories'] = {'feature': {'items': 99}}
+        results = daemon.rebuild()
+
+        assert [r.errors for r in results] == [[], []]
+        assert daemon.aggregates['lesson_categories'] == expected
+
+
+class TestOrganizationalMemoryLogs:
+    """Tests for the append-only outcome and lesson logs"""
+
+    def test_records_since_reads_from_offset(self, tmp_path):
+        """Test the watermark is a byte offset and only new lines are returned"""
+        memory = OrganizationalMemory(tmp_path)
+        _record_outcome(memory, 'MOL-1', 'success')
+        records, position = memory.get_records_since('outcomes')
+        assert [r['molecule_id'] for r in records] == ['MOL-1']
+        assert position == memory.outcomes_file.stat().st_size
+
+        _record_outcome(memory, 'MOL-2', 'failed')
+        records, position = memory.get_records_since('outcomes', position)
+        assert [r['molecule_id'] for r in records] == ['MOL-2']
+        assert memory.get_records_since('outcomes', position) == ([], position)
+
+    def test_migrates_legacy_yaml(self, tmp_path):
+        """Test a YAML outcomes list becomes the JSON-lines log once"""
+        memory = OrganizationalMemory(tmp_path)
+        legacy = memory.memory_path / "molecule_outcomes.yaml"
+        legacy.write_text(yaml.dump([{'id': 'outcome-MOL-0', 'molecule_id': 'MOL-0',
+                                      'task_type': 'feature', 'outcome': 'success'}]))
+
+        _record_outcome(memory, 'MOL-1', 'success')
+        records, _ = memory.get_records_since('outcomes')
+        assert [r['molecule_id'] for r in records] == ['MOL-0', 'MOL-1']
+        assert not legacy.exists()
+        assert legacy.with_suffix('.yaml.migrated').exists()
@@ -0,0 +1,194 @@
+"""
+Tests for the evolution runner: the completion event queue, budgeted
+ticks and the single-daemon lock.
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.core import learning as learning_module
+from src.core.evolution_runner import CycleBudget, EvolutionRunner, LearningEventQueue, _BudgetClock
+from src.core.learning import CycleType, LearningSystem
+from src.core.molecule import MoleculeEngine
+
+
+def _molecule_data(molecule_id):
+    return {'id': molecule_id, 'type': 'feature', 'status': 'completed', 'steps': []}
+
+
+@pytest.fixture
+def learning(tmp_path):
+    return LearningSystem(tmp_path)
+
+
+class TestLearningEventQueue:
+    """Tests for LearningEventQueue"""
+
+    def test_peek_and_ack(self, tmp_path):
+        """Test events stay queued until acknowledged"""
+        queue = LearningEventQueue(tmp_path / "events.jsonl")
+        for i in range(3):
+            queue.put(_molecule_data(f"MOL-{i}"))
+
+        batch = queue.peek(2)
+        assert [e['molecule']['id'] for e in batch] == ['MOL-0', 'MOL-1']
+        assert queue.peek(2)[0]['molecule']['id'] == 'MOL-0'   # Not acked yet
+
+        queue.ack(batch[-1]['_end'])
+        assert queue.pending() == 1
+        assert [e['molecule']['id'] for e in queue.peek(10)] == ['MOL-2']
+
+    def test_drained_queue_is_compacted(self, tmp_path):
+        """Test the file is truncated once every event is acknowledged"""
+        queue = LearningEventQueue(tmp_path / "events.jsonl")
+        queue.put(_molecule_data("MOL-1"))
+        queue.ack(queue.peek(10)[-1]['_end'])
+
+        assert queue.events_file.stat().st_size == 0
+        queue.put(_molecule_data("MOL-2"))
+        assert [e['molecule']['id'] for e in queue.peek(10)] == ['MOL-2']
+
+
+class TestEvolutionRunner:
+    """Tests for EvolutionRunner"""
+
+    def test_tick_drains_queue_through_fast_cycle(self, learning):
+        """Test queued completions are distilled in batches by one tick"""
+        for i in range(5):
+            learning.queue_molecule_complete(_molecule_data(f"MOL-{i}"))
+
+        runner = EvolutionRunner(learning, budget=CycleBudget(batch_size=2, yield_seconds=0))
+        results = runner.tick()
+
+        fast = [r for r in results if r.cycle_type == CycleType.FAST]
+        assert [r.molecules_processed for r in fast] == [2, 2, 1]
+        assert runner.events_processed == 5
+        assert learning.completion_queue.pending() == 0
+        # Medium and slow cycles were due on the first tick
+        assert {r.cycle_type for r in results} == {CycleType.FAST, CycleType.MEDIUM, CycleType.SLOW}
+
+    def test_cycles_wait_for_their_schedule(self, learning):
+        """Test a second tick runs nothing when no work is due"""
+        runner = EvolutionRunner(learning)
+        runner.tick()
+        assert runner.tick() == []
+
+    def test_backlog_uses_catchup_batches(self, learning):
+        """Test a backed-up queue is drained in catch-up sized batches"""
+        for i in range(6):
+            learning.queue_molecule_complete(_molecule_data(f"MOL-{i}"))
+
+        runner = EvolutionRunner(learning, budget=CycleBudget(
+            batch_size=2, catchup_batch_size=5, yield_seconds=0
+        ))
+        fast = [r for r in runner.tick() if r.cycle_type == CycleType.FAST]
+        assert [r.molecules_processed for r in fast] == [5, 1]
+
+    def test_catchup_batch_distills_on_pool(self, learning, monkeypatch):
+        """Test a catch-up batch goes through a pool capped by the budget"""
+        monkeypatch.setattr(learning_module, 'PARALLEL_DISTILL_MIN_BATCH', 4)
+        pool_sizes = []
+
+        class RecordingPool(learning_module.ProcessPoolExecutor):
+            def __init__(self, max_workers=None, mp_context=None):
+                pool_sizes.append((max_workers, mp_context.get_start_method()))
+                super().__init__(max_workers=max_workers, mp_context=mp_context)
+
+        monkeypatch.setattr(learning_module, 'ProcessPoolExecutor', RecordingPool)
+        for i in range(5):
+            learning.queue_molecule_complete(_molecule_data(f"MOL-{i}"))
+
+        runner = EvolutionRunner(learning, budget=CycleBudget(
+            batch_size=2, catchup_batch_size=5, max_distill_workers=2, yield_seconds=0
+        ))
+        fast = [r for r in runner.tick() if r.cycle_type == CycleType.FAST]
+
+        assert pool_sizes == [(2, 'spawn')]
+        assert fast[0].molecules_processed == 5 and fast[0].insights_generated > 0
+
+    def test_budget_counts_child_cpu(self):
+        """Test CPU burned by exited worker processes is charged to the tick"""
+        clock = _BudgetClock(CycleBudget(max_cpu_seconds=0.1))
+        subprocess.run([sys.executable, '-c',
+                        'import time\nend = time.process_time() + 0.3\n'
+                        'while time.process_time() < end: pass'], check=True)
+
+        assert clock.cpu_seconds() >= 0.2
+        assert clock.exhausted()
+
+    def test_failed_cycle_keeps_batch_queued(self, learning, monkeypatch):
+        """Test a batch whose fast cycle raised is not acknowledged"""
+        for i in range(2):
+            learning.queue_molecule_complete(_molecule_data(f"MOL-{i}"))
+
+        def broken_distill(*args, **kwargs):
+            raise OSError("insight segment unwritable")
+        monkeypatch.setattr(learning.evolution.distiller, 'distill_batch', broken_distill)
+        runner = EvolutionRunner(learning, budget=CycleBudget(yield_seconds=0))
+
+        results = runner.tick()
+        assert results[0].failed
+        assert learning.completion_queue.pending() == 2
+        assert runner.events_processed == 0
+
+        monkeypatch.undo()
+        runner.tick()
+        assert learning.completion_queue.pending() == 0
+
+    def test_exhausted_budget_defers_work(self, learning):
+        """Test work beyond the budget stays queued for the next tick"""
+        for i in range(4):
+            learning.queue_molecule_complete(_molecule_data(f"MOL-{i}"))
+
+        runner = EvolutionRunner(learning, budget=CycleBudget(max_seconds=0, batch_size=1))
+        results = runner.tick()
+
+        assert [r.cycle_type for r in results] == [CycleType.FAST]
+        assert learning.completion_queue.pending() == 3
+        assert runner.budget_exhausted == 1
+
+    def test_only_one_daemon_per_corp(self, learning, tmp_path):
+        """Test the lock file keeps a second runner out"""
+        first = EvolutionRunner(learning)
+        second = EvolutionRunner(LearningSystem(tmp_path))
+
+        assert first.acquire_lock() is True
+        assert second.acquire_lock() is False
+        assert second.lock_holder() is not None
+
+        first.release_lock()
+        assert second.acquire_lock() is True
+        second.release_lock()
+
+    def test_background_thread(self, learning):
+        """Test start/stop processes queued events off the caller's thread"""
+        learning.queue_molecule_complete(_molecule_data("MOL-1"))
+        runner = EvolutionRunner(learning, poll_interval=0.01)
+        runner.start()
+        try:
+            deadline = time.time() + 10
+            while runner.events_processed < 1 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            runner.stop()
+
+        assert runner.events_processed == 1
+        assert runner.get_stats()['running'] is False
+
+
+class TestMoleculeCompletionQueueing:
+    """Tests for MoleculeEngine handing completions to the queue"""
+
+    def test_completion_is_queued_not_distilled(self, learning, tmp_path):
+        """Test completing a molecule only enqueues an event"""
+        engine = MoleculeEngine(tmp_path, learning_system=learning)
+        molecule = engine.create_molecule(
+            name="Queued", description="", created_by="tester"
+        )
+        engine._move_to_completed(molecule)
+
+        assert learning.completion_queue.pending() == 1
+        assert learning.insights.get_all() == []
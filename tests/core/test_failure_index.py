@@ -0,0 +1,111 @@
+"""
+Tests for the failure index (MinHash similar-failure lookup) and
+RalphModeExecutor's persisted failure store.
+"""
+
+import pytest
+
+from src.core.failure_index import (
+    FailureIndex, minhash_signature, signature_similarity, failure_shingles
+)
+from src.core.learning import (
+    KnowledgeDistiller, InsightStore, OutcomeTracker, PatternLibrary, RalphModeExecutor
+)
+
+
+def _executor(base, persist=True):
+    insights = InsightStore(base / "insights")
+    outcomes = OutcomeTracker(base / "outcomes")
+    return RalphModeExecutor(
+        PatternLibrary(base / "patterns"),
+        KnowledgeDistiller(insights, outcomes),
+        outcomes,
+        store_path=base / "failures" if persist else None,
+    )
+
+
+class TestMinHash:
+    """Tests for error-message fingerprints"""
+
+    def test_numbers_are_folded(self):
+        """Test messages differing only in numbers and ids fingerprint alike"""
+        assert failure_shingles("Timed out after 30s") == failure_shingles("timed out after 45s")
+
+    def test_similarity_tracks_overlap(self):
+        """Test close messages score higher than unrelated ones"""
+        base = minhash_signature("Connection refused by api.example.com while fetching user profile")
+        close = minhash_signature("Connection refused by api.example.com while fetching user settings")
+        unrelated = minhash_signature("Gate criteria check failed: missing tests")
+
+        assert signature_similarity(base, close) > 0.4
+        assert signature_similarity(base, unrelated) < 0.2
+        assert minhash_signature("") == []
+
+
+class TestFailureIndex:
+    """Tests for FailureIndex"""
+
+    def test_ranked_by_similarity_then_recency(self, tmp_path):
+        """Test the closest message wins and ties go to the newest failure"""
+        index = FailureIndex(tmp_path / "index.jsonl")
+        message = "Connection refused by payments service during checkout"
+        index.add('FB-1', 'MOL-1', 'external_dependency', 'ConnectionError', message, '2026-09-01T10:00:00')
+        index.add('FB-2', 'MOL-2', 'external_dependency', 'ConnectionError', message, '2026-09-02T10:00:00')
+        index.add('FB-3', 'MOL-3', 'external_dependency', 'HTTPError', "Service returned 503", '2026-09-03T10:00:00')
+        index.add('FB-4', 'MOL-4', 'validation_error', 'AssertionError', "Tests failed", '2026-09-04T10:00:00')
+
+        matches = index.find_similar('external_dependency', 'ConnectionError', message, exclude_id='FB-2')
+        assert [fid for fid, _ in matches] == ['FB-1']
+
+        matches = index.find_similar('external_dependency', 'ConnectionError', message)
+        assert [fid for fid, _ in matches] == ['FB-2', 'FB-1']
+
+    def test_same_error_type_is_similar(self, tmp_path):
+        """Test a shared error type alone still counts as similar"""
+        index = FailureIndex()
+        index.add('FB-1', 'MOL-1', 'unknown', 'KeyError', "missing key 'name'", '2026-09-01T10:00:00')
+
+        assert [fid for fid, _ in index.find_similar('logic_error', 'KeyError', "other text")] == ['FB-1']
+        assert index.find_similar('logic_error', 'ValueError', "other text") == []
+
+    def test_reloads_from_file(self, tmp_path):
+        """Test the index survives a restart"""
+        FailureIndex(tmp_path / "index.jsonl").add(
+            'FB-1', 'MOL-1', 'timeout', 'TimeoutError', "step timed out", '2026-09-01T10:00:00'
+        )
+        reloaded = FailureIndex(tmp_path / "index.jsonl")
+        assert 'FB-1' in reloaded
+        assert reloaded.find_similar('timeout', 'TimeoutError', "step timed out")[0][0] == 'FB-1'
+
+
+class TestRalphFailureStore:
+    """Tests for RalphModeExecutor's persisted failures"""
+
+    def test_similar_failures_across_restart(self, tmp_path):
+        """Test failures recorded by one executor are found by the next"""
+        executor = _executor(tmp_path)
+        executor.record_failure('MOL-1', 'build', 1, 'TimeoutError', "build timed out after 300s")
+
+        restarted = _executor(tmp_path)
+        assert len(restarted.failure_store['MOL-1']) == 1
+
+        current = restarted.record_failure('MOL-2', 'build', 1, 'TimeoutError', "build timed out after 600s")
+        similar = restarted._find_similar_failures(current)
+        assert [f.molecule_id for f in similar] == ['MOL-1']
+
+    def test_rebuilds_missing_index(self, tmp_path):
+        """Test failures are re-indexed when the index file is lost"""
+        _executor(tmp_path).record_failure('MOL-1', 'deploy', 1, 'HTTPError', "api returned 502")
+        (tmp_path / "failures" / "index.jsonl").unlink()
+
+        restarted = _executor(tmp_path)
+        assert len(restarted.failure_index) == 1
+        assert (tmp_path / "failures" / "index.jsonl").exists()
+
+    def test_in_memory_without_store_path(self, tmp_path):
+        """Test an executor without a store path writes nothing"""
+        executor = _executor(tmp_path, persist=False)
+        executor.record_failure('MOL-1', 'build', 1, 'TimeoutError', "timed out")
+
+        assert not (tmp_path / "failures").exists()
+        assert len(executor.failure_index) == 1
@@ -0,0 +1,218 @@
+"""
+Tests for the insight hash index (exact and SimHash near-duplicate
+lookup) and InsightStore's monthly segments.
+"""
+
+import yaml
+import pytest
+
+from src.core.insight_index import (
+    InsightHashIndex, content_digest, content_fingerprint, simhash, hamming_distance,
+    MAX_SIMILAR_DISTANCE
+)
+from src.core import learning
+from src.core.learning import Insight, InsightStore, InsightType
+
+
+LONG_TEXT = (
+    "Molecule type 'feature' failed at step 'build' with TimeoutError: the build "
+    "timed out after waiting for the artifact cache to respond"
+)
+
+
+def _insight(insight_id, content, created_at='2026-09-15T10:00:00'):
+    return Insight(
+        id=insight_id,
+        type=InsightType.FAILURE_PATTERN,
+        content=content,
+        confidence=0.6,
+        source_molecule='MOL-001',
+        created_at=created_at,
+    )
+
+
+class TestFingerprints:
+    """Tests for content digests and SimHash"""
+
+    def test_digest_ignores_case_and_punctuation(self):
+        """Test normalization before hashing"""
+        assert content_digest("Use  Retries!") == content_digest("use retries")
+        assert content_digest("use retries") != content_digest("use caching")
+
+    def test_simhash_distance_tracks_similarity(self):
+        """Test a one-word edit stays close while different text is far"""
+        base = simhash(LONG_TEXT)
+        reworded = simhash(LONG_TEXT.replace('artifact', 'package'))
+        unrelated = simhash("Step 'deploy' actually depends on ['test', 'build']")
+
+        assert hamming_distance(base, reworded) <= MAX_SIMILAR_DISTANCE
+        assert hamming_distance(base, unrelated) > MAX_SIMILAR_DISTANCE
+
+
+class TestInsightHashIndex:
+    """Tests for InsightHashIndex"""
+
+    def test_exact_and_similar_lookup(self, tmp_path):
+        """Test exact digests and band-indexed near matches"""
+        index = InsightHashIndex(tmp_path / "index.jsonl")
+        index.add('INS-1', '2026-09', LONG_TEXT)
+        index.add('INS-2', '2026-09', "Molecule type 'bug' succeeded with 3 steps")
+
+        assert index.find_exact(LONG_TEXT.upper()) == 'INS-1'
+        assert index.find_exact("something else") is None
+
+        similar = index.find_similar(LONG_TEXT.replace('artifact', 'package'))
+        assert [insight_id for insight_id, _ in similar] == ['INS-1']
+
+    def test_reloads_from_file(self, tmp_path):
+        """Test the index survives a restart"""
+        index = InsightHashIndex(tmp_path / "index.jsonl")
+        index.add('INS-1', '2026-08', "first")
+        index.add('INS-2', '2026-09', "first")
+
+        reloaded = InsightHashIndex(tmp_path / "index.jsonl")
+        assert reloaded.month_of('INS-2') == '2026-09'
+        assert reloaded.months() == ['2026-08', '2026-09']
+        assert reloaded.duplicate_groups() == [['INS-1', 'INS-2']]
+
+    def test_add_many_with_precomputed_fingerprints(self, tmp_path):
+        """Test a batch is appended in one write and matches single adds"""
+        index = InsightHashIndex(tmp_path / "index.jsonl")
+        entries = [('INS-1', '2026-09', LONG_TEXT), ('INS-2', '2026-09', "other")]
+        index.add_many(entries, [content_fingerprint(c) for _, _, c in entries])
+
+        assert len((tmp_path / "index.jsonl").read_text().splitlines()) == 2
+        digest, fingerprint = content_fingerprint(LONG_TEXT)
+        assert index.find_exact("", digest) == 'INS-1'
+        assert index.find_similar("", fingerprint=fingerprint)[0] == ('INS-1', 0)
+
+    def test_in_memory_index(self, tmp_path):
+        """Test an index without a file writes nothing"""
+        index = InsightHashIndex()
+        index.add('INS-1', '', LONG_TEXT)
+        assert index.find_exact(LONG_TEXT) == 'INS-1'
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestInsightSegments:
+    """Tests for InsightStore monthly segments"""
+
+    def test_insights_packed_by_month(self, tmp_path):
+        """Test insights go to one segment file per month"""
+        store = InsightStore(tmp_path / "insights")
+        store.add(_insight('INS-1', "aug insight", created_at='2026-08-01T09:00:00'))
+        store.add(_insight('INS-2', "sep insight one"))
+        store.add(_insight('INS-3', "sep insight two"))
+
+        segments = sorted(p.name for p in (tmp_path / "insights" / "segments").glob("*.jsonl"))
+        assert segments == ['2026-08.jsonl', '2026-09.jsonl']
+
+    def test_get_loads_only_its_segment(self, tmp_path):
+        """Test a lookup reads one segment, not the whole store"""
+        store = InsightStore(tmp_path / "insights")
+        store.add(_insight('INS-1', "aug insight", created_at='2026-08-01T09:00:00'))
+        store.add(_insight('INS-2', "sep insight"))
+
+        reopened = InsightStore(tmp_path / "insights")
+        assert reopened.get('INS-2').content == "sep insight"
+        assert set(reopened._segment_offsets) == {'2026-09'}
+        assert len(reopened.get_all()) == 2
+
+    def test_validation_persists(self, tmp_path):
+        """Test a validated insight's new state wins on reload"""
+        store = InsightStore(tmp_path / "insights")
+        store.add(_insight('INS-1', "use retries"))
+        store.validate('INS-1', success=True)
+
+        reopened = InsightStore(tmp_path / "insights")
+        insight = reopened.get('INS-1')
+        assert insight.validated is True
+        assert insight.validation_count == 1
+        assert len(reopened.get_all()) == 1
+
+    def test_follows_other_writers(self, tmp_path):
+        """Test a store sees insights another process added or validated after it loaded"""
+        reader = InsightStore(tmp_path / "insights")
+        writer = InsightStore(tmp_path / "insights")
+        writer.add(_insight('INS-1', "use retries"))
+        assert reader.get('INS-1').content == "use retries"
+
+        writer.add(_insight('INS-2', "use caching"))
+        writer.validate('INS-1', success=True)
+        assert reader.get('INS-1').validated is True
+        assert [i.id for i in reader.get_all()] == ['INS-1', 'INS-2']
+        assert reader.is_duplicate(_insight('INS-3', "Use caching."))
+
+    def test_validations_compact_segment(self, tmp_path, monkeypatch):
+        """Test superseded lines are dropped once they pass the slack"""
+        monkeypatch.setattr(learning, 'SEGMENT_COMPACT_SLACK', 4)
+        store = InsightStore(tmp_path / "insights")
+        store.add(_insight('INS-1', "use retries"))
+        store.add(_insight('INS-2', "use caching"))
+        for _ in range(5):
+            store.validate('INS-1', success=True)
+
+        segment = tmp_path / "insights" / "segments" / "2026-09.jsonl"
+        assert len(segment.read_text().splitlines()) == 2
+
+        reopened = InsightStore(tmp_path / "insights")
+        assert reopened.get('INS-1').validation_count == 5
+        assert [i.id for i in reopened.get_all()] == ['INS-1', 'INS-2']
+
+    def test_near_duplicate_detection(self, tmp_path):
+        """Test is_duplicate only counts near matches when asked"""
+        store = InsightStore(tmp_path / "insights")
+        store.add(_insight('INS-1', LONG_TEXT))
+        reworded = _insight('INS-2', LONG_TEXT.replace('artifact', 'package'))
+
+        assert store.is_duplicate(reworded) is False
+        assert store.is_duplicate(reworded, max_distance=MAX_SIMILAR_DISTANCE) is True
+        assert [i.id for i in store.find_similar(reworded.content)] == ['INS-1']
+
+    def test_migrates_legacy_yaml_files(self, tmp_path):
+        """Test per-insight YAML files are packed into segments once"""
+        root = tmp_path / "insights"
+        month_dir = root / "INS-202"
+        month_dir.mkdir(parents=True)
+        insight = _insight('INS-20260915100000-abcdef', "legacy insight")
+        with open(month_dir / f"{insight.id}.yaml", 'w') as f:
+            yaml.dump(insight.to_dict(), f)
+        with open(root / "index.yaml", 'w') as f:
+            yaml.dump({'insights': [insight.id]}, f)
+
+        store = InsightStore(root)
+        assert store.get(insight.id).content == "legacy insight"
+        assert store.is_duplicate(_insight('INS-X', "Legacy insight."))
+        assert (root / "index.yaml.migrated").exists()
+
+    def test_interrupted_migration_is_redone(self, tmp_path, monkeypatch):
+        """Test a failed migration leaves no live index and succeeds on retry"""
+        root = tmp_path / "insights"
+        month_dir = root / "INS-202"
+        month_dir.mkdir(parents=True)
+        ids = ['INS-20260915100000-aaaaaa', 'INS-20260915100000-bbbbbb']
+        for n, insight_id in enumerate(ids):
+            with open(month_dir / f"{insight_id}.yaml", 'w') as f:
+                yaml.dump(_insight(insight_id, f"legacy insight {n}").to_dict(), f)
+        with open(root / "index.yaml", 'w') as f:
+            yaml.dump({'insights': ids}, f)
+
+        original = Insight.from_dict
+        calls = []
+
+        def flaky_from_dict(data):
+            calls.append(data['id'])
+            if len(calls) == 2:
+                raise OSError("disk went away")
+            return original(data)
+
+        monkeypatch.setattr(Insight, 'from_dict', staticmethod(flaky_from_dict))
+        with pytest.raises(OSError):
+            InsightStore(root)
+        assert not (root / "index.jsonl").exists()
+        assert (root / "index.yaml").exists()
+
+        monkeypatch.undo()
+        store = InsightStore(root)
+        assert [i.id for i in store.get_all()] == ids
+        assert (root / "index.yaml.migrated").exists()
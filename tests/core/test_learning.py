@@ -13,8 +13,10 @@ Tests cover:
 - ContextSynthesizer: context understanding (Phase 2)
 """
 
+import os
 import pytest
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -431,6 +433,24 @@ class TestPatternLibrary:
         assert len(matches) == 1
         assert matches[0].name == "Python Pattern"
 
+    def test_matchers_built_once_without_triggers(self, pattern_library, monkeypatch):
+        """Test an empty trigger automaton is reused, not rebuilt per match"""
+        pattern_library.add(Pattern(
+            id="PAT-001",
+            name="Backend Pattern",
+            description="Requirement-only",
+            type=PatternType.SUCCESS,
+            context_requirements={"layer": "backend"},
+            confidence=0.8
+        ))
+        builds = []
+        build = pattern_library._build_matchers
+        monkeypatch.setattr(pattern_library, '_build_matchers', lambda: builds.append(1) or build())
+
+        for _ in range(3):
+            assert [p.id for p in pattern_library.match({"layer": "backend"})] == ["PAT-001"]
+        assert len(builds) == 1
+
     def test_apply_pattern_updates_confidence(self, pattern_library):
         """Test that applying a pattern updates confidence"""
         pattern_library.add(Pattern(
@@ -541,6 +561,32 @@ class TestMetaLearner:
         # Pattern library should have higher weight (100% success vs 0%)
         assert weights.get("pattern_library", 0) > weights.get("entity_graph", 0)
 
+    def test_outcomes_are_checkpointed_not_saved_each_time(self, temp_dir):
+        """Test outcomes stay in memory until a checkpoint is due"""
+        meta = MetaLearner(temp_dir / "meta")
+        for _ in range(3):
+            meta.record_outcome("feature", "worker-1", True, 60, ["pattern_library"])
+        assert not (temp_dir / "meta" / "source_effectiveness.yaml").exists()
+
+        assert meta.checkpoint() is True
+        assert meta.checkpoint() is False   # Nothing new to write
+        assert (temp_dir / "meta" / "source_effectiveness.yaml").exists()
+
+        meta.checkpoint_interval = 0
+        meta.record_outcome("feature", "worker-1", False, 60, ["pattern_library"])
+        assert MetaLearner(temp_dir / "meta").get_source_effectiveness("pattern_library")[1] == 4
+
+    def test_success_rate_decays_after_warmup(self, meta_learner):
+        """Test old outcomes lose weight once the running-mean window is full"""
+        for _ in range(200):
+            meta_learner.record_outcome("feature", "worker-1", True, 60, ["pattern_library"])
+        for _ in range(50):
+            meta_learner.record_outcome("feature", "worker-1", False, 60, ["pattern_library"])
+
+        rate, sample = meta_learner.get_source_effectiveness("pattern_library")
+        assert sample == 250
+        assert rate < 0.5   # A plain running mean would still be 0.8
+
     def test_confidence_calibration(self, meta_learner):
         """Test confidence calibration"""
         # Initially, calibration should return same value (no data)
@@ -613,6 +659,48 @@ class TestKnowledgeDistiller:
 
         assert any(i.type == InsightType.TIME_ESTIMATE for i in insights)
 
+    def test_distill_batch_dedups_and_commits_once(self, insight_store, outcome_tracker):
+        """Test a batch is deduplicated in memory and written in one go"""
+        distiller = KnowledgeDistiller(insight_store, outcome_tracker)
+        molecules = [
+            {'id': f'MOL-{i}', 'type': 'feature', 'status': 'completed', 'steps': []}
+            for i in range(5)
+        ] + [{'id': 'MOL-BUG', 'type': 'bugfix', 'status': 'completed', 'steps': []}]
+
+        insights = distiller.distill_batch(molecules, workers=1)
+
+        # Identical success insights from the five features collapse to one
+        assert [i.source_molecule for i in insights] == ['MOL-0', 'MOL-BUG']
+        segments = list((insight_store.segments_path).glob("*.jsonl"))
+        assert sum(len(p.read_text().splitlines()) for p in segments) == 2
+        assert distiller.distill_batch(molecules, workers=1) == []
+
+    def test_distill_batch_on_process_pool(self, insight_store, outcome_tracker, monkeypatch):
+        """Test a large batch distilled on a pool matches in-process results"""
+        monkeypatch.setattr('src.core.learning.PARALLEL_DISTILL_MIN_BATCH', 4)
+        worker_pids = set()
+
+        class RecordingPool(ProcessPoolExecutor):
+            def map(self, fn, *iterables, **kwargs):
+                results = list(super().map(fn, *iterables, **kwargs))
+                worker_pids.update(self._processes)
+                return results
+
+        monkeypatch.setattr('src.core.learning.ProcessPoolExecutor', RecordingPool)
+        distiller = KnowledgeDistiller(insight_store, outcome_tracker)
+        molecules = [
+            {'id': f'MOL-{i}', 'type': f'type-{i}', 'status': 'completed', 'steps': []}
+            for i in range(8)
+        ] + [{'id': 'MOL-BAD', 'type': 'feature', 'status': 'completed', 'steps': None}]
+
+        errors = []
+        insights = distiller.distill_batch(molecules, workers=2, errors=errors)
+
+        assert [i.source_molecule for i in insights] == [f'MOL-{i}' for i in range(8)]
+        assert len(errors) == 1 and 'MOL-BAD' in errors[0]
+        assert len(InsightStore(insight_store.store_path).get_all()) == 8
+        assert worker_pids and os.getpid() not in worker_pids
+
     def test_distill_from_ralph_execution(self, insight_store, outcome_tracker):
         """Test extracting insights from Ralph Mode execution"""
         distiller = KnowledgeDistiller(insight_store, outcome_tracker)
@@ -839,6 +927,22 @@ class TestLearningSystem:
         assert 'attention_weights' in context
         assert 'recommendations' in context
 
+    def test_context_for_task_cached_until_patterns_change(self, learning_system):
+        """Test repeated lookups hit the cache and a new pattern invalidates it"""
+        first = learning_system.get_context_for_task("feature", ["python"], "engineering")
+        first['recommendations'].append("Caller's own note")
+        second = learning_system.get_context_for_task("feature", ["python"], "engineering")
+        assert second['patterns'] == first['patterns']
+        assert second['recommendations'] == []
+        assert learning_system.get_stats()['context_cache']['hits'] == 1
+
+        learning_system.patterns.add(Pattern(
+            id="PAT-CACHE", name="Cache Pattern", description="", type=PatternType.SUCCESS,
+            triggers=["python"], recommendation="Pin dependencies", confidence=0.9, promoted=True
+        ))
+        third = learning_system.get_context_for_task("feature", ["python"], "engineering")
+        assert third['recommendations'] == ["Pin dependencies"]
+
     def test_record_task_outcome(self, learning_system):
         """Test recording task outcomes"""
         learning_system.record_task_outcome(
@@ -997,6 +1101,7 @@ class TestPersistence:
             duration=3600,
             sources_used=["pattern_library"]
         )
+        assert meta1.checkpoint() is True
 
         # Create new meta-learner pointing to same path
         meta2 = MetaLearner(temp_dir / "meta")
@@ -1213,6 +1318,29 @@ class TestContextSynthesizer:
         assert isinstance(context.gaps, list)
         assert isinstance(context.recommendations, list)
 
+    def test_synthesis_cached_per_task_signature(self, synthesizer):
+        """Test similar work items reuse one synthesis until a store changes"""
+        first = synthesizer.synthesize(
+            "Build a feature", {'task_type': 'feature', 'capabilities': ['python', 'api']}
+        )
+        again = synthesizer.synthesize(
+            "Another item", {'task_type': 'feature', 'capabilities': ['api', 'python', 'api']}
+        )
+        first.gaps.append("Caller's own gap")
+        assert again.predictions == first.predictions
+        assert "Caller's own gap" not in again.gaps
+        assert synthesizer.get_cache_stats()['hits'] == 1
+
+        synthesizer.insights.add(Insight(
+            id="INS-SIG-1", type=InsightType.FAILURE_PATTERN, content="feature failed",
+            confidence=0.8, source_molecule="MOL-1", tags=['feature']
+        ))
+        rebuilt = synthesizer.synthesize(
+            "Build a feature", {'task_type': 'feature', 'capabilities': ['python', 'api']}
+        )
+        assert synthesizer.get_cache_stats()['misses'] == 2
+        assert "0%" in rebuilt.predictions[-1].description
+
     def test_synthesize_with_patterns(self, synthesizer, temp_dir):
         """Test synthesis includes patterns"""
         # Add a pattern
@@ -0,0 +1,91 @@
+"""
+Tests for prompt-prefix caching in LLM requests and the API backend.
+"""
+
+from types import SimpleNamespace
+
+from src.core.llm import ClaudeAPIBackend, LLMRequest
+
+
+class FakeMessages:
+    """Records create() calls and returns canned usage"""
+
+    def __init__(self, usages):
+        self.usages = list(usages)
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text='ok')],
+            model=kwargs['model'],
+            stop_reason='end_turn',
+            usage=self.usages.pop(0)
+        )
+
+
+def make_backend(usages):
+    backend = ClaudeAPIBackend()
+    backend._client = SimpleNamespace(messages=FakeMessages(usages))
+    return backend
+
+
+class TestSystemPromptPrefix:
+    """Tests for splitting system prompts into stable and dynamic parts"""
+
+    def test_full_system_prompt_puts_prefix_first(self):
+        request = LLMRequest(prompt='hi', system_prompt_prefix='STATIC', system_prompt='dynamic')
+        assert request.full_system_prompt() == 'STATIC\n\ndynamic'
+
+    def test_full_system_prompt_without_prefix(self):
+        assert LLMRequest(prompt='hi', system_prompt='only').full_system_prompt() == 'only'
+        assert LLMRequest(prompt='hi', system_prompt_prefix='only').full_system_prompt() == 'only'
+        assert LLMRequest(prompt='hi').full_system_prompt() is None
+
+
+class TestClaudeAPIPromptCaching:
+    """Tests for cache_control markers and cached-token accounting"""
+
+    def test_prefix_sent_as_cached_block(self):
+        backend = make_backend([SimpleNamespace(input_tokens=10, output_tokens=5)])
+        backend.execute(LLMRequest(prompt='hi', system_prompt_prefix='STATIC', system_prompt='dynamic'))
+
+        system = backend._client.messages.calls[0]['system']
+        assert system == [
+            {'type': 'text', 'text': 'STATIC', 'cache_control': {'type': 'ephemeral'}},
+            {'type': 'text', 'text': 'dynamic'},
+        ]
+
+    def test_plain_system_prompt_unchanged(self):
+        backend = make_backend([SimpleNamespace(input_tokens=10, output_tokens=5)])
+        backend.execute(LLMRequest(prompt='hi', system_prompt='plain'))
+
+        assert backend._client.messages.calls[0]['system'] == 'plain'
+
+    def test_cached_tokens_tracked(self):
+        backend = make_backend([
+            SimpleNamespace(input_tokens=50, output_tokens=10,
+                            cache_creation_input_tokens=2000, cache_read_input_tokens=0),
+            SimpleNamespace(input_tokens=40, output_tokens=10,
+                            cache_creation_input_tokens=0, cache_read_input_tokens=2000),
+        ])
+        request = LLMRequest(prompt='hi', system_prompt_prefix='STATIC')
+        first = backend.execute(request)
+        second = backend.execute(request)
+
+        assert first.metadata['usage']['cache_creation_input_tokens'] == 2000
+        assert second.metadata['usage']['cache_read_input_tokens'] == 2000
+
+        stats = backend.get_usage_stats()
+        assert stats['requests'] == 2
+        assert stats['cache_read_input_tokens'] == 2000
+        assert stats['cache_hit_rate'] == round(2000 / 4090, 3)
+
+    def test_usage_without_cache_fields(self):
+        """Older SDK usage objects lack cache fields"""
+        backend = make_backend([SimpleNamespace(input_tokens=10, output_tokens=5)])
+        backend.execute(LLMRequest(prompt='hi'))
+
+        stats = backend.get_usage_stats()
+        assert stats['cache_read_input_tokens'] == 0
+        assert stats['cache_hit_rate'] == 0.0
@@ -0,0 +1,231 @@
+"""
+Tests for usage metering: records, rollups, persistence, call tagging
+and metered Ralph Mode budgets.
+"""
+
+import io
+import json
+
+import pytest
+
+from src.core import llm, metering
+from src.core.learning import BudgetTracker
+from src.core.llm import ClaudeCodeBackend, LLMRequest
+from src.core.metering import (
+    UsageMeter, UsageRecord, estimate_cost, record_llm_call, usage_scope
+)
+
+
+@pytest.fixture
+def meter(tmp_path):
+    meter = UsageMeter(tmp_path, flush_interval=60)
+    yield meter
+    meter.close()
+
+
+@pytest.fixture
+def active_meter(meter):
+    previous = metering._active_meter
+    metering._active_meter = meter
+    yield meter
+    metering._active_meter = previous
+
+
+class TestEstimateCost:
+    """Tests for model pricing"""
+
+    def test_prices_by_model_family(self):
+        """Test input, output and cache tokens are priced per family"""
+        assert estimate_cost('claude-sonnet-4-5', 1_000_000, 1_000_000) == pytest.approx(18.0)
+        assert estimate_cost('claude-haiku-4-5', cache_read_input_tokens=1_000_000) == pytest.approx(0.10)
+        assert estimate_cost('unknown-model', 1000, 1000) == 0.0
+
+
+class TestUsageMeter:
+    """Tests for UsageMeter"""
+
+    def test_rollups_are_immediate(self, meter):
+        """Test a record is queryable before it is flushed"""
+        meter.record_call('claude_api', 'claude-sonnet-4-5',
+                          usage={'input_tokens': 1000, 'output_tokens': 200},
+                          latency_ms=850, tags={'agent_id': 'worker-1', 'molecule_id': 'MOL-1'})
+        meter.record_call('claude_api', 'claude-sonnet-4-5', usage={'input_tokens': 500},
+                          success=False, tags={'agent_id': 'worker-2', 'molecule_id': 'MOL-1'})
+
+        assert meter.get_molecule_cost('MOL-1') == pytest.approx(estimate_cost('sonnet', 1500, 200))
+        assert [r['key'] for r in meter.rollup('agent')] == ['worker-1', 'worker-2']
+        summary = meter.get_summary()
+        assert summary['calls'] == 2
+        assert summary['failures'] == 1
+        assert summary['buffered_records'] == 2
+        assert not meter.log_file.exists()
+
+    def test_flush_and_reload(self, tmp_path, meter):
+        """Test flushed records and rollups survive a restart"""
+        meter.record_call('claude_api', 'claude-opus-4-5', usage={'output_tokens': 100},
+                          tags={'molecule_id': 'MOL-1'})
+        assert meter.flush() == 1
+        assert len(meter.log_file.read_text().splitlines()) == 1
+
+        reloaded = UsageMeter(tmp_path)
+        assert reloaded.get_molecule_cost('MOL-1') == pytest.approx(0.0025)
+        assert reloaded.get_totals()['calls'] == 1
+
+    def test_replays_log_past_snapshot(self, tmp_path, meter):
+        """Test log lines written after the rollups snapshot are replayed"""
+        meter.record(UsageRecord(backend='claude_api', molecule_id='MOL-1', cost_usd=1.0))
+        meter.flush()
+        with open(meter.log_file, 'a') as f:
+            f.write(json.dumps(UsageRecord(backend='claude_api', molecule_id='MOL-1',
+                                           cost_usd=2.0).to_dict()) + '\n')
+
+        assert UsageMeter(tmp_path).get_molecule_cost('MOL-1') == pytest.approx(3.0)
+
+    def test_concurrent_writers_share_the_log(self, tmp_path):
+        """Test two meters on one log neither lose nor double-count records"""
+        first, second = UsageMeter(tmp_path, flush_interval=60), UsageMeter(tmp_path, flush_interval=60)
+        second.record(UsageRecord(backend='claude_api', molecule_id='M', cost_usd=1.0))
+        second.flush()
+        first.record(UsageRecord(backend='claude_api', molecule_id='M', cost_usd=2.0))
+        first.flush()
+
+        # The later flush folded in the other writer's line
+        assert first.get_molecule_cost('M') == pytest.approx(3.0)
+        assert UsageMeter(tmp_path).get_molecule_cost('M') == pytest.approx(3.0)
+
+        # Interleaved flushes each land exactly once
+        first.record(UsageRecord(backend='claude_api', molecule_id='M', cost_usd=5.0))
+        second.record(UsageRecord(backend='claude_api', molecule_id='M', cost_usd=0.5))
+        second.flush()
+        first.flush()
+        assert UsageMeter(tmp_path).get_molecule_cost('M') == pytest.approx(8.5)
+        first.close()
+        second.close()
+
+    def test_queries_see_other_writers_without_flushing(self, tmp_path, meter):
+        """Test a meter that never flushes still counts spend other processes logged"""
+        writer = UsageMeter(tmp_path, flush_interval=60)
+        writer.record(UsageRecord(backend='claude_api', molecule_id='MOL-1', cost_usd=1.5))
+        assert meter.get_molecule_cost('MOL-1') == 0.0
+
+        writer.flush()
+        assert meter.get_molecule_cost('MOL-1') == pytest.approx(1.5)
+        assert meter.get_totals()['calls'] == 1
+        assert meter.refresh() == 0
+        writer.close()
+
+    def test_hour_rollup_newest_first(self, meter):
+        """Test hourly rollups sort newest first and honour `since`"""
+        for hour in ('2026-10-18T08', '2026-10-18T10', '2026-10-18T09'):
+            meter.record(UsageRecord(backend='claude_code', recorded_at=f"{hour}:15:00"))
+
+        assert [r['key'] for r in meter.rollup('hour')] == [
+            '2026-10-18T10', '2026-10-18T09', '2026-10-18T08'
+        ]
+        assert len(meter.rollup('hour', since='2026-10-18T09')) == 2
+        with pytest.raises(ValueError):
+            meter.rollup('team')
+
+
+class TestCallTagging:
+    """Tests for record_llm_call tags"""
+
+    def test_no_active_meter_is_noop(self):
+        """Test calls are not metered without an active meter"""
+        previous = metering._active_meter
+        metering._active_meter = None
+        try:
+            assert record_llm_call('claude_api', LLMRequest(prompt="hi")) is None
+        finally:
+            metering._active_meter = previous
+
+    def test_scope_tags_override_request_context(self, active_meter):
+        """Test usage_scope tags win and request context fills the gaps"""
+        request = LLMRequest(prompt="hi", context={'agent_id': 'ctx-agent', 'step_id': 'S-1'})
+        with usage_scope(agent_id='worker-1', molecule_id='MOL-1'):
+            with usage_scope(step_id=None):
+                record = record_llm_call('claude_code', request, latency_ms=12.34)
+
+        assert (record.agent_id, record.molecule_id, record.step_id) == ('worker-1', 'MOL-1', 'S-1')
+        assert record.latency_ms == 12.3
+        assert record.model == request.model
+
+
+class _FakeStreamProcess:
+    """Stands in for the Claude CLI emitting stream-json lines"""
+
+    def __init__(self, *args, **kwargs):
+        self.stdin = io.StringIO()
+        self.stdout = iter([
+            json.dumps({'type': 'assistant', 'message': {'content': [{'type': 'text', 'text': 'hi'}]}}) + '\n',
+            json.dumps({'type': 'assistant', 'message': {'content': [{'type': 'text', 'text': 'there'}]}}) + '\n',
+        ])
+        self.stderr = io.StringIO()
+        self.returncode = None
+        self.killed = False
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        if self.returncode is None:
+            self.returncode = 0
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+
+
+class TestStreamingMetering:
+    """Tests for metering streamed Claude Code calls"""
+
+    def test_abandoned_stream_is_metered(self, active_meter, monkeypatch):
+        """Test a stream closed by its consumer is still recorded as a failure"""
+        backend = ClaudeCodeBackend()
+        backend._claude_path = 'claude'
+        monkeypatch.setattr(backend, 'is_available', lambda: True)
+        monkeypatch.setattr(llm.subprocess, 'Popen', _FakeStreamProcess)
+
+        stream = backend.execute_streaming(LLMRequest(prompt="hi"))
+        assert next(stream).event_type == 'content'
+        stream.close()
+
+        summary = active_meter.get_summary()
+        assert summary['calls'] == 1
+        assert summary['failures'] == 1
+
+
+class TestMeteredBudget:
+    """Tests for BudgetTracker backed by a UsageMeter"""
+
+    def test_spend_follows_meter(self, meter):
+        """Test metered calls, manual costs and resets all count"""
+        budget = BudgetTracker(meter)
+        meter.record(UsageRecord(backend='claude_api', molecule_id='MOL-1', cost_usd=0.5))
+        budget.add_cost('MOL-1', 0.25)
+        assert budget.get_spent('MOL-1') == pytest.approx(0.75)
+
+        budget.reset('MOL-1')
+        assert budget.get_spent('MOL-1') == 0.0
+        meter.record(UsageRecord(backend='claude_api', molecule_id='MOL-1', cost_usd=0.1))
+        assert budget.get_spent('MOL-1') == pytest.approx(0.1)
+
+    def test_reset_survives_restart(self, tmp_path, meter):
+        """Test a reset baseline is saved with the meter, not just in memory"""
+        meter.record(UsageRecord(backend='claude_api', molecule_id='MOL-1', cost_usd=2.0))
+        BudgetTracker(meter).reset('MOL-1')
+        meter.flush()
+
+        restarted = UsageMeter(tmp_path, flush_interval=60)
+        budget = BudgetTracker(restarted)
+        assert budget.get_spent('MOL-1') == 0.0
+        budget.add_cost('MOL-1', 0.5)
+        assert budget.get_spent('MOL-1') == pytest.approx(0.5)
+        restarted.close()
+
+    def test_in_memory_without_meter(self):
+        """Test the tracker still works without a meter"""
+        budget = BudgetTracker()
+        budget.add_cost('MOL-1', 1.5)
+        assert budget.get_spent('MOL-1') == 1.5
@@ -0,0 +1,145 @@
+"""
+Tests for src/core/molecule_index.py
+
+Tests the molecule summary index used for paged project listings.
+"""
+
+import threading
+import time
+
+import pytest
+from pathlib import Path
+
+from src.core.molecule import MoleculeEngine, MoleculeStatus, MoleculeStep
+from src.core.molecule_index import MoleculeSummaryIndex, INDEX_COMPACT_SLACK
+
+
+@pytest.fixture
+def engine(temp_corp_path):
+    return MoleculeEngine(Path(temp_corp_path))
+
+
+def make_molecules(engine, count, **kwargs):
+    molecules = []
+    for i in range(count):
+        molecules.append(engine.create_molecule(
+            name=f"Project {i}", description="d", created_by="coo", **kwargs
+        ))
+    return molecules
+
+
+class TestMoleculeSummaryIndex:
+    """Tests for summary recording and paging"""
+
+    def test_pages_newest_first(self, engine):
+        """Test cursor pages cover every molecule exactly once"""
+        created = make_molecules(engine, 7)
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = engine.list_molecule_summaries(cursor=cursor, limit=3)
+            seen.extend(s['id'] for s in page)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(m.id for m in created)
+        updated = [engine.summary_index.get(i)['updated_at'] for i in seen]
+        assert updated == sorted(updated, reverse=True)
+
+    def test_completed_included(self, engine):
+        """Test completed molecules are listed by location and status"""
+        active, done = make_molecules(engine, 2)
+        done.status = MoleculeStatus.COMPLETED
+        engine._move_to_completed(done)
+
+        active_ids = [s['id'] for s in engine.list_molecule_summaries(location='active')[0]]
+        completed = engine.list_molecule_summaries(status='completed')[0]
+
+        assert active_ids == [active.id]
+        assert [s['id'] for s in completed] == [done.id]
+        assert completed[0]['location'] == 'completed'
+
+    def test_filters(self, engine):
+        """Test owner and department filters"""
+        first, second = make_molecules(engine, 2)
+        second.raci.accountable = 'vp_engineering'
+        second.add_step(MoleculeStep.create(name='Build', description='b', department='engineering'))
+        engine._save_molecule(second)
+
+        owned = engine.list_molecule_summaries(owner='vp_engineering')[0]
+        assert [s['id'] for s in owned] == [second.id]
+        assert [s['id'] for s in engine.list_molecule_summaries(department='engineering')[0]] == [second.id]
+        assert engine.list_molecule_summaries(owner='nobody')[0] == []
+
+    def test_updated_since(self, engine):
+        older, newer = make_molecules(engine, 2)
+        newer.updated_at = '2999-01-01T00:00:00'
+        engine._save_molecule(newer)
+
+        page, _ = engine.list_molecule_summaries(updated_since='2999-01-01T00:00:00')
+        assert [s['id'] for s in page] == [newer.id]
+
+    def test_delete_removes_summary(self, engine):
+        molecule, = make_molecules(engine, 1)
+        engine.delete_molecule(molecule.id, cleanup_hooks=False)
+
+        assert engine.summary_index.get(molecule.id) is None
+        assert engine.list_molecule_summaries()[0] == []
+
+    def test_rebuilt_from_files_when_missing(self, engine, temp_corp_path):
+        """Test a corp without an index file is indexed by scanning"""
+        created = make_molecules(engine, 3)
+        index_file = Path(temp_corp_path) / "molecules" / "index.jsonl"
+        index_file.unlink()
+
+        reopened = MoleculeEngine(Path(temp_corp_path))
+        assert reopened.summary_index.count() == 3
+        assert {s['id'] for s in reopened.list_molecule_summaries()[0]} == {m.id for m in created}
+
+    def test_follows_other_instances(self, engine, temp_corp_path):
+        other = MoleculeEngine(Path(temp_corp_path))
+        other.summary_index  # Load before the write
+        molecule, = make_molecules(engine, 1)
+
+        assert other.summary_index.get(molecule.id)['name'] == 'Project 0'
+
+    def test_compaction(self, engine):
+        molecule, = make_molecules(engine, 1)
+        for i in range(INDEX_COMPACT_SLACK + 5):
+            molecule.name = f"Renamed {i}"
+            engine._save_molecule(molecule)
+
+        assert engine.summary_index.get_stats()['index_lines'] <= INDEX_COMPACT_SLACK
+        reopened = MoleculeSummaryIndex(engine.summary_index.index_file)
+        assert reopened.get(molecule.id)['name'] == f"Renamed {INDEX_COMPACT_SLACK + 4}"
+
+    def test_compaction_keeps_concurrent_appends(self, engine, temp_corp_path):
+        """Test an append made while another instance compacts is not lost"""
+        molecule, other_molecule = make_molecules(engine, 2)
+        compacting = engine.summary_index
+        other = MoleculeEngine(Path(temp_corp_path))
+        other.summary_index  # Separate instance, as in another process
+
+        write_all = compacting._write_all
+        started = threading.Event()
+
+        def slow_write_all(summaries):
+            started.set()
+            time.sleep(0.2)
+            write_all(summaries)
+        compacting._write_all = slow_write_all
+
+        def rename_other():
+            started.wait(5)
+            other_molecule.name = "Renamed elsewhere"
+            other._save_molecule(other_molecule)
+        writer = threading.Thread(target=rename_other)
+        writer.start()
+        for i in range(INDEX_COMPACT_SLACK + 5):
+            molecule.name = f"Renamed {i}"
+            engine._save_molecule(molecule)
+        writer.join()
+
+        reopened = MoleculeSummaryIndex(compacting.index_file)
+        assert reopened.get(other_molecule.id)['name'] == "Renamed elsewhere"
+        assert reopened.get(molecule.id)['name'] == f"Renamed {INDEX_COMPACT_SLACK + 4}"
@@ -0,0 +1,173 @@
+"""
+Tests for columnar outcome storage, time-windowed aggregation and the
+append-only outcome log.
+"""
+
+import yaml
+import pytest
+from datetime import datetime, timedelta
+
+from src.core.learning import Outcome, OutcomeTracker, LearningSystem
+from src.core.outcome_columns import OutcomeColumns
+
+
+def _outcome(outcome_id, days_ago, success=True, molecule_type='feature',
+             agent='worker-1', duration=60.0, cost=0.5, molecule_id=None):
+    return Outcome(
+        id=outcome_id,
+        molecule_id=molecule_id or f'MOL-{outcome_id}',
+        molecule_type=molecule_type,
+        success=success,
+        duration_seconds=duration,
+        assigned_to=agent,
+        department='engineering',
+        cost_usd=cost,
+        created_at=(datetime.now() - timedelta(days=days_ago)).isoformat(),
+    )
+
+
+class TestOutcomeColumns:
+    """Tests for OutcomeColumns"""
+
+    def test_rows_stay_time_ordered(self):
+        """Test late outcomes are inserted at their timestamp position"""
+        columns = OutcomeColumns()
+        columns.upsert(_outcome('a', 5))
+        columns.upsert(_outcome('b', 1))
+        columns.upsert(_outcome('c', 3))
+
+        assert list(columns._ids) == ['a', 'c', 'b']
+        assert list(columns._ts) == sorted(columns._ts)
+        assert 'c' in columns
+
+    def test_upsert_replaces_existing_row(self):
+        """Test recording the same ID twice keeps one row"""
+        columns = OutcomeColumns()
+        columns.upsert(_outcome('a', 2, success=False))
+        columns.upsert(_outcome('a', 1, success=True))
+
+        assert len(columns) == 1
+        assert columns.summarize()['successes'] == 1
+
+    def test_summarize_time_window(self):
+        """Test a time window only counts outcomes inside it"""
+        columns = OutcomeColumns()
+        columns.upsert(_outcome('old', 40, success=False, cost=10.0))
+        columns.upsert(_outcome('new1', 2, success=True, duration=100.0, cost=1.0))
+        columns.upsert(_outcome('new2', 1, success=False, duration=20.0, cost=2.0))
+
+        since = (datetime.now() - timedelta(days=30)).timestamp()
+        stats = columns.summarize(since=since)
+        assert stats['total'] == 2
+        assert stats['successes'] == 1
+        assert stats['success_rate'] == pytest.approx(0.5)
+        assert stats['avg_duration'] == pytest.approx(60.0)
+        assert stats['avg_success_duration'] == pytest.approx(100.0)
+        assert stats['total_cost'] == pytest.approx(3.0)
+
+    def test_summarize_filters_and_unknown_values(self):
+        """Test type/agent filters, with unknown values matching nothing"""
+        columns = OutcomeColumns()
+        columns.upsert(_outcome('a', 1, agent='w1', molecule_type='bug'))
+        columns.upsert(_outcome('b', 1, agent='w2', molecule_type='bug', success=False))
+        columns.upsert(_outcome('c', 1, agent='w1', molecule_type='feature'))
+
+        assert columns.summarize(molecule_type='bug')['total'] == 2
+        assert columns.summarize(molecule_type='bug', agent='w1')['total'] == 1
+        assert columns.summarize(agent='nobody')['total'] == 0
+        assert columns.ids_for('agent', 'w1') == ['a', 'c']
+
+    def test_group_by(self):
+        """Test per-type totals in one pass"""
+        columns = OutcomeColumns()
+        for i in range(4):
+            columns.upsert(_outcome(f'f{i}', 1, molecule_type='feature', success=i < 3))
+        columns.upsert(_outcome('b0', 1, molecule_type='bug', duration=30.0))
+
+        groups = columns.group_by('type')
+        assert groups['feature']['total'] == 4
+        assert groups['feature']['success_rate'] == pytest.approx(0.75)
+        assert groups['bug']['avg_duration'] == pytest.approx(30.0)
+
+        with pytest.raises(ValueError):
+            columns.group_by('department')
+
+    def test_percentiles(self):
+        """Test linear-interpolated percentiles"""
+        columns = OutcomeColumns()
+        for i, duration in enumerate([10.0, 20.0, 30.0, 40.0, 50.0]):
+            columns.upsert(_outcome(f'o{i}', 1, duration=duration, success=i != 4))
+
+        result = columns.percentiles('duration', (0, 50, 100))
+        assert result == {0: 10.0, 50: 30.0, 100: 50.0}
+        assert columns.percentiles('duration', (100,), successful_only=True) == {100: 40.0}
+        assert columns.percentiles('duration', molecule_type='none') == {}
+
+    def test_rolling_success_rate(self):
+        """Test each point covers its trailing window"""
+        columns = OutcomeColumns()
+        now = datetime.now().timestamp()
+        for i in range(10):
+            columns.upsert(_outcome(f'o{i}', i + 0.5, success=i >= 5))
+
+        points = columns.rolling_success_rate(
+            window_days=2, step_days=1, since=now - 10 * 86400, until=now
+        )
+        assert len(points) == 10
+        # Latest window holds days 0-1 (both failures), oldest window only successes
+        assert points[-1]['total'] == 2
+        assert points[-1]['success_rate'] == pytest.approx(0.0)
+        assert points[0]['success_rate'] == pytest.approx(1.0)
+        assert sum(p['total'] for p in points) == 19
+
+
+class TestOutcomeTrackerLog:
+    """Tests for the append-only outcome log"""
+
+    def test_outcomes_survive_reload(self, tmp_path):
+        """Test outcomes are read back from the log"""
+        tracker = OutcomeTracker(tmp_path / "outcomes")
+        tracker.record(_outcome('a', 1, molecule_id='MOL-1'))
+        tracker.record(_outcome('b', 1, molecule_id='MOL-1', success=False))
+
+        reloaded = OutcomeTracker(tmp_path / "outcomes")
+        assert reloaded.get('a').success is True
+        assert [o.id for o in reloaded.get_by_molecule('MOL-1')] == ['a', 'b']
+        assert reloaded.get_success_rate('worker-1') == (pytest.approx(0.5), 2)
+        assert not (tmp_path / "outcomes" / "outcomes.yaml").exists()
+
+    def test_picks_up_other_writers(self, tmp_path):
+        """Test a tracker sees outcomes appended by another instance"""
+        reader = OutcomeTracker(tmp_path / "outcomes")
+        writer = OutcomeTracker(tmp_path / "outcomes")
+        writer.record(_outcome('a', 1))
+
+        assert reader.get('a') is not None
+
+    def test_migrates_legacy_yaml(self, tmp_path):
+        """Test outcomes.yaml is converted to the log once"""
+        store = tmp_path / "outcomes"
+        store.mkdir()
+        legacy = {'outcomes': {'a': _outcome('a', 3).to_dict(), 'b': _outcome('b', 1).to_dict()}}
+        with open(store / "outcomes.yaml", 'w') as f:
+            yaml.dump(legacy, f)
+
+        tracker = OutcomeTracker(store)
+        assert set(tracker.outcomes) == {'a', 'b'}
+        assert (store / "outcomes.jsonl").exists()
+        assert (store / "outcomes.yaml.migrated").exists()
+
+    def test_daemon_analysis_uses_time_window(self, tmp_path):
+        """Test slow-cycle analysis counts only outcomes within the period"""
+        system = LearningSystem(tmp_path)
+        tracker = system.outcomes
+        tracker.record(_outcome('old', 60, success=False, molecule_type='bug'))
+        for i in range(3):
+            tracker.record(_outcome(f'n{i}', i + 1, success=i > 0, cost=2.0))
+
+        analysis = system.evolution._analyze_outcomes(30)
+
+        assert analysis['total_outcomes'] == 3
+        assert analysis['success_count'] == 2
+        assert analysis['avg_cost_usd'] == pytest.approx(2.0)
+        assert set(analysis['by_type']) == {'feature'}
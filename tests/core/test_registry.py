@@ -0,0 +1,132 @@
+"""
+Tests for src/core/registry.py
+
+Tests shared store instances and the parsed file cache.
+"""
+
+import os
+import time
+import pytest
+from pathlib import Path
+
+from src.core.registry import (
+    StoreRegistry, get_gate_keeper, get_hook_manager, get_molecule_engine,
+    get_store_registry, load_yaml_file, forget_yaml_file
+)
+from src.core.gate import GateKeeper
+
+
+class TestStoreRegistry:
+    """Tests for shared store instances"""
+
+    def test_same_instance_per_corp(self, temp_corp_path):
+        """Test callers share one manager per corp and kind"""
+        path = Path(temp_corp_path)
+        assert get_hook_manager(path) is get_hook_manager(path / '.')
+        assert get_molecule_engine(path) is get_molecule_engine(str(path))
+        assert get_gate_keeper(path) is not get_hook_manager(path)
+
+    def test_different_corps_not_shared(self, tmp_path):
+        first = get_hook_manager(tmp_path / 'a')
+        second = get_hook_manager(tmp_path / 'b')
+        assert first is not second
+
+    def test_factory_called_once(self, temp_corp_path):
+        registry = StoreRegistry()
+        calls = []
+
+        def factory(path):
+            calls.append(path)
+            return object()
+
+        registry.get('kind', Path(temp_corp_path), factory)
+        registry.get('kind', Path(temp_corp_path), factory)
+        assert len(calls) == 1
+
+    def test_stats_report_cache_sizes(self, temp_corp_path):
+        """Test stats count managers and their cached items"""
+        hooks = get_hook_manager(Path(temp_corp_path))
+        hooks.create_hook('Test', 'role', 'worker-1')
+
+        stats = get_store_registry().get_stats()
+        entry = next(
+            s for s in stats['stores']
+            if s['kind'] == 'hooks' and s['corp_path'] == str(Path(temp_corp_path).resolve())
+        )
+        assert entry['cached_items'] == 1
+        assert stats['managers'] >= 1
+        assert 'hit_rate' in stats['parsed_files']
+
+    def test_stats_report_molecule_summaries(self, temp_corp_path):
+        """Test the molecule engine's summary index counts as its cache"""
+        engine = get_molecule_engine(Path(temp_corp_path))
+        engine.create_molecule(name='Cached', description='d', created_by='coo')
+        engine.list_molecule_summaries()
+
+        entry = next(
+            s for s in get_store_registry().get_stats()['stores']
+            if s['kind'] == 'molecules' and s['corp_path'] == str(Path(temp_corp_path).resolve())
+        )
+        assert entry['cached_items'] == 1
+
+
+class TestParsedFileCache:
+    """Tests for load_yaml_file"""
+
+    def age(self, path, seconds=10):
+        """Backdate a file so it is outside the racy window"""
+        past = time.time() - seconds
+        os.utime(path, (past, past))
+
+    def test_unchanged_file_reused(self, tmp_path):
+        path = tmp_path / 'a.yaml'
+        path.write_text('items: [1, 2]\n')
+        self.age(path)
+
+        first = load_yaml_file(path)
+        first['items'].append(3)  # Callers get a private copy
+
+        assert load_yaml_file(path) == {'items': [1, 2]}
+
+    def test_changed_file_reparsed(self, tmp_path):
+        path = tmp_path / 'a.yaml'
+        path.write_text('value: 1\n')
+        self.age(path, 20)
+        assert load_yaml_file(path) == {'value': 1}
+
+        path.write_text('value: 2\n')
+        self.age(path, 10)
+        assert load_yaml_file(path) == {'value': 2}
+
+    def test_recent_write_not_cached(self, tmp_path):
+        """Test a file inside the racy window is re-read every time"""
+        path = tmp_path / 'a.yaml'
+        path.write_text('value: 1\n')
+        assert load_yaml_file(path) == {'value': 1}
+
+        stat = os.stat(path)
+        path.write_text('value: 2\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # Same mtime and size
+        assert load_yaml_file(path) == {'value': 2}
+
+    def test_forget(self, tmp_path):
+        path = tmp_path / 'a.yaml'
+        path.write_text('value: 1\n')
+        self.age(path)
+        load_yaml_file(path)
+
+        forget_yaml_file(path)
+        path.unlink()
+        with pytest.raises(FileNotFoundError):
+            load_yaml_file(path)
+
+
+class TestGateKeeperDefaults:
+    """Tests for default gate initialization"""
+
+    def test_defaults_created_once(self, temp_corp_path):
+        GateKeeper(Path(temp_corp_path))
+        keeper = GateKeeper(Path(temp_corp_path))
+
+        stages = [g.pipeline_stage for g in keeper.list_gates()]
+        assert len(stages) == len(set(stages))
@@ -0,0 +1,163 @@
+"""
+Tests for array-backed relationship strength storage, decay and ranking.
+"""
+
+import time
+import pytest
+from pathlib import Path
+
+from src.core.entities import (
+    EntityStore, EntityType, Relationship, RelationshipType
+)
+from src.core.graph import EntityGraph
+from src.core.relationship_columns import RelationshipColumns
+
+
+def _rel(rel_id, source, target, strength):
+    rel = Relationship.create(source, target, RelationshipType.COLLEAGUE)
+    rel.id = rel_id
+    rel.strength = strength
+    return rel
+
+
+class TestRelationshipColumns:
+    """Tests for RelationshipColumns"""
+
+    def test_rank_orders_by_strength(self):
+        """Test ranking returns strongest first and honours limit"""
+        columns = RelationshipColumns()
+        for i, strength in enumerate([0.2, 0.9, 0.5, 0.7]):
+            columns.upsert(_rel(f'r{i}', 'a', f'e{i}', strength))
+
+        ids = columns.ids_for_entity('a')
+        assert columns.rank(ids) == ['r1', 'r3', 'r2', 'r0']
+        assert columns.rank(ids, limit=2) == ['r1', 'r3']
+        assert columns.rank(ids, limit=0) == []
+
+    def test_remove_keeps_rows_dense(self):
+        """Test swap-removal keeps IDs and values aligned"""
+        columns = RelationshipColumns()
+        columns.upsert(_rel('r0', 'a', 'b', 0.1))
+        columns.upsert(_rel('r1', 'a', 'c', 0.2))
+        columns.upsert(_rel('r2', 'a', 'd', 0.3))
+
+        assert columns.remove('r0') is True
+        assert len(columns) == 2
+        assert columns.strength('r2') == pytest.approx(0.3)
+        assert columns.ids_for_entity('b') == []
+        assert columns.remove('r0') is False
+
+    def test_exponential_decay_by_elapsed_time(self):
+        """Test strength halves once per half-life regardless of call frequency"""
+        now = time.time()
+        columns = RelationshipColumns()
+        columns.upsert(_rel('r0', 'a', 'b', 0.8), now=now)
+        columns.upsert(_rel('r1', 'a', 'c', 0.0), now=now)
+
+        day = 86400.0
+        assert columns.decay(half_life_days=10, now=now + 5 * day) == 1
+        columns.decay(half_life_days=10, now=now + 10 * day)
+
+        assert columns.strength('r0') == pytest.approx(0.4)
+        assert columns.strength('r1') == 0.0
+
+    def test_strongest_skips_ended_relationships(self):
+        """Test global top-k excludes inactive edges"""
+        columns = RelationshipColumns()
+        ended = _rel('r0', 'a', 'b', 0.9)
+        ended.end()
+        columns.upsert(ended)
+        columns.upsert(_rel('r1', 'c', 'd', 0.5))
+
+        assert columns.strongest(5) == ['r1']
+
+    def test_save_and_load_strengths(self, tmp_path):
+        """Test persisted strengths overlay existing rows"""
+        columns = RelationshipColumns()
+        columns.upsert(_rel('r0', 'a', 'b', 0.25))
+        path = tmp_path / 'strengths.bin'
+        columns.save(path)
+
+        reloaded = RelationshipColumns()
+        reloaded.upsert(_rel('r0', 'a', 'b', 0.9))
+        assert reloaded.load_strengths(path) == 1
+        assert reloaded.strength('r0') == pytest.approx(0.25)
+
+
+class TestEntityStoreRelationships:
+    """Tests for column-backed relationship queries on EntityStore"""
+
+    def test_relationships_for_entity_ranked_with_limit(self, temp_corp_path):
+        """Test per-entity queries use the edge index and strength ranking"""
+        store = EntityStore(Path(temp_corp_path))
+        hub = store.create_entity("Hub", EntityType.PERSON)
+        others = [store.create_entity(f"P{i}", EntityType.PERSON) for i in range(3)]
+
+        for other, strength in zip(others, [0.3, 0.8, 0.5]):
+            rel = store.create_relationship(hub.id, other.id, RelationshipType.COLLEAGUE)
+            rel.strength = strength
+            store.update_relationship(rel)
+
+        top = store.get_relationships_for_entity(hub.id, limit=2)
+        assert [r.target_id for r in top] == [others[1].id, others[2].id]
+        assert store.find_relationship(hub.id, others[0].id) is not None
+        assert store.get_relationships_for_entity(others[0].id, direction="outgoing") == []
+
+    def test_decay_persists_without_yaml_rewrite(self, temp_corp_path):
+        """Test decayed strengths survive a reload"""
+        graph = EntityGraph(Path(temp_corp_path))
+        a = graph.entity_store.create_entity("A", EntityType.PERSON)
+        b = graph.entity_store.create_entity("B", EntityType.PERSON)
+        rel = graph.entity_store.create_relationship(a.id, b.id, RelationshipType.FRIEND)
+
+        yaml_mtime = graph.entity_store.relationships_index.stat().st_mtime_ns
+        columns = graph.entity_store.relationship_columns
+        columns.decay(half_life_days=1, now=time.time() + 86400)
+        graph.entity_store.save_relationship_strengths()
+
+        assert graph.entity_store.relationships_index.stat().st_mtime_ns == yaml_mtime
+
+        reloaded = EntityStore(Path(temp_corp_path))
+        assert reloaded.get_relationship(rel.id).strength == pytest.approx(0.25, abs=0.01)
+
+    def test_decay_updates_cached_relationships(self, temp_corp_path):
+        """Test store decay is visible on cached objects and survives a save"""
+        store = EntityStore(Path(temp_corp_path))
+        a = store.create_entity("A", EntityType.PERSON)
+        b = store.create_entity("B", EntityType.PERSON)
+        rel = store.create_relationship(a.id, b.id, RelationshipType.FRIEND)
+        before = rel.strength
+
+        store.relationship_columns._decayed_at[0] -= 86400
+        store.decay_relationship_strengths(half_life_days=1)
+        assert store.get_relationship(rel.id).strength == pytest.approx(before / 2, abs=0.01)
+
+        store._save()
+        assert store.relationship_columns.strength(rel.id) == pytest.approx(before / 2, abs=0.01)
+
+    def test_ended_relationship_leaves_active_column(self, temp_corp_path):
+        """Test ending a relationship object and saving updates the columns"""
+        graph = EntityGraph(Path(temp_corp_path))
+        store = graph.entity_store
+        a = store.create_entity("A", EntityType.PERSON)
+        b = store.create_entity("B", EntityType.PERSON)
+        rel = store.create_relationship(a.id, b.id, RelationshipType.FRIEND)
+        assert [r.id for r in graph.get_strongest_relationships(limit=5)] == [rel.id]
+
+        rel.end()
+        store._save()
+        assert graph.get_strongest_relationships(limit=5) == []
+
+    def test_merge_repoints_edge_index(self, temp_corp_path):
+        """Test merging entities moves relationships in the edge index"""
+        graph = EntityGraph(Path(temp_corp_path))
+        a = graph.entity_store.create_entity("A", EntityType.PERSON)
+        dup = graph.entity_store.create_entity("A dup", EntityType.PERSON)
+        c = graph.entity_store.create_entity("C", EntityType.PERSON)
+        graph.entity_store.create_relationship(dup.id, c.id, RelationshipType.FRIEND)
+
+        graph.merge_entities(a.id, dup.id)
+
+        rels = graph.entity_store.get_relationships_for_entity(a.id)
+        assert [r.target_id for r in rels] == [c.id]
+        assert graph.get_strongest_relationships(limit=1)[0].source_id == a.id
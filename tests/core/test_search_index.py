@@ -0,0 +1,235 @@
+"""
+Tests for the shared N-gram search index and its use by the
+entity and interaction stores.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.core.search_index import NgramIndex
+from src.core.entities import EntityStore, EntityType, EntitySource
+from src.core.interactions import (
+    Interaction, InteractionType, InteractionDirection, InteractionStore
+)
+
+
+class TestNgramIndex:
+    """Tests for NgramIndex"""
+
+    def test_substring_search(self):
+        """Test infix queries match like a linear `in` scan"""
+        index = NgramIndex()
+        index.add('a', ['Tim Cook'])
+        index.add('b', ['Timothy Smith'])
+        index.add('c', ['Jane Doe'])
+
+        assert index.search('tim') == ['a', 'b']
+        assert index.search('mith') == ['b']
+        assert index.search('COOK') == ['a']
+        assert index.search('xyz') == []
+
+    def test_prefix_search(self):
+        """Test word-prefix queries for typeahead"""
+        index = NgramIndex()
+        index.add('a', ['John Smith'])
+        index.add('b', ['Blacksmith Inc'])
+
+        assert index.search_prefix('smi') == ['a']
+        assert index.search('smi') == ['a', 'b']
+
+    def test_short_query_falls_back_to_scan(self):
+        """Test queries shorter than the gram size still match"""
+        index = NgramIndex()
+        index.add('a', ['Al'])
+        index.add('b', ['Bob'])
+
+        assert index.search('l') == ['a']
+        assert index.search('') == ['a', 'b']
+        assert index.search_prefix('b') == ['b']
+
+    def test_matches_do_not_span_fields(self):
+        """Test substrings across two fields are not matched"""
+        index = NgramIndex()
+        index.add('a', ['abc', 'def'])
+
+        assert index.search('cde') == []
+        assert index.search('def') == ['a']
+
+    def test_replace_and_remove(self):
+        """Test incremental maintenance keeps postings consistent"""
+        index = NgramIndex()
+        index.add('a', ['alpha'])
+        index.add('a', ['beta'])
+
+        assert index.search('alp') == []
+        assert index.search('bet') == ['a']
+
+        assert index.remove('a') is True
+        assert index.search('bet') == []
+        assert index.get_stats()['grams'] == 0
+        assert index.remove('a') is False
+
+    def test_results_in_insertion_order(self):
+        """Test results are ordered by insertion, with limit applied"""
+        index = NgramIndex()
+        for i in range(10):
+            index.add(f'doc-{i}', [f'shared text {i}'])
+
+        assert index.search('shared', limit=3) == ['doc-0', 'doc-1', 'doc-2']
+
+
+class TestEntityStoreSearch:
+    """Tests for index-backed entity lookups"""
+
+    @pytest.fixture
+    def store(self, temp_corp_path):
+        return EntityStore(Path(temp_corp_path))
+
+    def test_search_entities_uses_name_and_aliases(self, store):
+        """Test search matches names, descriptions, and alias values"""
+        tim = store.create_entity("Tim Cook", EntityType.PERSON, description="CEO")
+        store.add_alias(tim.id, "tim@apple.com", "email", EntitySource.MANUAL)
+        store.create_entity("Jane Doe", EntityType.PERSON)
+
+        assert [e.id for e in store.search_entities("cook")] == [tim.id]
+        assert [e.id for e in store.search_entities("apple.com")] == [tim.id]
+        assert [e.id for e in store.search_entities("ceo")] == [tim.id]
+        assert store.search_entities("cook", entity_type=EntityType.ORGANIZATION) == []
+
+    def test_find_by_any_alias(self, store):
+        """Test partial alias lookup through the alias index"""
+        tim = store.create_entity("Tim", EntityType.PERSON)
+        store.add_alias(tim.id, "tim@apple.com", "email", EntitySource.MANUAL)
+        store.add_alias(tim.id, "Tim@Apple.com", "email", EntitySource.MANUAL)
+
+        assert [e.id for e in store.find_by_any_alias("apple")] == [tim.id]
+        assert store.find_by_any_alias("google") == []
+
+    def test_index_follows_updates_and_deletes(self, store):
+        """Test renames and deletes are reflected in search"""
+        entity = store.create_entity("Old Name", EntityType.PERSON)
+        entity.name = "New Name"
+        store.update_entity(entity)
+
+        assert store.search_entities("old") == []
+        assert [e.id for e in store.search_entities("new")] == [entity.id]
+
+        store.delete_entity(entity.id)
+        assert store.search_entities("new") == []
+
+    def test_index_rebuilt_on_load(self, store, temp_corp_path):
+        """Test a fresh store can search persisted entities"""
+        entity = store.create_entity("Persisted Person", EntityType.PERSON)
+
+        reloaded = EntityStore(Path(temp_corp_path))
+        assert [e.id for e in reloaded.typeahead("pers")] == [entity.id]
+
+    def test_typeahead_ranks_by_interaction_count(self, store):
+        """Test typeahead results are ordered by interaction count"""
+        quiet = store.create_entity("Sam Quiet", EntityType.PERSON)
+        busy = store.create_entity("Sam Busy", EntityType.PERSON)
+        busy.interaction_count = 10
+        store.update_entity(busy)
+
+        assert [e.id for e in store.typeahead("sam")] == [busy.id, quiet.id]
+        assert store.typeahead("am") == []
+
+
+class TestInteractionStoreSearch:
+    """Tests for index-backed interaction search"""
+
+    def test_search_after_update(self, temp_corp_path):
+        """Test search reflects subject changes made through update()"""
+        store = InteractionStore(Path(temp_corp_path))
+        interaction = Interaction.create(
+            interaction_type=InteractionType.EMAIL,
+            source=EntitySource.GMAIL,
+            direction=InteractionDirection.INCOMING,
+            subject="Quarterly planning"
+        )
+        store.add(interaction)
+
+        assert [i.id for i in store.search("planning")] == [interaction.id]
+
+        interaction.subject = "Budget review"
+        store.update(interaction)
+
+        assert store.search("planning") == []
+        assert [i.id for i in store.search("budget")] == [interaction.id]
+
+
+class TestInteractionTimeIndex:
+    """Tests for the timeline, type and token indexes on InteractionStore"""
+
+    @pytest.fixture
+    def store(self, temp_corp_path):
+        return InteractionStore(Path(temp_corp_path))
+
+    def _add(self, store, timestamp, subject="", interaction_type=InteractionType.EMAIL):
+        interaction = Interaction.create(
+            interaction_type=interaction_type,
+            source=EntitySource.GMAIL,
+            direction=InteractionDirection.INCOMING,
+            timestamp=timestamp,
+            subject=subject
+        )
+        return store.add(interaction)
+
+    def test_date_range_is_inclusive_and_ordered(self, store):
+        """Test bisect range queries include both end days, newest first"""
+        a = self._add(store, "2024-01-01T09:00:00")
+        b = self._add(store, "2024-01-02T23:59:59")
+        self._add(store, "2024-01-03T00:00:00")
+
+        results = store.get_in_date_range("2024-01-01", "2024-01-02")
+        assert [i.id for i in results] == [b.id, a.id]
+
+    def test_recent_by_type(self, store):
+        """Test get_recent uses the per-type timeline"""
+        from datetime import datetime, timedelta
+        now = datetime.utcnow()
+        self._add(store, (now - timedelta(days=30)).isoformat())
+        recent = self._add(store, (now - timedelta(days=1)).isoformat())
+        meeting = self._add(
+            store, (now - timedelta(hours=1)).isoformat(),
+            interaction_type=InteractionType.MEETING
+        )
+
+        assert [i.id for i in store.get_recent(days=7)] == [meeting.id, recent.id]
+        assert [i.id for i in store.get_recent(days=7, interaction_type=InteractionType.EMAIL)] == [recent.id]
+        assert len(store.get_recent(days=7, limit=1)) == 1
+
+    def test_timeline_follows_timestamp_updates(self, store):
+        """Test re-indexing moves an interaction within the timeline"""
+        interaction = self._add(store, "2024-01-01T00:00:00")
+        interaction.timestamp = "2024-06-01T00:00:00"
+        store.update(interaction)
+
+        assert store.get_in_date_range("2024-01-01", "2024-01-31") == []
+        assert [i.id for i in store.get_in_date_range("2024-06-01", "2024-06-01")] == [interaction.id]
+
+    def test_token_search_and_reload(self, store, temp_corp_path):
+        """Test word queries match in any order, including after reload"""
+        match = self._add(store, "2024-01-01T00:00:00", subject="Budget review for Q3")
+        self._add(store, "2024-01-02T00:00:00", subject="Budget only")
+
+        assert [i.id for i in store.search_terms("q3 budget")] == [match.id]
+
+        reloaded = InteractionStore(Path(temp_corp_path))
+        assert [i.id for i in reloaded.search_terms("review budget")] == [match.id]
+        assert len(reloaded.get_in_date_range("2024-01-01", "2024-12-31")) == 2
+
+    def test_action_items_index(self, store):
+        """Test only interactions with action items are visited"""
+        interaction = Interaction.create(
+            interaction_type=InteractionType.EMAIL,
+            source=EntitySource.GMAIL,
+            direction=InteractionDirection.INCOMING,
+            subject="Follow up"
+        )
+        interaction.add_action_item("Send deck")
+        store.add(interaction)
+        self._add(store, "2024-01-01T00:00:00")
+
+        items = store.get_action_items()
+        assert [item['interaction_id'] for item in items] == [interaction.id]
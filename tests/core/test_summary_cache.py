@@ -0,0 +1,119 @@
+"""
+Tests for memoized entity profiles and relationship summaries.
+"""
+
+import pytest
+from pathlib import Path
+
+from src.core.graph import EntityGraph
+from src.core.entities import EntityType, EntitySource, RelationshipType
+from src.core.entity_summarizer import SummaryCache, SummaryScope
+from src.core.interactions import Interaction, InteractionType, InteractionDirection
+
+
+@pytest.fixture
+def graph(temp_corp_path):
+    return EntityGraph(Path(temp_corp_path))
+
+
+def _add_interaction(graph, participants):
+    interaction = Interaction.create(
+        interaction_type=InteractionType.EMAIL,
+        source=EntitySource.GMAIL,
+        direction=InteractionDirection.INCOMING,
+        subject="Sync",
+        participants=participants
+    )
+    return graph.interaction_store.add(interaction)
+
+
+class TestSummaryCache:
+    """Tests for the SummaryCache container"""
+
+    def test_hit_requires_matching_versions(self):
+        """Test entries are only reused for identical input versions"""
+        cache = SummaryCache()
+        cache.put('k', (1, 0), 'value', '9999-12-31')
+
+        assert cache.get('k', (1, 0)) == 'value'
+        assert cache.get('k', (2, 0)) is None
+        assert cache.get('k', (1, 0)) is None  # Evicted on mismatch
+        assert cache.get_stats()['hits'] == 1
+        assert cache.get_stats()['misses'] == 2
+
+    def test_expired_entries_miss(self):
+        """Test wall-clock validity still bounds reuse"""
+        cache = SummaryCache()
+        cache.put('k', (0,), 'value', '2000-01-01')
+
+        assert cache.get('k', (0,)) is None
+
+    def test_lru_bound(self):
+        """Test the cache evicts least recently used entries"""
+        cache = SummaryCache(max_entries=2)
+        cache.put('a', (0,), 1, '9999-12-31')
+        cache.put('b', (0,), 2, '9999-12-31')
+        cache.get('a', (0,))
+        cache.put('c', (0,), 3, '9999-12-31')
+
+        assert cache.get('b', (0,)) is None
+        assert cache.get('a', (0,)) == 1
+
+
+class TestSummarizerMemoization:
+    """Tests for dependency-based invalidation in EntitySummarizer"""
+
+    def test_profile_reused_until_entity_changes(self, graph):
+        """Test profiles are rebuilt only after update_entity"""
+        entity = graph.entity_store.create_entity("Tim", EntityType.PERSON)
+
+        first = graph.summarizer.generate_entity_profile(entity.id)
+        assert graph.summarizer.generate_entity_profile(entity.id) is first
+
+        entity.tags.append("investor")
+        graph.entity_store.update_entity(entity)
+
+        rebuilt = graph.summarizer.generate_entity_profile(entity.id)
+        assert rebuilt is not first
+        assert "Categories: investor" in rebuilt.key_facts
+
+    def test_profile_invalidated_by_new_interaction(self, graph):
+        """Test adding an interaction invalidates its participants' profiles"""
+        entity = graph.entity_store.create_entity("Tim", EntityType.PERSON)
+        other = graph.entity_store.create_entity("Jane", EntityType.PERSON)
+
+        tim_profile = graph.summarizer.generate_entity_profile(entity.id)
+        jane_profile = graph.summarizer.generate_entity_profile(other.id)
+
+        _add_interaction(graph, [entity.id])
+
+        assert graph.summarizer.generate_entity_profile(entity.id) is not tim_profile
+        assert graph.summarizer.generate_entity_profile(other.id) is jane_profile
+
+    def test_relationship_summary_invalidated_by_relationship_change(self, graph):
+        """Test relationship changes invalidate pairwise summaries"""
+        a = graph.entity_store.create_entity("A", EntityType.PERSON)
+        b = graph.entity_store.create_entity("B", EntityType.PERSON)
+
+        first = graph.summarizer.generate_relationship_summary(a.id, b.id, SummaryScope.RECENT)
+        assert graph.summarizer.generate_relationship_summary(
+            a.id, b.id, SummaryScope.RECENT
+        ) is first
+
+        graph.entity_store.create_relationship(a.id, b.id, RelationshipType.COLLEAGUE)
+
+        rebuilt = graph.summarizer.generate_relationship_summary(a.id, b.id, SummaryScope.RECENT)
+        assert rebuilt is not first
+        assert "colleague" in rebuilt.content
+
+    def test_statistics_report_hit_rate(self, graph):
+        """Test get_statistics exposes cache counters"""
+        a = graph.entity_store.create_entity("A", EntityType.PERSON)
+        b = graph.entity_store.create_entity("B", EntityType.PERSON)
+
+        graph.get_context_for_agent([a.id, b.id], agent_level=3)
+        graph.get_context_for_agent([a.id, b.id], agent_level=3)
+
+        stats = graph.get_statistics()['summary_cache']
+        assert stats['hits'] > 0
+        assert 0 < stats['hit_rate'] <= 1
@@ -0,0 +1,123 @@
+"""
+Tests for src/core/threads.py
+
+Tests the append-only conversation thread store.
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+from src.core.threads import ConversationThreadStore, CATALOG_COMPACT_SLACK
+
+
+def make_header(thread_id, title="Planning", **extra):
+    header = {
+        'id': thread_id,
+        'title': title,
+        'created_at': '2024-01-01T00:00:00',
+        'updated_at': '2024-01-01T00:00:00',
+        'status': 'active',
+        'tags': [],
+        'messages': [],
+        'linked_molecules': [],
+        'summary': '',
+        'key_decisions': [],
+    }
+    header.update(extra)
+    return header
+
+
+def make_message(content, timestamp='2024-01-02T00:00:00'):
+    return {'id': f'msg-{content[:8]}', 'role': 'user', 'content': content, 'timestamp': timestamp}
+
+
+class TestConversationThreadStore:
+    """Tests for thread storage and the catalog"""
+
+    @pytest.fixture
+    def store(self, temp_corp_path):
+        return ConversationThreadStore(Path(temp_corp_path) / "threads")
+
+    def test_append_and_read(self, store):
+        """Test messages are appended to the log and read back in order"""
+        store.create(make_header('thread-1'))
+        store.append_message('thread-1', make_message('first'))
+        store.append_message('thread-1', make_message('second', '2024-01-03T00:00:00'))
+
+        thread = store.get('thread-1')
+        assert [m['content'] for m in thread['messages']] == ['first', 'second']
+        assert thread['updated_at'] == '2024-01-03T00:00:00'
+        assert 'messages' not in json.loads((store.store_path / 'thread-1' / 'header.json').read_text())
+
+    def test_append_to_missing_thread_raises(self, store):
+        with pytest.raises(ValueError):
+            store.append_message('thread-missing', make_message('hi'))
+
+    def test_list_threads_from_catalog(self, store):
+        """Test listing uses catalog entries with filters, newest first"""
+        store.create(make_header('thread-1', tags=['ops']))
+        store.create(make_header('thread-2', status='archived'))
+        store.append_message('thread-1', make_message('hello'))
+
+        threads = store.list_threads()
+        assert [t['id'] for t in threads] == ['thread-2', 'thread-1']
+        assert threads[1]['message_count'] == 1
+        assert [t['id'] for t in store.list_threads(status='active')] == ['thread-1']
+        assert [t['id'] for t in store.list_threads(tags=['ops'])] == ['thread-1']
+
+    def test_update_header(self, store):
+        """Test header updates are reflected in the catalog"""
+        store.create(make_header('thread-1'))
+        store.update_header('thread-1', lambda h: h.update(title='Renamed', summary='Short'))
+
+        assert store.get_header('thread-1')['summary'] == 'Short'
+        assert store.list_threads()[0]['title'] == 'Renamed'
+        assert store.title_tokens('thread-1') == {'renamed'}
+
+    def test_token_index(self, store):
+        """Test token lookups find threads and message positions"""
+        store.create(make_header('thread-1', title='Budget review'))
+        store.create(make_header('thread-2', title='Hiring'))
+        store.append_message('thread-2', make_message('the budget for q3'))
+        store.append_message('thread-2', make_message('unrelated'))
+        store.append_message('thread-2', make_message('q3 budget approved'))
+
+        assert store.find_threads({'budget'}) == {'thread-1', 'thread-2'}
+        assert store.match_positions('thread-2', {'budget', 'q3'}) == {0: 2, 2: 2}
+        assert store.match_positions('thread-2', {'budget'}, start=1) == {2: 1}
+
+    def test_sees_writes_from_other_instances(self, store):
+        """Test a second store on the same path follows the catalog"""
+        other = ConversationThreadStore(store.store_path)
+        store.create(make_header('thread-1'))
+        store.append_message('thread-1', make_message('budget'))
+
+        assert other.list_threads()[0]['message_count'] == 1
+        assert other.find_threads({'budget'}) == {'thread-1'}
+
+        other.append_message('thread-1', make_message('more budget'))
+        assert store.match_positions('thread-1', {'budget'}) == {0: 1, 1: 1}
+
+    def test_catalog_compaction(self, store):
+        """Test superseded catalog lines are compacted away"""
+        store.create(make_header('thread-1'))
+        for i in range(CATALOG_COMPACT_SLACK + 5):
+            store.append_message('thread-1', make_message(f'message {i}'))
+
+        assert store.get_stats()['catalog_lines'] < CATALOG_COMPACT_SLACK
+        reloaded = ConversationThreadStore(store.store_path)
+        assert reloaded.list_threads()[0]['message_count'] == CATALOG_COMPACT_SLACK + 5
+
+    def test_migrates_legacy_thread_files(self, temp_corp_path):
+        """Test single-file threads are converted on load"""
+        store_path = Path(temp_corp_path) / "threads"
+        store_path.mkdir(parents=True)
+        legacy = make_header('thread-20240101-abc', messages=[make_message('old budget talk')])
+        (store_path / 'thread-20240101-abc.json').write_text(json.dumps(legacy))
+
+        store = ConversationThreadStore(store_path)
+
+        assert not (store_path / 'thread-20240101-abc.json').exists()
+        assert [m['content'] for m in store.get('thread-20240101-abc')['messages']] == ['old budget talk']
+        assert store.find_threads({'budget'}) == {'thread-20240101-abc'}
@@ -0,0 +1,86 @@
+"""
+Tests for the trigger automaton and PatternLibrary matching through it.
+"""
+
+import pytest
+
+from src.core.learning import Pattern, PatternLibrary, PatternType
+from src.core.trigger_automaton import TriggerAutomaton
+
+
+def _pattern(pattern_id, triggers=None, requirements=None, confidence=0.5):
+    return Pattern(
+        id=pattern_id,
+        name=pattern_id,
+        description="",
+        type=PatternType.SUCCESS,
+        triggers=triggers or [],
+        context_requirements=requirements or {},
+        confidence=confidence,
+    )
+
+
+class TestTriggerAutomaton:
+    """Tests for TriggerAutomaton"""
+
+    def test_finds_overlapping_keywords(self):
+        """Test keywords inside or overlapping other keywords are all found"""
+        automaton = TriggerAutomaton([
+            ('api gateway', 'P1'), ('api', 'P2'), ('gateway', 'P3'), ('pig', 'P4'),
+        ])
+        assert automaton.search('deploy the api gateway') == {'P1', 'P2', 'P3'}
+        assert automaton.search('rapid') == {'P2'}
+        assert automaton.search('nothing here') == set()
+
+    def test_keywords_are_case_insensitive(self):
+        """Test keywords are lowercased at compile time"""
+        automaton = TriggerAutomaton([('Python', 'P1'), ('', 'P2')])
+        assert automaton.search('"language": "python"') == {'P1'}
+        assert len(automaton) == 1
+
+    def test_shared_keyword_owners(self):
+        """Test one keyword can belong to several patterns"""
+        automaton = TriggerAutomaton([('retry', 'P1'), ('retry', 'P2')])
+        assert automaton.search('retry later') == {'P1', 'P2'}
+
+
+class TestPatternLibraryMatching:
+    """Tests for PatternLibrary.match"""
+
+    def test_trigger_and_requirement_matches(self, tmp_path):
+        """Test trigger hits and requirement-only matches"""
+        library = PatternLibrary(tmp_path / "patterns")
+        library.add(_pattern('P-PY', triggers=['python'], confidence=0.9))
+        library.add(_pattern('P-GO', triggers=['golang']))
+        library.add(_pattern('P-ENG', requirements={'department': 'engineering'}, confidence=0.7))
+        library.add(_pattern('P-OPS', requirements={'department': ['ops', 'sre']}))
+
+        matches = library.match({'language': 'python', 'department': 'engineering'})
+        assert [p.id for p in matches] == ['P-PY', 'P-ENG']
+
+        matches = library.match({'department': 'sre'})
+        assert [p.id for p in matches] == ['P-OPS']
+
+    def test_trigger_overrides_conflicting_requirement(self, tmp_path):
+        """Test a trigger hit matches even when a requirement conflicts"""
+        library = PatternLibrary(tmp_path / "patterns")
+        library.add(_pattern('P1', triggers=['urgent'], requirements={'department': 'ops'}))
+
+        assert [p.id for p in library.match({'department': 'engineering', 'note': 'URGENT'})] == ['P1']
+        assert library.match({'department': 'engineering'}) == []
+
+    def test_new_patterns_are_matched_after_add(self, tmp_path):
+        """Test the automaton is rebuilt after add"""
+        library = PatternLibrary(tmp_path / "patterns")
+        library.add(_pattern('P1', triggers=['python']))
+        assert len(library.match({'language': 'rust'})) == 0
+
+        library.add(_pattern('P2', triggers=['rust']))
+        assert [p.id for p in library.match({'language': 'rust'})] == ['P2']
+
+    def test_reloaded_library_matches(self, tmp_path):
+        """Test matching works for patterns loaded from disk"""
+        PatternLibrary(tmp_path / "patterns").add(_pattern('P1', triggers=['backend']))
+
+        library = PatternLibrary(tmp_path / "patterns")
+        assert [p.id for p in library.match({'team': 'Backend'})] == ['P1']
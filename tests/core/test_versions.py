@@ -0,0 +1,98 @@
+"""
+Tests for src/core/versions.py
+
+Tests store change counters and the versioned cache.
+"""
+
+from pathlib import Path
+
+from src.core.versions import VersionedCache, bump_version, get_version, get_versions
+from src.core.molecule import MoleculeEngine
+from src.core.memory import OrganizationalMemory
+
+
+class TestChangeCounters:
+    """Tests for process-wide change counters"""
+
+    def test_bump_and_read(self, temp_corp_path):
+        assert get_version(temp_corp_path, 'molecules') == 0
+        bump_version(temp_corp_path, 'molecules')
+        bump_version(Path(temp_corp_path) / '.', 'molecules')  # Same scope once resolved
+
+        assert get_version(temp_corp_path, 'molecules') == 2
+        assert get_versions(temp_corp_path, ('molecules', 'gates')) == (2, 0)
+
+    def test_store_writes_bump_counters(self, temp_corp_path):
+        """Test store save paths bump their component"""
+        engine = MoleculeEngine(Path(temp_corp_path))
+        engine.create_molecule(name="Test", description="d", created_by="coo")
+        assert get_version(temp_corp_path, 'molecules') >= 1
+
+        memory = OrganizationalMemory(Path(temp_corp_path))
+        memory.record_lesson(
+            lesson_id='l1', title='t', situation='s', action_taken='a',
+            outcome='o', lesson='l', recommendations=[], recorded_by='coo'
+        )
+        assert get_version(temp_corp_path, 'memory.lessons_learned') == 1
+        assert get_version(temp_corp_path, 'memory.decisions') == 0
+
+
+class TestVersionedCache:
+    """Tests for VersionedCache"""
+
+    def test_reuses_value_until_versions_change(self):
+        cache = VersionedCache()
+        calls = []
+
+        def load():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get('x', (1,), load) == 1
+        assert cache.get('x', (1,), load) == 1
+        assert cache.get('x', (2,), load) == 2
+        assert cache.get_stats()['hits'] == 1
+
+    def test_expires_after_max_age(self):
+        cache = VersionedCache(max_age_seconds=0)
+        values = iter([1, 2])
+        cache.get('x', (1,), lambda: next(values))
+
+        import time
+        time.sleep(0.01)
+        assert cache.get('x', (1,), lambda: next(values)) == 2
+
+    def test_generation_tracks_rebuilds(self):
+        cache = VersionedCache()
+        assert cache.generation('x') is None
+
+        _, first = cache.get_with_generation('x', (1,), lambda: 'a')
+        _, again = cache.get_with_generation('x', (1,), lambda: 'b')
+        _, rebuilt = cache.get_with_generation('x', (2,), lambda: 'c')
+
+        assert first == again
+        assert rebuilt > first
+
+    def test_failed_loads_are_not_cached(self):
+        cache = VersionedCache()
+
+        def fail():
+            raise RuntimeError("disk error")
+
+        try:
+            cache.get('x', (1,), fail)
+        except RuntimeError:
+            pass
+        assert cache.generation('x') is None
+        assert cache.get('x', (1,), lambda: 'ok') == 'ok'
+
+    def test_max_entries_evicts_least_recently_used(self):
+        cache = VersionedCache(max_entries=2)
+        cache.get('a', (1,), lambda: 'a')
+        cache.get('b', (1,), lambda: 'b')
+        cache.get('a', (1,), lambda: 'stale')   # 'a' is now most recent
+        cache.get('c', (1,), lambda: 'c')
+
+        assert cache.generation('b') is None
+        assert cache.get('a', (1,), lambda: 'rebuilt') == 'a'
+        assert cache.get_stats()['entries'] == 2